@@ -59,10 +59,109 @@ class Settings(BaseSettings):
         default="",
         description="Override model for detail_full neutralization (e.g., gpt-5-mini). Empty = use OPENAI_MODEL.",
     )
+    DETAIL_FULL_MODE: str = Field(
+        default="synthesis",
+        description="detail_full generation: 'synthesis' (LLM rewrites the body) or 'spans' (apply detected span edits locally, falling back to synthesis)",
+    )
+    FUSED_BRIEF_FEED_CALL: bool = Field(
+        default=False,
+        description="Generate detail_brief and the feed outputs in one structured call instead of Calls 2 and 3",
+    )
+    DETAIL_FULL_CHUNKING: bool = Field(
+        default=False,
+        description="Split long bodies at paragraph boundaries and generate detail_full for the chunks concurrently",
+    )
+    DETAIL_FULL_CHUNK_SIZE: int = Field(
+        default=4000,
+        description="Target chunk size in characters for chunked detail_full generation",
+    )
+    DETAIL_FULL_CHUNK_CONCURRENCY: int = Field(
+        default=4,
+        description="Maximum concurrent chunk requests per article for chunked detail_full generation",
+    )
     SPAN_DETECTION_MODEL: str = Field(
         default="gpt-5-mini",
         description="OpenAI model for span detection (supports gpt-5-mini, gpt-5.1, gpt-4o-mini)",
     )
+    NEUTRALIZE_SYNDICATION_DEDUPE: bool = Field(
+        default=True,
+        description="Neutralize one story per identical body and fan results out to syndicated copies",
+    )
+    NEUTRALIZE_BATCH_DIR: str = Field(
+        default="./storage/neutralize_batches",
+        description="Directory for batch-mode neutralization JSONL request files",
+    )
+    NEUTRALIZE_BATCH_POLL_SECONDS: int = Field(
+        default=30,
+        description="Seconds between status polls of a submitted neutralization batch job",
+    )
+    NEUTRALIZE_BATCH_TIMEOUT_SECONDS: int = Field(
+        default=86400,
+        description="Give up waiting on a neutralization batch job after this many seconds (provider window is 24h)",
+    )
+
+    # LLM Concurrency
+    LLM_ADAPTIVE_CONCURRENCY: bool = Field(
+        default=True,
+        description="Gate LLM calls through per provider/model AIMD concurrency limiters",
+    )
+    LLM_CONCURRENCY_INITIAL: int = Field(
+        default=4,
+        description="Starting concurrent LLM calls per provider/model",
+    )
+    LLM_CONCURRENCY_MIN: int = Field(
+        default=1,
+        description="Floor for the adaptive LLM concurrency limit",
+    )
+    LLM_CONCURRENCY_MAX: int = Field(
+        default=16,
+        description="Ceiling for the adaptive LLM concurrency limit",
+    )
+    LLM_TPM_BUDGETS: dict[str, int] = Field(
+        default_factory=dict,
+        description='Tokens-per-minute budgets as JSON, keyed "provider:model" or "provider" (e.g. {"openai": 200000})',
+    )
+    LLM_CONCURRENCY_DB_COORDINATION: bool = Field(
+        default=False,
+        description="Share LLM concurrency slots across processes via PostgreSQL advisory locks",
+    )
+    LLM_RPM_BUDGETS: dict[str, int] = Field(
+        default_factory=dict,
+        description='Requests-per-minute budgets as JSON, keyed "provider:model" or "provider" (e.g. {"openai": 500})',
+    )
+    RATE_LIMIT_DB_COORDINATION: bool = Field(
+        default=False,
+        description="Share rate limiter token buckets (LLM requests, batch articles) across processes via PostgreSQL",
+    )
+
+    LLM_STREAMING: bool = Field(
+        default=False,
+        description="Stream LLM replies and abort refusals, repetition loops and malformed JSON as they arrive",
+    )
+    LLM_STREAM_ABORT_RETRIES: int = Field(
+        default=1,
+        description="Immediate retries after a streamed reply is aborted before the call fails",
+    )
+
+    # NTRL scanner (v2 endpoints)
+    NTRL_CPU_EXECUTOR: str = Field(
+        default="thread",
+        description='Run the lexical/structural detectors in the default thread pool ("thread") or warm worker processes ("process")',
+    )
+    NTRL_CPU_WORKERS: int | None = Field(
+        default=None,
+        description='Detector worker processes when NTRL_CPU_EXECUTOR is "process" (default: one per core)',
+    )
+
+    # Prompt registry
+    PROMPT_REGISTRY_LISTEN: bool = Field(
+        default=True,
+        description="Invalidate cached prompts on PostgreSQL NOTIFY from the prompts table trigger",
+    )
+    PROMPT_REGISTRY_CHECK_SECONDS: float = Field(
+        default=5.0,
+        description="How often to check the prompts table for changes when no NOTIFY listener is running",
+    )
 
     # Classification
     CLASSIFICATION_MODEL: str = Field(
@@ -235,10 +235,17 @@ def log_llm_call(provider: str, model: str, call_type: str):
             response = await client.chat(...)
             metrics["tokens_in"] = response.usage.prompt_tokens
             metrics["tokens_out"] = response.usage.completion_tokens
+
+    tokens_in counts every prompt token, including the tokens_cached subset
+    served from the provider's prompt cache (see record_llm_usage).
+
+    A caller that abandons a reply part-way (e.g. an aborted stream) sets
+    metrics["aborted"] to the reason; the call is then logged as
+    llm_call_aborted with whatever token estimate the caller recorded.
     """
     start_time = time.time()
     logger = logging.getLogger("pipeline.llm")
-    metrics: dict = {"tokens_in": 0, "tokens_out": 0}
+    metrics: dict = {"tokens_in": 0, "tokens_out": 0, "tokens_cached": 0, "tokens_cache_write": 0, "aborted": None}
 
     logger.debug(
         f"LLM call started: {provider}/{model} for {call_type}",
@@ -254,19 +261,27 @@ def log_llm_call(provider: str, model: str, call_type: str):
         yield metrics
 
         duration_ms = int((time.time() - start_time) * 1000)
-        cost_usd = _estimate_llm_cost(provider, model, metrics["tokens_in"], metrics["tokens_out"])
+        cost_usd = _estimate_llm_cost(
+            provider, model, metrics["tokens_in"], metrics["tokens_out"], tokens_cached=metrics["tokens_cached"]
+        )
 
-        logger.info(
-            f"LLM call completed: {provider}/{model} ({duration_ms}ms, ${cost_usd:.4f})",
+        aborted = metrics["aborted"]
+        logger.log(
+            logging.WARNING if aborted else logging.INFO,
+            f"LLM call {f'aborted ({aborted})' if aborted else 'completed'}: "
+            f"{provider}/{model} ({duration_ms}ms, ${cost_usd:.4f})",
             extra={
-                "event": "llm_call_complete",
+                "event": "llm_call_aborted" if aborted else "llm_call_complete",
                 "provider": provider,
                 "model": model,
                 "call_type": call_type,
                 "duration_ms": duration_ms,
                 "tokens_in": metrics["tokens_in"],
                 "tokens_out": metrics["tokens_out"],
+                "tokens_cached": metrics["tokens_cached"],
+                "tokens_cache_write": metrics["tokens_cache_write"],
                 "cost_usd": cost_usd,
+                "aborted": aborted,
             },
         )
     except Exception as e:
@@ -284,6 +299,51 @@ def log_llm_call(provider: str, model: str, call_type: str):
         raise
 
 
+def _token_count(obj: Any, name: str) -> int:
+    """Read an integer token count attribute, treating anything else as zero."""
+    value = getattr(obj, name, 0)
+    return value if isinstance(value, int) else 0
+
+
+def record_llm_usage(metrics: dict, response: Any) -> None:
+    """
+    Copy token usage from a provider response into log_llm_call metrics.
+
+    Normalizes the three SDK shapes, including prompt-cache counts:
+    - OpenAI: usage.prompt_tokens / completion_tokens,
+      usage.prompt_tokens_details.cached_tokens
+    - Anthropic: usage.input_tokens / output_tokens, plus
+      cache_read_input_tokens and cache_creation_input_tokens (which are
+      reported separately from input_tokens, so they are added back in)
+    - Gemini: usage_metadata.prompt_token_count / candidates_token_count,
+      usage_metadata.cached_content_token_count
+
+    Missing fields are treated as zero; responses without usage are ignored.
+    """
+    usage = getattr(response, "usage", None)
+    if isinstance(getattr(usage, "prompt_tokens", None), int):
+        details = getattr(usage, "prompt_tokens_details", None)
+        metrics["tokens_in"] = _token_count(usage, "prompt_tokens")
+        metrics["tokens_out"] = _token_count(usage, "completion_tokens")
+        metrics["tokens_cached"] = _token_count(details, "cached_tokens")
+        return
+
+    if isinstance(getattr(usage, "input_tokens", None), int):
+        cache_read = _token_count(usage, "cache_read_input_tokens")
+        cache_write = _token_count(usage, "cache_creation_input_tokens")
+        metrics["tokens_in"] = _token_count(usage, "input_tokens") + cache_read + cache_write
+        metrics["tokens_out"] = _token_count(usage, "output_tokens")
+        metrics["tokens_cached"] = cache_read
+        metrics["tokens_cache_write"] = cache_write
+        return
+
+    usage_metadata = getattr(response, "usage_metadata", None)
+    if isinstance(getattr(usage_metadata, "prompt_token_count", None), int):
+        metrics["tokens_in"] = _token_count(usage_metadata, "prompt_token_count")
+        metrics["tokens_out"] = _token_count(usage_metadata, "candidates_token_count")
+        metrics["tokens_cached"] = _token_count(usage_metadata, "cached_content_token_count")
+
+
 @contextmanager
 def log_s3_operation(operation: str, key: str):
     """
@@ -444,8 +504,16 @@ LLM_COSTS = {
 }
 
 
-def _estimate_llm_cost(provider: str, model: str, tokens_in: int, tokens_out: int) -> float:
-    """Estimate LLM cost based on token usage."""
+# Price of a prompt-cache read relative to an uncached input token
+CACHED_INPUT_PRICE_RATIO = {
+    "openai": 0.5,
+    "anthropic": 0.1,
+    "google": 0.25,
+}
+
+
+def _estimate_llm_cost(provider: str, model: str, tokens_in: int, tokens_out: int, tokens_cached: int = 0) -> float:
+    """Estimate LLM cost based on token usage (tokens_cached is a subset of tokens_in)."""
     key = (provider.lower(), model.lower())
 
     # Try exact match first
@@ -462,7 +530,9 @@ def _estimate_llm_cost(provider: str, model: str, tokens_in: int, tokens_out: in
         # Default to a reasonable estimate
         costs = {"input": 1.0, "output": 3.0}
 
-    input_cost = (tokens_in / 1_000_000) * costs["input"]
+    cached_ratio = CACHED_INPUT_PRICE_RATIO.get(provider.lower(), 1.0)
+    uncached_in = max(tokens_in - tokens_cached, 0)
+    input_cost = ((uncached_in + tokens_cached * cached_ratio) / 1_000_000) * costs["input"]
     output_cost = (tokens_out / 1_000_000) * costs["output"]
 
     return round(input_cost + output_cost, 6)
@@ -61,9 +61,11 @@ async def lifespan(app: FastAPI):
 
     On startup:
     - Clean up stale pipeline jobs that may have been orphaned
+    - Start the CPU detector worker processes (NTRL_CPU_EXECUTOR="process")
     - Log server startup
 
     On shutdown:
+    - Close the shared NTRL pipelines and CPU detector pools
     - Log server shutdown
     """
     # Startup
@@ -84,11 +86,29 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to cleanup stale jobs on startup: {e}")
 
+    # Warm the v2 endpoints' detector worker processes before the first request
+    try:
+        from app.services.ntrl_runtime import get_ntrl_runtime
+
+        await get_ntrl_runtime().warm()
+    except Exception as e:
+        logger.error(f"Failed to warm NTRL runtime on startup: {e}")
+
     yield
 
     # Shutdown
     logger.info("NTRL API shutting down")
 
+    # Close the v2 endpoints' shared pipelines (HTTP clients) and detector worker processes
+    try:
+        from app.services.ntrl_runtime import close_ntrl_runtime
+        from app.services.ntrl_scan import shutdown_detector_pools
+
+        await close_ntrl_runtime()
+        shutdown_detector_pools()
+    except Exception as e:
+        logger.error(f"Failed to close NTRL runtime on shutdown: {e}")
+
     # Cancel any running pipeline jobs
     from app.services.pipeline_job_manager import PipelineJobManager as _ShutdownJobManager
 
@@ -475,6 +475,7 @@ class StoryNeutralized(Base):
     # Model/prompt tracking
     model_name = Column(String(128), nullable=True)
     prompt_version = Column(String(64), nullable=True)
+    stage_fingerprints = Column(JSONB, nullable=True)  # {detail_full, detail_brief, feed_outputs: hash}
 
     # Neutralization status tracking
     neutralization_status = Column(String(50), default="success", nullable=False)
@@ -1258,3 +1259,26 @@ class ContentLifecycleEvent(Base):
         Index("ix_lifecycle_events_timestamp", "event_timestamp"),
         Index("ix_lifecycle_events_idempotency", "idempotency_key"),
     )
+
+
+# -----------------------------------------------------------------------------
+# RateLimitBucket
+# -----------------------------------------------------------------------------
+
+
+class RateLimitBucket(Base):
+    """
+    Token bucket shared across processes (RATE_LIMIT_DB_COORDINATION).
+
+    One row per limiter name (e.g. "llm:openai:gpt-4o-mini"). Rows are read
+    and written only by PostgresRateBucketCoordinator in
+    app/services/resilience.py, in raw SQL that refills and takes tokens in
+    one locked UPDATE; the model keeps the table in Base.metadata for
+    Alembic.
+    """
+
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String(255), primary_key=True)
+    tokens = Column(Float(precision=53), nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
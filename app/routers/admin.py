@@ -1394,23 +1394,21 @@ def test_prompts(
     import logging
 
     from app import models
-    from app.services.neutralizer import (
-        _prompt_cache,
-        get_neutralizer_provider,
-    )
+    from app.services.neutralizer import get_neutralizer_provider
+    from app.services.prompt_registry import override_prompts
 
     logger = logging.getLogger(__name__)
 
     started_at = datetime.now(UTC)
 
-    # If custom prompts provided, temporarily update cache
-    original_cache = _prompt_cache.copy()
+    # If custom prompts provided, serve them for this request only
+    overrides = {}
     if request.system_prompt:
-        _prompt_cache["system_prompt"] = request.system_prompt
+        overrides["system_prompt"] = request.system_prompt
     if request.user_prompt_template:
-        _prompt_cache["user_prompt_template"] = request.user_prompt_template
+        overrides["user_prompt_template"] = request.user_prompt_template
 
-    try:
+    with override_prompts(overrides):
         # Get sample articles (recent, not duplicates)
         stories = (
             db.query(models.StoryRaw)
@@ -1463,11 +1461,6 @@ def test_prompts(
             results=results,
         )
 
-    finally:
-        # Restore original cache
-        _prompt_cache.clear()
-        _prompt_cache.update(original_cache)
-
 
 # -----------------------------------------------------------------------------
 # Reset endpoint (for testing)
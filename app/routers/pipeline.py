@@ -6,26 +6,27 @@ Provides endpoints for:
 - /v2/scan - Detection only
 - /v2/fix - Rewriting with provided scan results
 - /v2/process - Full pipeline (scan + fix)
-- /v2/batch - Batch processing
+- /v2/batch - Batch processing (optionally streamed as NDJSON)
 
 These endpoints use the new two-phase architecture for improved performance.
+
+Handlers share the app-lifespan pipelines and batchers of NTRLRuntime
+(result cache, HTTP clients, rate limiter); request options are passed to
+them per call.
 """
 
+import time
+from collections.abc import AsyncIterator
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.auth import require_admin_key
-from app.services.ntrl_batcher import (
-    ArticleInput,
-    NTRLBatcher,
-)
-from app.services.ntrl_fix import FixerConfig, GeneratorConfig
-from app.services.ntrl_pipeline import (
-    NTRLPipeline,
-    PipelineConfig,
-    ProcessingMode,
-)
-from app.services.ntrl_scan import ScannerConfig
+from app.services.ntrl_batcher import ArticleInput, NTRLBatcher
+from app.services.ntrl_pipeline import PipelineResult
+from app.services.ntrl_runtime import NTRLRuntime, get_ntrl_runtime
 
 router = APIRouter(prefix="/v2", tags=["ntrl-v2"])
 
@@ -110,6 +111,10 @@ class BatchRequest(BaseModel):
     articles: list[BatchArticle] = Field(..., max_length=50)
     enable_semantic: bool = Field(True, description="Enable semantic detection")
     mock_mode: bool = Field(False, description="Use mock LLM (for testing)")
+    stream: bool = Field(
+        False,
+        description="Stream application/x-ndjson: one line per article as it completes, then a summary line",
+    )
 
 
 class BatchResultItem(BaseModel):
@@ -136,6 +141,23 @@ class BatchResponse(BaseModel):
     results: list[BatchResultItem]
 
 
+class BatchStreamItem(BatchResultItem):
+    """NDJSON line for one article in a streamed batch."""
+
+    type: Literal["result"] = "result"
+
+
+class BatchStreamSummary(BaseModel):
+    """Final NDJSON line of a streamed batch."""
+
+    type: Literal["summary"] = "summary"
+    total_articles: int
+    successful: int
+    failed: int
+    total_time_ms: float
+    avg_time_per_article_ms: float
+
+
 class TransparencyRequest(BaseModel):
     """Request for transparency data."""
 
@@ -162,7 +184,11 @@ class TransparencyResponse(BaseModel):
 
 
 @router.post("/scan", response_model=ScanResponse)
-async def scan_article(request: ScanRequest, _: None = Depends(require_admin_key)):
+async def scan_article(
+    request: ScanRequest,
+    _: None = Depends(require_admin_key),
+    runtime: NTRLRuntime = Depends(get_ntrl_runtime),
+):
     """
     Scan article for manipulation (detection only, no rewriting).
 
@@ -171,53 +197,45 @@ async def scan_article(request: ScanRequest, _: None = Depends(require_admin_key
 
     Returns detection statistics and span details.
     """
-    config = PipelineConfig(
-        mode=ProcessingMode.SCAN_ONLY,
-        scanner_config=ScannerConfig(
-            enable_semantic=request.enable_semantic,
-            semantic_provider="mock" if not request.enable_semantic else "auto",
-        ),
+    body_scan, title_scan = await runtime.pipeline().scan_only(
+        body=request.body,
+        title=request.title,
+        enable_semantic=request.enable_semantic,
     )
 
-    pipeline = NTRLPipeline(config=config)
-    try:
-        body_scan, title_scan = await pipeline.scan_only(
-            body=request.body,
-            title=request.title,
-        )
-
-        # Build response
-        body_spans = [_span_to_dict(s) for s in body_scan.spans]
-        title_spans = [_span_to_dict(s) for s in title_scan.spans] if title_scan else []
-
-        # Aggregate stats
-        all_spans = body_scan.spans + (title_scan.spans if title_scan else [])
-
-        by_category = {}
-        by_severity = {}
-        for span in all_spans:
-            cat = span.type_id_primary[0]
-            by_category[cat] = by_category.get(cat, 0) + 1
-            sev = span.severity
-            by_severity[sev] = by_severity.get(sev, 0) + 1
-
-        return ScanResponse(
-            body_detections=len(body_scan.spans),
-            title_detections=len(title_spans),
-            total_detections=len(all_spans),
-            scan_time_ms=body_scan.total_scan_duration_ms,
-            detections_by_category=by_category,
-            detections_by_severity=by_severity,
-            body_spans=body_spans,
-            title_spans=title_spans,
-        )
-
-    finally:
-        await pipeline.close()
+    # Build response
+    body_spans = [_span_to_dict(s) for s in body_scan.spans]
+    title_spans = [_span_to_dict(s) for s in title_scan.spans] if title_scan else []
+
+    # Aggregate stats
+    all_spans = body_scan.spans + (title_scan.spans if title_scan else [])
+
+    by_category = {}
+    by_severity = {}
+    for span in all_spans:
+        cat = span.type_id_primary[0]
+        by_category[cat] = by_category.get(cat, 0) + 1
+        sev = span.severity
+        by_severity[sev] = by_severity.get(sev, 0) + 1
+
+    return ScanResponse(
+        body_detections=len(body_scan.spans),
+        title_detections=len(title_spans),
+        total_detections=len(all_spans),
+        scan_time_ms=body_scan.total_scan_duration_ms,
+        detections_by_category=by_category,
+        detections_by_severity=by_severity,
+        body_spans=body_spans,
+        title_spans=title_spans,
+    )
 
 
 @router.post("/process", response_model=ProcessResponse)
-async def process_article(request: ProcessRequest, _: None = Depends(require_admin_key)):
+async def process_article(
+    request: ProcessRequest,
+    _: None = Depends(require_admin_key),
+    runtime: NTRLRuntime = Depends(get_ntrl_runtime),
+):
     """
     Process article through full NTRL pipeline (scan + fix).
 
@@ -227,74 +245,80 @@ async def process_article(request: ProcessRequest, _: None = Depends(require_adm
 
     Returns neutralized content and transparency data.
     """
-    # Configure pipeline
-    scanner_config = ScannerConfig(
+    result = await runtime.pipeline(mock=request.mock_mode).process(
+        body=request.body,
+        title=request.title,
+        deck=request.deck,
+        force=request.force,
         enable_semantic=request.enable_semantic,
-        semantic_provider="mock" if request.mock_mode else "auto",
-    )
-
-    fixer_config = FixerConfig(
-        generator_config=GeneratorConfig(
-            provider="mock" if request.mock_mode else "auto",
-        ),
         strict_validation=False,  # Be lenient in API responses
     )
 
-    config = PipelineConfig(
-        mode=ProcessingMode.REALTIME,
-        scanner_config=scanner_config,
-        fixer_config=fixer_config,
-        generate_transparency=True,
+    # Build response
+    by_category = {}
+    by_action = {}
+
+    if result.transparency:
+        by_category = result.transparency.detections_by_category
+        for change in result.transparency.changes:
+            action = change.action.value
+            by_action[action] = by_action.get(action, 0) + 1
+
+    return ProcessResponse(
+        detail_full=result.detail_full,
+        detail_brief=result.detail_brief,
+        feed_title=result.feed_title,
+        feed_summary=result.feed_summary,
+        total_detections=result.body_scan.total_detections
+        + (result.title_scan.total_detections if result.title_scan else 0),
+        total_changes=result.total_changes,
+        passed_validation=result.passed_validation,
+        total_time_ms=result.total_processing_time_ms,
+        scan_time_ms=result.scan_time_ms,
+        fix_time_ms=result.fix_time_ms,
+        cache_hit=result.cache_hit,
+        detections_by_category=by_category,
+        changes_by_action=by_action,
     )
 
-    pipeline = NTRLPipeline(config=config)
-    try:
-        result = await pipeline.process(
-            body=request.body,
-            title=request.title,
-            deck=request.deck,
-            force=request.force,
-        )
-
-        # Build response
-        by_category = {}
-        by_action = {}
-
-        if result.transparency:
-            by_category = result.transparency.detections_by_category
-            for change in result.transparency.changes:
-                action = change.action.value
-                by_action[action] = by_action.get(action, 0) + 1
-
-        return ProcessResponse(
-            detail_full=result.detail_full,
-            detail_brief=result.detail_brief,
-            feed_title=result.feed_title,
-            feed_summary=result.feed_summary,
-            total_detections=result.body_scan.total_detections
-            + (result.title_scan.total_detections if result.title_scan else 0),
-            total_changes=result.total_changes,
-            passed_validation=result.passed_validation,
-            total_time_ms=result.total_processing_time_ms,
-            scan_time_ms=result.scan_time_ms,
-            fix_time_ms=result.fix_time_ms,
-            cache_hit=result.cache_hit,
-            detections_by_category=by_category,
-            changes_by_action=by_action,
-        )
-
-    finally:
-        await pipeline.close()
-
 
 @router.post("/batch", response_model=BatchResponse)
-async def process_batch(request: BatchRequest, _: None = Depends(require_admin_key)):
+async def process_batch(
+    request: BatchRequest,
+    _: None = Depends(require_admin_key),
+    runtime: NTRLRuntime = Depends(get_ntrl_runtime),
+):
     """
     Process multiple articles in batch.
 
     Automatically selects optimal processing strategy based on batch size.
     Uses parallel processing with rate limiting.
+
+    With stream=true the response is application/x-ndjson: one
+    BatchStreamItem line per article as soon as it completes (completion
+    order), then one BatchStreamSummary line.
     """
+    if len(request.articles) > 100:
+        raise HTTPException(status_code=400, detail="Maximum batch size is 100 articles")
+
+    # Convert to ArticleInput
+    articles = [
+        ArticleInput(
+            article_id=a.article_id,
+            body=a.body,
+            title=a.title,
+        )
+        for a in request.articles
+    ]
+
+    batcher = runtime.batcher(mock=request.mock_mode)
+
+    if request.stream:
+        return StreamingResponse(
+            _stream_batch(batcher, articles, request.enable_semantic),
+            media_type="application/x-ndjson",
+        )
+
     if not request.articles:
         return BatchResponse(
             total_articles=0,
@@ -305,114 +329,60 @@ async def process_batch(request: BatchRequest, _: None = Depends(require_admin_k
             results=[],
         )
 
-    if len(request.articles) > 100:
-        raise HTTPException(status_code=400, detail="Maximum batch size is 100 articles")
-
-    # Configure batcher
-    pipeline_config = PipelineConfig(
-        scanner_config=ScannerConfig(
-            enable_semantic=request.enable_semantic,
-            semantic_provider="mock" if request.mock_mode else "auto",
-        ),
-        fixer_config=FixerConfig(
-            generator_config=GeneratorConfig(
-                provider="mock" if request.mock_mode else "auto",
-            ),
-        ),
-    )
-
-    batcher = NTRLBatcher(pipeline_config=pipeline_config)
-    try:
-        # Convert to ArticleInput
-        articles = [
-            ArticleInput(
-                article_id=a.article_id,
-                body=a.body,
-                title=a.title,
-            )
-            for a in request.articles
-        ]
-
-        batch_result = await batcher.process_batch(articles)
-
-        # Build response
-        result_items = []
-        for article in request.articles:
-            if article.article_id in batch_result.results:
-                r = batch_result.results[article.article_id]
-                result_items.append(
-                    BatchResultItem(
-                        article_id=article.article_id,
-                        success=True,
-                        detail_full=r.detail_full,
-                        feed_title=r.feed_title,
-                        total_detections=r.body_scan.total_detections,
-                        total_changes=r.total_changes,
-                        processing_time_ms=r.total_processing_time_ms,
-                    )
-                )
-            else:
-                error = batch_result.failures.get(article.article_id, "Unknown error")
-                result_items.append(
-                    BatchResultItem(
-                        article_id=article.article_id,
-                        success=False,
-                        error=error,
-                    )
-                )
+    batch_result = await batcher.process_batch(articles, enable_semantic=request.enable_semantic)
 
-        return BatchResponse(
-            total_articles=batch_result.total_articles,
-            successful=batch_result.successful,
-            failed=batch_result.failed,
-            total_time_ms=batch_result.total_time_ms,
-            avg_time_per_article_ms=batch_result.avg_time_per_article_ms,
-            results=result_items,
+    # Build response
+    result_items = [
+        _batch_item(
+            BatchResultItem,
+            article.article_id,
+            batch_result.results.get(article.article_id),
+            batch_result.failures.get(article.article_id, "Unknown error"),
         )
-
-    finally:
-        await batcher.close()
+        for article in request.articles
+    ]
+
+    return BatchResponse(
+        total_articles=batch_result.total_articles,
+        successful=batch_result.successful,
+        failed=batch_result.failed,
+        total_time_ms=batch_result.total_time_ms,
+        avg_time_per_article_ms=batch_result.avg_time_per_article_ms,
+        results=result_items,
+    )
 
 
 @router.post("/transparency", response_model=TransparencyResponse)
-async def get_transparency(request: TransparencyRequest, _: None = Depends(require_admin_key)):
+async def get_transparency(
+    request: TransparencyRequest,
+    _: None = Depends(require_admin_key),
+    runtime: NTRLRuntime = Depends(get_ntrl_runtime),
+):
     """
     Get full transparency package for an article.
 
     Returns detailed information about what was changed and why,
     suitable for the ntrl-view UI.
     """
-    config = PipelineConfig(
-        generate_transparency=True,
-        fixer_config=FixerConfig(
-            generator_config=GeneratorConfig(provider="mock"),
-        ),
-        scanner_config=ScannerConfig(enable_semantic=False),
+    result = await runtime.pipeline(mock=True).process(
+        body=request.body,
+        title=request.title,
+        enable_semantic=False,
     )
 
-    pipeline = NTRLPipeline(config=config)
-    try:
-        result = await pipeline.process(
-            body=request.body,
-            title=request.title,
-        )
-
-        if not result.transparency:
-            raise HTTPException(status_code=500, detail="Failed to generate transparency data")
-
-        return TransparencyResponse(
-            total_detections=result.transparency.total_detections,
-            detections_by_category=result.transparency.detections_by_category,
-            detections_by_severity=result.transparency.detections_by_severity,
-            manipulation_density=result.transparency.manipulation_density,
-            epistemic_flags=result.transparency.epistemic_flags,
-            validation_passed=result.transparency.validation.passed,
-            changes=[_change_to_dict(c) for c in result.transparency.changes],
-            filter_version=result.transparency.filter_version,
-        )
-
-    finally:
-        await pipeline.close()
+    if not result.transparency:
+        raise HTTPException(status_code=500, detail="Failed to generate transparency data")
+
+    return TransparencyResponse(
+        total_detections=result.transparency.total_detections,
+        detections_by_category=result.transparency.detections_by_category,
+        detections_by_severity=result.transparency.detections_by_severity,
+        manipulation_density=result.transparency.manipulation_density,
+        epistemic_flags=result.transparency.epistemic_flags,
+        validation_passed=result.transparency.validation.passed,
+        changes=[_change_to_dict(c) for c in result.transparency.changes],
+        filter_version=result.transparency.filter_version,
+    )
 
 
 # ============================================================================
@@ -420,6 +390,46 @@ async def get_transparency(request: TransparencyRequest, _: None = Depends(requi
 # ============================================================================
 
 
+async def _stream_batch(
+    batcher: NTRLBatcher, articles: list[ArticleInput], enable_semantic: bool
+) -> AsyncIterator[str]:
+    """NDJSON lines for a streamed batch; only the articles in flight are held in memory."""
+    start_time = time.perf_counter()
+    successful = 0
+
+    async for outcome in batcher.process_stream(articles, enable_semantic=enable_semantic):
+        successful += outcome.result is not None
+        item = _batch_item(BatchStreamItem, outcome.article_id, outcome.result, outcome.error or "Unknown error")
+        yield item.model_dump_json() + "\n"
+
+    total_time_ms = (time.perf_counter() - start_time) * 1000
+    summary = BatchStreamSummary(
+        total_articles=len(articles),
+        successful=successful,
+        failed=len(articles) - successful,
+        total_time_ms=round(total_time_ms, 2),
+        avg_time_per_article_ms=round(total_time_ms / len(articles), 2) if articles else 0.0,
+    )
+    yield summary.model_dump_json() + "\n"
+
+
+def _batch_item(
+    item_type: type[BatchResultItem], article_id: str, result: PipelineResult | None, error: str
+) -> BatchResultItem:
+    """Batch response item for one article's result, or its error if there is no result."""
+    if result is None:
+        return item_type(article_id=article_id, success=False, error=error)
+    return item_type(
+        article_id=article_id,
+        success=True,
+        detail_full=result.detail_full,
+        feed_title=result.feed_title,
+        total_detections=result.body_scan.total_detections,
+        total_changes=result.total_changes,
+        processing_time_ms=result.total_processing_time_ms,
+    )
+
+
 def _span_to_dict(span) -> dict:
     """Convert DetectionInstance to dict for API response."""
     return {
@@ -1,18 +1,28 @@
 # app/services/__init__.py
 """
 Business logic services.
+
+Services are imported on first attribute access, so importing one service
+module (e.g. app.services.neutralizer) does not pull in every other
+service and its dependencies.
 """
 
-from app.services.brief_assembly import BriefAssemblyService
-from app.services.classifier import SectionClassifier
-from app.services.deduper import Deduper
-from app.services.evaluation_service import EvaluationService
-from app.services.ingestion import IngestionService
-from app.services.llm_classifier import LLMClassifier, clear_classification_prompt_cache
-from app.services.neutralizer import NeutralizerProvider, NeutralizerService
-from app.services.prompt_optimizer import PromptOptimizer
-from app.services.rollback_service import RollbackService
-from app.services.search_service import SearchService
+from importlib import import_module
+
+_SERVICE_MODULES = {
+    "BriefAssemblyService": "app.services.brief_assembly",
+    "SectionClassifier": "app.services.classifier",
+    "Deduper": "app.services.deduper",
+    "EvaluationService": "app.services.evaluation_service",
+    "IngestionService": "app.services.ingestion",
+    "LLMClassifier": "app.services.llm_classifier",
+    "clear_classification_prompt_cache": "app.services.llm_classifier",
+    "NeutralizerProvider": "app.services.neutralizer",
+    "NeutralizerService": "app.services.neutralizer",
+    "PromptOptimizer": "app.services.prompt_optimizer",
+    "RollbackService": "app.services.rollback_service",
+    "SearchService": "app.services.search_service",
+}
 
 __all__ = [
     "IngestionService",
@@ -28,3 +38,10 @@ __all__ = [
     "clear_classification_prompt_cache",
     "SearchService",
 ]
+
+
+def __getattr__(name: str):
+    module = _SERVICE_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
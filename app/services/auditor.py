@@ -16,6 +16,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+from app.services.resilience import estimate_tokens, llm_permit
+
 logger = logging.getLogger(__name__)
 
 
@@ -219,15 +221,16 @@ MODEL OUTPUT:
 
 Return a single JSON object with verdict, reasons, checks, and suggested_action."""
 
-            response = client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {"role": "system", "content": AUDITOR_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.1,  # More deterministic for validation
-                response_format={"type": "json_object"},
-            )
+            with llm_permit("openai", self._model, estimate_tokens(AUDITOR_SYSTEM_PROMPT, user_prompt)):
+                response = client.chat.completions.create(
+                    model=self._model,
+                    messages=[
+                        {"role": "system", "content": AUDITOR_SYSTEM_PROMPT},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=0.1,  # More deterministic for validation
+                    response_format={"type": "json_object"},
+                )
 
             data = json.loads(response.choices[0].message.content)
             return self._parse_audit_response(data)
@@ -22,6 +22,7 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from app import models
+from app.services.resilience import estimate_tokens, llm_permit
 
 logger = logging.getLogger(__name__)
 
@@ -1057,12 +1058,16 @@ Evaluate the span detection quality (precision and recall)."""
 
             client = anthropic.Anthropic(api_key=api_key, timeout=90.0)
 
-            response = client.messages.create(
-                model=self.teacher_model,
-                max_tokens=4096,
-                system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
-            )
+            estimated = estimate_tokens(system_prompt, user_prompt) + 4096
+            with llm_permit("anthropic", self.teacher_model, estimated) as permit:
+                response = client.messages.create(
+                    model=self.teacher_model,
+                    max_tokens=4096,
+                    system=system_prompt,
+                    messages=[{"role": "user", "content": user_prompt}],
+                )
+                if response.usage:
+                    permit.record_usage(response.usage.input_tokens + response.usage.output_tokens)
 
             # Track tokens (thread-safe)
             if response.usage:
@@ -1103,15 +1108,18 @@ Evaluate the span detection quality (precision and recall)."""
 
             client = OpenAI(api_key=api_key, timeout=30.0)
 
-            response = client.chat.completions.create(
-                model=self.teacher_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.2,
-                response_format={"type": "json_object"},
-            )
+            with llm_permit("openai", self.teacher_model, estimate_tokens(system_prompt, user_prompt)) as permit:
+                response = client.chat.completions.create(
+                    model=self.teacher_model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=0.2,
+                    response_format={"type": "json_object"},
+                )
+                if response.usage:
+                    permit.record_usage(response.usage.prompt_tokens + response.usage.completion_tokens)
 
             # Track tokens (thread-safe)
             if response.usage:
@@ -29,12 +29,11 @@ from sqlalchemy.orm import Session
 from app.models import Domain
 from app.services.domain_mapper import map_domain_to_feed_category
 from app.services.enhanced_keyword_classifier import classify_by_keywords
+from app.services.prompt_registry import get_prompt_registry, invalidate_prompt_registry
+from app.services.resilience import estimate_tokens, llm_permit
 
 logger = logging.getLogger(__name__)
 
-# Prompt cache for hot-reload
-_classification_prompt_cache: dict[str, str] = {}
-
 
 # ---------------------------------------------------------------------------
 # Result types
@@ -229,34 +228,13 @@ def get_classification_prompt(prompt_name: str = "classification_system_prompt")
     """
     Get classification prompt from database, with hardcoded fallback.
 
-    Prompts are cached for performance. Use clear_classification_prompt_cache()
-    to reload after changes.
+    Prompts come from the shared prompt registry, which reloads them when
+    they change. Use clear_classification_prompt_cache() to force a reload.
     """
-    if prompt_name in _classification_prompt_cache:
-        return _classification_prompt_cache[prompt_name]
-
-    # Try to fetch from database
     try:
-        from app import models
-        from app.database import SessionLocal
-
-        db = SessionLocal()
-        try:
-            prompt = (
-                db.query(models.Prompt)
-                .filter(
-                    models.Prompt.name == prompt_name,
-                    models.Prompt.is_active == True,
-                )
-                .first()
-            )
-
-            if prompt and prompt.content:
-                _classification_prompt_cache[prompt_name] = prompt.content
-                logger.info(f"[CLASSIFY] Loaded prompt '{prompt_name}' from DB (v{prompt.version})")
-                return prompt.content
-        finally:
-            db.close()
+        content = get_prompt_registry().get_any(prompt_name)
+        if content:
+            return content
     except Exception as e:
         logger.warning(f"[CLASSIFY] Failed to load prompt '{prompt_name}' from DB: {e}")
 
@@ -267,8 +245,7 @@ def get_classification_prompt(prompt_name: str = "classification_system_prompt")
     }
 
     if prompt_name in fallback:
-        _classification_prompt_cache[prompt_name] = fallback[prompt_name]
-        logger.info(f"[CLASSIFY] Using hardcoded fallback for '{prompt_name}'")
+        logger.debug(f"[CLASSIFY] Using hardcoded fallback for '{prompt_name}'")
         return fallback[prompt_name]
 
     # If not a known prompt, return the system prompt as default
@@ -278,7 +255,7 @@ def get_classification_prompt(prompt_name: str = "classification_system_prompt")
 
 def clear_classification_prompt_cache() -> None:
     """Clear the prompt cache to force reload from DB."""
-    _classification_prompt_cache.clear()
+    invalidate_prompt_registry()
     logger.info("[CLASSIFY] Prompt cache cleared")
 
 
@@ -375,7 +352,8 @@ def _classify_openai(
         if not model.startswith("gpt-5"):
             create_kwargs["temperature"] = 0.2
 
-        response = client.chat.completions.create(**create_kwargs)
+        with llm_permit("openai", model, estimate_tokens(system_prompt, user_prompt)):
+            response = client.chat.completions.create(**create_kwargs)
 
         content = response.choices[0].message.content.strip()
         return _parse_llm_response(content)
@@ -420,7 +398,8 @@ def _classify_gemini(
             },
         )
 
-        response = gemini_model.generate_content(user_prompt)
+        with llm_permit("google", resolved_model, estimate_tokens(system_prompt, user_prompt)):
+            response = gemini_model.generate_content(user_prompt)
         content = response.text.strip()
         return _parse_llm_response(content)
 
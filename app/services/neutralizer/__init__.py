@@ -12,25 +12,46 @@ Removes manipulative language and produces:
 - Transparency spans with what was removed/changed and why
 
 The NeutralizerProvider is an abstraction for LLM integration.
-A mock provider is included for deterministic testing.
+Implementations (OpenAI, Gemini, Anthropic and a deterministic mock for
+testing) live in the providers subpackage and are imported on first use.
 """
 
+import json
 import logging
 import os
 import re
 import uuid
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from typing import Any
 
 from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app import models
 from app.config import get_settings
+from app.logging_config import log_llm_call, record_llm_usage
 from app.models import PipelineStage, PipelineStatus, SpanAction, SpanReason
 from app.services.auditor import Auditor, AuditVerdict
+from app.services.neutralizer.chunking import ArticleChunker
+from app.services.neutralizer.phrase_locator import BodyIndex, normalize_whitespace
+from app.services.neutralizer.providers import LAZY_EXPORTS, PROVIDERS, load_export, load_provider_class
+from app.services.neutralizer.spans import BodyAnalysis
+from app.services.neutralizer.streaming import (
+    GARBLED_PATTERN_LIMIT,
+    StreamAborted,
+    StreamGuard,
+    count_broken_grammar,
+    stream_anthropic_message,
+    stream_gemini_generate,
+    stream_openai_chat,
+    streaming_settings,
+)
+from app.services.prompt_registry import get_prompt_registry, invalidate_prompt_registry
+from app.services.resilience import OUTCOME_ERROR, LLMPermit, estimate_tokens, llm_permit
+from app.storage.base import compute_content_hash
 from app.storage.factory import get_storage_provider
 
 logger = logging.getLogger(__name__)
@@ -132,7 +153,9 @@ class NeutralizerProvider(ABC):
         pass
 
     @abstractmethod
-    def _neutralize_detail_full(self, body: str, title: str = None) -> DetailFullResult:
+    def _neutralize_detail_full(
+        self, body: str, title: str = None, feed_category: str | None = None
+    ) -> DetailFullResult:
         """
         Filter an article body to produce detail_full (Call 1: Filter & Track).
 
@@ -142,6 +165,7 @@ class NeutralizerProvider(ABC):
         Args:
             body: The original article body text to filter
             title: The original article title (for headline manipulation detection)
+            feed_category: Article genre for content-type-aware span detection
 
         Returns:
             DetailFullResult containing:
@@ -187,349 +211,91 @@ class NeutralizerProvider(ABC):
         """
         pass
 
-
-# -----------------------------------------------------------------------------
-# Mock provider for testing
-# -----------------------------------------------------------------------------
-
-# Manipulative patterns to detect (for mock)
-MANIPULATIVE_PATTERNS = {
-    SpanReason.CLICKBAIT: [
-        r"\b(shocking|unbelievable|you won\'t believe|mind-blowing|jaw-dropping)\b",
-        r"\b(must see|must read|can\'t miss|don\'t miss)\b",
-        r"\b(secret|hidden|exposed|revealed)\b",
-        r"\b(stunning|explosive|bombshell)\b",
-    ],
-    SpanReason.URGENCY_INFLATION: [
-        r"\b(breaking|urgent|just in|developing|happening now)\b",
-        r"\b(alert|emergency|crisis|chaos)\b",
-        r"\b(grinds to a halt|comes to a standstill|at a standstill)\b",
-        r"\b(huge delays|massive delays|major delays)\b",
-        r"\bROAD CLOSED\b",  # All-caps urgency
-        r"\b[A-Z]{4,}\s+[A-Z]{4,}\b",  # Consecutive all-caps words (e.g., "ROAD CLOSED")
-    ],
-    SpanReason.EMOTIONAL_TRIGGER: [
-        r"\b(outrage|fury|furious|enraged|livid)\b",
-        r"\b(slams|blasts|destroys|demolishes|eviscerates)\b",
-        r"\b(heartbreaking|devastating|horrifying|terrifying)\b",
-        r"\b(horror|nightmare|nightmare scenario)\b",
-        r"\bhorror\s+\w+\b",  # "horror smash", "horror crash", etc.
-        r"\b(sparking|sparks|sparked)\s+(huge|massive|widespread|major)\b",
-    ],
-    SpanReason.SELLING: [
-        r"\b(exclusive|insider|behind the scenes)\b",
-        r"\b(viral|trending|everyone is talking)\b",
-    ],
-    SpanReason.AGENDA_SIGNALING: [
-        r"\b(radical|extremist|dangerous)\b",
-        r"\b(the truth about|what they don\'t want you to know)\b",
-    ],
-    SpanReason.RHETORICAL_FRAMING: [
-        r"\b(some say|critics say|experts warn)\b",
-        r"\b(could|might|may|potentially)\s+(be\s+)?(devastating|catastrophic|huge)\b",
-    ],
-}
-
-# Replacements for common patterns
-REPLACEMENTS = {
-    "shocking": "notable",
-    "slams": "criticizes",
-    "blasts": "criticizes",
-    "destroys": "challenges",
-    "demolishes": "disputes",
-    "furious": "concerned",
-    "outrage": "disagreement",
-    "breaking": "",
-    "urgent": "",
-    "just in": "",
-    "must see": "",
-    "must read": "",
-    "horror": "",
-    "nightmare": "",
-    "stunning": "notable",
-    "explosive": "",
-    "bombshell": "",
-    "grinds to a halt": "stops",
-    "comes to a standstill": "stops",
-    "huge delays": "delays",
-    "massive delays": "delays",
-    "major delays": "delays",
-    "road closed": "road closure",
-}
-
-
-class MockNeutralizerProvider(NeutralizerProvider):
-    """
-    Deterministic mock provider for testing.
-    Uses pattern matching to detect and replace manipulative language.
-    """
-
-    @property
-    def name(self) -> str:
-        return "mock"
-
-    @property
-    def model_name(self) -> str:
-        return "mock-v1"
-
-    def _find_spans(self, text: str, field: str) -> list[TransparencySpan]:
-        """Find manipulative spans in text."""
-        if not text:
-            return []
-
-        spans = []
-        text_lower = text.lower()
-
-        for reason, patterns in MANIPULATIVE_PATTERNS.items():
-            for pattern in patterns:
-                for match in re.finditer(pattern, text_lower, re.IGNORECASE):
-                    original = text[match.start() : match.end()]
-                    replacement = REPLACEMENTS.get(original.lower())
-
-                    if replacement is not None:
-                        action = SpanAction.REPLACED if replacement else SpanAction.REMOVED
-                    else:
-                        action = SpanAction.SOFTENED
-                        replacement = None
-
-                    spans.append(
-                        TransparencySpan(
-                            field=field,
-                            start_char=match.start(),
-                            end_char=match.end(),
-                            original_text=original,
-                            action=action,
-                            reason=reason,
-                            replacement_text=replacement,
-                        )
-                    )
-
-        # Sort by position and remove overlaps
-        spans.sort(key=lambda s: s.start_char)
-        non_overlapping = []
-        last_end = -1
-        for span in spans:
-            if span.start_char >= last_end:
-                non_overlapping.append(span)
-                last_end = span.end_char
-
-        return non_overlapping
-
-    def _neutralize_text(self, text: str, spans: list[TransparencySpan]) -> str:
-        """Apply span replacements to text."""
-        if not spans:
-            return text
-
-        result = []
-        last_end = 0
-
-        for span in sorted(spans, key=lambda s: s.start_char):
-            # Add text before this span
-            result.append(text[last_end : span.start_char])
-
-            # Add replacement (or nothing if removed)
-            if span.replacement_text:
-                result.append(span.replacement_text)
-
-            last_end = span.end_char
-
-        # Add remaining text
-        result.append(text[last_end:])
-
-        # Clean up extra spaces
-        neutralized = " ".join("".join(result).split())
-        return neutralized
-
-    def neutralize(
-        self,
-        title: str,
-        description: str | None,
-        body: str | None,
-        repair_instructions: str | None = None,
-    ) -> NeutralizationResult:
-        """Neutralize content using pattern matching."""
-        # Note: repair_instructions ignored in mock provider
-        # Find spans in each field
-        title_spans = self._find_spans(title, "title")
-        desc_spans = self._find_spans(description or "", "description") if description else []
-        body_spans = self._find_spans(body or "", "body") if body else []
-
-        all_spans = title_spans + desc_spans + body_spans
-        has_manipulative = len(all_spans) > 0
-
-        # Neutralize title
-        neutral_headline = self._neutralize_text(title, title_spans)
-        # Ensure no trailing punctuation issues
-        neutral_headline = neutral_headline.strip().rstrip(":").strip()
-
-        # Neutralize description for summary
-        neutral_desc = self._neutralize_text(description or "", desc_spans) if description else ""
-
-        # Build summary (2-3 lines max)
-        if neutral_desc:
-            neutral_summary = neutral_desc[:500]
-        elif body:
-            neutral_body = self._neutralize_text(body, body_spans)
-            neutral_summary = neutral_body[:500]
-        else:
-            neutral_summary = neutral_headline
-
-        # Truncate to 2-3 sentences
-        sentences = re.split(r"(?<=[.!?])\s+", neutral_summary)
-        neutral_summary = " ".join(sentences[:3])
-
-        return NeutralizationResult(
-            feed_title=neutral_headline,
-            feed_summary=neutral_summary,
-            detail_title=None,  # Not generated by mock provider
-            detail_brief=None,  # Not generated by mock provider
-            detail_full=None,  # Not generated by mock provider
-            has_manipulative_content=has_manipulative,
-            spans=all_spans,
-            removed_phrases=[s.original_text for s in all_spans],  # Extract from spans
-        )
-
-    def _neutralize_detail_full(self, body: str, title: str = None) -> DetailFullResult:
+    def neutralize_detail_full(
+        self, body: str, title: str = None, feed_category: str | None = None
+    ) -> DetailFullResult:
         """
-        Filter an article body using pattern matching (mock implementation).
+        Run Call 1 for the service.
 
-        Uses the same pattern matching logic as neutralize() but focused on body text.
-        Now also detects spans in title for headline manipulation.
+        With DETAIL_FULL_MODE="spans", only span detection goes to the LLM and
+        detail_full is rebuilt locally from the body (see
+        reconstruct_detail_full); if the rebuilt text fails its guards, the
+        synthesis path below runs instead.
 
-        Args:
-            body: Article body text
-            title: Original article title (for headline manipulation detection)
+        With DETAIL_FULL_CHUNKING on, long bodies are split at paragraph
+        boundaries and each chunk goes through _neutralize_detail_full
+        concurrently (see neutralize_detail_full_chunked). Otherwise this is
+        a single _neutralize_detail_full call.
         """
-        if not body:
-            return DetailFullResult(detail_full="", spans=[])
-
-        # Find spans in title if provided
-        title_spans = self._find_spans(title, "title") if title else []
-
-        # Find spans in body
-        body_spans = self._find_spans(body, "body")
-
-        # Combine spans (title first, then body)
-        all_spans = title_spans + body_spans
+        settings = get_settings()
+        if body and settings.DETAIL_FULL_MODE == "spans":
+            result = reconstruct_detail_full(self, body, title, feed_category)
+            if result is not None:
+                return result
+        if body and settings.DETAIL_FULL_CHUNKING:
+            chunker = ArticleChunker(chunk_size=settings.DETAIL_FULL_CHUNK_SIZE, overlap_size=0)
+            if chunker.needs_chunking(body):
+                return neutralize_detail_full_chunked(
+                    self, body, chunker, title, feed_category, max_workers=settings.DETAIL_FULL_CHUNK_CONCURRENCY
+                )
+        return self._neutralize_detail_full(body, title=title, feed_category=feed_category)
 
-        # Apply neutralization to body only
-        filtered_body = self._neutralize_text(body, body_spans)
+    def _neutralize_brief_and_feed_outputs(self, body: str) -> tuple[str, dict]:
+        """
+        Produce detail_brief and the feed outputs in one structured call (Calls 2 + 3 fused).
 
-        return DetailFullResult(
-            detail_full=filtered_body,
-            spans=all_spans,
-        )
+        Providers that support it send build_fused_brief_feed_prompt and pass
+        the JSON reply to finish_fused_brief_feed. The default raises
+        NotImplementedError, which makes neutralize_brief_and_feed use the
+        separate calls.
 
-    def _neutralize_detail_brief(self, body: str) -> str:
+        Returns:
+            (detail_brief, feed_outputs) in the same shapes as
+            _neutralize_detail_brief and _neutralize_feed_outputs
         """
-        Synthesize an article body into a brief (mock implementation).
+        raise NotImplementedError
 
-        Creates a simple 3-paragraph summary by extracting key sentences.
-        This is a deterministic mock for testing purposes.
+    def neutralize_brief_and_feed(self, body: str) -> tuple[str, dict]:
         """
-        if not body:
-            return ""
-
-        # Split into sentences
-        sentences = re.split(r"(?<=[.!?])\s+", body.strip())
-        if not sentences:
-            return ""
+        Run Calls 2 and 3 for the service.
 
-        # Filter out very short sentences and apply neutralization
-        body_spans = self._find_spans(body, "body")
-        filtered_body = self._neutralize_text(body, body_spans)
-        filtered_sentences = re.split(r"(?<=[.!?])\s+", filtered_body.strip())
-        filtered_sentences = [s for s in filtered_sentences if len(s) > 20]
-
-        if not filtered_sentences:
-            return filtered_body[:500] if filtered_body else ""
-
-        # Build 3-paragraph brief
-        paragraphs = []
-
-        # Paragraph 1: Grounding (first 2-3 sentences)
-        grounding = " ".join(filtered_sentences[: min(3, len(filtered_sentences))])
-        paragraphs.append(grounding)
-
-        # Paragraph 2: Context (next 2-3 sentences if available)
-        if len(filtered_sentences) > 3:
-            context = " ".join(filtered_sentences[3 : min(6, len(filtered_sentences))])
-            paragraphs.append(context)
-
-        # Paragraph 3: Remaining (if available)
-        if len(filtered_sentences) > 6:
-            remaining = " ".join(filtered_sentences[6 : min(9, len(filtered_sentences))])
-            paragraphs.append(remaining)
-
-        return "\n\n".join(paragraphs)
-
-    def _neutralize_feed_outputs(self, body: str, detail_brief: str) -> dict:
+        With FUSED_BRIEF_FEED_CALL on, one structured call returns the brief
+        and the feed outputs together, saving a sequential round trip. If the
+        provider has no fused call or the fused reply is unusable, this falls
+        back to _neutralize_detail_brief followed by _neutralize_feed_outputs.
         """
-        Generate compressed feed outputs (mock implementation).
+        if body and get_settings().FUSED_BRIEF_FEED_CALL:
+            try:
+                return self._neutralize_brief_and_feed_outputs(body)
+            except NotImplementedError:
+                pass
+            except NeutralizationResponseError as e:
+                logger.warning(f"Fused brief/feed call failed, using separate calls: {e}")
+
+        detail_brief = self._neutralize_detail_brief(body) if body else ""
+        return detail_brief, self._neutralize_feed_outputs(body or "", detail_brief)
 
-        Creates simple feed outputs by extracting from the original content.
-        This is a deterministic mock for testing purposes.
+    def _detect_title_spans(self, title: str, feed_category: str | None = None) -> list[TransparencySpan]:
         """
-        if not body and not detail_brief:
-            return {
-                "feed_title": "",
-                "feed_summary": "",
-                "detail_title": "",
-                "section": "world",
-            }
+        Detect manipulative spans in a headline only.
 
-        # Use detail_brief if available, otherwise use body
-        source = detail_brief or body or ""
-
-        # Split into sentences for processing
-        sentences = re.split(r"(?<=[.!?])\s+", source.strip())
-        sentences = [s.strip() for s in sentences if s.strip()]
-
-        # Apply neutralization to the source
-        body_spans = self._find_spans(source, "body")
-        filtered_source = self._neutralize_text(source, body_spans)
-        filtered_sentences = re.split(r"(?<=[.!?])\s+", filtered_source.strip())
-        filtered_sentences = [s.strip() for s in filtered_sentences if s.strip()]
-
-        # Generate feed_title: Extract key phrase from first sentence, max 12 words
-        feed_title = ""
-        if filtered_sentences:
-            first_sentence = filtered_sentences[0]
-            words = first_sentence.split()
-            # Take first 6-12 words, stopping at natural break
-            feed_title_words = words[: min(6, len(words))]
-            feed_title = " ".join(feed_title_words)
-            # Remove trailing punctuation except periods
-            feed_title = feed_title.rstrip(",:;")
-            if not feed_title.endswith("."):
-                feed_title = feed_title.rstrip(".")
-
-        # Generate feed_summary: First 1-2 sentences, max ~120 chars
-        feed_summary = ""
-        if filtered_sentences:
-            feed_summary = filtered_sentences[0]
-            if len(filtered_sentences) > 1 and len(feed_summary) < 60:
-                combined = f"{filtered_sentences[0]} {filtered_sentences[1]}"
-                if len(combined) <= 120:
-                    feed_summary = combined
-
-        # Generate detail_title: Slightly longer version of feed_title
-        detail_title = ""
-        if filtered_sentences:
-            first_sentence = filtered_sentences[0]
-            words = first_sentence.split()
-            # Take up to 15 words for detail_title
-            detail_title_words = words[: min(15, len(words))]
-            detail_title = " ".join(detail_title_words)
-            # Clean up punctuation
-            detail_title = detail_title.rstrip(",:;")
+        Used for syndicated copies that share a body with an already-neutralized
+        story: the body outputs are reused and only the headline is scanned.
 
-        return {
-            "feed_title": feed_title,
-            "feed_summary": feed_summary,
-            "detail_title": detail_title,
-            "section": "world",  # Mock always returns world (LLM providers do real classification)
-        }
+        Returns:
+            List of TransparencySpan with field="title"
+        """
+        if not title:
+            return []
+        spans = _detect_spans_with_config(
+            body="",
+            provider_api_key=getattr(self, "_api_key", None),
+            provider_type=self.name,
+            provider_model=self.model_name,
+            title=title,
+            feed_category=feed_category,
+        )
+        return [s for s in spans if s.field == "title"]
 
 
 # -----------------------------------------------------------------------------
@@ -1625,42 +1391,14 @@ def get_model_agnostic_prompt(name: str, default: str) -> str:
 
     Used for prompts that work across all models (e.g., multi-pass detection prompts).
     """
-    global _prompt_cache
-
-    cache_key = f"{name}:agnostic"
-
-    # Return from cache if available
-    if cache_key in _prompt_cache:
-        return _prompt_cache[cache_key]
-
-    # Load from DB
     try:
-        from app import models
-        from app.database import SessionLocal
-
-        db = SessionLocal()
-        try:
-            prompt = (
-                db.query(models.Prompt)
-                .filter(
-                    models.Prompt.name == name,
-                    models.Prompt.model.is_(None),  # model=NULL (agnostic)
-                    models.Prompt.is_active == True,
-                )
-                .first()
-            )
-
-            if prompt:
-                _prompt_cache[cache_key] = prompt.content
-                return prompt.content
-        finally:
-            db.close()
+        content = get_prompt_registry().get(name, None)
     except Exception as e:
         logger.warning(f"Failed to load model-agnostic prompt '{name}' from DB: {e}")
+        content = None
 
     # Use default if prompt not found
-    _prompt_cache[cache_key] = default
-    return default
+    return content if content is not None else default
 
 
 def build_content_type_hint(feed_category: str | None) -> str:
@@ -1734,13 +1472,6 @@ def build_span_detection_prompt(body: str) -> str:
     return template.format(body=wrapped_body)
 
 
-def _normalize_whitespace(text: str) -> str:
-    """Collapse all whitespace runs to single spaces and strip boundary punctuation."""
-    import re
-
-    return re.sub(r"\s+", " ", text).strip().strip(".,;:!?\"'")
-
-
 def _fuzzy_find_in_body(phrase: str, body: str, start: int = 0) -> tuple[int, int] | None:
     """
     Find a fuzzy match for phrase in body using word-token similarity.
@@ -1748,57 +1479,17 @@ def _fuzzy_find_in_body(phrase: str, body: str, start: int = 0) -> tuple[int, in
     Only activates for phrases >15 chars to avoid false matches on short words.
     Uses difflib.SequenceMatcher with 0.85 threshold on word tokens.
 
-    Returns (start_pos, end_pos) in body, or None if no match found.
+    Returns (start_pos, end_pos) in body, or None if no match found. Callers
+    matching many phrases against one body should reuse a BodyIndex instead.
     """
-    from difflib import SequenceMatcher
-
-    if len(phrase) <= 15:
-        return None
-
-    phrase_words = phrase.lower().split()
-    if len(phrase_words) < 2:
-        return None
-
-    body_lower = body.lower()
-    body_words_with_pos: list[tuple[str, int, int]] = []
-    i = start
-    while i < len(body):
-        if body_lower[i].isalnum():
-            j = i
-            while j < len(body) and (body_lower[j].isalnum() or body_lower[j] == "'"):
-                j += 1
-            body_words_with_pos.append((body_lower[i:j], i, j))
-            i = j
-        else:
-            i += 1
-
-    if not body_words_with_pos:
-        return None
-
-    # Sliding window over body words
-    window_size = len(phrase_words)
-    best_ratio = 0.0
-    best_start = -1
-    best_end = -1
-
-    for wi in range(len(body_words_with_pos) - window_size + 1):
-        window_words = [w[0] for w in body_words_with_pos[wi : wi + window_size]]
-        window_text = " ".join(window_words)
-        phrase_text = " ".join(phrase_words)
-
-        ratio = SequenceMatcher(None, phrase_text, window_text).ratio()
-        if ratio > best_ratio:
-            best_ratio = ratio
-            best_start = body_words_with_pos[wi][1]
-            best_end = body_words_with_pos[wi + window_size - 1][2]
+    return BodyIndex(body, start).fuzzy_find(phrase)
 
-    if best_ratio >= 0.85:
-        return best_start, best_end
 
-    return None
-
-
-def find_phrase_positions(body: str, llm_phrases: list) -> list[TransparencySpan]:
+def find_phrase_positions(
+    body: str,
+    llm_phrases: list,
+    analysis: BodyAnalysis | None = None,
+) -> list[TransparencySpan]:
     """
     Find character positions for LLM-identified manipulative phrases.
 
@@ -1812,9 +1503,14 @@ def find_phrase_positions(body: str, llm_phrases: list) -> list[TransparencySpan
     3. Whitespace-normalized match (collapse whitespace, strip boundary punctuation)
     4. Word-boundary fuzzy match (phrases >15 chars, difflib ratio >= 0.85)
 
+    All tiers resolve against one BodyAnalysis, so the body is lowercased,
+    normalized and tokenized once per call, or once per pass when the
+    caller passes the analysis it also hands to the span filters.
+
     Args:
         body: The original article body text
         llm_phrases: List of dicts from LLM with {phrase, reason, action, replacement}
+        analysis: Precomputed BodyAnalysis for body (optional)
 
     Returns:
         List of TransparencySpan objects with accurate character positions
@@ -1822,12 +1518,10 @@ def find_phrase_positions(body: str, llm_phrases: list) -> list[TransparencySpan
     if not body or not llm_phrases:
         return []
 
-    import re
-
     spans = []
-    body_lower = body.lower()
-    # Pre-compute whitespace-normalized body for tier 3
-    body_ws_normalized = _normalize_whitespace(body_lower)
+    # Lowercased/normalized body and word tokens, built once and shared by all phrases
+    analysis = BodyAnalysis.of(body, analysis)
+    body_lower = analysis.lower
 
     for phrase_data in llm_phrases:
         # Handle case where phrase_data is a string instead of a dict
@@ -1879,21 +1573,14 @@ def find_phrase_positions(body: str, llm_phrases: list) -> list[TransparencySpan
 
             # Tier 3: Whitespace-normalized match
             if pos == -1:
-                phrase_ws_normalized = _normalize_whitespace(phrase_lower)
+                phrase_ws_normalized = normalize_whitespace(phrase_lower)
                 if phrase_ws_normalized and phrase_ws_normalized != phrase_lower:
-                    # Search in normalized body — but we need the position in the original body
-                    norm_pos = body_ws_normalized.find(phrase_ws_normalized, 0)
-                    if norm_pos != -1:
-                        # Map normalized position back to original body using regex
-                        # Build a regex that matches the phrase with flexible whitespace
-                        escaped_words = [re.escape(w) for w in phrase_ws_normalized.split()]
-                        if escaped_words:
-                            pattern = r"\s+".join(escaped_words)
-                            match = re.search(pattern, body_lower[start:], re.IGNORECASE)
-                            if match:
-                                pos = start + match.start()
-                                matched_text = body[pos : pos + match.end() - match.start()]
-                                match_tier = "whitespace_normalized"
+                    # Search the normalized body and map the hit back through the offset map
+                    found = analysis.find_normalized(phrase_ws_normalized, start)
+                    if found:
+                        pos = found[0]
+                        matched_text = body[pos : found[1]]
+                        match_tier = "whitespace_normalized"
 
             if pos == -1:
                 break
@@ -1922,7 +1609,7 @@ def find_phrase_positions(body: str, llm_phrases: list) -> list[TransparencySpan
 
         # Tier 4: Word-boundary fuzzy match (only if no matches found above)
         if not found_any:
-            fuzzy_result = _fuzzy_find_in_body(phrase, body)
+            fuzzy_result = analysis.fuzzy_find(phrase)
             if fuzzy_result:
                 fstart, fend = fuzzy_result
                 matched_text = body[fstart:fend]
@@ -1953,136 +1640,32 @@ def find_phrase_positions(body: str, llm_phrases: list) -> list[TransparencySpan
     return non_overlapping
 
 
-# Quote character pairs for matching (opening -> closing)
-# Using Unicode escapes to ensure curly quotes are correctly defined
-QUOTE_PAIRS = {
-    '"': '"',  # Straight double quote (U+0022)
-    "\u201c": "\u201d",  # Curly double quotes: " -> " (U+201C -> U+201D)
-    "'": "'",  # Straight single quote (U+0027)
-    "\u2018": "\u2019",  # Curly single quotes: ' -> ' (U+2018 -> U+2019)
-}
-
-# All characters that can open a quote
-QUOTE_CHARS_OPEN = set(QUOTE_PAIRS.keys())
-
-# All characters that can close a quote
-QUOTE_CHARS_CLOSE = set(QUOTE_PAIRS.values())
-
-
-def is_contraction_apostrophe(body: str, pos: int) -> bool:
-    """
-    Check if apostrophe at position is part of a contraction, not a quote boundary.
-
-    Contractions have letters on both sides of the apostrophe, like:
-    - won't, can't, don't (n't pattern)
-    - it's, he's, she's ('s pattern)
-    - they're, we're, you're ('re pattern)
-    - I've, you've, we've ('ve pattern)
-    - I'll, you'll, we'll ('ll pattern)
-    - I'd, you'd, we'd ('d pattern)
-
-    Quote boundaries typically have space or punctuation on at least one side.
-
-    Note: This function intentionally does NOT detect possessives like "James' dog"
-    because they are ambiguous with closing quotes like 'shocking'. Single quotes
-    at word boundaries should be treated as potential quote marks for proper pairing.
-    """
-    if pos <= 0 or pos >= len(body) - 1:
-        return False
-
-    char_before = body[pos - 1]
-    char_after = body[pos + 1]
-
-    # Core rule: letters on both sides = contraction
-    # Example: "won't" -> 'n' + "'" + 't'
-    if char_before.isalpha() and char_after.isalpha():
-        return True
-
-    return False
-
-
-def filter_spans_in_quotes(body: str, spans: list[TransparencySpan]) -> list[TransparencySpan]:
-    """
-    Reclassify spans inside quotation marks as selective_quoting.
-
-    Instead of removing spans in quotes (which killed recall), reclassifies them
-    with reason=SELECTIVE_QUOTING and action=SOFTENED. This preserves the span
-    for recall while giving users insight into editorial quote selection.
-
-    Handles multiple quote types:
-    - Straight double quotes: "..."
-    - Curly double quotes: "..."
-    - Straight single quotes: '...'
-    - Curly single quotes: '...'
-
-    Distinguishes between apostrophes used as quote marks vs contractions:
-    - Contractions: won't, it's, they're (letters on both sides)
-    - Quotes: 'totally shocking' (space before opening, space after closing)
-    """
-    if not body or not spans:
-        return spans
-
-    # Find all quote boundaries using a stack for nested quotes
-    quote_ranges = []
-    stack = []  # Track (open_char, start_position)
-
-    for i, char in enumerate(body):
-        # Skip apostrophes that are part of contractions (not quote boundaries)
-        if char in ("'", "'") and is_contraction_apostrophe(body, i):
-            continue
-
-        if char in QUOTE_CHARS_OPEN:
-            # Check if this is an opening quote (not a closing one for the same type)
-            # Handle ambiguous chars like " and ' that serve as both open and close
-            if char in ('"', "'"):
-                # Ambiguous quote - toggle behavior
-                if stack and stack[-1][0] == char:
-                    # Same quote type on stack, treat as closing
-                    open_char, start = stack.pop()
-                    quote_ranges.append((start, i + 1))
-                else:
-                    # New quote opening
-                    stack.append((char, i))
-            else:
-                # Unambiguous opening quote (curly open quotes)
-                stack.append((char, i))
-        elif char in QUOTE_CHARS_CLOSE and char not in QUOTE_CHARS_OPEN:
-            # Unambiguous closing quote (curly close quotes)
-            if stack:
-                open_char, start = stack[-1]
-                expected_close = QUOTE_PAIRS.get(open_char)
-                if expected_close == char:
-                    stack.pop()
-                    quote_ranges.append((start, i + 1))
-
-    if not quote_ranges:
-        return spans
-
-    # Reclassify spans inside quotes as selective_quoting
-    result = []
-    reclassified_count = 0
-    for span in spans:
-        inside_quote = any(start <= span.start_char and span.end_char <= end for start, end in quote_ranges)
-        if inside_quote:
-            reclassified = TransparencySpan(
-                field=span.field,
-                start_char=span.start_char,
-                end_char=span.end_char,
-                original_text=span.original_text,
-                action=SpanAction.SOFTENED,
-                reason=SpanReason.SELECTIVE_QUOTING,
-                replacement_text=span.replacement_text,
-            )
-            result.append(reclassified)
-            reclassified_count += 1
-        else:
-            result.append(span)
+# Quote scanning and the per-body analysis live in spans.py; re-exported here
+# for existing callers. filter_spans_in_quotes is defined below as a wrapper.
+from app.services.neutralizer.spans import (
+    QUOTE_CHARS_CLOSE as QUOTE_CHARS_CLOSE,
+)
+from app.services.neutralizer.spans import (
+    QUOTE_CHARS_OPEN as QUOTE_CHARS_OPEN,
+)
+from app.services.neutralizer.spans import (
+    QUOTE_PAIRS as QUOTE_PAIRS,
+)
+from app.services.neutralizer.spans import (
+    filter_spans_in_quotes as _filter_spans_in_quotes_from_spans,
+)
+from app.services.neutralizer.spans import (
+    is_contraction_apostrophe as is_contraction_apostrophe,
+)
 
-    if reclassified_count > 0:
-        reclassified_texts = [s.original_text for s in result if s.reason == SpanReason.SELECTIVE_QUOTING]
-        logger.info(f"[SPAN_RECALL_DEBUG] Quote filter reclassified {reclassified_count}: {reclassified_texts}")
 
-    return result
+def filter_spans_in_quotes(
+    body: str,
+    spans: list[TransparencySpan],
+    analysis: BodyAnalysis | None = None,
+) -> list[TransparencySpan]:
+    """Delegate to the canonical filter_spans_in_quotes in spans.py."""
+    return _filter_spans_in_quotes_from_spans(body, spans, analysis=analysis)
 
 
 # Import FALSE_POSITIVE_PHRASES and filter_false_positives from canonical location (spans.py)
@@ -2825,11 +2408,6 @@ If feed_summary repeats the title, REWRITE to add new information instead."""
 # Prompt loading from DB - DB is source of truth for model selection
 # -----------------------------------------------------------------------------
 
-_prompt_cache: dict[str, str] = {}
-_prompt_cache_time: datetime | None = None
-_active_model_cache: str | None = None
-PROMPT_CACHE_TTL_SECONDS = 60  # Refresh from DB every 60 seconds
-
 
 class NeutralizerConfigError(Exception):
     """Raised when neutralizer is misconfigured (no prompts, no API key, etc.)."""
@@ -2844,49 +2422,22 @@ def get_active_model() -> str:
     The active model is determined by the active system_prompt row.
     Raises NeutralizerConfigError if no active system_prompt found.
     """
-    global _active_model_cache, _prompt_cache_time
-
-    # Check if cache is stale
-    now = datetime.now(UTC)
-    if _prompt_cache_time is None or (now - _prompt_cache_time).total_seconds() > PROMPT_CACHE_TTL_SECONDS:
-        _active_model_cache = None
-        _prompt_cache_time = now
-
-    if _active_model_cache is not None:
-        return _active_model_cache
-
     try:
-        from app import models
-        from app.database import SessionLocal
-
-        db = SessionLocal()
-        try:
-            # Find the active system_prompt - its model field determines which model to use
-            prompt = (
-                db.query(models.Prompt)
-                .filter(models.Prompt.name == "system_prompt", models.Prompt.is_active == True)
-                .first()
-            )
+        snapshot = get_prompt_registry().snapshot()
+    except Exception as e:
+        raise NeutralizerConfigError(f"Failed to load active model from database: {e}")
 
-            if not prompt:
-                raise NeutralizerConfigError(
-                    "No active system_prompt found in database. "
-                    "Please create a prompt via PUT /v1/prompts/system_prompt"
-                )
+    if not snapshot.has_system_prompt:
+        raise NeutralizerConfigError(
+            "No active system_prompt found in database. Please create a prompt via PUT /v1/prompts/system_prompt"
+        )
 
-            if not prompt.model:
-                raise NeutralizerConfigError(
-                    "Active system_prompt has no model specified. Please update the prompt with a valid model."
-                )
+    if not snapshot.active_model:
+        raise NeutralizerConfigError(
+            "Active system_prompt has no model specified. Please update the prompt with a valid model."
+        )
 
-            _active_model_cache = prompt.model
-            return prompt.model
-        finally:
-            db.close()
-    except NeutralizerConfigError:
-        raise
-    except Exception as e:
-        raise NeutralizerConfigError(f"Failed to load active model from database: {e}")
+    return snapshot.active_model
 
 
 def get_prompt(name: str, default: str) -> str:
@@ -2894,52 +2445,18 @@ def get_prompt(name: str, default: str) -> str:
     Get a prompt from the database for the active model.
 
     Raises NeutralizerConfigError if no active prompt found.
-    Caches prompts for PROMPT_CACHE_TTL_SECONDS to avoid DB hits on every call.
+    Prompts come from the in-process registry snapshot, so lookups do not hit the DB.
     """
-    global _prompt_cache, _prompt_cache_time
-
-    # Get the active model (this also refreshes cache if stale)
     model = get_active_model()
-
-    # Cache key includes model
-    cache_key = f"{name}:{model}"
-
-    # Return from cache if available
-    if cache_key in _prompt_cache:
-        return _prompt_cache[cache_key]
-
-    # Load from DB
-    try:
-        from app import models
-        from app.database import SessionLocal
-
-        db = SessionLocal()
-        try:
-            prompt = (
-                db.query(models.Prompt)
-                .filter(models.Prompt.name == name, models.Prompt.model == model, models.Prompt.is_active == True)
-                .first()
-            )
-
-            if prompt:
-                _prompt_cache[cache_key] = prompt.content
-                return prompt.content
-        finally:
-            db.close()
-    except Exception as e:
-        logger.warning(f"Failed to load prompt '{name}' for model '{model}' from DB: {e}")
+    content = get_prompt_registry().get(name, model)
 
     # Use default if prompt not found (e.g., user_prompt_template might not be customized)
-    _prompt_cache[cache_key] = default
-    return default
+    return content if content is not None else default
 
 
 def clear_prompt_cache() -> None:
-    """Clear the prompt cache (called when prompts are updated via API)."""
-    global _prompt_cache, _prompt_cache_time, _active_model_cache
-    _prompt_cache = {}
-    _prompt_cache_time = None
-    _active_model_cache = None
+    """Reload prompts on next use (called when prompts are updated via API)."""
+    invalidate_prompt_registry()
 
 
 def get_system_prompt() -> str:
@@ -3145,6 +2662,131 @@ def _validate_feed_outputs(result: dict) -> None:
         logger.warning(f"Garbled feed output detected: {'; '.join(issues)}")
 
 
+# -----------------------------------------------------------------------------
+# Fused brief + feed outputs (Calls 2 and 3 in one request)
+# -----------------------------------------------------------------------------
+
+DEFAULT_FUSED_BRIEF_FEED_PROMPT = """Complete TWO tasks for the same article in a single response.
+
+═══════════════════════════════════════════════════════════════════════════════
+TASK 1: detail_brief
+═══════════════════════════════════════════════════════════════════════════════
+
+{brief_task}
+
+═══════════════════════════════════════════════════════════════════════════════
+TASK 2: feed outputs
+═══════════════════════════════════════════════════════════════════════════════
+
+{feed_task}
+
+═══════════════════════════════════════════════════════════════════════════════
+OUTPUT FORMAT (overrides any output format given above)
+═══════════════════════════════════════════════════════════════════════════════
+
+Write the detail_brief first, then write the feed outputs from that brief and the article.
+Return ONLY a JSON object with exactly these keys:
+{{"detail_brief": "...", "feed_title": "...", "feed_summary": "...", "detail_title": "...", "section": "..."}}
+
+detail_brief is plain prose with paragraphs separated by blank lines (\\n\\n), no headers or bullets."""
+
+
+def get_fused_brief_feed_prompt() -> str:
+    """Get the wrapper template for the fused brief + feed outputs call."""
+    return get_prompt("fused_brief_feed_prompt", DEFAULT_FUSED_BRIEF_FEED_PROMPT)
+
+
+def build_fused_brief_feed_prompt(body: str) -> str:
+    """
+    Build the user prompt for the fused call.
+
+    Embeds the Call 2 and Call 3 prompts unchanged, so edits to either
+    prompt apply to the fused call too. The article is given once, in
+    TASK 1; TASK 2 refers back to it and to the brief being written.
+    """
+    brief_task = build_synthesis_detail_brief_prompt(body)
+    feed_task = build_compression_feed_outputs_prompt(
+        "(the article in TASK 1)", "(the detail_brief you write for TASK 1)"
+    )
+    return get_fused_brief_feed_prompt().format(brief_task=brief_task, feed_task=feed_task)
+
+
+def parse_fused_brief_feed_response(content: str) -> dict:
+    """
+    Parse the JSON object returned by the fused call.
+
+    Raises NeutralizationResponseError if the reply is not a JSON object
+    or has no detail_brief.
+    """
+    try:
+        data = json.loads(_strip_json_code_fence((content or "").strip()))
+    except json.JSONDecodeError as e:
+        raise NeutralizationResponseError(f"Fused brief/feed response is not valid JSON: {e}") from e
+    if not isinstance(data, dict) or not str(data.get("detail_brief") or "").strip():
+        raise NeutralizationResponseError("Fused brief/feed response has no detail_brief")
+    return data
+
+
+FUSED_MAX_REPAIRS = 2
+
+
+def finish_fused_brief_feed(data: dict, repair: Callable[[str, str, str], str]) -> tuple[str, dict]:
+    """
+    Validate and repair a parsed fused reply the same way Calls 2 and 3 do.
+
+    The brief is checked with validate_brief_neutralization and the
+    feed_summary with validate_feed_summary, each repaired up to
+    FUSED_MAX_REPAIRS times with its repair prompt. Then feed_summary is
+    truncated at a sentence boundary and the feed outputs go through
+    _validate_feed_outputs.
+
+    Args:
+        data: Output of parse_fused_brief_feed_response
+        repair: Provider callback (call_type, system_prompt, user_prompt) -> text
+
+    Returns:
+        (detail_brief, feed_outputs)
+    """
+    brief = str(data.get("detail_brief") or "").strip()
+    for attempt in range(FUSED_MAX_REPAIRS):
+        violations = validate_brief_neutralization(brief)
+        if not violations:
+            break
+        logger.warning(f"Brief validation failed (attempt {attempt + 1}/{FUSED_MAX_REPAIRS + 1}): {violations}")
+        brief = repair(
+            "detail_brief_repair", get_article_system_prompt(), build_brief_repair_prompt(brief, violations)
+        ).strip()
+    else:
+        violations = validate_brief_neutralization(brief)
+        if violations:
+            logger.error(f"Brief validation failed after {FUSED_MAX_REPAIRS + 1} attempts: {violations}")
+
+    result = {
+        "feed_title": data.get("feed_title", ""),
+        "feed_summary": data.get("feed_summary", ""),
+        "detail_title": data.get("detail_title", ""),
+        "section": data.get("section", "world"),
+    }
+    for attempt in range(FUSED_MAX_REPAIRS):
+        violations = validate_feed_summary(result["feed_summary"])
+        if not violations:
+            break
+        logger.warning(f"Feed summary validation failed (attempt {attempt + 1}/{FUSED_MAX_REPAIRS + 1}): {violations}")
+        result["feed_summary"] = repair(
+            "feed_summary_repair",
+            "You are a neutral news editor. Return only the rewritten text.",
+            build_feed_summary_repair_prompt(result["feed_summary"], violations),
+        ).strip()
+    else:
+        violations = validate_feed_summary(result["feed_summary"])
+        if violations:
+            logger.error(f"Feed summary validation failed after {FUSED_MAX_REPAIRS + 1} attempts: {violations}")
+
+    result["feed_summary"] = truncate_at_sentence(result["feed_summary"], 130)
+    _validate_feed_outputs(result)
+    return brief, result
+
+
 def build_user_prompt(title: str, description: str | None, body: str | None) -> str:
     """Build the user prompt for neutralization using template from DB."""
     template = get_user_prompt_template()
@@ -3212,18 +2854,241 @@ def parse_llm_response(
     )
 
 
-def detect_spans_via_llm_openai(body: str, api_key: str, model: str) -> list[TransparencySpan]:
+# -----------------------------------------------------------------------------
+# Provider request layout (prompt caching + usage logging)
+# -----------------------------------------------------------------------------
+
+# Every user prompt wraps the article in this tag, and everything before it
+# comes from the (DB-backed) template, so the text up to the tag is identical
+# for every article and can be served from the provider's prompt cache.
+ARTICLE_CONTENT_TAG = "<article_content>"
+ANTHROPIC_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def split_cacheable_prefix(user_prompt: str) -> tuple[str, str]:
     """
-    Detect manipulative spans using OpenAI LLM with context awareness.
+    Split a user prompt into its static template prefix and per-article suffix.
 
-    This is the hybrid approach:
-    1. LLM identifies phrases with semantic understanding (no position tracking)
-    2. find_phrase_positions() locates exact character positions
+    Returns ("", user_prompt) when the prompt has no article tag or nothing
+    static precedes it (e.g. repair prompts built around prior output).
+    """
+    prefix, tag, rest = user_prompt.partition(ARTICLE_CONTENT_TAG)
+    if not tag or not prefix.strip():
+        return "", user_prompt
+    return prefix, tag + rest
 
-    Benefits over pattern-only approach:
-    - Understands "slams" as criticism vs "car slams into wall"
-    - Distinguishes author language from quoted speech
-    - Applies judgment about justified vs inflated urgency
+
+def build_anthropic_cached_request(system: str, user_prompt: str) -> dict[str, Any]:
+    """
+    Lay out an Anthropic request so its static prefix is cacheable.
+
+    The system prompt and the static part of the user prompt each end in a
+    cache_control breakpoint; the article follows as a separate text block.
+    Prefixes below the model's minimum cacheable length are simply not cached.
+    """
+    prefix, suffix = split_cacheable_prefix(user_prompt)
+    if prefix:
+        content: list[dict[str, Any]] = [
+            {"type": "text", "text": prefix, "cache_control": ANTHROPIC_CACHE_CONTROL},
+            {"type": "text", "text": suffix},
+        ]
+    else:
+        content = [{"type": "text", "text": user_prompt}]
+    return {
+        "system": [{"type": "text", "text": system, "cache_control": ANTHROPIC_CACHE_CONTROL}],
+        "messages": [{"role": "user", "content": content}],
+    }
+
+
+def _record_permit_usage(permit: LLMPermit, metrics: dict) -> None:
+    """Reconcile the permit's TPM estimate with the usage the provider reported."""
+    tokens = metrics["tokens_in"] + metrics["tokens_out"]
+    if tokens:
+        permit.record_usage(tokens)
+
+
+# Call types whose reply is a JSON object; streamed replies of these are checked structurally
+JSON_CALL_TYPES = frozenset(
+    {
+        "neutralize",
+        "feed_outputs",
+        "brief_feed_fused",
+        "span_detection",
+        "span_detection_debug",
+        "span_high_recall",
+        "span_adversarial",
+    }
+)
+
+
+def _guarded_llm_call(
+    provider: str,
+    model: str,
+    call_type: str,
+    prompt_tokens: int,
+    max_tokens: int,
+    send: Callable[[], Any],
+    stream: Callable[[StreamGuard], Any],
+) -> Any:
+    """
+    Make one LLM call under a permit with usage logging, streaming it if LLM_STREAMING is on.
+
+    A streamed reply that fails a StreamGuard check is abandoned as soon as
+    the check fails and the call is retried immediately, up to
+    LLM_STREAM_ABORT_RETRIES times; after that StreamAborted is raised to
+    the caller like any other call failure. Each aborted attempt is logged
+    as aborted, counted as an error by the concurrency limiter and charged
+    an estimate of its prompt and partial output against the TPM budget.
+    """
+    streaming, retries = streaming_settings()
+    attempts = retries + 1 if streaming else 1
+    aborted: StreamAborted | None = None
+    for attempt in range(attempts):
+        aborted = None
+        with (
+            llm_permit(provider, model, prompt_tokens + max_tokens) as permit,
+            log_llm_call(provider, model, call_type) as metrics,
+        ):
+            if streaming:
+                try:
+                    response = stream(StreamGuard(expect_json=call_type in JSON_CALL_TYPES))
+                except StreamAborted as e:
+                    aborted = e
+            else:
+                response = send()
+            if aborted is None:
+                record_llm_usage(metrics, response)
+            else:
+                # Streams are abandoned before the provider reports usage
+                metrics["tokens_in"] = prompt_tokens
+                metrics["tokens_out"] = estimate_tokens(aborted.text)
+                metrics["aborted"] = aborted.reason
+                permit.record_outcome(OUTCOME_ERROR)
+            _record_permit_usage(permit, metrics)
+        if aborted is None:
+            return response
+        logger.warning(
+            f"[STREAM] {provider}/{model} {call_type} aborted after {len(aborted.text)} chars "
+            f"({aborted.reason}), attempt {attempt + 1}/{attempts}"
+        )
+    raise aborted
+
+
+def _openai_chat(client: Any, call_type: str, **create_kwargs: Any) -> Any:
+    """
+    Create an OpenAI chat completion with usage logging.
+
+    OpenAI caches prompt prefixes automatically; messages already put the
+    static system prompt and template first. prompt_cache_key groups requests
+    of the same call type so they are routed to the same cache.
+
+    Holds a permit on the shared openai/<model> concurrency limiter for the call.
+    """
+    create_kwargs.setdefault("prompt_cache_key", f"ntrl-{call_type}")
+    model = create_kwargs["model"]
+    return _guarded_llm_call(
+        "openai",
+        model,
+        call_type,
+        estimate_tokens(*(m["content"] for m in create_kwargs.get("messages", []))),
+        create_kwargs.get("max_tokens", 0),
+        send=lambda: client.chat.completions.create(**create_kwargs),
+        stream=lambda guard: stream_openai_chat(client, guard, **create_kwargs),
+    )
+
+
+def _anthropic_message(client: Any, call_type: str, *, system: str, user_prompt: str, **create_kwargs: Any) -> Any:
+    """Create an Anthropic message with cacheable prompt layout, usage logging and a concurrency permit."""
+    model = create_kwargs["model"]
+    request = {**create_kwargs, **build_anthropic_cached_request(system, user_prompt)}
+    return _guarded_llm_call(
+        "anthropic",
+        model,
+        call_type,
+        estimate_tokens(system, user_prompt),
+        create_kwargs.get("max_tokens", 0),
+        send=lambda: client.messages.create(**request),
+        stream=lambda guard: stream_anthropic_message(client, guard, **request),
+    )
+
+
+def _gemini_generate(model_obj: Any, model_name: str, call_type: str, prompt: str) -> Any:
+    """Generate Gemini content with usage logging (implicit prefix caching) and a concurrency permit."""
+    return _guarded_llm_call(
+        "google",
+        model_name,
+        call_type,
+        estimate_tokens(prompt),
+        0,
+        send=lambda: model_obj.generate_content(prompt),
+        stream=lambda guard: stream_gemini_generate(model_obj, guard, prompt),
+    )
+
+
+def _strip_json_code_fence(content: str) -> str:
+    """Extract the JSON from a markdown code block if the model wrapped it in one."""
+    if not content.startswith("```"):
+        return content
+    json_lines = []
+    in_block = False
+    for line in content.split("\n"):
+        if line.startswith("```"):
+            in_block = not in_block
+            continue
+        if in_block:
+            json_lines.append(line)
+    return "\n".join(json_lines)
+
+
+def parse_span_detection_phrases(content: str) -> list:
+    """
+    Parse a span detection response into the LLM's list of phrase dicts.
+
+    Models return either a bare array or an object wrapping it under one of
+    several keys ({"phrases": [...]}, {"spans": [...]}, ...), sometimes inside
+    a markdown code block.
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    import json
+
+    data = json.loads(_strip_json_code_fence(content.strip()))
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        # Try common keys that LLMs use to wrap the array
+        llm_phrases = (
+            data.get("phrases")
+            or data.get("spans")
+            or data.get("manipulative_phrases")
+            or data.get("response")
+            or data.get("output")
+            or data.get("results")
+            or data.get("items")
+            or data.get("data")
+            or []
+        )
+        # If LLM returned a single object with "phrase" key (not wrapped in array)
+        # treat it as a single-element array
+        if not llm_phrases and "phrase" in data:
+            llm_phrases = [data]
+        return llm_phrases
+    return []
+
+
+def detect_spans_via_llm_openai(body: str, api_key: str, model: str) -> list[TransparencySpan]:
+    """
+    Detect manipulative spans using OpenAI LLM with context awareness.
+
+    This is the hybrid approach:
+    1. LLM identifies phrases with semantic understanding (no position tracking)
+    2. find_phrase_positions() locates exact character positions
+
+    Benefits over pattern-only approach:
+    - Understands "slams" as criticism vs "car slams into wall"
+    - Distinguishes author language from quoted speech
+    - Applies judgment about justified vs inflated urgency
 
     Args:
         body: Original article body text
@@ -3258,7 +3123,7 @@ def detect_spans_via_llm_openai(body: str, api_key: str, model: str) -> list[Tra
         }
         if not model.startswith("gpt-5"):
             create_kwargs["temperature"] = 0.3
-        response = client.chat.completions.create(**create_kwargs)
+        response = _openai_chat(client, "span_detection", **create_kwargs)
 
         # Parse LLM response
         content = response.choices[0].message.content.strip()
@@ -3266,28 +3131,7 @@ def detect_spans_via_llm_openai(body: str, api_key: str, model: str) -> list[Tra
 
         # Handle JSON response (might be {"phrases": [...]} or just [...])
         try:
-            data = json.loads(content)
-            if isinstance(data, list):
-                llm_phrases = data
-            elif isinstance(data, dict):
-                # Try common keys that LLMs use to wrap the array
-                llm_phrases = (
-                    data.get("phrases")
-                    or data.get("spans")
-                    or data.get("manipulative_phrases")
-                    or data.get("response")
-                    or data.get("output")
-                    or data.get("results")
-                    or data.get("items")
-                    or data.get("data")
-                    or []
-                )
-                # If LLM returned a single object with "phrase" key (not wrapped in array)
-                # treat it as a single-element array
-                if not llm_phrases and "phrase" in data:
-                    llm_phrases = [data]
-            else:
-                llm_phrases = []
+            llm_phrases = parse_span_detection_phrases(content)
             logger.info(f"[SPAN_DETECTION] LLM returned {len(llm_phrases)} phrases")
             # Log the raw reason values from LLM for debugging
             raw_reasons = [p.get("reason", "N/A") for p in llm_phrases if isinstance(p, dict)]
@@ -3297,9 +3141,10 @@ def detect_spans_via_llm_openai(body: str, api_key: str, model: str) -> list[Tra
             return []
 
         # Convert to TransparencySpans with position matching
-        spans = find_phrase_positions(body, llm_phrases)
+        analysis = BodyAnalysis(body)
+        spans = find_phrase_positions(body, llm_phrases, analysis)
         after_position = len(spans)
-        spans = filter_spans_in_quotes(body, spans)
+        spans = filter_spans_in_quotes(body, spans, analysis)
         after_quotes = len(spans)
         spans = filter_false_positives(spans)
         after_fp = len(spans)
@@ -3356,7 +3201,9 @@ def detect_spans_debug_openai(body: str, api_key: str, model: str) -> SpanDetect
 
         user_prompt = build_span_detection_prompt(body)
 
-        response = client.chat.completions.create(
+        response = _openai_chat(
+            client,
+            "span_detection_debug",
             model=model,
             messages=[
                 {"role": "system", "content": SPAN_DETECTION_SYSTEM_PROMPT},
@@ -3405,17 +3252,17 @@ def detect_spans_debug_openai(body: str, api_key: str, model: str) -> SpanDetect
 
         # Track phrases not found in text
         not_found_in_text = []
-        body_lower = body.lower()
+        analysis = BodyAnalysis(body)
         for phrase_data in llm_phrases:
             phrase = phrase_data.get("phrase", "")
-            if phrase and phrase.lower() not in body_lower and phrase not in body:
+            if phrase and phrase.lower() not in analysis.lower and phrase not in body:
                 not_found_in_text.append(phrase)
 
         # Position matching
-        spans_after_position = find_phrase_positions(body, llm_phrases)
+        spans_after_position = find_phrase_positions(body, llm_phrases, analysis)
 
         # Quote filtering - track what's filtered
-        spans_after_quotes = filter_spans_in_quotes(body, spans_after_position)
+        spans_after_quotes = filter_spans_in_quotes(body, spans_after_position, analysis)
         filtered_by_quotes = [s.original_text for s in spans_after_position if s not in spans_after_quotes]
 
         # False positive filtering - track what's filtered
@@ -3475,7 +3322,7 @@ def detect_spans_via_llm_gemini(body: str, api_key: str, model: str) -> list[Tra
             },
         )
 
-        response = gemini_model.generate_content(user_prompt)
+        response = _gemini_generate(gemini_model, model, "span_detection", user_prompt)
         content = response.text.strip()
 
         # Parse response
@@ -3505,8 +3352,9 @@ def detect_spans_via_llm_gemini(body: str, api_key: str, model: str) -> list[Tra
             logger.warning(f"Gemini span detection returned invalid JSON: {content[:200]}")
             return []
 
-        spans = find_phrase_positions(body, llm_phrases)
-        spans = filter_spans_in_quotes(body, spans)
+        analysis = BodyAnalysis(body)
+        spans = find_phrase_positions(body, llm_phrases, analysis)
+        spans = filter_spans_in_quotes(body, spans, analysis)
         spans = filter_false_positives(spans)
         logger.info(f"Gemini span detection found {len(spans)} manipulative phrases")
         return spans
@@ -3535,60 +3383,27 @@ def detect_spans_via_llm_anthropic(body: str, api_key: str, model: str) -> list[
         # Use minimal system prompt to let the detailed user prompt control detection
         user_prompt = build_span_detection_prompt(body)
 
-        response = client.messages.create(
+        response = _anthropic_message(
+            client,
+            "span_detection",
             model=model,
             max_tokens=4096,
             system=SPAN_DETECTION_SYSTEM_PROMPT,
-            messages=[
-                {"role": "user", "content": user_prompt},
-            ],
+            user_prompt=user_prompt,
         )
 
         content = response.content[0].text.strip()
 
-        # Claude may wrap JSON in markdown code blocks
-        if content.startswith("```"):
-            # Extract JSON from code block
-            lines = content.split("\n")
-            json_lines = []
-            in_block = False
-            for line in lines:
-                if line.startswith("```"):
-                    in_block = not in_block
-                    continue
-                if in_block:
-                    json_lines.append(line)
-            content = "\n".join(json_lines)
-
-        # Parse response
+        # Parse response (Claude may wrap JSON in markdown code blocks)
         try:
-            data = json.loads(content)
-            if isinstance(data, list):
-                llm_phrases = data
-            elif isinstance(data, dict):
-                # Try common keys that LLMs use to wrap the array
-                llm_phrases = (
-                    data.get("phrases")
-                    or data.get("spans")
-                    or data.get("manipulative_phrases")
-                    or data.get("response")
-                    or data.get("output")
-                    or data.get("results")
-                    or data.get("items")
-                    or data.get("data")
-                    or []
-                )
-                # If LLM returned a single object with "phrase" key (not wrapped in array)
-                if not llm_phrases and "phrase" in data:
-                    llm_phrases = [data]
-            else:
-                llm_phrases = []
+            llm_phrases = parse_span_detection_phrases(content)
         except json.JSONDecodeError:
             logger.warning(f"Anthropic span detection returned invalid JSON: {content[:200]}")
             return []
 
-        spans = find_phrase_positions(body, llm_phrases)
-        spans = filter_spans_in_quotes(body, spans)
+        analysis = BodyAnalysis(body)
+        spans = find_phrase_positions(body, llm_phrases, analysis)
+        spans = filter_spans_in_quotes(body, spans, analysis)
         spans = filter_false_positives(spans)
         logger.info(f"Anthropic span detection found {len(spans)} manipulative phrases")
         return spans
@@ -3701,13 +3516,13 @@ def detect_spans_high_recall_anthropic(
         user_prompt = prompt_template.format(body=wrapped_body, content_type_hint=content_type_hint)
         logger.info(f"[SPAN_DETECTION] High-recall pass starting, model={model}, body_length={len(body)}")
 
-        response = client.messages.create(
+        response = _anthropic_message(
+            client,
+            "span_high_recall",
             model=model,
             max_tokens=4096,
             system=HIGH_RECALL_SYSTEM_PROMPT,
-            messages=[
-                {"role": "user", "content": user_prompt},
-            ],
+            user_prompt=user_prompt,
         )
 
         content = response.content[0].text.strip()
@@ -3891,7 +3706,7 @@ def detect_spans_adversarial_pass(
         }
         if not model.startswith("gpt-5"):
             create_kwargs["temperature"] = 0.3
-        response = client.chat.completions.create(**create_kwargs)
+        response = _openai_chat(client, "span_adversarial", **create_kwargs)
 
         content = response.choices[0].message.content.strip()
 
@@ -3932,11 +3747,10 @@ def detect_spans_adversarial_pass(
             f"{len(new_phrases)} new, {len(detected_phrases) - len(keep_phrases)} removed as FP"
         )
 
-        # Position matching for validated phrases
-        validated_spans = find_phrase_positions(body, keep_phrases)
-
-        # Position matching for new phrases
-        new_spans = find_phrase_positions(body, new_phrases)
+        # Position matching for validated and new phrases against one analysis of the chunk
+        analysis = BodyAnalysis(body)
+        validated_spans = find_phrase_positions(body, keep_phrases, analysis)
+        new_spans = find_phrase_positions(body, new_phrases, analysis)
 
         # Filter out any new phrases that duplicate validated ones
         validated_texts = {s.original_text.lower() for s in validated_spans}
@@ -4189,6 +4003,137 @@ def detect_spans_multi_pass(
     )
 
 
+TITLE_SEPARATOR = "\n\n---ARTICLE BODY---\n\n"
+HEADLINE_PREFIX = "HEADLINE: "
+
+
+def combine_title_and_body(title: str | None, body: str) -> str:
+    """
+    Build the text sent to span detection: the headline (if any) followed by the body.
+
+    Spans found in the combined text are mapped back to their own field by
+    rebase_combined_spans().
+    """
+    if title:
+        return f"{HEADLINE_PREFIX}{title}{TITLE_SEPARATOR}{body}"
+    return body
+
+
+def rebase_combined_spans(
+    spans: list[TransparencySpan],
+    title: str | None,
+    body: str,
+) -> list[TransparencySpan]:
+    """
+    Map spans found in combine_title_and_body() output back to title/body positions.
+
+    Spans that fall outside their field after the shift are dropped (and logged).
+
+    Args:
+        spans: Spans with positions in the combined text
+        title: Original article title (None/empty if no headline was combined)
+        body: Original article body
+
+    Returns:
+        List of TransparencySpan with field="title" or field="body"
+    """
+    if not title:
+        return spans
+
+    title_offset = len(f"{HEADLINE_PREFIX}{title}{TITLE_SEPARATOR}")
+    headline_prefix_len = len(HEADLINE_PREFIX)
+
+    # DEBUG: Log reasons BEFORE adjustment
+    pre_adjust_reasons = (
+        [s.reason.value if hasattr(s.reason, "value") else str(s.reason) for s in spans] if spans else []
+    )
+    logger.info(f"[SPAN_DETECTION] Pre-adjustment reasons: {pre_adjust_reasons}")
+
+    adjusted_spans = []
+    dropped_title_spans = []
+    dropped_body_spans = []
+    for span in spans:
+        if span.start_char < title_offset:
+            # Span is in title section
+            adjusted_start = span.start_char - headline_prefix_len
+            adjusted_end = span.end_char - headline_prefix_len
+            # Ensure positions are within title bounds
+            if adjusted_start >= 0 and adjusted_end <= len(title):
+                adjusted_spans.append(
+                    TransparencySpan(
+                        field="title",
+                        start_char=adjusted_start,
+                        end_char=adjusted_end,
+                        original_text=span.original_text,
+                        action=span.action,
+                        reason=span.reason,
+                        replacement_text=span.replacement_text,
+                    )
+                )
+            else:
+                # Title span dropped due to bounds check failure
+                dropped_title_spans.append(
+                    {
+                        "phrase": span.original_text,
+                        "adjusted_start": adjusted_start,
+                        "adjusted_end": adjusted_end,
+                        "title_len": len(title),
+                        "original_start": span.start_char,
+                        "original_end": span.end_char,
+                    }
+                )
+        else:
+            # Span is in body section
+            adjusted_start = span.start_char - title_offset
+            adjusted_end = span.end_char - title_offset
+            # Ensure positions are within body bounds
+            if adjusted_start >= 0 and adjusted_end <= len(body):
+                adjusted_spans.append(
+                    TransparencySpan(
+                        field="body",
+                        start_char=adjusted_start,
+                        end_char=adjusted_end,
+                        original_text=span.original_text,
+                        action=span.action,
+                        reason=span.reason,
+                        replacement_text=span.replacement_text,
+                    )
+                )
+            else:
+                # Body span dropped due to bounds check failure
+                dropped_body_spans.append(
+                    {
+                        "phrase": span.original_text,
+                        "adjusted_start": adjusted_start,
+                        "adjusted_end": adjusted_end,
+                        "body_len": len(body),
+                        "original_start": span.start_char,
+                        "original_end": span.end_char,
+                    }
+                )
+
+    # Log any dropped spans for debugging
+    if dropped_title_spans:
+        logger.warning(
+            f"[SPAN_DETECTION] Dropped {len(dropped_title_spans)} title spans due to bounds check: "
+            f"{dropped_title_spans}"
+        )
+    if dropped_body_spans:
+        logger.warning(
+            f"[SPAN_DETECTION] Dropped {len(dropped_body_spans)} body spans due to bounds check: {dropped_body_spans}"
+        )
+
+    # DEBUG: Log reasons AFTER adjustment
+    post_adjust_reasons = (
+        [s.reason.value if hasattr(s.reason, "value") else str(s.reason) for s in adjusted_spans]
+        if adjusted_spans
+        else []
+    )
+    logger.info(f"[SPAN_DETECTION] Post-adjustment reasons: {post_adjust_reasons}")
+
+    return adjusted_spans
+
+
 def detect_spans_with_mode(
     body: str,
     mode: str,
@@ -4222,15 +4167,7 @@ def detect_spans_with_mode(
         List of TransparencySpan with field="title" or field="body"
     """
     # Combine title + body for detection if title is provided
-    title_separator = "\n\n---ARTICLE BODY---\n\n"
-    if title:
-        combined_text = f"HEADLINE: {title}{title_separator}{body}"
-        title_offset = len(f"HEADLINE: {title}{title_separator}")
-        headline_prefix_len = len("HEADLINE: ")
-    else:
-        combined_text = body
-        title_offset = 0
-        headline_prefix_len = 0
+    combined_text = combine_title_and_body(title, body)
 
     if mode == "multi_pass":
         if not anthropic_api_key:
@@ -4266,100 +4203,7 @@ def detect_spans_with_mode(
     if spans is None:
         return []
 
-    # Adjust positions and set field based on whether span is in title or body
-    if title and title_offset > 0:
-        # DEBUG: Log reasons BEFORE adjustment
-        pre_adjust_reasons = (
-            [s.reason.value if hasattr(s.reason, "value") else str(s.reason) for s in spans] if spans else []
-        )
-        logger.info(f"[SPAN_DETECTION] Pre-adjustment reasons: {pre_adjust_reasons}")
-
-        adjusted_spans = []
-        dropped_title_spans = []
-        dropped_body_spans = []
-        for span in spans:
-            if span.start_char < title_offset:
-                # Span is in title section
-                adjusted_start = span.start_char - headline_prefix_len
-                adjusted_end = span.end_char - headline_prefix_len
-                # Ensure positions are within title bounds
-                if adjusted_start >= 0 and adjusted_end <= len(title):
-                    adjusted_spans.append(
-                        TransparencySpan(
-                            field="title",
-                            start_char=adjusted_start,
-                            end_char=adjusted_end,
-                            original_text=span.original_text,
-                            action=span.action,
-                            reason=span.reason,
-                            replacement_text=span.replacement_text,
-                        )
-                    )
-                else:
-                    # Title span dropped due to bounds check failure
-                    dropped_title_spans.append(
-                        {
-                            "phrase": span.original_text,
-                            "adjusted_start": adjusted_start,
-                            "adjusted_end": adjusted_end,
-                            "title_len": len(title),
-                            "original_start": span.start_char,
-                            "original_end": span.end_char,
-                        }
-                    )
-            else:
-                # Span is in body section
-                adjusted_start = span.start_char - title_offset
-                adjusted_end = span.end_char - title_offset
-                # Ensure positions are within body bounds
-                if adjusted_start >= 0 and adjusted_end <= len(body):
-                    adjusted_spans.append(
-                        TransparencySpan(
-                            field="body",
-                            start_char=adjusted_start,
-                            end_char=adjusted_end,
-                            original_text=span.original_text,
-                            action=span.action,
-                            reason=span.reason,
-                            replacement_text=span.replacement_text,
-                        )
-                    )
-                else:
-                    # Body span dropped due to bounds check failure
-                    dropped_body_spans.append(
-                        {
-                            "phrase": span.original_text,
-                            "adjusted_start": adjusted_start,
-                            "adjusted_end": adjusted_end,
-                            "body_len": len(body),
-                            "original_start": span.start_char,
-                            "original_end": span.end_char,
-                        }
-                    )
-
-        # Log any dropped spans for debugging
-        if dropped_title_spans:
-            logger.warning(
-                f"[SPAN_DETECTION] Dropped {len(dropped_title_spans)} title spans due to bounds check: "
-                f"{dropped_title_spans}"
-            )
-        if dropped_body_spans:
-            logger.warning(
-                f"[SPAN_DETECTION] Dropped {len(dropped_body_spans)} body spans due to bounds check: "
-                f"{dropped_body_spans}"
-            )
-
-        # DEBUG: Log reasons AFTER adjustment
-        post_adjust_reasons = (
-            [s.reason.value if hasattr(s.reason, "value") else str(s.reason) for s in adjusted_spans]
-            if adjusted_spans
-            else []
-        )
-        logger.info(f"[SPAN_DETECTION] Post-adjustment reasons: {post_adjust_reasons}")
-
-        return adjusted_spans
-
-    return spans
+    return rebase_combined_spans(spans, title, body)
 
 
 def _detect_spans_with_config(
@@ -4448,7 +4292,11 @@ def _detect_spans_with_config(
     return spans if spans is not None else []
 
 
-def _correct_span_positions(spans: list[TransparencySpan], original_body: str) -> list[TransparencySpan]:
+def _correct_span_positions(
+    spans: list[TransparencySpan],
+    original_body: str,
+    analysis: BodyAnalysis | None = None,
+) -> list[TransparencySpan]:
     """
     Correct span positions by searching for original_text in the body.
 
@@ -4458,6 +4306,8 @@ def _correct_span_positions(spans: list[TransparencySpan], original_body: str) -
     if not original_body:
         return spans
 
+    analysis = BodyAnalysis.of(original_body, analysis)
+
     corrected = []
     used_positions = set()  # Track used positions to avoid duplicates
 
@@ -4479,7 +4329,7 @@ def _correct_span_positions(spans: list[TransparencySpan], original_body: str) -
 
         # If still not found, try case-insensitive search
         if pos == -1:
-            lower_body = original_body.lower()
+            lower_body = analysis.lower
             lower_text = original_text.lower()
             pos = lower_body.find(lower_text, search_start)
             if pos == -1:
@@ -4646,21 +4496,9 @@ def _detect_garbled_output(original: str, filtered: str) -> bool:
 
     # Check 2: Look for broken grammar patterns
     # Pattern: ". The " followed by punctuation or article (e.g., ". The , " or ". The a ")
-    broken_patterns = [
-        r"\. [A-Z][a-z]* [,\.\!\?]",  # "The ," or "She ."
-        r"\. [A-Z][a-z]* (a|an|the) [,\.\!\?]",  # "The a ," broken article
-        r"'s [,\.\!\?]",  # "'s ," missing word after possessive
-        r"\. [,\.\!\?]",  # Direct ". ," or ". ."
-    ]
-
-    import re
+    broken_count = count_broken_grammar(filtered)
 
-    broken_count = 0
-    for pattern in broken_patterns:
-        matches = re.findall(pattern, filtered)
-        broken_count += len(matches)
-
-    if broken_count > 5:
+    if broken_count > GARBLED_PATTERN_LIMIT:
         logger.warning(f"Garbled output detected: {broken_count} broken grammar patterns found")
         return True
 
@@ -4889,7 +4727,9 @@ def _synthesize_detail_full_fallback(
             from openai import OpenAI
 
             client = OpenAI(api_key=api_key)
-            response = client.chat.completions.create(
+            response = _openai_chat(
+                client,
+                "detail_full_fallback",
                 model=model or "gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -4903,11 +4743,13 @@ def _synthesize_detail_full_fallback(
             import anthropic
 
             client = anthropic.Anthropic(api_key=api_key)
-            response = client.messages.create(
+            response = _anthropic_message(
+                client,
+                "detail_full_fallback",
                 model=model or "claude-sonnet-4-20250514",
                 max_tokens=4096,
                 system=system_prompt,
-                messages=[{"role": "user", "content": user_prompt}],
+                user_prompt=user_prompt,
             )
             detail_full = response.content[0].text.strip()
 
@@ -4917,7 +4759,7 @@ def _synthesize_detail_full_fallback(
             genai.configure(api_key=api_key)
             model_obj = genai.GenerativeModel(model or "gemini-2.0-flash")
             full_prompt = f"{system_prompt}\n\n{user_prompt}"
-            response = model_obj.generate_content(full_prompt)
+            response = _gemini_generate(model_obj, model or "gemini-2.0-flash", "detail_full_fallback", full_prompt)
             detail_full = response.text.strip()
 
         else:
@@ -5033,1035 +4875,212 @@ def parse_detail_full_response(data: dict, original_body: str) -> DetailFullResu
 
 
 # -----------------------------------------------------------------------------
-# OpenAI provider
+# Local detail_full reconstruction from spans
 # -----------------------------------------------------------------------------
 
+_SENTENCE_END = re.compile(r"(^|[.!?][\"')\]]?)$")
 
-class OpenAINeutralizerProvider(NeutralizerProvider):
-    """OpenAI-based neutralizer (GPT-4o-mini, GPT-4o, etc.)."""
 
-    def __init__(self, model: str = "gpt-4o-mini"):
-        self._model = model
-        self._api_key = os.getenv("OPENAI_API_KEY")
+def _join_cut(left: str, replacement: str, right: str) -> str:
+    """Join the text either side of one span edit, tidying spacing and punctuation at the seam."""
+    if replacement:
+        return left + replacement + right
 
-    @property
-    def name(self) -> str:
-        return "openai"
+    head = left.rstrip(" \t")
+    tail = right.lstrip(" \t")
+    at_line_start = not head or head.endswith("\n")
+    at_sentence_start = at_line_start or bool(_SENTENCE_END.search(head))
+    # A cut between two marks, or at a sentence start, orphans the mark after it ("BREAKING: The")
+    if tail[:1] in (",", ";", ":") and (at_sentence_start or head[-1:] in (",", ";", ":")):
+        tail = tail[1:].lstrip(" \t")
+    if at_sentence_start and tail[:1].islower():
+        tail = tail[0].upper() + tail[1:]
 
-    @property
-    def model_name(self) -> str:
-        return self._model
+    if at_line_start or not tail or tail[0] in "\n.,;:!?":
+        return head + tail
+    return f"{head} {tail}"
 
-    def neutralize(
-        self,
-        title: str,
-        description: str | None,
-        body: str | None,
-        repair_instructions: str | None = None,
-    ) -> NeutralizationResult:
-        """Neutralize using OpenAI API.
 
-        Raises NeutralizationResponseError if no API key or neutralization fails.
-        """
-        if not self._api_key:
-            logger.error("No OPENAI_API_KEY set - cannot neutralize")
-            raise NeutralizationResponseError("No OPENAI_API_KEY configured")
+def apply_spans_to_text(text: str, spans: list[TransparencySpan]) -> str:
+    """
+    Apply span edits to text: removed spans are cut, replaced spans take
+    their replacement_text, softened spans without a replacement are cut.
 
-        try:
-            from openai import OpenAI
+    Spans are applied by position, so the rest of the text is kept as is
+    apart from tidying the spacing and punctuation at each cut. A span
+    overlapping one already applied is skipped.
+    """
+    result = text
+    applied_from = len(text)
+    # Right to left, so each seam sees the original text on its left
+    for span in sorted(spans, key=lambda s: (s.start_char, s.end_char), reverse=True):
+        if span.end_char > applied_from or span.start_char < 0:
+            continue
+        replacement = span.replacement_text if span.action != SpanAction.REMOVED else None
+        if replacement and span.original_text[:1].isupper() and replacement[:1].islower():
+            replacement = replacement[0].upper() + replacement[1:]
+        result = _join_cut(result[: span.start_char], replacement or "", result[span.end_char :])
+        applied_from = span.start_char
+    return result.strip()
 
-            client = OpenAI(api_key=self._api_key)
 
-            if repair_instructions:
-                system_prompt = get_repair_system_prompt()
-                user_prompt = build_repair_prompt(title, description, body, repair_instructions)
-            else:
-                system_prompt = get_system_prompt()
-                user_prompt = build_user_prompt(title, description, body)
+def _spans_took_effect(body: str, rebuilt: str, spans: list[TransparencySpan]) -> bool:
+    """
+    Check that applying spans actually edited the body.
 
-            response = client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"},
-            )
+    _validate_neutralization's similarity cutoff is meant for an LLM echoing
+    the body back; a few deterministic span edits on a long article stay
+    above it. Instead, reject only when nothing changed or when the
+    characters edited fall far short of what the spans cover (most spans
+    were skipped as overlapping or out of range).
+    """
+    import difflib
 
-            import json
+    if rebuilt == body.strip():
+        return False
+    expected = sum(max(0, s.end_char - s.start_char) for s in spans)
+    matcher = difflib.SequenceMatcher(None, body, rebuilt, autojunk=False)
+    edited = sum(i2 - i1 for tag, i1, i2, _, _ in matcher.get_opcodes() if tag != "equal")
+    return edited * 4 >= expected
 
-            data = json.loads(response.choices[0].message.content)
-            return parse_llm_response(data, title, description)
 
-        except NeutralizationResponseError:
-            raise  # Re-raise our own exceptions
-        except Exception as e:
-            logger.error(f"OpenAI neutralization failed: {e}")
-            raise NeutralizationResponseError(f"OpenAI neutralization failed: {str(e)}")
+def reconstruct_detail_full(
+    provider: NeutralizerProvider,
+    body: str,
+    title: str = None,
+    feed_category: str | None = None,
+) -> DetailFullResult | None:
+    """
+    Call 1 without generating text: detect spans, then apply them to the body.
 
-    def _neutralize_detail_full(
-        self,
-        body: str,
-        title: str = None,
-        retry_count: int = 0,
-        feed_category: str | None = None,
-    ) -> DetailFullResult:
-        """
-        Neutralize an article body using OpenAI with SYNTHESIS approach.
+    The LLM only returns phrases and replacements, so detail_full costs no
+    output tokens beyond the span list and is reproducible for a given set
+    of spans. A clean body (no body spans) is returned unchanged.
 
-        Uses synthesis mode (plain text output) as the primary approach because:
-        - LLMs are better at generating fresh text than surgical editing
-        - No position tracking = better grammar preservation
-        - More consistent, readable output
+    Returns None when the caller should fall back to full generation: span
+    detection raised, the rebuilt text looks garbled (_detect_garbled_output),
+    or the spans barely changed it (_spans_took_effect).
+    """
+    try:
+        spans = _detect_spans_with_config(
+            body=body,
+            provider_api_key=getattr(provider, "_api_key", None),
+            provider_type=provider.name,
+            provider_model=provider.model_name,
+            title=title,
+            feed_category=feed_category,
+        )
+    except Exception as e:
+        logger.warning(f"[DETAIL_FULL] Span detection failed in spans mode, falling back to synthesis: {e}")
+        return None
 
-        Spans are detected via hybrid LLM + position matching:
-        1. LLM identifies manipulative phrases with context awareness
-        2. Position matcher finds exact character positions in original body/title
-        3. Returns failure status if LLM fails (no mock fallback)
+    body_spans = [s for s in spans if s.field == "body"]
+    if not body_spans:
+        return DetailFullResult(detail_full=body.strip(), spans=spans)
 
-        Args:
-            body: Article body text
-            title: Original article title (for headline manipulation detection)
-            retry_count: Current retry attempt number
-            feed_category: Article genre for content-type-aware span detection
-        """
-        MAX_RETRIES = 2
-
-        if not body:
-            return DetailFullResult(detail_full="", spans=[])
-
-        if not self._api_key:
-            logger.error("No OPENAI_API_KEY set - cannot neutralize")
-            return DetailFullResult(
-                detail_full="", spans=[], status="failed_llm", failure_reason="No OPENAI_API_KEY configured"
-            )
-
-        # Get spans via config-aware detection (respects SPAN_DETECTION_MODE)
-        # Uses multi_pass for 99% recall if configured, otherwise single-pass
-        # Now includes title for headline manipulation detection
-        spans = _detect_spans_with_config(
-            body=body,
-            provider_api_key=self._api_key,
-            provider_type="openai",
-            provider_model=self._model,
-            title=title,
-            feed_category=feed_category,
-        )
-        logger.info(
-            f"Span detection completed with {len(spans)} spans (title spans: {sum(1 for s in spans if s.field == 'title')})"
+    detail_full = apply_spans_to_text(body, body_spans)
+    if _detect_garbled_output(body, detail_full):
+        logger.warning("[DETAIL_FULL] Reconstructed body looks garbled, falling back to synthesis")
+        return None
+    if not _spans_took_effect(body, detail_full, body_spans):
+        logger.warning(
+            f"[DETAIL_FULL] {len(body_spans)} spans left the body nearly unchanged, falling back to synthesis"
         )
+        return None
 
-        try:
-            from openai import OpenAI
-
-            client = OpenAI(api_key=self._api_key)
-
-            # Use SYNTHESIS prompt (plain text output, not JSON)
-            system_prompt = get_article_system_prompt()
-            user_prompt = build_synthesis_detail_full_prompt(body)
-
-            # Allow model override for detail_full via DETAIL_FULL_MODEL
-            from app.config import get_settings
-
-            detail_full_model = get_settings().DETAIL_FULL_MODEL or self._model
-
-            # Some models (e.g. gpt-5-mini) only support temperature=1
-            create_kwargs: dict[str, Any] = {
-                "model": detail_full_model,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-            }
-            if not detail_full_model.startswith("gpt-5"):
-                create_kwargs["temperature"] = 0.3
-
-            response = client.chat.completions.create(**create_kwargs)
-
-            detail_full = response.choices[0].message.content.strip()
-
-            # Validate output isn't garbled
-            if _detect_garbled_output(body, detail_full):
-                logger.error("OpenAI synthesis produced garbled output")
-                return DetailFullResult(
-                    detail_full="",
-                    spans=spans,
-                    status="failed_garbled",
-                    failure_reason="OpenAI synthesis produced garbled output",
-                )
-
-            return DetailFullResult(detail_full=detail_full, spans=spans)
-
-        except Exception as e:
-            # API error - retry, then return failure status
-            if retry_count < MAX_RETRIES:
-                logger.warning(
-                    f"OpenAI synthesis error (attempt {retry_count + 1}/{MAX_RETRIES + 1}): {e}, retrying..."
-                )
-                import time
-
-                time.sleep(1)
-                return self._neutralize_detail_full(body, title, retry_count + 1)
-            else:
-                logger.error(f"OpenAI synthesis failed after {MAX_RETRIES + 1} attempts: {e}")
-                return DetailFullResult(
-                    detail_full="",
-                    spans=spans,
-                    status="failed_llm",
-                    failure_reason=f"OpenAI synthesis failed after {MAX_RETRIES + 1} attempts: {str(e)}",
-                )
-
-    def _neutralize_detail_brief(self, body: str) -> str:
-        """
-        Synthesize an article body into a brief using OpenAI (Call 2: Synthesize).
-
-        Uses shared article_system_prompt + synthesis_detail_brief_prompt.
-        Returns plain text (3-5 paragraphs, no headers or bullets).
-
-        Includes retry logic: if the brief contains banned phrases, retry with
-        a repair prompt up to MAX_BRIEF_RETRIES times.
-
-        Raises NeutralizationResponseError if no API key or synthesis fails.
-        """
-        MAX_BRIEF_RETRIES = 2
-
-        if not body:
-            return ""
-
-        if not self._api_key:
-            logger.error("No OPENAI_API_KEY set - cannot synthesize brief")
-            raise NeutralizationResponseError("No OPENAI_API_KEY configured")
-
-        try:
-            from openai import OpenAI
-
-            client = OpenAI(api_key=self._api_key)
-
-            system_prompt = get_article_system_prompt()
-            user_prompt = build_synthesis_detail_brief_prompt(body)
-
-            response = client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.3,
-                # Note: No JSON response format - we want plain text
-            )
-
-            brief = response.choices[0].message.content.strip()
-
-            # Validate and retry if violations found
-            for attempt in range(MAX_BRIEF_RETRIES):
-                violations = validate_brief_neutralization(brief)
-                if not violations:
-                    return brief
-
-                logger.warning(f"Brief validation failed (attempt {attempt + 1}/{MAX_BRIEF_RETRIES + 1}): {violations}")
-
-                # Generate repair prompt and retry
-                repair_prompt = build_brief_repair_prompt(brief, violations)
-                repair_response = client.chat.completions.create(
-                    model=self._model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": repair_prompt},
-                    ],
-                    temperature=0.3,
-                )
-                brief = repair_response.choices[0].message.content.strip()
-
-            # Final validation after all retries
-            violations = validate_brief_neutralization(brief)
-            if violations:
-                logger.error(f"Brief validation failed after {MAX_BRIEF_RETRIES + 1} attempts: {violations}")
-            return brief
-
-        except Exception as e:
-            logger.error(f"OpenAI detail_brief synthesis failed: {e}")
-            raise NeutralizationResponseError(f"OpenAI detail_brief synthesis failed: {str(e)}")
-
-    def _neutralize_feed_outputs(self, body: str, detail_brief: str) -> dict:
-        """
-        Generate compressed feed outputs using OpenAI (Call 3: Compress).
-
-        Uses shared article_system_prompt + compression_feed_outputs_prompt.
-        Returns dict with feed_title, feed_summary, detail_title.
-
-        Includes validation and retry for feed_summary banned phrases.
-        """
-        MAX_FEED_SUMMARY_RETRIES = 2
-
-        if not body and not detail_brief:
-            return {
-                "feed_title": "",
-                "feed_summary": "",
-                "detail_title": "",
-                "section": "world",
-            }
-
-        if not self._api_key:
-            logger.error("No OPENAI_API_KEY set - cannot generate feed outputs")
-            raise NeutralizationResponseError("No OPENAI_API_KEY configured")
-
-        try:
-            import json
-
-            from openai import OpenAI
-
-            client = OpenAI(api_key=self._api_key)
-
-            # Use lighter headline prompt for feed outputs (not aggressive article prompt)
-            system_prompt = get_headline_system_prompt()
-            user_prompt = build_compression_feed_outputs_prompt(body, detail_brief)
-
-            response = client.chat.completions.create(
-                model=self._model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"},
-            )
-
-            data = json.loads(response.choices[0].message.content)
-            result = {
-                "feed_title": data.get("feed_title", ""),
-                "feed_summary": data.get("feed_summary", ""),
-                "detail_title": data.get("detail_title", ""),
-                "section": data.get("section", "world"),
-            }
-
-            # Validate and retry feed_summary if it contains banned phrases
-            for attempt in range(MAX_FEED_SUMMARY_RETRIES):
-                violations = validate_feed_summary(result["feed_summary"])
-                if not violations:
-                    break
-
-                logger.warning(
-                    f"Feed summary validation failed (attempt {attempt + 1}/{MAX_FEED_SUMMARY_RETRIES + 1}): {violations}"
-                )
-
-                # Generate repair prompt and retry
-                repair_prompt = build_feed_summary_repair_prompt(result["feed_summary"], violations)
-                repair_response = client.chat.completions.create(
-                    model=self._model,
-                    messages=[
-                        {"role": "system", "content": "You are a neutral news editor. Return only the rewritten text."},
-                        {"role": "user", "content": repair_prompt},
-                    ],
-                    temperature=0.3,
-                )
-                result["feed_summary"] = repair_response.choices[0].message.content.strip()
-
-            # Final validation
-            violations = validate_feed_summary(result["feed_summary"])
-            if violations:
-                logger.error(
-                    f"Feed summary validation failed after {MAX_FEED_SUMMARY_RETRIES + 1} attempts: {violations}"
-                )
-
-            # Apply sentence-boundary truncation as safety net
-            result["feed_summary"] = truncate_at_sentence(result["feed_summary"], 130)
-
-            # Validate feed outputs for garbled content
-            _validate_feed_outputs(result)
-            return result
-
-        except Exception as e:
-            logger.error(f"OpenAI feed outputs compression failed: {e}")
-            raise NeutralizationResponseError(f"OpenAI feed outputs compression failed: {str(e)}")
+    logger.info(f"[DETAIL_FULL] Reconstructed detail_full locally from {len(body_spans)} body spans")
+    return DetailFullResult(detail_full=detail_full, spans=spans)
 
 
 # -----------------------------------------------------------------------------
-# Gemini provider
+# Chunked detail_full for long articles
 # -----------------------------------------------------------------------------
 
 
-class GeminiNeutralizerProvider(NeutralizerProvider):
-    """Google Gemini-based neutralizer (Gemini 1.5 Flash, Gemini 2.0 Flash, etc.)."""
-
-    # Available Gemini models
-    MODELS = {
-        "gemini-1.5-flash": "gemini-1.5-flash",
-        "gemini-1.5-flash-latest": "gemini-1.5-flash-latest",
-        "gemini-1.5-pro": "gemini-1.5-pro",
-        "gemini-2.0-flash": "gemini-2.0-flash-exp",
-        "gemini-2.0-flash-exp": "gemini-2.0-flash-exp",
-    }
-
-    def __init__(self, model: str = "gemini-1.5-flash"):
-        self._model = self.MODELS.get(model, model)
-        self._api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
-
-    @property
-    def name(self) -> str:
-        return "gemini"
-
-    @property
-    def model_name(self) -> str:
-        return self._model
-
-    def neutralize(
-        self,
-        title: str,
-        description: str | None,
-        body: str | None,
-        repair_instructions: str | None = None,
-    ) -> NeutralizationResult:
-        """Neutralize using Google Gemini API.
+def detail_full_chunk_bounds(body: str, chunker: ArticleChunker) -> list[tuple[int, int]]:
+    """
+    Partition a body into contiguous (start, end) ranges at the chunker's split points.
 
-        Raises NeutralizationResponseError if no API key or neutralization fails.
-        """
-        if not self._api_key:
-            logger.error("No GOOGLE_API_KEY or GEMINI_API_KEY set - cannot neutralize")
-            raise NeutralizationResponseError("No GOOGLE_API_KEY or GEMINI_API_KEY configured")
+    The chunker should have no overlap, so split points fall on paragraph (or
+    failing that, sentence) boundaries. A chunk the chunker skips as too small
+    is folded into the next range, so the ranges always cover the whole body.
+    """
+    splits = [chunk.end_offset for chunk in chunker.chunk(body)[:-1]]
+    return list(zip([0, *splits], [*splits, len(body)]))
+
+
+def _chunk_separator(body: str, boundary: int) -> str:
+    """Whitespace to put between two stitched chunk outputs, mirroring the original boundary."""
+    start = boundary
+    while start > 0 and body[start - 1].isspace():
+        start -= 1
+    end = boundary
+    while end < len(body) and body[end].isspace():
+        end += 1
+    gap = body[start:end]
+    if "\n\n" in gap:
+        return "\n\n"
+    if "\n" in gap:
+        return "\n"
+    return " "
+
+
+def neutralize_detail_full_chunked(
+    provider: NeutralizerProvider,
+    body: str,
+    chunker: ArticleChunker,
+    title: str = None,
+    feed_category: str | None = None,
+    max_workers: int = 4,
+) -> DetailFullResult:
+    """
+    Call 1 on a long body as concurrent per-chunk calls.
+
+    Each chunk is filtered (and span-detected) by the provider's own
+    _neutralize_detail_full, so output length per request, and with it
+    latency, stays roughly constant as articles grow. Outputs are joined
+    with the whitespace found at each boundary, and chunk-relative spans are
+    re-based with adjust_chunk_positions. Title spans come from the first
+    chunk only. If any chunk fails, the whole call fails with that chunk's
+    status.
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
-        try:
-            import google.generativeai as genai
+    from app.services.neutralizer.spans import adjust_chunk_positions
 
-            genai.configure(api_key=self._api_key)
+    bounds = detail_full_chunk_bounds(body, chunker)
+    if len(bounds) == 1:
+        return provider._neutralize_detail_full(body, title=title, feed_category=feed_category)
 
-            # Use proper system instruction (not concatenated prompt)
-            if repair_instructions:
-                system_prompt = get_repair_system_prompt()
-                user_prompt = build_repair_prompt(title, description, body, repair_instructions)
-            else:
-                system_prompt = get_system_prompt()
-                user_prompt = build_user_prompt(title, description, body)
-
-            model = genai.GenerativeModel(
-                self._model,
-                system_instruction=system_prompt,
-                generation_config=genai.GenerationConfig(
-                    response_mime_type="application/json",
-                    temperature=0.3,
-                ),
+    logger.info(f"[DETAIL_FULL] Filtering {len(body)} char body as {len(bounds)} concurrent chunks")
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(bounds)))) as executor:
+        futures = [
+            executor.submit(
+                provider._neutralize_detail_full,
+                body[start:end],
+                title=title if i == 0 else None,
+                feed_category=feed_category,
             )
-
-            response = model.generate_content(user_prompt)
-
-            import json
-
-            data = json.loads(response.text)
-            return parse_llm_response(data, title, description)
-
-        except NeutralizationResponseError:
-            raise  # Re-raise our own exceptions
-        except Exception as e:
-            logger.error(f"Gemini neutralization failed: {e}")
-            raise NeutralizationResponseError(f"Gemini neutralization failed: {str(e)}")
-
-    def _neutralize_detail_full(
-        self,
-        body: str,
-        title: str = None,
-        retry_count: int = 0,
-        feed_category: str | None = None,
-    ) -> DetailFullResult:
-        """
-        Neutralize an article body using Gemini with SYNTHESIS approach.
-
-        Uses synthesis mode (plain text output) as the primary approach.
-        Spans are detected via hybrid LLM + position matching for context awareness.
-        Returns failure status if synthesis fails (no mock fallback).
-
-        Args:
-            body: Article body text
-            title: Original article title (for headline manipulation detection)
-            retry_count: Current retry attempt number
-            feed_category: Article genre for content-type-aware span detection
-        """
-        MAX_RETRIES = 2
-
-        if not body:
-            return DetailFullResult(detail_full="", spans=[])
-
-        if not self._api_key:
-            logger.error("No GOOGLE_API_KEY or GEMINI_API_KEY set - cannot neutralize")
+            for i, (start, end) in enumerate(bounds)
+        ]
+        results = [future.result() for future in futures]
+
+    spans: list[TransparencySpan] = []
+    detail_full = ""
+    for (start, _end), result in zip(bounds, results):
+        if result.status != "success":
             return DetailFullResult(
                 detail_full="",
                 spans=[],
-                status="failed_llm",
-                failure_reason="No GOOGLE_API_KEY or GEMINI_API_KEY configured",
+                status=result.status,
+                failure_reason=f"Chunk at offset {start} of {len(bounds)}-chunk body: {result.failure_reason}",
             )
+        spans.extend(adjust_chunk_positions(result.spans, start))
+        piece = result.detail_full.strip()
+        if piece:
+            detail_full = f"{detail_full}{_chunk_separator(body, start)}{piece}" if detail_full else piece
 
-        # Get spans via config-aware detection (respects SPAN_DETECTION_MODE)
-        # Uses multi_pass for 99% recall if configured, otherwise single-pass
-        # Now includes title for headline manipulation detection
-        spans = _detect_spans_with_config(
-            body=body,
-            provider_api_key=self._api_key,
-            provider_type="gemini",
-            provider_model=self._model,
-            title=title,
-            feed_category=feed_category,
-        )
-        logger.info(
-            f"Span detection completed with {len(spans)} spans (title spans: {sum(1 for s in spans if s.field == 'title')})"
-        )
-
-        try:
-            import google.generativeai as genai
-
-            genai.configure(api_key=self._api_key)
-
-            # Use SYNTHESIS prompt (plain text output, not JSON)
-            system_prompt = get_article_system_prompt()
-            user_prompt = build_synthesis_detail_full_prompt(body)
-
-            model = genai.GenerativeModel(
-                self._model,
-                system_instruction=system_prompt,
-                generation_config=genai.GenerationConfig(
-                    # No JSON mime type - plain text synthesis
-                    temperature=0.3,
-                ),
-            )
-
-            response = model.generate_content(user_prompt)
-            detail_full = response.text.strip()
-
-            # Validate output isn't garbled
-            if _detect_garbled_output(body, detail_full):
-                logger.error("Gemini synthesis produced garbled output")
-                return DetailFullResult(
-                    detail_full="",
-                    spans=spans,
-                    status="failed_garbled",
-                    failure_reason="Gemini synthesis produced garbled output",
-                )
-
-            return DetailFullResult(detail_full=detail_full, spans=spans)
-
-        except Exception as e:
-            # API error - retry, then return failure status
-            if retry_count < MAX_RETRIES:
-                logger.warning(
-                    f"Gemini synthesis error (attempt {retry_count + 1}/{MAX_RETRIES + 1}): {e}, retrying..."
-                )
-                import time
-
-                time.sleep(1)
-                return self._neutralize_detail_full(body, title, retry_count + 1)
-            else:
-                logger.error(f"Gemini synthesis failed after {MAX_RETRIES + 1} attempts: {e}")
-                return DetailFullResult(
-                    detail_full="",
-                    spans=spans,
-                    status="failed_llm",
-                    failure_reason=f"Gemini synthesis failed after {MAX_RETRIES + 1} attempts: {str(e)}",
-                )
-
-    def _neutralize_detail_brief(self, body: str) -> str:
-        """
-        Synthesize an article body into a brief using Gemini (Call 2: Synthesize).
-
-        Uses shared article_system_prompt + synthesis_detail_brief_prompt.
-        Returns plain text (3-5 paragraphs, no headers or bullets).
-
-        Includes retry logic: if the brief contains banned phrases, retry with
-        a repair prompt up to MAX_BRIEF_RETRIES times.
-
-        Raises NeutralizationResponseError if no API key or synthesis fails.
-        """
-        MAX_BRIEF_RETRIES = 2
-
-        if not body:
-            return ""
-
-        if not self._api_key:
-            logger.error("No GOOGLE_API_KEY or GEMINI_API_KEY set - cannot synthesize brief")
-            raise NeutralizationResponseError("No GOOGLE_API_KEY or GEMINI_API_KEY configured")
-
-        try:
-            import google.generativeai as genai
-
-            genai.configure(api_key=self._api_key)
-
-            system_prompt = get_article_system_prompt()
-            user_prompt = build_synthesis_detail_brief_prompt(body)
-
-            model = genai.GenerativeModel(
-                self._model,
-                system_instruction=system_prompt,
-                generation_config=genai.GenerationConfig(
-                    # Note: No JSON mime type - we want plain text
-                    temperature=0.3,
-                ),
-            )
-
-            response = model.generate_content(user_prompt)
-            brief = response.text.strip()
-
-            # Validate and retry if violations found
-            for attempt in range(MAX_BRIEF_RETRIES):
-                violations = validate_brief_neutralization(brief)
-                if not violations:
-                    return brief
-
-                logger.warning(f"Brief validation failed (attempt {attempt + 1}/{MAX_BRIEF_RETRIES + 1}): {violations}")
-
-                # Generate repair prompt and retry
-                repair_prompt = build_brief_repair_prompt(brief, violations)
-                repair_response = model.generate_content(repair_prompt)
-                brief = repair_response.text.strip()
-
-            # Final validation after all retries
-            violations = validate_brief_neutralization(brief)
-            if violations:
-                logger.error(f"Brief validation failed after {MAX_BRIEF_RETRIES + 1} attempts: {violations}")
-            return brief
-
-        except Exception as e:
-            logger.error(f"Gemini detail_brief synthesis failed: {e}")
-            raise NeutralizationResponseError(f"Gemini detail_brief synthesis failed: {str(e)}")
-
-    def _neutralize_feed_outputs(self, body: str, detail_brief: str) -> dict:
-        """
-        Generate compressed feed outputs using Gemini (Call 3: Compress).
-
-        Uses shared article_system_prompt + compression_feed_outputs_prompt.
-        Returns dict with feed_title, feed_summary, detail_title, section.
-
-        Includes validation and retry for feed_summary banned phrases.
-
-        Raises NeutralizationResponseError if no API key or compression fails.
-        """
-        MAX_FEED_SUMMARY_RETRIES = 2
-
-        if not body and not detail_brief:
-            return {
-                "feed_title": "",
-                "feed_summary": "",
-                "detail_title": "",
-                "section": "world",
-            }
-
-        if not self._api_key:
-            logger.error("No GOOGLE_API_KEY or GEMINI_API_KEY set - cannot generate feed outputs")
-            raise NeutralizationResponseError("No GOOGLE_API_KEY or GEMINI_API_KEY configured")
-
-        try:
-            import json
-
-            import google.generativeai as genai
-
-            genai.configure(api_key=self._api_key)
-
-            # Use lighter headline prompt for feed outputs (not aggressive article prompt)
-            system_prompt = get_headline_system_prompt()
-            user_prompt = build_compression_feed_outputs_prompt(body, detail_brief)
-
-            model = genai.GenerativeModel(
-                self._model,
-                system_instruction=system_prompt,
-                generation_config=genai.GenerationConfig(
-                    response_mime_type="application/json",
-                    temperature=0.3,
-                ),
-            )
-
-            response = model.generate_content(user_prompt)
-            data = json.loads(response.text)
-            result = {
-                "feed_title": data.get("feed_title", ""),
-                "feed_summary": data.get("feed_summary", ""),
-                "detail_title": data.get("detail_title", ""),
-                "section": data.get("section", "world"),
-            }
-
-            # Validate and retry feed_summary if it contains banned phrases
-            repair_model = genai.GenerativeModel(
-                self._model,
-                system_instruction="You are a neutral news editor. Return only the rewritten text.",
-                generation_config=genai.GenerationConfig(temperature=0.3),
-            )
-
-            for attempt in range(MAX_FEED_SUMMARY_RETRIES):
-                violations = validate_feed_summary(result["feed_summary"])
-                if not violations:
-                    break
-
-                logger.warning(
-                    f"Feed summary validation failed (attempt {attempt + 1}/{MAX_FEED_SUMMARY_RETRIES + 1}): {violations}"
-                )
-
-                # Generate repair prompt and retry
-                repair_prompt = build_feed_summary_repair_prompt(result["feed_summary"], violations)
-                repair_response = repair_model.generate_content(repair_prompt)
-                result["feed_summary"] = repair_response.text.strip()
-
-            # Final validation
-            violations = validate_feed_summary(result["feed_summary"])
-            if violations:
-                logger.error(
-                    f"Feed summary validation failed after {MAX_FEED_SUMMARY_RETRIES + 1} attempts: {violations}"
-                )
-
-            # Apply sentence-boundary truncation as safety net
-            result["feed_summary"] = truncate_at_sentence(result["feed_summary"], 130)
-
-            # Validate feed outputs for garbled content
-            _validate_feed_outputs(result)
-            return result
-
-        except Exception as e:
-            logger.error(f"Gemini feed outputs compression failed: {e}")
-            raise NeutralizationResponseError(f"Gemini feed outputs compression failed: {str(e)}")
-
-
-# -----------------------------------------------------------------------------
-# Anthropic provider
-# -----------------------------------------------------------------------------
-
-
-class AnthropicNeutralizerProvider(NeutralizerProvider):
-    """Anthropic Claude-based neutralizer (Claude 3.5 Haiku, Sonnet, etc.)."""
-
-    MODELS = {
-        "claude-3-5-haiku": "claude-haiku-4-5",
-        "claude-3-5-sonnet": "claude-3-5-sonnet-latest",
-        "claude-3-haiku": "claude-3-haiku-20240307",
-    }
-
-    def __init__(self, model: str = "claude-3-5-haiku"):
-        self._model = self.MODELS.get(model, model)
-        self._api_key = os.getenv("ANTHROPIC_API_KEY")
-
-    @property
-    def name(self) -> str:
-        return "anthropic"
-
-    @property
-    def model_name(self) -> str:
-        return self._model
-
-    def neutralize(
-        self,
-        title: str,
-        description: str | None,
-        body: str | None,
-        repair_instructions: str | None = None,
-    ) -> NeutralizationResult:
-        """Neutralize using Anthropic Claude API.
-
-        Raises NeutralizationResponseError if no API key or neutralization fails.
-        """
-        if not self._api_key:
-            logger.error("No ANTHROPIC_API_KEY set - cannot neutralize")
-            raise NeutralizationResponseError("No ANTHROPIC_API_KEY configured")
-
-        try:
-            import anthropic
-
-            client = anthropic.Anthropic(api_key=self._api_key)
-
-            if repair_instructions:
-                system_prompt = get_repair_system_prompt()
-                user_prompt = build_repair_prompt(title, description, body, repair_instructions)
-            else:
-                system_prompt = get_system_prompt()
-                user_prompt = build_user_prompt(title, description, body)
-
-            response = client.messages.create(
-                model=self._model,
-                max_tokens=1024,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt},
-                ],
-            )
-
-            import json
-
-            # Claude returns text, need to extract JSON
-            text = response.content[0].text
-            # Handle potential markdown code blocks
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
-
-            data = json.loads(text.strip())
-            return parse_llm_response(data, title, description)
-
-        except NeutralizationResponseError:
-            raise  # Re-raise our own exceptions
-        except Exception as e:
-            logger.error(f"Anthropic neutralization failed: {e}")
-            raise NeutralizationResponseError(f"Anthropic neutralization failed: {str(e)}")
-
-    def _neutralize_detail_full(
-        self,
-        body: str,
-        title: str = None,
-        retry_count: int = 0,
-        feed_category: str | None = None,
-    ) -> DetailFullResult:
-        """
-        Neutralize an article body using Anthropic Claude with SYNTHESIS approach.
-
-        Uses synthesis mode (plain text output) as the primary approach.
-        Spans are detected via hybrid LLM + position matching for context awareness.
-        Returns failure status if synthesis fails (no mock fallback).
-
-        Args:
-            body: Article body text
-            title: Original article title (for headline manipulation detection)
-            retry_count: Current retry attempt number
-            feed_category: Article genre for content-type-aware span detection
-        """
-        MAX_RETRIES = 2
-
-        if not body:
-            return DetailFullResult(detail_full="", spans=[])
-
-        if not self._api_key:
-            logger.error("No ANTHROPIC_API_KEY set - cannot neutralize")
-            return DetailFullResult(
-                detail_full="", spans=[], status="failed_llm", failure_reason="No ANTHROPIC_API_KEY configured"
-            )
-
-        # Get spans via config-aware detection (respects SPAN_DETECTION_MODE)
-        # Uses multi_pass for 99% recall if configured, otherwise single-pass
-        # Now includes title for headline manipulation detection
-        spans = _detect_spans_with_config(
-            body=body,
-            provider_api_key=self._api_key,
-            provider_type="anthropic",
-            provider_model=self._model,
-            title=title,
-            feed_category=feed_category,
-        )
-        logger.info(
-            f"Span detection completed with {len(spans)} spans (title spans: {sum(1 for s in spans if s.field == 'title')})"
-        )
-
-        try:
-            import anthropic
-
-            client = anthropic.Anthropic(api_key=self._api_key)
-
-            # Use SYNTHESIS prompt (plain text output, not JSON)
-            system_prompt = get_article_system_prompt()
-            user_prompt = build_synthesis_detail_full_prompt(body)
-
-            response = client.messages.create(
-                model=self._model,
-                max_tokens=8192,  # Larger max for full article synthesis
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt},
-                ],
-            )
-
-            detail_full = response.content[0].text.strip()
-
-            # Validate output isn't garbled
-            if _detect_garbled_output(body, detail_full):
-                logger.error("Anthropic synthesis produced garbled output")
-                return DetailFullResult(
-                    detail_full="",
-                    spans=spans,
-                    status="failed_garbled",
-                    failure_reason="Anthropic synthesis produced garbled output",
-                )
-
-            return DetailFullResult(detail_full=detail_full, spans=spans)
-
-        except Exception as e:
-            # API error - retry, then return failure status
-            if retry_count < MAX_RETRIES:
-                logger.warning(
-                    f"Anthropic synthesis error (attempt {retry_count + 1}/{MAX_RETRIES + 1}): {e}, retrying..."
-                )
-                import time
-
-                time.sleep(1)
-                return self._neutralize_detail_full(body, title, retry_count + 1)
-            else:
-                logger.error(f"Anthropic synthesis failed after {MAX_RETRIES + 1} attempts: {e}")
-                return DetailFullResult(
-                    detail_full="",
-                    spans=spans,
-                    status="failed_llm",
-                    failure_reason=f"Anthropic synthesis failed after {MAX_RETRIES + 1} attempts: {str(e)}",
-                )
-
-    def _neutralize_detail_brief(self, body: str) -> str:
-        """
-        Synthesize an article body into a brief using Anthropic Claude (Call 2: Synthesize).
-
-        Uses shared article_system_prompt + synthesis_detail_brief_prompt.
-        Returns plain text (3-5 paragraphs, no headers or bullets).
-
-        Includes retry logic: if the brief contains banned phrases, retry with
-        a repair prompt up to MAX_BRIEF_RETRIES times.
-
-        Raises NeutralizationResponseError if no API key or synthesis fails.
-        """
-        MAX_BRIEF_RETRIES = 2
-
-        if not body:
-            return ""
-
-        if not self._api_key:
-            logger.error("No ANTHROPIC_API_KEY set - cannot synthesize brief")
-            raise NeutralizationResponseError("No ANTHROPIC_API_KEY configured")
-
-        try:
-            import anthropic
-
-            client = anthropic.Anthropic(api_key=self._api_key)
-
-            system_prompt = get_article_system_prompt()
-            user_prompt = build_synthesis_detail_brief_prompt(body)
-
-            response = client.messages.create(
-                model=self._model,
-                max_tokens=2048,  # Sufficient for 3-5 paragraph brief
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt},
-                ],
-            )
-
-            brief = response.content[0].text.strip()
-
-            # Validate and retry if violations found
-            for attempt in range(MAX_BRIEF_RETRIES):
-                violations = validate_brief_neutralization(brief)
-                if not violations:
-                    return brief
-
-                logger.warning(f"Brief validation failed (attempt {attempt + 1}/{MAX_BRIEF_RETRIES + 1}): {violations}")
-
-                # Generate repair prompt and retry
-                repair_prompt = build_brief_repair_prompt(brief, violations)
-                repair_response = client.messages.create(
-                    model=self._model,
-                    max_tokens=2048,
-                    system=system_prompt,
-                    messages=[
-                        {"role": "user", "content": repair_prompt},
-                    ],
-                )
-                brief = repair_response.content[0].text.strip()
-
-            # Final validation after all retries
-            violations = validate_brief_neutralization(brief)
-            if violations:
-                logger.error(f"Brief validation failed after {MAX_BRIEF_RETRIES + 1} attempts: {violations}")
-            return brief
-
-        except Exception as e:
-            logger.error(f"Anthropic detail_brief synthesis failed: {e}")
-            raise NeutralizationResponseError(f"Anthropic detail_brief synthesis failed: {str(e)}")
-
-    def _neutralize_feed_outputs(self, body: str, detail_brief: str) -> dict:
-        """
-        Generate compressed feed outputs using Anthropic Claude (Call 3: Compress).
-
-        Uses shared article_system_prompt + compression_feed_outputs_prompt.
-        Returns dict with feed_title, feed_summary, detail_title, section.
-
-        Includes validation and retry for feed_summary banned phrases.
-
-        Raises NeutralizationResponseError if no API key or compression fails.
-        """
-        MAX_FEED_SUMMARY_RETRIES = 2
-
-        if not body and not detail_brief:
-            return {
-                "feed_title": "",
-                "feed_summary": "",
-                "detail_title": "",
-                "section": "world",
-            }
-
-        if not self._api_key:
-            logger.error("No ANTHROPIC_API_KEY set - cannot generate feed outputs")
-            raise NeutralizationResponseError("No ANTHROPIC_API_KEY configured")
-
-        try:
-            import json
-
-            import anthropic
-
-            client = anthropic.Anthropic(api_key=self._api_key)
-
-            # Use lighter headline prompt for feed outputs (not aggressive article prompt)
-            system_prompt = get_headline_system_prompt()
-            user_prompt = build_compression_feed_outputs_prompt(body, detail_brief)
-
-            response = client.messages.create(
-                model=self._model,
-                max_tokens=1024,  # Sufficient for feed outputs
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt},
-                ],
-            )
-
-            # Claude returns text, need to extract JSON
-            text = response.content[0].text
-            # Handle potential markdown code blocks
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
-
-            data = json.loads(text.strip())
-            result = {
-                "feed_title": data.get("feed_title", ""),
-                "feed_summary": data.get("feed_summary", ""),
-                "detail_title": data.get("detail_title", ""),
-                "section": data.get("section", "world"),
-            }
-
-            # Validate and retry feed_summary if it contains banned phrases
-            for attempt in range(MAX_FEED_SUMMARY_RETRIES):
-                violations = validate_feed_summary(result["feed_summary"])
-                if not violations:
-                    break
-
-                logger.warning(
-                    f"Feed summary validation failed (attempt {attempt + 1}/{MAX_FEED_SUMMARY_RETRIES + 1}): {violations}"
-                )
-
-                # Generate repair prompt and retry
-                repair_prompt = build_feed_summary_repair_prompt(result["feed_summary"], violations)
-                repair_response = client.messages.create(
-                    model=self._model,
-                    max_tokens=256,
-                    system="You are a neutral news editor. Return only the rewritten text.",
-                    messages=[
-                        {"role": "user", "content": repair_prompt},
-                    ],
-                )
-                result["feed_summary"] = repair_response.content[0].text.strip()
-
-            # Final validation
-            violations = validate_feed_summary(result["feed_summary"])
-            if violations:
-                logger.error(
-                    f"Feed summary validation failed after {MAX_FEED_SUMMARY_RETRIES + 1} attempts: {violations}"
-                )
-
-            # Apply sentence-boundary truncation as safety net
-            result["feed_summary"] = truncate_at_sentence(result["feed_summary"], 130)
-
-            # Validate feed outputs for garbled content
-            _validate_feed_outputs(result)
-            return result
-
-        except Exception as e:
-            logger.error(f"Anthropic feed outputs compression failed: {e}")
-            raise NeutralizationResponseError(f"Anthropic feed outputs compression failed: {str(e)}")
+    return DetailFullResult(detail_full=detail_full, spans=spans)
 
 
 # -----------------------------------------------------------------------------
@@ -6087,13 +5106,14 @@ def _infer_provider_from_model(model: str) -> str:
         )
 
 
-# Provider registry - maps provider names to classes
-PROVIDERS = {
-    "mock": MockNeutralizerProvider,
-    "openai": OpenAINeutralizerProvider,
-    "gemini": GeminiNeutralizerProvider,
-    "anthropic": AnthropicNeutralizerProvider,
-}
+def __getattr__(name: str) -> Any:
+    """Resolve provider classes from the providers subpackage on first access."""
+    if name in LAZY_EXPORTS:
+        value = load_export(name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # API key env var names for each provider
 PROVIDER_API_KEYS = {
@@ -6143,20 +5163,167 @@ def get_neutralizer_provider() -> NeutralizerProvider:
     # Get the active model from DB
     model = get_active_model()
 
-    # Infer provider from model name
-    provider_name = _infer_provider_from_model(model)
+    # Infer provider from model name
+    provider_name = _infer_provider_from_model(model)
+
+    # Check API key is configured
+    _check_api_key(provider_name)
+
+    if provider_name not in PROVIDERS:
+        raise NeutralizerConfigError(f"Unknown provider '{provider_name}'")
+
+    # Only the selected provider's module is imported
+    provider_class = load_provider_class(provider_name)
+    if provider_name == "mock":
+        return provider_class()
+
+    return provider_class(model=model)
+
+
+# -----------------------------------------------------------------------------
+# Stage fingerprints - incremental re-neutralization
+# -----------------------------------------------------------------------------
+
+STAGE_DETAIL_FULL = "detail_full"
+STAGE_DETAIL_BRIEF = "detail_brief"
+STAGE_FEED_OUTPUTS = "feed_outputs"
+
+
+def _fingerprint(*parts: Any) -> str:
+    """Short stable hash of JSON-serializable parts."""
+    return compute_content_hash(json.dumps(parts, default=str).encode("utf-8"))[:16]
+
+
+def compute_stage_fingerprints(provider: NeutralizerProvider, body: str | None) -> dict[str, str]:
+    """
+    Fingerprint every generation stage's inputs for one article.
+
+    Each fingerprint hashes the prompt contents and models the stage runs
+    with, plus the body it reads. Feed outputs are written from the brief,
+    so their fingerprint folds in the brief's and changes whenever it does.
+    A stage whose fingerprint matches the previous version row's would
+    produce the same kind of output, so a forced re-run can reuse it.
+
+    Returns:
+        Dict of stage name (STAGE_*) -> fingerprint
+    """
+    settings = get_settings()
+    body_hash = compute_content_hash((body or "").encode("utf-8"))
+    article_system = get_article_system_prompt()
+    repair_system = get_repair_system_prompt()
+    fused_prompt = get_fused_brief_feed_prompt() if settings.FUSED_BRIEF_FEED_CALL else None
+
+    detail_full = _fingerprint(
+        STAGE_DETAIL_FULL,
+        provider.name,
+        provider.model_name,
+        settings.DETAIL_FULL_MODEL,
+        settings.DETAIL_FULL_MODE,
+        settings.DETAIL_FULL_CHUNKING,
+        settings.DETAIL_FULL_CHUNK_SIZE,
+        settings.SPAN_DETECTION_MODE,
+        settings.SPAN_DETECTION_MODEL,
+        settings.HIGH_RECALL_MODEL,
+        settings.ADVERSARIAL_MODEL,
+        article_system,
+        get_synthesis_detail_full_prompt(),
+        get_span_detection_prompt(),
+        get_high_recall_prompt(),
+        get_adversarial_prompt(),
+        body_hash,
+    )
+    detail_brief = _fingerprint(
+        STAGE_DETAIL_BRIEF,
+        provider.name,
+        provider.model_name,
+        article_system,
+        repair_system,
+        get_synthesis_detail_brief_prompt(),
+        fused_prompt,
+        body_hash,
+    )
+    feed_outputs = _fingerprint(
+        STAGE_FEED_OUTPUTS,
+        provider.name,
+        provider.model_name,
+        get_headline_system_prompt(),
+        repair_system,
+        get_compression_feed_outputs_prompt(),
+        fused_prompt,
+        detail_brief,
+    )
+    return {STAGE_DETAIL_FULL: detail_full, STAGE_DETAIL_BRIEF: detail_brief, STAGE_FEED_OUTPUTS: feed_outputs}
+
+
+@dataclass
+class PreviousStageOutputs:
+    """Stage outputs of the current version row, kept for a forced re-run."""
+
+    fingerprints: dict[str, str]
+    detail_full: DetailFullResult
+    detail_brief: str
+    feed_outputs: dict
+
+    @classmethod
+    def from_row(cls, row: models.StoryNeutralized | None) -> "PreviousStageOutputs | None":
+        """Snapshot a successful row with recorded fingerprints, or None. Reads row.spans."""
+        if row is None or not row.stage_fingerprints or row.neutralization_status != "success":
+            return None
+        spans = [
+            TransparencySpan(
+                field=span.field,
+                start_char=span.start_char,
+                end_char=span.end_char,
+                original_text=span.original_text,
+                action=SpanAction(span.action),
+                reason=SpanReason(span.reason),
+                replacement_text=span.replacement_text,
+            )
+            for span in row.spans
+        ]
+        return cls(
+            fingerprints=dict(row.stage_fingerprints),
+            detail_full=DetailFullResult(detail_full=row.detail_full or "", spans=spans),
+            detail_brief=row.detail_brief or "",
+            feed_outputs={
+                "feed_title": row.feed_title,
+                "feed_summary": row.feed_summary,
+                "detail_title": row.detail_title,
+            },
+        )
+
+    def reusable_stages(self, fingerprints: dict[str, str]) -> set[str]:
+        """Stages whose fingerprint is unchanged."""
+        return {stage for stage, fingerprint in fingerprints.items() if self.fingerprints.get(stage) == fingerprint}
+
+
+# -----------------------------------------------------------------------------
+# Syndication grouping - neutralize once, fan out to wire copies
+# -----------------------------------------------------------------------------
+
 
-    # Check API key is configured
-    _check_api_key(provider_name)
+def group_syndicated_stories(story_data: list[dict]) -> list[tuple[dict, list[dict]]]:
+    """
+    Group prepared stories that share an identical body.
 
-    if provider_name == "mock":
-        return MockNeutralizerProvider()
+    Wire stories are often republished verbatim by several outlets, producing
+    separate StoryRaw rows with the same body. The key is the stored
+    raw_content_hash (SHA256 of the body text), falling back to hashing the
+    fetched body when the column is empty. Exact hashes are used rather than a
+    normalized form because body spans are cloned by character offset.
 
-    provider_class = PROVIDERS.get(provider_name)
-    if not provider_class:
-        raise NeutralizerConfigError(f"Unknown provider '{provider_name}'")
+    Args:
+        story_data: Prepared story dicts with "body" and optional "content_hash"
 
-    return provider_class(model=model)
+    Returns:
+        List of (representative, siblings) tuples in input order. The first
+        story of each group is the representative.
+    """
+    groups: dict[str, list[dict]] = {}
+    for sd in story_data:
+        key = sd.get("content_hash") or compute_content_hash(sd["body"].encode("utf-8"))
+        groups.setdefault(key, []).append(sd)
+    return [(members[0], members[1:]) for members in groups.values()]
 
 
 class NeutralizerService:
@@ -6245,6 +5412,11 @@ class NeutralizerService:
             # Fetch body from storage
             body = _get_body_from_storage(story)
 
+            # On a forced re-run, stages whose prompts and model are unchanged reuse the current row
+            fingerprints = compute_stage_fingerprints(self.provider, body)
+            previous = PreviousStageOutputs.from_row(existing)
+            reusable = previous.reusable_stages(fingerprints) if previous else set()
+
             # Initialize auditor
             auditor = Auditor()
             audit_result = None
@@ -6255,10 +5427,16 @@ class NeutralizerService:
 
             # Run the 3-call pipeline with retry loop for audit
             for attempt in range(MAX_RETRY_ATTEMPTS + 1):
+                # An audit retry regenerates everything
+                reuse = reusable if attempt == 0 else set()
+
                 # Call 1: Filter & Track - produces detail_full and spans
                 # Pass title and feed_category for content-type-aware detection
-                if body:
-                    detail_full_result = self.provider._neutralize_detail_full(
+                if body and STAGE_DETAIL_FULL in reuse:
+                    detail_full_result = previous.detail_full
+                    transparency_spans = detail_full_result.spans
+                elif body:
+                    detail_full_result = self.provider.neutralize_detail_full(
                         body,
                         title=story.original_title,
                         feed_category=story.feed_category,
@@ -6335,13 +5513,8 @@ class NeutralizerService:
                     transparency_spans = []
 
                 # Call 2: Synthesize - produces detail_brief
-                if body:
-                    detail_brief = self.provider._neutralize_detail_brief(body)
-                else:
-                    detail_brief = ""
-
                 # Call 3: Compress - produces feed_title, feed_summary, detail_title, section
-                feed_outputs = self.provider._neutralize_feed_outputs(body or "", detail_brief)
+                detail_brief, feed_outputs = self._brief_and_feed(body or "", previous, reuse)
 
                 # Apply LLM section classification if valid and different from keyword classifier
                 llm_section = feed_outputs.get("section", "").lower()
@@ -6435,6 +5608,7 @@ class NeutralizerService:
                 has_manipulative_content=has_manipulative_content,
                 model_name=self.provider.model_name,
                 prompt_version="v3",  # Updated for 3-call pipeline
+                stage_fingerprints=fingerprints,
                 neutralization_status="success",
                 failure_reason=None,
                 created_at=datetime.now(UTC),
@@ -6494,6 +5668,7 @@ class NeutralizerService:
                     "audit_verdict": audit_result.verdict.value if audit_result else "none",
                     "retry_count": attempt if "attempt" in dir() else 0,
                     "span_count": len(transparency_spans),
+                    "reused_stages": sorted(reuse),
                 },
             )
 
@@ -6518,6 +5693,7 @@ class NeutralizerService:
         description: str | None,
         body: str | None,
         feed_category: str | None = None,
+        previous: PreviousStageOutputs | None = None,
     ) -> dict[str, Any]:
         """
         Neutralize content using 3-call LLM pipeline (thread-safe, no db operations).
@@ -6534,9 +5710,12 @@ class NeutralizerService:
             description: Original article description
             body: Original article body
             feed_category: Article genre for content-type-aware span detection
+            previous: Outputs of the current version row on a forced re-run;
+                stages whose fingerprint is unchanged reuse them
 
         Returns:
-            Dict with neutralization result, transparency spans, or error
+            Dict with neutralization result, transparency spans, stage
+            fingerprints, or error
         """
         from app.services.auditor import Auditor, AuditVerdict
 
@@ -6551,12 +5730,21 @@ class NeutralizerService:
             # Span detection uses the ORIGINAL body for position integrity.
             cleaned_body = clean_article_body(body) if body else body
 
+            fingerprints = compute_stage_fingerprints(self.provider, body)
+            reusable = previous.reusable_stages(fingerprints) if previous else set()
+
             # Run the 3-call pipeline with retry loop for audit
             for attempt in range(MAX_RETRY_ATTEMPTS + 1):
+                # An audit retry regenerates everything
+                reuse = reusable if attempt == 0 else set()
+
                 # Call 1: Filter & Track - produces detail_full and spans
                 # Uses ORIGINAL body so spans reference correct positions
-                if body:
-                    detail_full_result = self.provider._neutralize_detail_full(
+                if body and STAGE_DETAIL_FULL in reuse:
+                    detail_full_result = previous.detail_full
+                    transparency_spans = detail_full_result.spans
+                elif body:
+                    detail_full_result = self.provider.neutralize_detail_full(
                         body,
                         title=title,
                         feed_category=feed_category,
@@ -6581,13 +5769,8 @@ class NeutralizerService:
                     transparency_spans = []
 
                 # Call 2: Synthesize - produces detail_brief (uses cleaned body)
-                if cleaned_body:
-                    detail_brief = self.provider._neutralize_detail_brief(cleaned_body)
-                else:
-                    detail_brief = ""
-
                 # Call 3: Compress - produces feed_title, feed_summary, detail_title
-                feed_outputs = self.provider._neutralize_feed_outputs(cleaned_body or "", detail_brief)
+                detail_brief, feed_outputs = self._brief_and_feed(cleaned_body or "", previous, reuse)
 
                 # Determine if content was manipulative (has transparency spans)
                 has_manipulative_content = len(transparency_spans) > 0
@@ -6651,6 +5834,8 @@ class NeutralizerService:
                 "transparency_spans": transparency_spans,  # Include spans for storage
                 "audit_verdict": audit_result.verdict.value if audit_result else "none",
                 "retry_count": attempt,
+                "stage_fingerprints": fingerprints,
+                "reused_stages": sorted(reuse),
             }
 
         except Exception as e:
@@ -6661,31 +5846,71 @@ class NeutralizerService:
                 "error": str(e),
             }
 
-    def neutralize_pending(
+    def _brief_and_feed(
         self,
-        db: Session,
-        story_ids: list[str] | None = None,
-        force: bool = False,
-        limit: int = 50,
-        max_workers: int = 5,
+        body: str,
+        previous: PreviousStageOutputs | None,
+        reuse: set[str],
+    ) -> tuple[str, dict]:
+        """Calls 2 and 3, skipping whichever the previous version row can supply."""
+        # The feed fingerprint covers the brief's, so a reusable feed implies a reusable brief
+        if STAGE_FEED_OUTPUTS in reuse:
+            return previous.detail_brief, dict(previous.feed_outputs)
+        if STAGE_DETAIL_BRIEF in reuse:
+            return previous.detail_brief, self.provider._neutralize_feed_outputs(body, previous.detail_brief)
+        return self.provider.neutralize_brief_and_feed(body)
+
+    def _fan_out_syndicated(
+        self,
+        representative_result: dict[str, Any],
+        representative_title: str,
+        sibling: dict,
     ) -> dict[str, Any]:
         """
-        Neutralize pending stories with parallel processing.
-
-        Args:
-            db: Database session
-            story_ids: Specific story IDs to process (optional)
-            force: Re-neutralize even if already done
-            limit: Max stories to process
-            max_workers: Number of parallel workers (default: 5)
+        Derive a syndicated sibling's result from its representative (thread-safe).
 
-        Returns:
-            Dict with processing results
+        Body-derived outputs (detail_full, detail_brief, feed outputs and body
+        spans) are reused as-is. Feed outputs are generated from the body alone,
+        so the only title-dependent output is the headline spans from Call 1;
+        those are copied when the headline matches and re-detected otherwise.
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        started_at = datetime.now(UTC)
+        story_id = sibling["story_id"]
+        if representative_result["status"] != "completed":
+            return {**representative_result, "story_id": story_id}
+
+        representative = representative_result["result"]
+        body_spans = [s for s in representative.spans if s.field != "title"]
+        if sibling["title"] == representative_title:
+            title_spans = [s for s in representative.spans if s.field == "title"]
+        else:
+            try:
+                title_spans = self.provider._detect_title_spans(sibling["title"], sibling.get("feed_category"))
+            except Exception as e:
+                logger.warning(f"Title span detection failed for syndicated story {story_id}: {e}")
+                title_spans = []
+
+        spans = [replace(s) for s in title_spans + body_spans]
+        result = replace(
+            representative,
+            spans=spans,
+            has_manipulative_content=len(spans) > 0,
+            removed_phrases=[s.original_text for s in spans],
+        )
+        return {
+            **representative_result,
+            "story_id": story_id,
+            "result": result,
+            "transparency_spans": spans,
+        }
 
+    def _select_stories_for_neutralization(
+        self,
+        db: Session,
+        story_ids: list[str] | None,
+        force: bool,
+        limit: int,
+    ) -> list[models.StoryRaw]:
+        """Query the stories a neutralization run should process, freshest first."""
         # Get stories to process
         if story_ids:
             # When specific IDs are requested, skip is_duplicate filter
@@ -6756,28 +5981,15 @@ class NeutralizerService:
                 logger.info(f"Early filter: skipped {skipped_truncated} articles with truncated/insufficient bodies")
 
         # Prioritize fresh articles - most recent first
-        stories = query.order_by(models.StoryRaw.published_at.desc()).limit(limit).all()
-
-        result = {
-            "status": "completed",
-            "started_at": started_at,
-            "finished_at": None,
-            "duration_ms": 0,
-            "total_processed": 0,
-            "total_skipped": 0,
-            "total_failed": 0,
-            "skipped_no_body": 0,  # Stories skipped due to missing body content
-            "story_results": [],
-            "max_workers": max_workers,
-        }
+        return query.order_by(models.StoryRaw.published_at.desc()).limit(limit).all()
 
-        if not stories:
-            result["finished_at"] = datetime.now(UTC)
-            result["duration_ms"] = int((result["finished_at"] - started_at).total_seconds() * 1000)
-            return result
+    def _prepare_story_data(self, stories: list[models.StoryRaw]) -> tuple[list[dict], int]:
+        """
+        Extract plain story dicts from ORM objects for worker threads.
 
-        # Prepare data for parallel processing (extract from ORM objects)
-        # Skip stories where body is empty/unavailable even after storage check
+        Stories whose body is empty/unavailable even after the storage check
+        are skipped. Returns (story_data, skipped_no_body).
+        """
         story_data = []
         skipped_no_body = 0
         for story in stories:
@@ -6794,29 +6006,292 @@ class NeutralizerService:
                     "description": story.original_description,
                     "body": body,
                     "feed_category": story.feed_category,
+                    "content_hash": story.raw_content_hash,
                     "story_obj": story,  # Keep reference for db operations
                 }
             )
+        return story_data, skipped_no_body
 
-        result["skipped_no_body"] = skipped_no_body
+    def _group_story_data(self, story_data: list[dict], result: dict[str, Any]) -> list[tuple[dict, list[dict]]]:
+        """Group stories by identical body so one representative is neutralized per group."""
+        if get_settings().NEUTRALIZE_SYNDICATION_DEDUPE:
+            groups = group_syndicated_stories(story_data)
+        else:
+            groups = [(sd, []) for sd in story_data]
+        result["total_syndicated"] = sum(len(siblings) for _, siblings in groups)
+        if result["total_syndicated"]:
+            logger.info(
+                f"Syndication: {len(story_data)} stories share {len(groups)} bodies, "
+                f"reusing outputs for {result['total_syndicated']}"
+            )
+        return groups
 
-        # Check for existing neutralizations
-        existing_map = {}
-        if force:
-            existing_neutralized = (
-                db.query(models.StoryNeutralized)
-                .filter(
-                    models.StoryNeutralized.story_raw_id.in_([s["story_id"] for s in story_data]),
-                    models.StoryNeutralized.is_current == True,
+    def _load_existing_neutralizations(
+        self,
+        db: Session,
+        story_data: list[dict],
+        force: bool,
+    ) -> dict[uuid.UUID, models.StoryNeutralized]:
+        """Map story_raw_id -> current StoryNeutralized for stories being re-neutralized."""
+        if not force:
+            return {}
+        existing_neutralized = (
+            db.query(models.StoryNeutralized)
+            .options(selectinload(models.StoryNeutralized.spans))
+            .filter(
+                models.StoryNeutralized.story_raw_id.in_([s["story_id"] for s in story_data]),
+                models.StoryNeutralized.is_current == True,
+            )
+            .all()
+        )
+        return {n.story_raw_id: n for n in existing_neutralized}
+
+    @staticmethod
+    def _new_run_result(started_at: datetime, **extra: Any) -> dict[str, Any]:
+        """Empty result dict shared by the pending and batch neutralization runs."""
+        return {
+            "status": "completed",
+            "started_at": started_at,
+            "finished_at": None,
+            "duration_ms": 0,
+            "total_processed": 0,
+            "total_skipped": 0,
+            "total_failed": 0,
+            "skipped_no_body": 0,  # Stories skipped due to missing body content
+            "total_syndicated": 0,  # Stories that reused a sibling's LLM outputs
+            "story_results": [],
+            **extra,
+        }
+
+    @staticmethod
+    def _finish_run_result(result: dict[str, Any]) -> dict[str, Any]:
+        """Stamp timing and roll per-story outcomes up into the run status."""
+        finished_at = datetime.now(UTC)
+        result["finished_at"] = finished_at
+        result["duration_ms"] = int((finished_at - result["started_at"]).total_seconds() * 1000)
+
+        if result["total_failed"] > 0 and result["total_processed"] == 0:
+            result["status"] = "failed"
+        elif result["total_failed"] > 0:
+            result["status"] = "partial"
+
+        return result
+
+    def _persist_llm_result(
+        self,
+        db: Session,
+        sd: dict,
+        llm_result: dict[str, Any],
+        existing_map: dict[uuid.UUID, models.StoryNeutralized],
+        started_at: datetime,
+        result: dict[str, Any],
+    ) -> None:
+        """
+        Write one story's neutralization outcome to the session.
+
+        Adds the StoryNeutralized row and its spans (or a skipped/failed
+        pipeline log), updates the run counters and appends the story result.
+        Does not commit.
+        """
+        story_id = sd["story_id"]
+        story_result = {
+            "story_id": str(story_id),
+            "status": llm_result["status"],
+            "feed_title": None,
+            "has_manipulative_content": False,
+            "span_count": 0,
+            "error": llm_result.get("error"),
+        }
+
+        if llm_result["status"] == "completed":
+            neutralization = llm_result["result"]
+
+            # Determine version
+            version = 1
+            existing = existing_map.get(story_id)
+            if existing:
+                existing.is_current = False
+                version = existing.version + 1
+
+            # Create neutralized record
+            neutralized = models.StoryNeutralized(
+                id=uuid.uuid4(),
+                story_raw_id=story_id,
+                version=version,
+                is_current=True,
+                feed_title=neutralization.feed_title,
+                feed_summary=neutralization.feed_summary,
+                detail_title=neutralization.detail_title,
+                detail_brief=neutralization.detail_brief,
+                detail_full=neutralization.detail_full,
+                disclosure="Manipulative language removed." if neutralization.has_manipulative_content else "",
+                has_manipulative_content=neutralization.has_manipulative_content,
+                model_name=self.provider.model_name,
+                prompt_version="v3",  # Updated for 3-call pipeline
+                stage_fingerprints=llm_result.get("stage_fingerprints"),
+                created_at=datetime.now(UTC),
+            )
+            db.add(neutralized)
+            db.flush()  # Flush to get neutralized.id for span FK
+
+            # Save transparency spans
+            transparency_spans = llm_result.get("transparency_spans", [])
+            for span in transparency_spans:
+                span_record = models.TransparencySpan(
+                    id=uuid.uuid4(),
+                    story_neutralized_id=neutralized.id,
+                    field=span.field,
+                    start_char=span.start_char,
+                    end_char=span.end_char,
+                    original_text=span.original_text,
+                    action=span.action.value if isinstance(span.action, SpanAction) else span.action,
+                    reason=span.reason.value if isinstance(span.reason, SpanReason) else span.reason,
+                    replacement_text=span.replacement_text,
                 )
-                .all()
+                db.add(span_record)
+
+            # Log success
+            self._log_pipeline(
+                db,
+                stage=PipelineStage.NEUTRALIZE,
+                status=PipelineStatus.COMPLETED,
+                story_raw_id=story_id,
+                started_at=started_at,
+                metadata={
+                    "provider": self.provider.name,
+                    "model": self.provider.model_name,
+                    "has_manipulative": neutralization.has_manipulative_content,
+                    "span_count": len(transparency_spans),
+                    "audit_verdict": llm_result.get("audit_verdict", "none"),
+                    "retry_count": llm_result.get("retry_count", 0),
+                    "syndicated_from": str(llm_result["syndicated_from"])
+                    if llm_result.get("syndicated_from")
+                    else None,
+                    "reused_stages": llm_result.get("reused_stages", []),
+                },
+            )
+
+            story_result["feed_title"] = neutralization.feed_title
+            story_result["has_manipulative_content"] = neutralization.has_manipulative_content
+            story_result["span_count"] = len(transparency_spans)
+            result["total_processed"] += 1
+
+        elif llm_result["status"] == "skipped":
+            self._log_pipeline(
+                db,
+                stage=PipelineStage.NEUTRALIZE,
+                status=PipelineStatus.SKIPPED,
+                story_raw_id=story_id,
+                started_at=started_at,
+                metadata={
+                    "reason": llm_result.get("reason", "unknown"),
+                    "audit_reasons": llm_result.get("audit_reasons", []),
+                },
+            )
+            result["total_skipped"] += 1
+
+        else:  # failed
+            self._log_pipeline(
+                db,
+                stage=PipelineStage.NEUTRALIZE,
+                status=PipelineStatus.FAILED,
+                story_raw_id=story_id,
+                started_at=started_at,
+                error_message=llm_result.get("error", "Unknown error"),
+            )
+            result["total_failed"] += 1
+
+        result["story_results"].append(story_result)
+
+    def _persist_and_commit(
+        self,
+        db: Session,
+        sd: dict,
+        llm_result: dict[str, Any],
+        existing_map: dict[uuid.UUID, models.StoryNeutralized],
+        started_at: datetime,
+        result: dict[str, Any],
+    ) -> None:
+        """
+        Persist one story's outcome in its own transaction.
+
+        Run counters are only updated once the commit succeeds; a failed
+        commit is rolled back and the story is reported as failed.
+        """
+        story_run = {"total_processed": 0, "total_skipped": 0, "total_failed": 0, "story_results": []}
+        try:
+            self._persist_llm_result(db, sd, llm_result, existing_map, started_at, story_run)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to persist neutralization for story {sd['story_id']}: {e}")
+            result["total_failed"] += 1
+            result["story_results"].append(
+                {
+                    "story_id": str(sd["story_id"]),
+                    "status": "failed",
+                    "feed_title": None,
+                    "has_manipulative_content": False,
+                    "span_count": 0,
+                    "error": f"Persist failed: {e}",
+                }
             )
-            existing_map = {n.story_raw_id: n for n in existing_neutralized}
+            return
+
+        for key in ("total_processed", "total_skipped", "total_failed"):
+            result[key] += story_run[key]
+        result["story_results"].extend(story_run["story_results"])
+
+    def neutralize_pending(
+        self,
+        db: Session,
+        story_ids: list[str] | None = None,
+        force: bool = False,
+        limit: int = 50,
+        max_workers: int = 5,
+    ) -> dict[str, Any]:
+        """
+        Neutralize pending stories with parallel processing.
+
+        Each story is committed in its own transaction as soon as its LLM
+        calls finish, so finished stories are visible to QC and the brief
+        while the rest of the run is still in flight, and a failed commit
+        only loses that one story.
+
+        Args:
+            db: Database session
+            story_ids: Specific story IDs to process (optional)
+            force: Re-neutralize even if already done
+            limit: Max stories to process
+            max_workers: Number of parallel workers (default: 5)
+
+        Returns:
+            Dict with processing results
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        started_at = datetime.now(UTC)
+        stories = self._select_stories_for_neutralization(db, story_ids, force, limit)
+        result = self._new_run_result(started_at, max_workers=max_workers)
+
+        if not stories:
+            return self._finish_run_result(result)
+
+        # Prepare data for parallel processing (extract from ORM objects)
+        story_data, result["skipped_no_body"] = self._prepare_story_data(stories)
+
+        # Neutralize one story per identical body; siblings reuse its outputs
+        groups = self._group_story_data(story_data, result)
 
-        # Run LLM calls in parallel
-        llm_results = {}
+        # Check for existing neutralizations
+        existing_map = self._load_existing_neutralizations(db, story_data, force)
+
+        # Run LLM calls in parallel and persist each story as soon as it finishes.
+        # Siblings are submitted once their representative completes, so the
+        # persist loop only ever holds results that have not been written yet.
+        siblings_by_rep = {representative["story_id"]: siblings for representative, siblings in groups}
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
+            pending = {
                 executor.submit(
                     self._neutralize_content,
                     sd["story_id"],
@@ -6824,145 +6299,127 @@ class NeutralizerService:
                     sd["description"],
                     sd["body"],
                     sd.get("feed_category"),
-                ): sd["story_id"]
-                for sd in story_data
+                    PreviousStageOutputs.from_row(existing_map.get(sd["story_id"])),
+                ): (sd, None)
+                for sd, _ in groups
             }
+            # Workers hold their own references; drop ours so bodies can be freed
+            del story_data, groups, stories
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    sd, representative = pending.pop(future)
+                    story_id = sd["story_id"]
+                    try:
+                        llm_result = future.result()
+                        if representative is not None:
+                            llm_result["syndicated_from"] = representative["story_id"]
+                    except Exception as e:
+                        stage = "Syndication fan-out" if representative is not None else "Future"
+                        logger.error(f"{stage} failed for story {story_id}: {e}")
+                        llm_result = {
+                            "story_id": story_id,
+                            "status": "failed",
+                            "error": str(e),
+                        }
 
-            for future in as_completed(futures):
-                story_id = futures[future]
-                try:
-                    llm_result = future.result()
-                    llm_results[story_id] = llm_result
-                except Exception as e:
-                    logger.error(f"Future failed for story {story_id}: {e}")
-                    llm_results[story_id] = {
-                        "story_id": story_id,
-                        "status": "failed",
-                        "error": str(e),
-                    }
+                    # Fan representative results out to syndicated siblings
+                    if representative is None:
+                        for sibling in siblings_by_rep.pop(story_id, []):
+                            sibling_future = executor.submit(self._fan_out_syndicated, llm_result, sd["title"], sibling)
+                            pending[sibling_future] = (sibling, sd)
 
-        # Save results to database (sequential)
-        for sd in story_data:
-            story_id = sd["story_id"]
-            story = sd["story_obj"]
-            llm_result = llm_results.get(story_id, {"status": "failed", "error": "No result"})
-
-            story_result = {
-                "story_id": str(story_id),
-                "status": llm_result["status"],
-                "feed_title": None,
-                "has_manipulative_content": False,
-                "span_count": 0,
-                "error": llm_result.get("error"),
-            }
+                    self._persist_and_commit(db, sd, llm_result, existing_map, started_at, result)
 
-            if llm_result["status"] == "completed":
-                neutralization = llm_result["result"]
+                    # Free the body and ORM reference now that the story is in the DB
+                    sd["body"] = None
+                    sd["story_obj"] = None
 
-                # Determine version
-                version = 1
-                existing = existing_map.get(story_id)
-                if existing:
-                    existing.is_current = False
-                    version = existing.version + 1
+        return self._finish_run_result(result)
 
-                # Create neutralized record
-                neutralized = models.StoryNeutralized(
-                    id=uuid.uuid4(),
-                    story_raw_id=story_id,
-                    version=version,
-                    is_current=True,
-                    feed_title=neutralization.feed_title,
-                    feed_summary=neutralization.feed_summary,
-                    detail_title=neutralization.detail_title,
-                    detail_brief=neutralization.detail_brief,
-                    detail_full=neutralization.detail_full,
-                    disclosure="Manipulative language removed." if neutralization.has_manipulative_content else "",
-                    has_manipulative_content=neutralization.has_manipulative_content,
-                    model_name=self.provider.model_name,
-                    prompt_version="v3",  # Updated for 3-call pipeline
-                    created_at=datetime.now(UTC),
-                )
-                db.add(neutralized)
-                db.flush()  # Flush to get neutralized.id for span FK
-
-                # Save transparency spans
-                transparency_spans = llm_result.get("transparency_spans", [])
-                for span in transparency_spans:
-                    span_record = models.TransparencySpan(
-                        id=uuid.uuid4(),
-                        story_neutralized_id=neutralized.id,
-                        field=span.field,
-                        start_char=span.start_char,
-                        end_char=span.end_char,
-                        original_text=span.original_text,
-                        action=span.action.value if isinstance(span.action, SpanAction) else span.action,
-                        reason=span.reason.value if isinstance(span.reason, SpanReason) else span.reason,
-                        replacement_text=span.replacement_text,
-                    )
-                    db.add(span_record)
-
-                # Log success
-                self._log_pipeline(
-                    db,
-                    stage=PipelineStage.NEUTRALIZE,
-                    status=PipelineStatus.COMPLETED,
-                    story_raw_id=story_id,
-                    started_at=started_at,
-                    metadata={
-                        "provider": self.provider.name,
-                        "model": self.provider.model_name,
-                        "has_manipulative": neutralization.has_manipulative_content,
-                        "span_count": len(transparency_spans),
-                        "audit_verdict": llm_result.get("audit_verdict", "none"),
-                        "retry_count": llm_result.get("retry_count", 0),
-                    },
-                )
+    def neutralize_batch(
+        self,
+        db: Session,
+        story_ids: list[str] | None = None,
+        force: bool = False,
+        limit: int = 500,
+        executor: Any | None = None,
+        poll_interval: float | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Neutralize stories through provider batch APIs (offline bulk mode).
+
+        Intended for backfills and force re-neutralizations: requests are
+        submitted as batch jobs instead of synchronous calls, so they stay off
+        the interactive rate budget. On a forced re-run only stages whose
+        fingerprint changed since the current version row are resubmitted. Story selection, syndication grouping and
+        persistence are shared with neutralize_pending: each story is committed
+        in its own transaction, so one bad row doesn't roll back the run.
+        Blocks until the jobs finish (up to NEUTRALIZE_BATCH_TIMEOUT_SECONDS
+        per round).
+
+        Only representatives go through the batch API. Syndicated siblings
+        reuse their outputs; a sibling whose headline differs gets a
+        synchronous title span detection call, which draws on the interactive
+        rate budget.
 
-                story_result["feed_title"] = neutralization.feed_title
-                story_result["has_manipulative_content"] = neutralization.has_manipulative_content
-                story_result["span_count"] = len(transparency_spans)
-                result["total_processed"] += 1
-
-            elif llm_result["status"] == "skipped":
-                self._log_pipeline(
-                    db,
-                    stage=PipelineStage.NEUTRALIZE,
-                    status=PipelineStatus.SKIPPED,
-                    story_raw_id=story_id,
-                    started_at=started_at,
-                    metadata={
-                        "reason": llm_result.get("reason", "unknown"),
-                        "audit_reasons": llm_result.get("audit_reasons", []),
-                    },
-                )
-                result["total_skipped"] += 1
-
-            else:  # failed
-                self._log_pipeline(
-                    db,
-                    stage=PipelineStage.NEUTRALIZE,
-                    status=PipelineStatus.FAILED,
-                    story_raw_id=story_id,
-                    started_at=started_at,
-                    error_message=llm_result.get("error", "Unknown error"),
-                )
-                result["total_failed"] += 1
+        Args:
+            db: Database session
+            story_ids: Specific story IDs to process (optional)
+            force: Re-neutralize even if already done
+            limit: Max stories to process
+            executor: BatchExecutor to use (default: the active provider's batch API)
+            poll_interval: Seconds between job polls (default: NEUTRALIZE_BATCH_POLL_SECONDS)
+            timeout: Seconds to wait per round (default: NEUTRALIZE_BATCH_TIMEOUT_SECONDS)
+
+        Returns:
+            Dict with processing results (same shape as neutralize_pending)
 
-            result["story_results"].append(story_result)
+        Raises:
+            NeutralizerConfigError: If the provider has no batch API
+        """
+        from app.services.neutralizer.batch import get_batch_executor, run_batch_neutralization
 
-        db.commit()
+        settings = get_settings()
+        executor = executor or get_batch_executor(self.provider)
+        started_at = datetime.now(UTC)
+        stories = self._select_stories_for_neutralization(db, story_ids, force, limit)
+        result = self._new_run_result(started_at, executor=executor.name)
 
-        finished_at = datetime.now(UTC)
-        result["finished_at"] = finished_at
-        result["duration_ms"] = int((finished_at - started_at).total_seconds() * 1000)
+        if not stories:
+            return self._finish_run_result(result)
 
-        if result["total_failed"] > 0 and result["total_processed"] == 0:
-            result["status"] = "failed"
-        elif result["total_failed"] > 0:
-            result["status"] = "partial"
+        story_data, result["skipped_no_body"] = self._prepare_story_data(stories)
+        groups = self._group_story_data(story_data, result)
+        existing_map = self._load_existing_neutralizations(db, story_data, force)
 
-        return result
+        llm_results = run_batch_neutralization(
+            self.provider,
+            executor,
+            [representative for representative, _ in groups],
+            poll_interval=poll_interval if poll_interval is not None else settings.NEUTRALIZE_BATCH_POLL_SECONDS,
+            timeout=timeout if timeout is not None else settings.NEUTRALIZE_BATCH_TIMEOUT_SECONDS,
+            previous={
+                representative["story_id"]: PreviousStageOutputs.from_row(existing_map.get(representative["story_id"]))
+                for representative, _ in groups
+            },
+        )
 
+        # Persist each representative, then fan its result out to syndicated siblings
+        for representative, siblings in groups:
+            representative_result = llm_results.pop(
+                representative["story_id"], {"status": "failed", "error": "No result"}
+            )
+            self._persist_and_commit(db, representative, representative_result, existing_map, started_at, result)
+            for sibling in siblings:
+                try:
+                    llm_result = self._fan_out_syndicated(representative_result, representative["title"], sibling)
+                    llm_result["syndicated_from"] = representative["story_id"]
+                except Exception as e:
+                    logger.error(f"Syndication fan-out failed for story {sibling['story_id']}: {e}")
+                    llm_result = {"story_id": sibling["story_id"], "status": "failed", "error": str(e)}
+                self._persist_and_commit(db, sibling, llm_result, existing_map, started_at, result)
 
-# Force rebuild Sat Jan 31 09:39:18 EST 2026
+        return self._finish_run_result(result)
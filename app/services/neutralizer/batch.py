@@ -0,0 +1,803 @@
+# app/services/neutralizer/batch.py
+"""
+Offline bulk neutralization via provider batch APIs.
+
+Backfills and force re-neutralizations don't need real-time latency, and
+running them through the synchronous per-story calls competes with the
+scheduled pipeline for rate limits. Batch mode serializes the same prompts
+into provider batch jobs (OpenAI Batch API, Anthropic Message Batches),
+polls until they finish and ingests the responses with the same parsing,
+validation and persistence as NeutralizerService.neutralize_pending.
+
+Call 3 (feed outputs) needs the detail_brief from Call 2, so a run is a
+short sequence of batch rounds:
+
+    1. span detection + detail_full synthesis + detail_brief
+    2. brief repair        (only stories whose brief has banned phrases)
+    3. feed outputs
+    4. feed summary repair (only stories whose summary has banned phrases)
+
+Span detection always runs single-pass here: multi_pass chains two
+providers per chunk and has no batch equivalent.
+
+On a forced re-run, stages whose fingerprint (compute_stage_fingerprints)
+matches the previous version row are reused instead of resubmitted, as in
+NeutralizerService._neutralize_content.
+
+Executors are pluggable. LocalBatchExecutor runs requests in-process
+through a handler callable, so tests (and dry runs) never touch a
+provider.
+"""
+
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from app.config import get_settings
+from app.services.neutralizer import (
+    SPAN_DETECTION_SYSTEM_PROMPT,
+    BodyAnalysis,
+    DetailFullResult,
+    NeutralizationResult,
+    NeutralizerConfigError,
+    NeutralizerProvider,
+    PreviousStageOutputs,
+    _detect_garbled_output,
+    _validate_feed_outputs,
+    build_anthropic_cached_request,
+    build_brief_repair_prompt,
+    build_compression_feed_outputs_prompt,
+    build_feed_summary_repair_prompt,
+    build_span_detection_prompt,
+    build_synthesis_detail_brief_prompt,
+    build_synthesis_detail_full_prompt,
+    combine_title_and_body,
+    compute_stage_fingerprints,
+    filter_false_positives,
+    filter_spans_in_quotes,
+    find_phrase_positions,
+    get_article_system_prompt,
+    get_headline_system_prompt,
+    parse_span_detection_phrases,
+    rebase_combined_spans,
+    truncate_at_sentence,
+    validate_brief_neutralization,
+    validate_feed_summary,
+)
+
+logger = logging.getLogger(__name__)
+
+FEED_SUMMARY_REPAIR_SYSTEM_PROMPT = "You are a neutral news editor. Return only the rewritten text."
+
+# Batch stages (also the call_type used for prompt-cache keys)
+STAGE_SPAN_DETECTION = "span_detection"
+STAGE_DETAIL_FULL = "detail_full"
+STAGE_DETAIL_BRIEF = "detail_brief"
+STAGE_DETAIL_BRIEF_REPAIR = "detail_brief_repair"
+STAGE_FEED_OUTPUTS = "feed_outputs"
+STAGE_FEED_SUMMARY_REPAIR = "feed_summary_repair"
+
+
+@dataclass
+class BatchRequest:
+    """One LLM call in a batch job."""
+
+    custom_id: str  # "<stage>-<story_id>", unique within the job
+    call_type: str
+    model: str
+    system: str
+    user_prompt: str
+    max_tokens: int = 4096
+    json_output: bool = False
+    temperature: float | None = 0.3
+
+
+@dataclass
+class BatchResponse:
+    """Outcome of one batch request: the response text, or an error."""
+
+    custom_id: str
+    text: str | None = None
+    error: str | None = None
+
+
+def make_custom_id(stage: str, story_id: uuid.UUID | str) -> str:
+    """
+    Build a batch custom_id for a story's stage.
+
+    Stage names use underscores and story IDs use hyphens, so the first hyphen
+    separates them. The result fits Anthropic's [a-zA-Z0-9_-]{1,64} rule.
+    """
+    return f"{stage}-{story_id}"
+
+
+def parse_custom_id(custom_id: str) -> tuple[str, str]:
+    """Split a custom_id from make_custom_id() into (stage, story_id)."""
+    stage, _, story_id = custom_id.partition("-")
+    return stage, story_id
+
+
+# -----------------------------------------------------------------------------
+# Executors
+# -----------------------------------------------------------------------------
+
+
+class BatchExecutor(ABC):
+    """Submits batch jobs to a provider and collects their results."""
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Executor name for logging."""
+        pass
+
+    @abstractmethod
+    def submit(self, requests: list[BatchRequest]) -> str:
+        """Submit requests for a single model as one job. Returns the job ID."""
+        pass
+
+    @abstractmethod
+    def is_done(self, batch_id: str) -> bool:
+        """Whether the job has reached a terminal state (finished, expired, cancelled)."""
+        pass
+
+    @abstractmethod
+    def results(self, batch_id: str) -> list[BatchResponse]:
+        """Fetch whatever results a terminal job produced."""
+        pass
+
+    def run(
+        self,
+        requests: list[BatchRequest],
+        poll_interval: float,
+        timeout: float,
+    ) -> dict[str, BatchResponse]:
+        """
+        Submit requests (one job per model), wait for every job and collect results.
+
+        Requests missing from a job's output, and all requests of jobs that
+        didn't finish before the timeout, come back as errors.
+
+        Returns:
+            Dict mapping custom_id -> BatchResponse for every request
+        """
+        if not requests:
+            return {}
+
+        by_model: dict[str, list[BatchRequest]] = {}
+        for request in requests:
+            by_model.setdefault(request.model, []).append(request)
+
+        pending = {self.submit(model_requests): model for model, model_requests in by_model.items()}
+        logger.info(f"[BATCH] {self.name}: submitted {len(requests)} requests as {len(pending)} job(s)")
+
+        responses: dict[str, BatchResponse] = {}
+        deadline = time.monotonic() + timeout
+        while pending:
+            for batch_id in [b for b in pending if self.is_done(b)]:
+                for response in self.results(batch_id):
+                    responses[response.custom_id] = response
+                logger.info(f"[BATCH] {self.name}: job {batch_id} ({pending.pop(batch_id)}) finished")
+            if not pending:
+                break
+            if time.monotonic() >= deadline:
+                logger.error(f"[BATCH] {self.name}: timed out waiting on jobs {list(pending)}")
+                break
+            time.sleep(poll_interval)
+
+        for request in requests:
+            if request.custom_id not in responses:
+                responses[request.custom_id] = BatchResponse(request.custom_id, error="No result in batch output")
+        return responses
+
+
+def write_batch_jsonl(path: Path, lines: Iterable[dict]) -> Path:
+    """Write batch request lines to a JSONL file, creating the directory if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        for line in lines:
+            f.write(json.dumps(line, ensure_ascii=False) + "\n")
+    return path
+
+
+def _batch_file_path(work_dir: str | Path, provider: str, model: str) -> Path:
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+    return Path(work_dir) / f"{provider}-{model}-{stamp}-{uuid.uuid4().hex[:8]}.jsonl"
+
+
+class OpenAIBatchExecutor(BatchExecutor):
+    """OpenAI Batch API (/v1/chat/completions, 24h completion window)."""
+
+    ENDPOINT = "/v1/chat/completions"
+    TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+    def __init__(self, api_key: str, work_dir: str | Path):
+        from openai import OpenAI
+
+        self._client = OpenAI(api_key=api_key)
+        self._work_dir = work_dir
+
+    @property
+    def name(self) -> str:
+        return "openai"
+
+    @staticmethod
+    def request_line(request: BatchRequest) -> dict[str, Any]:
+        """Serialize a request as one line of an OpenAI batch input file."""
+        body: dict[str, Any] = {
+            "model": request.model,
+            "messages": [
+                {"role": "system", "content": request.system},
+                {"role": "user", "content": request.user_prompt},
+            ],
+            "prompt_cache_key": f"ntrl-{request.call_type}",
+        }
+        # Some models (e.g. gpt-5-mini) only support temperature=1
+        if request.temperature is not None and not request.model.startswith("gpt-5"):
+            body["temperature"] = request.temperature
+        if request.json_output:
+            body["response_format"] = {"type": "json_object"}
+        return {"custom_id": request.custom_id, "method": "POST", "url": OpenAIBatchExecutor.ENDPOINT, "body": body}
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        path = write_batch_jsonl(
+            _batch_file_path(self._work_dir, self.name, requests[0].model),
+            (self.request_line(r) for r in requests),
+        )
+        with path.open("rb") as f:
+            input_file = self._client.files.create(file=f, purpose="batch")
+        batch = self._client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=self.ENDPOINT,
+            completion_window="24h",
+            metadata={"source": "ntrl-neutralizer"},
+        )
+        logger.info(f"[BATCH] openai: created batch {batch.id} from {path}")
+        return batch.id
+
+    def is_done(self, batch_id: str) -> bool:
+        return self._client.batches.retrieve(batch_id).status in self.TERMINAL_STATUSES
+
+    def results(self, batch_id: str) -> list[BatchResponse]:
+        batch = self._client.batches.retrieve(batch_id)
+        responses = []
+        # Expired/cancelled batches may still have partial output
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self._client.files.content(file_id).text.splitlines():
+                if line.strip():
+                    responses.append(self.parse_result_line(json.loads(line)))
+        return responses
+
+    @staticmethod
+    def parse_result_line(line: dict[str, Any]) -> BatchResponse:
+        """Parse one line of an OpenAI batch output or error file."""
+        custom_id = line["custom_id"]
+        if line.get("error"):
+            return BatchResponse(custom_id, error=str(line["error"].get("message", line["error"])))
+        response = line.get("response") or {}
+        if response.get("status_code") != 200:
+            return BatchResponse(custom_id, error=f"HTTP {response.get('status_code')}: {response.get('body')}")
+        content = response["body"]["choices"][0]["message"]["content"]
+        return BatchResponse(custom_id, text=content.strip() if content else "")
+
+
+class AnthropicBatchExecutor(BatchExecutor):
+    """Anthropic Message Batches API."""
+
+    def __init__(self, api_key: str, work_dir: str | Path):
+        import anthropic
+
+        self._client = anthropic.Anthropic(api_key=api_key)
+        self._work_dir = work_dir
+
+    @property
+    def name(self) -> str:
+        return "anthropic"
+
+    @staticmethod
+    def request_line(request: BatchRequest) -> dict[str, Any]:
+        """Serialize a request as a Message Batches entry (same layout as the sync path)."""
+        return {
+            "custom_id": request.custom_id,
+            "params": {
+                "model": request.model,
+                "max_tokens": request.max_tokens,
+                **build_anthropic_cached_request(request.system, request.user_prompt),
+            },
+        }
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        lines = [self.request_line(r) for r in requests]
+        # Keep the JSONL on disk as the record of what was submitted
+        path = write_batch_jsonl(_batch_file_path(self._work_dir, self.name, requests[0].model), lines)
+        batch = self._client.messages.batches.create(requests=lines)
+        logger.info(f"[BATCH] anthropic: created batch {batch.id} from {path}")
+        return batch.id
+
+    def is_done(self, batch_id: str) -> bool:
+        return self._client.messages.batches.retrieve(batch_id).processing_status == "ended"
+
+    def results(self, batch_id: str) -> list[BatchResponse]:
+        responses = []
+        for entry in self._client.messages.batches.results(batch_id):
+            if entry.result.type == "succeeded":
+                text = entry.result.message.content[0].text.strip()
+                responses.append(BatchResponse(entry.custom_id, text=text))
+            else:
+                error = getattr(entry.result, "error", None)
+                responses.append(BatchResponse(entry.custom_id, error=f"{entry.result.type}: {error}"))
+        return responses
+
+
+class LocalBatchExecutor(BatchExecutor):
+    """
+    In-process stand-in for a provider batch API.
+
+    Each request is answered by calling handler(request) -> response text;
+    an exception from the handler becomes that request's error. Useful for
+    tests and for dry-running a reprocessing job without spending rate budget.
+    """
+
+    def __init__(self, handler: Callable[[BatchRequest], str]):
+        self._handler = handler
+        self._jobs: dict[str, list[BatchResponse]] = {}
+        self.submitted: list[list[BatchRequest]] = []
+
+    @property
+    def name(self) -> str:
+        return "local"
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        self.submitted.append(list(requests))
+        batch_id = f"local-{len(self._jobs)}"
+        responses = []
+        for request in requests:
+            try:
+                responses.append(BatchResponse(request.custom_id, text=self._handler(request)))
+            except Exception as e:
+                responses.append(BatchResponse(request.custom_id, error=str(e)))
+        self._jobs[batch_id] = responses
+        return batch_id
+
+    def is_done(self, batch_id: str) -> bool:
+        return True
+
+    def results(self, batch_id: str) -> list[BatchResponse]:
+        return self._jobs.pop(batch_id)
+
+
+def get_batch_executor(provider: NeutralizerProvider) -> BatchExecutor:
+    """
+    Get the batch executor for the active neutralizer provider.
+
+    Raises:
+        NeutralizerConfigError: If the provider has no batch API or no API key
+    """
+    settings = get_settings()
+    executors = {"openai": OpenAIBatchExecutor, "anthropic": AnthropicBatchExecutor}
+    if provider.name not in executors:
+        raise NeutralizerConfigError(
+            f"Batch neutralization is not supported for provider '{provider.name}'. Supported: {list(executors)}"
+        )
+    api_key = getattr(provider, "_api_key", None)
+    if not api_key:
+        raise NeutralizerConfigError(f"Batch neutralization requires an API key for provider '{provider.name}'")
+    return executors[provider.name](api_key, settings.NEUTRALIZE_BATCH_DIR)
+
+
+# -----------------------------------------------------------------------------
+# Request building
+# -----------------------------------------------------------------------------
+
+
+def _span_detection_model(provider: NeutralizerProvider) -> str:
+    # Mirrors _detect_spans_with_config's single mode
+    return get_settings().SPAN_DETECTION_MODEL if provider.name == "openai" else provider.model_name
+
+
+def _detail_full_model(provider: NeutralizerProvider) -> str:
+    # Mirrors OpenAINeutralizerProvider's DETAIL_FULL_MODEL override
+    if provider.name == "openai":
+        return get_settings().DETAIL_FULL_MODEL or provider.model_name
+    return provider.model_name
+
+
+def build_generation_requests(
+    provider: NeutralizerProvider, sd: dict, reuse: set[str] | frozenset[str] = frozenset()
+) -> list[BatchRequest]:
+    """
+    Build the round-1 requests for a story: span detection, detail_full and detail_brief.
+
+    Span detection and detail_full use the ORIGINAL body so spans reference
+    correct positions; detail_brief uses the cleaned body (sd["cleaned_body"]).
+    Stages in reuse are left out; reusable feed outputs imply a reusable brief.
+    """
+    story_id = sd["story_id"]
+    article_system = get_article_system_prompt()
+    requests = []
+    if STAGE_DETAIL_FULL not in reuse:
+        requests += [
+            BatchRequest(
+                custom_id=make_custom_id(STAGE_SPAN_DETECTION, story_id),
+                call_type=STAGE_SPAN_DETECTION,
+                model=_span_detection_model(provider),
+                system=SPAN_DETECTION_SYSTEM_PROMPT,
+                user_prompt=build_span_detection_prompt(combine_title_and_body(sd["title"], sd["body"])),
+                max_tokens=4096,
+                json_output=True,
+            ),
+            BatchRequest(
+                custom_id=make_custom_id(STAGE_DETAIL_FULL, story_id),
+                call_type=STAGE_DETAIL_FULL,
+                model=_detail_full_model(provider),
+                system=article_system,
+                user_prompt=build_synthesis_detail_full_prompt(sd["body"]),
+                max_tokens=8192,  # Larger max for full article synthesis
+            ),
+        ]
+    if not reuse & {STAGE_DETAIL_BRIEF, STAGE_FEED_OUTPUTS}:
+        requests.append(
+            BatchRequest(
+                custom_id=make_custom_id(STAGE_DETAIL_BRIEF, story_id),
+                call_type=STAGE_DETAIL_BRIEF,
+                model=provider.model_name,
+                system=article_system,
+                user_prompt=build_synthesis_detail_brief_prompt(sd["cleaned_body"]),
+                max_tokens=2048,
+            )
+        )
+    return requests
+
+
+def build_brief_repair_request(
+    provider: NeutralizerProvider, sd: dict, brief: str, violations: list[str]
+) -> BatchRequest:
+    """Build a repair request for a brief that contains banned language."""
+    return BatchRequest(
+        custom_id=make_custom_id(STAGE_DETAIL_BRIEF_REPAIR, sd["story_id"]),
+        call_type=STAGE_DETAIL_BRIEF_REPAIR,
+        model=provider.model_name,
+        system=get_article_system_prompt(),
+        user_prompt=build_brief_repair_prompt(brief, violations),
+        max_tokens=2048,
+    )
+
+
+def build_feed_outputs_request(provider: NeutralizerProvider, sd: dict, detail_brief: str) -> BatchRequest:
+    """Build the Call 3 (compress) request from the cleaned body and final brief."""
+    return BatchRequest(
+        custom_id=make_custom_id(STAGE_FEED_OUTPUTS, sd["story_id"]),
+        call_type=STAGE_FEED_OUTPUTS,
+        model=provider.model_name,
+        system=get_headline_system_prompt(),
+        user_prompt=build_compression_feed_outputs_prompt(sd["cleaned_body"], detail_brief),
+        max_tokens=1024,
+        json_output=True,
+    )
+
+
+def build_feed_summary_repair_request(
+    provider: NeutralizerProvider, sd: dict, summary: str, violations: list[str]
+) -> BatchRequest:
+    """Build a repair request for a feed summary that contains banned language."""
+    return BatchRequest(
+        custom_id=make_custom_id(STAGE_FEED_SUMMARY_REPAIR, sd["story_id"]),
+        call_type=STAGE_FEED_SUMMARY_REPAIR,
+        model=provider.model_name,
+        system=FEED_SUMMARY_REPAIR_SYSTEM_PROMPT,
+        user_prompt=build_feed_summary_repair_prompt(summary, violations),
+        max_tokens=256,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Ingestion
+# -----------------------------------------------------------------------------
+
+
+def parse_span_response(response: BatchResponse, title: str | None, body: str) -> list:
+    """
+    Turn a span detection response into title/body TransparencySpans.
+
+    Same pipeline as single-pass detection: position matching on the combined
+    headline + body text, quote filter, false-positive filter, then rebasing.
+    A failed or unparseable response yields no spans, as in the sync path.
+    """
+    if response.error:
+        logger.warning(f"[BATCH] Span detection failed for {response.custom_id}: {response.error}")
+        return []
+    try:
+        llm_phrases = parse_span_detection_phrases(response.text or "")
+    except json.JSONDecodeError:
+        logger.warning(f"[BATCH] Span detection returned invalid JSON for {response.custom_id}")
+        return []
+
+    combined_text = combine_title_and_body(title, body)
+    analysis = BodyAnalysis(combined_text)
+    spans = find_phrase_positions(combined_text, llm_phrases, analysis)
+    spans = filter_spans_in_quotes(combined_text, spans, analysis)
+    spans = filter_false_positives(spans)
+    return rebase_combined_spans(spans, title, body)
+
+
+def parse_detail_full_response(response: BatchResponse, spans: list, body: str) -> DetailFullResult:
+    """Turn a detail_full synthesis response into a DetailFullResult (with garble check)."""
+    if response.error:
+        return DetailFullResult(
+            detail_full="", spans=spans, status="failed_llm", failure_reason=f"batch request failed: {response.error}"
+        )
+    detail_full = response.text or ""
+    if _detect_garbled_output(body, detail_full):
+        return DetailFullResult(
+            detail_full="",
+            spans=spans,
+            status="failed_garbled",
+            failure_reason="batch synthesis produced garbled output",
+        )
+    return DetailFullResult(detail_full=detail_full, spans=spans)
+
+
+def parse_feed_outputs_response(response: BatchResponse) -> dict:
+    """
+    Parse a feed outputs response into the Call 3 dict.
+
+    Raises:
+        ValueError: If the request failed
+        json.JSONDecodeError: If the response is not valid JSON
+    """
+    if response.error:
+        raise ValueError(f"batch request failed: {response.error}")
+    text = response.text or ""
+    # Handle potential markdown code blocks
+    if "```json" in text:
+        text = text.split("```json")[1].split("```")[0]
+    elif "```" in text:
+        text = text.split("```")[1].split("```")[0]
+    data = json.loads(text.strip())
+    return {
+        "feed_title": data.get("feed_title", ""),
+        "feed_summary": data.get("feed_summary", ""),
+        "detail_title": data.get("detail_title", ""),
+        "section": data.get("section", "world"),
+    }
+
+
+def finalize_feed_outputs(feed_outputs: dict) -> dict:
+    """Apply the sync path's final feed summary checks: violation log, truncation, garble check."""
+    violations = validate_feed_summary(feed_outputs["feed_summary"])
+    if violations:
+        logger.error(f"Feed summary validation failed after batch repair: {violations}")
+    feed_outputs["feed_summary"] = truncate_at_sentence(feed_outputs["feed_summary"], 130)
+    _validate_feed_outputs(feed_outputs)
+    return feed_outputs
+
+
+def build_story_result(
+    sd: dict,
+    detail_full_result: DetailFullResult,
+    detail_brief: str,
+    feed_outputs: dict,
+    stage_fingerprints: dict[str, str] | None = None,
+    reused_stages: set[str] | frozenset[str] = frozenset(),
+) -> dict[str, Any]:
+    """
+    Audit a story's batch outputs and build the same result dict as _neutralize_content.
+
+    Batch prompts are deterministic, so an audit RETRY is accepted as-is
+    (the sync path accepts it too once its retries are exhausted).
+    """
+    from app.services.auditor import Auditor, AuditVerdict
+
+    story_id = sd["story_id"]
+    transparency_spans = detail_full_result.spans
+    has_manipulative_content = len(transparency_spans) > 0
+
+    audit_result = Auditor().audit(
+        original_title=sd["title"],
+        original_description=sd["description"],
+        original_body=sd["body"],
+        model_output={
+            "neutral_headline": feed_outputs.get("feed_title", ""),
+            "neutral_summary": feed_outputs.get("feed_summary", ""),
+            "has_manipulative_content": has_manipulative_content,
+            "removed_phrases": [s.original_text for s in transparency_spans],
+        },
+    )
+    if audit_result.verdict == AuditVerdict.SKIP:
+        return {
+            "story_id": story_id,
+            "status": "skipped",
+            "reason": "audit_skip",
+            "audit_reasons": [r.code for r in audit_result.reasons],
+        }
+    if audit_result.verdict == AuditVerdict.FAIL:
+        return {
+            "story_id": story_id,
+            "status": "failed",
+            "error": "Audit failed permanently",
+            "audit_reasons": [r.code for r in audit_result.reasons],
+        }
+
+    result = NeutralizationResult(
+        feed_title=feed_outputs.get("feed_title", ""),
+        feed_summary=feed_outputs.get("feed_summary", ""),
+        detail_title=feed_outputs.get("detail_title"),
+        detail_brief=detail_brief,
+        detail_full=detail_full_result.detail_full,
+        has_manipulative_content=has_manipulative_content,
+        spans=transparency_spans,
+        removed_phrases=[s.original_text for s in transparency_spans],
+    )
+    return {
+        "story_id": story_id,
+        "status": "completed",
+        "result": result,
+        "transparency_spans": transparency_spans,
+        "audit_verdict": audit_result.verdict.value,
+        "retry_count": 0,
+        "stage_fingerprints": stage_fingerprints,
+        "reused_stages": sorted(reused_stages),
+    }
+
+
+def run_batch_neutralization(
+    provider: NeutralizerProvider,
+    executor: BatchExecutor,
+    story_data: list[dict],
+    poll_interval: float,
+    timeout: float,
+    previous: dict[uuid.UUID, PreviousStageOutputs | None] | None = None,
+) -> dict[uuid.UUID, dict[str, Any]]:
+    """
+    Neutralize stories through batch rounds (no db operations).
+
+    Args:
+        provider: Active neutralizer provider (selects models)
+        executor: Batch executor to submit jobs with
+        story_data: Story dicts as prepared by NeutralizerService._prepare_story_data
+        poll_interval: Seconds between job status polls
+        timeout: Seconds to wait on each round before giving up
+        previous: Outputs of each story's current version row on a forced
+            re-run; stages whose fingerprint is unchanged reuse them
+
+    Returns:
+        Dict mapping story_id -> result dict in the _neutralize_content format
+    """
+    from app.utils.content_cleaner import clean_article_body
+
+    previous = previous or {}
+
+    def run_round(requests: list[BatchRequest]) -> dict[str, BatchResponse]:
+        return executor.run(requests, poll_interval=poll_interval, timeout=timeout)
+
+    def response_for(responses: dict[str, BatchResponse], stage: str, sd: dict) -> BatchResponse:
+        return responses[make_custom_id(stage, sd["story_id"])]
+
+    results: dict[uuid.UUID, dict[str, Any]] = {}
+
+    def fail(sd: dict, error: str) -> None:
+        logger.error(f"[BATCH] Neutralization failed for story {sd['story_id']}: {error}")
+        results[sd["story_id"]] = {"story_id": sd["story_id"], "status": "failed", "error": error}
+
+    # Clean body for LLM generation (detail_brief, feed_outputs).
+    # Span detection and detail_full use the ORIGINAL body.
+    fingerprints: dict[uuid.UUID, dict[str, str]] = {}
+    reuse: dict[uuid.UUID, set[str]] = {}
+    for sd in story_data:
+        sd["cleaned_body"] = clean_article_body(sd["body"]) if sd["body"] else sd["body"]
+        fingerprints[sd["story_id"]] = compute_stage_fingerprints(provider, sd["body"])
+        story_previous = previous.get(sd["story_id"])
+        reuse[sd["story_id"]] = (
+            story_previous.reusable_stages(fingerprints[sd["story_id"]]) if story_previous else set()
+        )
+
+    # Round 1: span detection + detail_full + detail_brief (stages not reused)
+    responses = run_round(
+        [r for sd in story_data for r in build_generation_requests(provider, sd, reuse[sd["story_id"]])]
+    )
+    detail_full_results: dict[uuid.UUID, DetailFullResult] = {}
+    briefs: dict[uuid.UUID, str] = {}
+    repair_requests = []
+    for sd in story_data:
+        story_id = sd["story_id"]
+        story_reuse = reuse[story_id]
+        if STAGE_DETAIL_FULL in story_reuse:
+            detail_full_result = previous[story_id].detail_full
+        else:
+            spans = parse_span_response(response_for(responses, STAGE_SPAN_DETECTION, sd), sd["title"], sd["body"])
+            detail_full_result = parse_detail_full_response(
+                response_for(responses, STAGE_DETAIL_FULL, sd), spans, sd["body"]
+            )
+            if detail_full_result.status != "success":
+                fail(sd, f"detail_full failed: {detail_full_result.failure_reason}")
+                continue
+        detail_full_results[story_id] = detail_full_result
+
+        if story_reuse & {STAGE_DETAIL_BRIEF, STAGE_FEED_OUTPUTS}:
+            briefs[story_id] = previous[story_id].detail_brief
+            continue
+        brief_response = response_for(responses, STAGE_DETAIL_BRIEF, sd)
+        if brief_response.error:
+            fail(sd, f"detail_brief synthesis failed: {brief_response.error}")
+            continue
+        briefs[story_id] = brief_response.text or ""
+        violations = validate_brief_neutralization(briefs[story_id])
+        if violations:
+            logger.warning(f"Brief validation failed for story {story_id}: {violations}")
+            repair_requests.append(build_brief_repair_request(provider, sd, briefs[story_id], violations))
+
+    # Round 2: brief repairs
+    remaining = [sd for sd in story_data if sd["story_id"] in briefs]
+    responses = run_round(repair_requests)
+    for sd in remaining:
+        repair = responses.get(make_custom_id(STAGE_DETAIL_BRIEF_REPAIR, sd["story_id"]))
+        if repair is None:
+            continue
+        if repair.text:
+            briefs[sd["story_id"]] = repair.text
+        violations = validate_brief_neutralization(briefs[sd["story_id"]])
+        if violations:
+            logger.error(f"Brief validation failed after batch repair for story {sd['story_id']}: {violations}")
+
+    # Round 3: feed outputs (stories whose previous feed outputs aren't reusable)
+    feed_outputs: dict[uuid.UUID, dict] = {
+        sd["story_id"]: dict(previous[sd["story_id"]].feed_outputs)
+        for sd in remaining
+        if STAGE_FEED_OUTPUTS in reuse[sd["story_id"]]
+    }
+    responses = run_round(
+        [
+            build_feed_outputs_request(provider, sd, briefs[sd["story_id"]])
+            for sd in remaining
+            if sd["story_id"] not in feed_outputs
+        ]
+    )
+    repair_requests = []
+    for sd in remaining:
+        if sd["story_id"] in feed_outputs:
+            continue
+        try:
+            outputs = parse_feed_outputs_response(response_for(responses, STAGE_FEED_OUTPUTS, sd))
+        except Exception as e:
+            fail(sd, f"feed outputs compression failed: {e}")
+            continue
+        feed_outputs[sd["story_id"]] = outputs
+        violations = validate_feed_summary(outputs["feed_summary"])
+        if violations:
+            logger.warning(f"Feed summary validation failed for story {sd['story_id']}: {violations}")
+            repair_requests.append(build_feed_summary_repair_request(provider, sd, outputs["feed_summary"], violations))
+
+    # Round 4: feed summary repairs, then final checks and audit
+    responses = run_round(repair_requests)
+    for sd in remaining:
+        story_id = sd["story_id"]
+        if story_id not in feed_outputs:
+            continue
+        try:
+            # Reused feed outputs already passed these checks when they were written
+            if STAGE_FEED_OUTPUTS not in reuse[story_id]:
+                repair = responses.get(make_custom_id(STAGE_FEED_SUMMARY_REPAIR, story_id))
+                if repair and repair.text:
+                    feed_outputs[story_id]["feed_summary"] = repair.text
+                finalize_feed_outputs(feed_outputs[story_id])
+            results[story_id] = build_story_result(
+                sd,
+                detail_full_results[story_id],
+                briefs[story_id],
+                feed_outputs[story_id],
+                stage_fingerprints=fingerprints[story_id],
+                reused_stages=reuse[story_id],
+            )
+        except Exception as e:
+            fail(sd, str(e))
+
+    return results
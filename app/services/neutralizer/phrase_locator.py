@@ -0,0 +1,236 @@
+# app/services/neutralizer/phrase_locator.py
+"""
+Indexed phrase location for span position matching.
+
+find_phrase_positions() resolves each LLM phrase against the article body in
+four tiers: exact, case-insensitive, whitespace-normalized and word-token
+fuzzy. BodyIndex holds what those tiers need for one body so it is computed
+once per body rather than once per phrase:
+
+- lowercased and whitespace-normalized copies of the body (tiers 2-3)
+- word tokens with their character offsets (tier 4)
+
+The fuzzy tier scores every phrase-length window of body words with
+difflib.SequenceMatcher and keeps the best ratio >= 0.85. Scoring every
+window was the expensive part, so windows are first screened with cheap
+upper bounds on the ratio (window length, shared character counts, and the
+LCS from a bit-parallel indel distance). Only windows that could still beat
+the best score so far are handed to SequenceMatcher. Every bound is >= the
+true ratio, so the result is identical to scoring every window.
+"""
+
+import re
+from collections import Counter
+from difflib import SequenceMatcher
+
+# Tier 4 only applies to phrases longer than this (short phrases match too loosely)
+FUZZY_MIN_PHRASE_CHARS = 15
+
+# Minimum SequenceMatcher ratio for a fuzzy word-window match
+FUZZY_MIN_RATIO = 0.85
+
+# A word token starts with a letter or digit and continues through letters,
+# digits and apostrophes. [^\W_] is exactly str.isalnum() for one character.
+_TOKEN_RE = re.compile(r"[^\W_](?:[^\W_]|')*")
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Punctuation stripped from both ends of whitespace-normalized text
+BOUNDARY_PUNCTUATION = ".,;:!?\"'"
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse all whitespace runs to single spaces and strip boundary punctuation."""
+    return WHITESPACE_RE.sub(" ", text).strip().strip(BOUNDARY_PUNCTUATION)
+
+
+def _lcs_length(pattern_masks: dict[str, int], pattern_len: int, text: str) -> int:
+    """
+    Longest common subsequence length via a bit-parallel indel distance.
+
+    Each bit of V tracks one pattern position; zero bits count matched
+    characters (Hyyro 2004). One big-int update per text character.
+    """
+    full = (1 << pattern_len) - 1
+    v = full
+    for ch in text:
+        u = v & pattern_masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & full
+    return pattern_len - v.bit_count()
+
+
+class BodyIndex:
+    """
+    Lookup structures for locating phrases in one body.
+
+    Built lazily: the lowercased body is always needed, while the
+    whitespace-normalized copy and word tokens are only computed the first
+    time a phrase falls through to tier 3 or tier 4.
+    """
+
+    def __init__(self, body: str, start: int = 0):
+        self.body = body
+        self.lower = body.lower()
+        self._start = start
+        self._ws_normalized: str | None = None
+        self._tokens: list[str] | None = None
+        self._token_starts: list[int] = []
+        self._token_ends: list[int] = []
+        self._length_prefix: list[int] = []
+
+    @property
+    def ws_normalized(self) -> str:
+        """Whitespace-normalized lowercased body (tier 3)."""
+        if self._ws_normalized is None:
+            self._ws_normalized = normalize_whitespace(self.lower)
+        return self._ws_normalized
+
+    @property
+    def tokens(self) -> list[str]:
+        """Lowercased word tokens from the start offset onward (tier 4)."""
+        if self._tokens is None:
+            self._tokens = []
+            prefix = [0]
+            for match in _TOKEN_RE.finditer(self.lower, self._start, len(self.body)):
+                self._tokens.append(match.group())
+                self._token_starts.append(match.start())
+                self._token_ends.append(match.end())
+                prefix.append(prefix[-1] + match.end() - match.start())
+            self._length_prefix = prefix
+        return self._tokens
+
+    def fuzzy_find(self, phrase: str) -> tuple[int, int] | None:
+        """
+        Find the best word-window fuzzy match for phrase.
+
+        Only activates for phrases >15 chars with at least two words. Returns
+        (start_pos, end_pos) of the first window with the highest
+        SequenceMatcher ratio, if that ratio is >= 0.85.
+        """
+        if len(phrase) <= FUZZY_MIN_PHRASE_CHARS:
+            return None
+
+        phrase_words = phrase.lower().split()
+        window_size = len(phrase_words)
+        if window_size < 2:
+            return None
+
+        tokens = self.tokens
+        num_windows = len(tokens) - window_size + 1
+        if num_windows <= 0:
+            return None
+
+        phrase_text = " ".join(phrase_words)
+        phrase_len = len(phrase_text)
+        phrase_counts = Counter(phrase_text)
+        pattern_masks: dict[str, int] = {}
+        for i, ch in enumerate(phrase_text):
+            pattern_masks[ch] = pattern_masks.get(ch, 0) | (1 << i)
+        matcher = SequenceMatcher(None)
+        matcher.set_seq1(phrase_text)
+
+        # Character counts of the current window's tokens and how many of
+        # them the phrase can pair with. The n-1 joining spaces always pair.
+        window_counts: Counter[str] = Counter()
+        shared = 0
+        for token in tokens[: window_size - 1]:
+            for ch in token:
+                if window_counts[ch] < phrase_counts[ch]:
+                    shared += 1
+                window_counts[ch] += 1
+
+        prefix = self._length_prefix
+        best_ratio = 0.0
+        best_start = -1
+        best_end = -1
+
+        for wi in range(num_windows):
+            # Slide the character counts: drop the token that left, add the one that entered
+            if wi > 0:
+                for ch in tokens[wi - 1]:
+                    window_counts[ch] -= 1
+                    if window_counts[ch] < phrase_counts[ch]:
+                        shared -= 1
+            for ch in tokens[wi + window_size - 1]:
+                if window_counts[ch] < phrase_counts[ch]:
+                    shared += 1
+                window_counts[ch] += 1
+
+            # Ratio is 2*M/T; each bound below caps M, cheapest first
+            window_len = prefix[wi + window_size] - prefix[wi] + window_size - 1
+            total = phrase_len + window_len
+            bound = 2.0 * min(phrase_len, window_len) / total
+            if bound < FUZZY_MIN_RATIO or bound <= best_ratio:
+                continue
+            bound = 2.0 * (shared + window_size - 1) / total
+            if bound < FUZZY_MIN_RATIO or bound <= best_ratio:
+                continue
+
+            window_text = " ".join(tokens[wi : wi + window_size])
+            bound = 2.0 * _lcs_length(pattern_masks, phrase_len, window_text) / total
+            if bound < FUZZY_MIN_RATIO or bound <= best_ratio:
+                continue
+
+            matcher.set_seq2(window_text)
+            ratio = matcher.ratio()
+            if ratio > best_ratio:
+                best_ratio = ratio
+                best_start = self._token_starts[wi]
+                best_end = self._token_ends[wi + window_size - 1]
+                if ratio == 1.0:
+                    break
+
+        if best_ratio >= FUZZY_MIN_RATIO:
+            return best_start, best_end
+
+        return None
+
+
+def fuzzy_find_reference(phrase: str, body: str, start: int = 0) -> tuple[int, int] | None:
+    """
+    Unindexed fuzzy match that scores every window with SequenceMatcher.
+
+    The original tier 4 implementation, kept as the reference that
+    BodyIndex.fuzzy_find must agree with (tests and benchmark).
+    """
+    if len(phrase) <= FUZZY_MIN_PHRASE_CHARS:
+        return None
+
+    phrase_words = phrase.lower().split()
+    if len(phrase_words) < 2:
+        return None
+
+    body_lower = body.lower()
+    body_words_with_pos: list[tuple[str, int, int]] = []
+    i = start
+    while i < len(body):
+        if body_lower[i].isalnum():
+            j = i
+            while j < len(body) and (body_lower[j].isalnum() or body_lower[j] == "'"):
+                j += 1
+            body_words_with_pos.append((body_lower[i:j], i, j))
+            i = j
+        else:
+            i += 1
+
+    if not body_words_with_pos:
+        return None
+
+    window_size = len(phrase_words)
+    phrase_text = " ".join(phrase_words)
+    best_ratio = 0.0
+    best_start = -1
+    best_end = -1
+
+    for wi in range(len(body_words_with_pos) - window_size + 1):
+        window_text = " ".join(w[0] for w in body_words_with_pos[wi : wi + window_size])
+        ratio = SequenceMatcher(None, phrase_text, window_text).ratio()
+        if ratio > best_ratio:
+            best_ratio = ratio
+            best_start = body_words_with_pos[wi][1]
+            best_end = body_words_with_pos[wi + window_size - 1][2]
+
+    if best_ratio >= FUZZY_MIN_RATIO:
+        return best_start, best_end
+
+    return None
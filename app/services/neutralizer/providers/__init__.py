@@ -2,6 +2,37 @@
 """
 LLM provider implementations for neutralization.
 
-Provider classes are still in the main neutralizer __init__.py
-and will be extracted here incrementally.
+Each provider lives in its own submodule and is imported on first use, so
+processes that only need prompts, span utilities or the service itself
+never load provider code they do not call. This module must stay free of
+imports from the parent package: it is imported while
+app.services.neutralizer is still initializing.
 """
+
+from importlib import import_module
+
+# Provider registry - maps provider names to (submodule, class name)
+PROVIDERS = {
+    "mock": ("mock_provider", "MockNeutralizerProvider"),
+    "openai": ("openai_provider", "OpenAINeutralizerProvider"),
+    "gemini": ("gemini_provider", "GeminiNeutralizerProvider"),
+    "anthropic": ("anthropic_provider", "AnthropicNeutralizerProvider"),
+}
+
+# Public names re-exported lazily from app.services.neutralizer
+LAZY_EXPORTS = {
+    **{class_name: module for module, class_name in PROVIDERS.values()},
+    "MANIPULATIVE_PATTERNS": "mock_provider",
+    "REPLACEMENTS": "mock_provider",
+}
+
+
+def load_provider_class(provider_name: str) -> type:
+    """Import and return the provider class registered under provider_name."""
+    module_name, class_name = PROVIDERS[provider_name]
+    return getattr(import_module(f"{__name__}.{module_name}"), class_name)
+
+
+def load_export(name: str):
+    """Import the submodule defining a lazily re-exported name and return it."""
+    return getattr(import_module(f"{__name__}.{LAZY_EXPORTS[name]}"), name)
@@ -0,0 +1,417 @@
+# app/services/neutralizer/providers/gemini_provider.py
+"""
+Google Gemini neutralizer provider.
+
+Imported on first use by get_neutralizer_provider(). The google.generativeai
+SDK itself is only imported when a call is made.
+"""
+
+import logging
+import os
+
+from app.services.neutralizer import (
+    DetailFullResult,
+    NeutralizationResponseError,
+    NeutralizationResult,
+    NeutralizerProvider,
+    _detect_garbled_output,
+    _detect_spans_with_config,
+    _gemini_generate,
+    _validate_feed_outputs,
+    build_brief_repair_prompt,
+    build_compression_feed_outputs_prompt,
+    build_feed_summary_repair_prompt,
+    build_fused_brief_feed_prompt,
+    build_repair_prompt,
+    build_synthesis_detail_brief_prompt,
+    build_synthesis_detail_full_prompt,
+    build_user_prompt,
+    finish_fused_brief_feed,
+    get_article_system_prompt,
+    get_headline_system_prompt,
+    get_repair_system_prompt,
+    get_system_prompt,
+    parse_fused_brief_feed_response,
+    parse_llm_response,
+    truncate_at_sentence,
+    validate_brief_neutralization,
+    validate_feed_summary,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class GeminiNeutralizerProvider(NeutralizerProvider):
+    """Google Gemini-based neutralizer (Gemini 1.5 Flash, Gemini 2.0 Flash, etc.)."""
+
+    # Available Gemini models
+    MODELS = {
+        "gemini-1.5-flash": "gemini-1.5-flash",
+        "gemini-1.5-flash-latest": "gemini-1.5-flash-latest",
+        "gemini-1.5-pro": "gemini-1.5-pro",
+        "gemini-2.0-flash": "gemini-2.0-flash-exp",
+        "gemini-2.0-flash-exp": "gemini-2.0-flash-exp",
+    }
+
+    def __init__(self, model: str = "gemini-1.5-flash"):
+        self._model = self.MODELS.get(model, model)
+        self._api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+
+    @property
+    def name(self) -> str:
+        return "gemini"
+
+    @property
+    def model_name(self) -> str:
+        return self._model
+
+    def neutralize(
+        self,
+        title: str,
+        description: str | None,
+        body: str | None,
+        repair_instructions: str | None = None,
+    ) -> NeutralizationResult:
+        """Neutralize using Google Gemini API.
+
+        Raises NeutralizationResponseError if no API key or neutralization fails.
+        """
+        if not self._api_key:
+            logger.error("No GOOGLE_API_KEY or GEMINI_API_KEY set - cannot neutralize")
+            raise NeutralizationResponseError("No GOOGLE_API_KEY or GEMINI_API_KEY configured")
+
+        try:
+            import google.generativeai as genai
+
+            genai.configure(api_key=self._api_key)
+
+            # Use proper system instruction (not concatenated prompt)
+            if repair_instructions:
+                system_prompt = get_repair_system_prompt()
+                user_prompt = build_repair_prompt(title, description, body, repair_instructions)
+            else:
+                system_prompt = get_system_prompt()
+                user_prompt = build_user_prompt(title, description, body)
+
+            model = genai.GenerativeModel(
+                self._model,
+                system_instruction=system_prompt,
+                generation_config=genai.GenerationConfig(
+                    response_mime_type="application/json",
+                    temperature=0.3,
+                ),
+            )
+
+            response = _gemini_generate(model, self._model, "neutralize", user_prompt)
+
+            import json
+
+            data = json.loads(response.text)
+            return parse_llm_response(data, title, description)
+
+        except NeutralizationResponseError:
+            raise  # Re-raise our own exceptions
+        except Exception as e:
+            logger.error(f"Gemini neutralization failed: {e}")
+            raise NeutralizationResponseError(f"Gemini neutralization failed: {str(e)}")
+
+    def _neutralize_detail_full(
+        self,
+        body: str,
+        title: str = None,
+        retry_count: int = 0,
+        feed_category: str | None = None,
+    ) -> DetailFullResult:
+        """
+        Neutralize an article body using Gemini with SYNTHESIS approach.
+
+        Uses synthesis mode (plain text output) as the primary approach.
+        Spans are detected via hybrid LLM + position matching for context awareness.
+        Returns failure status if synthesis fails (no mock fallback).
+
+        Args:
+            body: Article body text
+            title: Original article title (for headline manipulation detection)
+            retry_count: Current retry attempt number
+            feed_category: Article genre for content-type-aware span detection
+        """
+        MAX_RETRIES = 2
+
+        if not body:
+            return DetailFullResult(detail_full="", spans=[])
+
+        if not self._api_key:
+            logger.error("No GOOGLE_API_KEY or GEMINI_API_KEY set - cannot neutralize")
+            return DetailFullResult(
+                detail_full="",
+                spans=[],
+                status="failed_llm",
+                failure_reason="No GOOGLE_API_KEY or GEMINI_API_KEY configured",
+            )
+
+        # Get spans via config-aware detection (respects SPAN_DETECTION_MODE)
+        # Uses multi_pass for 99% recall if configured, otherwise single-pass
+        # Now includes title for headline manipulation detection
+        spans = _detect_spans_with_config(
+            body=body,
+            provider_api_key=self._api_key,
+            provider_type="gemini",
+            provider_model=self._model,
+            title=title,
+            feed_category=feed_category,
+        )
+        logger.info(
+            f"Span detection completed with {len(spans)} spans (title spans: {sum(1 for s in spans if s.field == 'title')})"
+        )
+
+        try:
+            import google.generativeai as genai
+
+            genai.configure(api_key=self._api_key)
+
+            # Use SYNTHESIS prompt (plain text output, not JSON)
+            system_prompt = get_article_system_prompt()
+            user_prompt = build_synthesis_detail_full_prompt(body)
+
+            model = genai.GenerativeModel(
+                self._model,
+                system_instruction=system_prompt,
+                generation_config=genai.GenerationConfig(
+                    # No JSON mime type - plain text synthesis
+                    temperature=0.3,
+                ),
+            )
+
+            response = _gemini_generate(model, self._model, "detail_full", user_prompt)
+            detail_full = response.text.strip()
+
+            # Validate output isn't garbled
+            if _detect_garbled_output(body, detail_full):
+                logger.error("Gemini synthesis produced garbled output")
+                return DetailFullResult(
+                    detail_full="",
+                    spans=spans,
+                    status="failed_garbled",
+                    failure_reason="Gemini synthesis produced garbled output",
+                )
+
+            return DetailFullResult(detail_full=detail_full, spans=spans)
+
+        except Exception as e:
+            # API error - retry, then return failure status
+            if retry_count < MAX_RETRIES:
+                logger.warning(
+                    f"Gemini synthesis error (attempt {retry_count + 1}/{MAX_RETRIES + 1}): {e}, retrying..."
+                )
+                import time
+
+                time.sleep(1)
+                return self._neutralize_detail_full(body, title, retry_count + 1)
+            else:
+                logger.error(f"Gemini synthesis failed after {MAX_RETRIES + 1} attempts: {e}")
+                return DetailFullResult(
+                    detail_full="",
+                    spans=spans,
+                    status="failed_llm",
+                    failure_reason=f"Gemini synthesis failed after {MAX_RETRIES + 1} attempts: {str(e)}",
+                )
+
+    def _neutralize_detail_brief(self, body: str) -> str:
+        """
+        Synthesize an article body into a brief using Gemini (Call 2: Synthesize).
+
+        Uses shared article_system_prompt + synthesis_detail_brief_prompt.
+        Returns plain text (3-5 paragraphs, no headers or bullets).
+
+        Includes retry logic: if the brief contains banned phrases, retry with
+        a repair prompt up to MAX_BRIEF_RETRIES times.
+
+        Raises NeutralizationResponseError if no API key or synthesis fails.
+        """
+        MAX_BRIEF_RETRIES = 2
+
+        if not body:
+            return ""
+
+        if not self._api_key:
+            logger.error("No GOOGLE_API_KEY or GEMINI_API_KEY set - cannot synthesize brief")
+            raise NeutralizationResponseError("No GOOGLE_API_KEY or GEMINI_API_KEY configured")
+
+        try:
+            import google.generativeai as genai
+
+            genai.configure(api_key=self._api_key)
+
+            system_prompt = get_article_system_prompt()
+            user_prompt = build_synthesis_detail_brief_prompt(body)
+
+            model = genai.GenerativeModel(
+                self._model,
+                system_instruction=system_prompt,
+                generation_config=genai.GenerationConfig(
+                    # Note: No JSON mime type - we want plain text
+                    temperature=0.3,
+                ),
+            )
+
+            response = _gemini_generate(model, self._model, "detail_brief", user_prompt)
+            brief = response.text.strip()
+
+            # Validate and retry if violations found
+            for attempt in range(MAX_BRIEF_RETRIES):
+                violations = validate_brief_neutralization(brief)
+                if not violations:
+                    return brief
+
+                logger.warning(f"Brief validation failed (attempt {attempt + 1}/{MAX_BRIEF_RETRIES + 1}): {violations}")
+
+                # Generate repair prompt and retry
+                repair_prompt = build_brief_repair_prompt(brief, violations)
+                repair_response = _gemini_generate(model, self._model, "detail_brief_repair", repair_prompt)
+                brief = repair_response.text.strip()
+
+            # Final validation after all retries
+            violations = validate_brief_neutralization(brief)
+            if violations:
+                logger.error(f"Brief validation failed after {MAX_BRIEF_RETRIES + 1} attempts: {violations}")
+            return brief
+
+        except Exception as e:
+            logger.error(f"Gemini detail_brief synthesis failed: {e}")
+            raise NeutralizationResponseError(f"Gemini detail_brief synthesis failed: {str(e)}")
+
+    def _neutralize_brief_and_feed_outputs(self, body: str) -> tuple[str, dict]:
+        """
+        Produce detail_brief and feed outputs in one Gemini JSON call (Calls 2 + 3 fused).
+
+        Validation and repair match the separate calls (finish_fused_brief_feed).
+
+        Raises NeutralizationResponseError if no API key or the call fails.
+        """
+        if not self._api_key:
+            raise NeutralizationResponseError("No GOOGLE_API_KEY or GEMINI_API_KEY configured")
+
+        try:
+            import google.generativeai as genai
+
+            genai.configure(api_key=self._api_key)
+
+            model = genai.GenerativeModel(
+                self._model,
+                system_instruction=get_article_system_prompt(),
+                generation_config=genai.GenerationConfig(
+                    response_mime_type="application/json",
+                    temperature=0.3,
+                ),
+            )
+            response = _gemini_generate(model, self._model, "brief_feed_fused", build_fused_brief_feed_prompt(body))
+            data = parse_fused_brief_feed_response(response.text)
+
+            def repair(call_type: str, system_prompt: str, user_prompt: str) -> str:
+                repair_model = genai.GenerativeModel(
+                    self._model,
+                    system_instruction=system_prompt,
+                    generation_config=genai.GenerationConfig(temperature=0.3),
+                )
+                return _gemini_generate(repair_model, self._model, call_type, user_prompt).text
+
+            return finish_fused_brief_feed(data, repair)
+
+        except NeutralizationResponseError:
+            raise
+        except Exception as e:
+            logger.error(f"Gemini fused brief/feed call failed: {e}")
+            raise NeutralizationResponseError(f"Gemini fused brief/feed call failed: {str(e)}")
+
+    def _neutralize_feed_outputs(self, body: str, detail_brief: str) -> dict:
+        """
+        Generate compressed feed outputs using Gemini (Call 3: Compress).
+
+        Uses shared article_system_prompt + compression_feed_outputs_prompt.
+        Returns dict with feed_title, feed_summary, detail_title, section.
+
+        Includes validation and retry for feed_summary banned phrases.
+
+        Raises NeutralizationResponseError if no API key or compression fails.
+        """
+        MAX_FEED_SUMMARY_RETRIES = 2
+
+        if not body and not detail_brief:
+            return {
+                "feed_title": "",
+                "feed_summary": "",
+                "detail_title": "",
+                "section": "world",
+            }
+
+        if not self._api_key:
+            logger.error("No GOOGLE_API_KEY or GEMINI_API_KEY set - cannot generate feed outputs")
+            raise NeutralizationResponseError("No GOOGLE_API_KEY or GEMINI_API_KEY configured")
+
+        try:
+            import json
+
+            import google.generativeai as genai
+
+            genai.configure(api_key=self._api_key)
+
+            # Use lighter headline prompt for feed outputs (not aggressive article prompt)
+            system_prompt = get_headline_system_prompt()
+            user_prompt = build_compression_feed_outputs_prompt(body, detail_brief)
+
+            model = genai.GenerativeModel(
+                self._model,
+                system_instruction=system_prompt,
+                generation_config=genai.GenerationConfig(
+                    response_mime_type="application/json",
+                    temperature=0.3,
+                ),
+            )
+
+            response = _gemini_generate(model, self._model, "feed_outputs", user_prompt)
+            data = json.loads(response.text)
+            result = {
+                "feed_title": data.get("feed_title", ""),
+                "feed_summary": data.get("feed_summary", ""),
+                "detail_title": data.get("detail_title", ""),
+                "section": data.get("section", "world"),
+            }
+
+            # Validate and retry feed_summary if it contains banned phrases
+            repair_model = genai.GenerativeModel(
+                self._model,
+                system_instruction="You are a neutral news editor. Return only the rewritten text.",
+                generation_config=genai.GenerationConfig(temperature=0.3),
+            )
+
+            for attempt in range(MAX_FEED_SUMMARY_RETRIES):
+                violations = validate_feed_summary(result["feed_summary"])
+                if not violations:
+                    break
+
+                logger.warning(
+                    f"Feed summary validation failed (attempt {attempt + 1}/{MAX_FEED_SUMMARY_RETRIES + 1}): {violations}"
+                )
+
+                # Generate repair prompt and retry
+                repair_prompt = build_feed_summary_repair_prompt(result["feed_summary"], violations)
+                repair_response = _gemini_generate(repair_model, self._model, "feed_summary_repair", repair_prompt)
+                result["feed_summary"] = repair_response.text.strip()
+
+            # Final validation
+            violations = validate_feed_summary(result["feed_summary"])
+            if violations:
+                logger.error(
+                    f"Feed summary validation failed after {MAX_FEED_SUMMARY_RETRIES + 1} attempts: {violations}"
+                )
+
+            # Apply sentence-boundary truncation as safety net
+            result["feed_summary"] = truncate_at_sentence(result["feed_summary"], 130)
+
+            # Validate feed outputs for garbled content
+            _validate_feed_outputs(result)
+            return result
+
+        except Exception as e:
+            logger.error(f"Gemini feed outputs compression failed: {e}")
+            raise NeutralizationResponseError(f"Gemini feed outputs compression failed: {str(e)}")
@@ -0,0 +1,364 @@
+# app/services/neutralizer/providers/mock_provider.py
+"""
+Deterministic mock provider for testing.
+
+Detects manipulative language with regex patterns and replaces it from a
+fixed table, so tests and offline tools get repeatable output without
+network access.
+"""
+
+import re
+
+from app.models import SpanAction, SpanReason
+from app.services.neutralizer import (
+    DetailFullResult,
+    NeutralizationResult,
+    NeutralizerProvider,
+    TransparencySpan,
+)
+
+# Manipulative patterns to detect (for mock)
+MANIPULATIVE_PATTERNS = {
+    SpanReason.CLICKBAIT: [
+        r"\b(shocking|unbelievable|you won\'t believe|mind-blowing|jaw-dropping)\b",
+        r"\b(must see|must read|can\'t miss|don\'t miss)\b",
+        r"\b(secret|hidden|exposed|revealed)\b",
+        r"\b(stunning|explosive|bombshell)\b",
+    ],
+    SpanReason.URGENCY_INFLATION: [
+        r"\b(breaking|urgent|just in|developing|happening now)\b",
+        r"\b(alert|emergency|crisis|chaos)\b",
+        r"\b(grinds to a halt|comes to a standstill|at a standstill)\b",
+        r"\b(huge delays|massive delays|major delays)\b",
+        r"\bROAD CLOSED\b",  # All-caps urgency
+        r"\b[A-Z]{4,}\s+[A-Z]{4,}\b",  # Consecutive all-caps words (e.g., "ROAD CLOSED")
+    ],
+    SpanReason.EMOTIONAL_TRIGGER: [
+        r"\b(outrage|fury|furious|enraged|livid)\b",
+        r"\b(slams|blasts|destroys|demolishes|eviscerates)\b",
+        r"\b(heartbreaking|devastating|horrifying|terrifying)\b",
+        r"\b(horror|nightmare|nightmare scenario)\b",
+        r"\bhorror\s+\w+\b",  # "horror smash", "horror crash", etc.
+        r"\b(sparking|sparks|sparked)\s+(huge|massive|widespread|major)\b",
+    ],
+    SpanReason.SELLING: [
+        r"\b(exclusive|insider|behind the scenes)\b",
+        r"\b(viral|trending|everyone is talking)\b",
+    ],
+    SpanReason.AGENDA_SIGNALING: [
+        r"\b(radical|extremist|dangerous)\b",
+        r"\b(the truth about|what they don\'t want you to know)\b",
+    ],
+    SpanReason.RHETORICAL_FRAMING: [
+        r"\b(some say|critics say|experts warn)\b",
+        r"\b(could|might|may|potentially)\s+(be\s+)?(devastating|catastrophic|huge)\b",
+    ],
+}
+
+# Replacements for common patterns
+REPLACEMENTS = {
+    "shocking": "notable",
+    "slams": "criticizes",
+    "blasts": "criticizes",
+    "destroys": "challenges",
+    "demolishes": "disputes",
+    "furious": "concerned",
+    "outrage": "disagreement",
+    "breaking": "",
+    "urgent": "",
+    "just in": "",
+    "must see": "",
+    "must read": "",
+    "horror": "",
+    "nightmare": "",
+    "stunning": "notable",
+    "explosive": "",
+    "bombshell": "",
+    "grinds to a halt": "stops",
+    "comes to a standstill": "stops",
+    "huge delays": "delays",
+    "massive delays": "delays",
+    "major delays": "delays",
+    "road closed": "road closure",
+}
+
+
+class MockNeutralizerProvider(NeutralizerProvider):
+    """
+    Deterministic mock provider for testing.
+    Uses pattern matching to detect and replace manipulative language.
+    """
+
+    @property
+    def name(self) -> str:
+        return "mock"
+
+    @property
+    def model_name(self) -> str:
+        return "mock-v1"
+
+    def _find_spans(self, text: str, field: str) -> list[TransparencySpan]:
+        """Find manipulative spans in text."""
+        if not text:
+            return []
+
+        spans = []
+        text_lower = text.lower()
+
+        for reason, patterns in MANIPULATIVE_PATTERNS.items():
+            for pattern in patterns:
+                for match in re.finditer(pattern, text_lower, re.IGNORECASE):
+                    original = text[match.start() : match.end()]
+                    replacement = REPLACEMENTS.get(original.lower())
+
+                    if replacement is not None:
+                        action = SpanAction.REPLACED if replacement else SpanAction.REMOVED
+                    else:
+                        action = SpanAction.SOFTENED
+                        replacement = None
+
+                    spans.append(
+                        TransparencySpan(
+                            field=field,
+                            start_char=match.start(),
+                            end_char=match.end(),
+                            original_text=original,
+                            action=action,
+                            reason=reason,
+                            replacement_text=replacement,
+                        )
+                    )
+
+        # Sort by position and remove overlaps
+        spans.sort(key=lambda s: s.start_char)
+        non_overlapping = []
+        last_end = -1
+        for span in spans:
+            if span.start_char >= last_end:
+                non_overlapping.append(span)
+                last_end = span.end_char
+
+        return non_overlapping
+
+    def _neutralize_text(self, text: str, spans: list[TransparencySpan]) -> str:
+        """Apply span replacements to text."""
+        if not spans:
+            return text
+
+        result = []
+        last_end = 0
+
+        for span in sorted(spans, key=lambda s: s.start_char):
+            # Add text before this span
+            result.append(text[last_end : span.start_char])
+
+            # Add replacement (or nothing if removed)
+            if span.replacement_text:
+                result.append(span.replacement_text)
+
+            last_end = span.end_char
+
+        # Add remaining text
+        result.append(text[last_end:])
+
+        # Clean up extra spaces
+        neutralized = " ".join("".join(result).split())
+        return neutralized
+
+    def neutralize(
+        self,
+        title: str,
+        description: str | None,
+        body: str | None,
+        repair_instructions: str | None = None,
+    ) -> NeutralizationResult:
+        """Neutralize content using pattern matching."""
+        # Note: repair_instructions ignored in mock provider
+        # Find spans in each field
+        title_spans = self._find_spans(title, "title")
+        desc_spans = self._find_spans(description or "", "description") if description else []
+        body_spans = self._find_spans(body or "", "body") if body else []
+
+        all_spans = title_spans + desc_spans + body_spans
+        has_manipulative = len(all_spans) > 0
+
+        # Neutralize title
+        neutral_headline = self._neutralize_text(title, title_spans)
+        # Ensure no trailing punctuation issues
+        neutral_headline = neutral_headline.strip().rstrip(":").strip()
+
+        # Neutralize description for summary
+        neutral_desc = self._neutralize_text(description or "", desc_spans) if description else ""
+
+        # Build summary (2-3 lines max)
+        if neutral_desc:
+            neutral_summary = neutral_desc[:500]
+        elif body:
+            neutral_body = self._neutralize_text(body, body_spans)
+            neutral_summary = neutral_body[:500]
+        else:
+            neutral_summary = neutral_headline
+
+        # Truncate to 2-3 sentences
+        sentences = re.split(r"(?<=[.!?])\s+", neutral_summary)
+        neutral_summary = " ".join(sentences[:3])
+
+        return NeutralizationResult(
+            feed_title=neutral_headline,
+            feed_summary=neutral_summary,
+            detail_title=None,  # Not generated by mock provider
+            detail_brief=None,  # Not generated by mock provider
+            detail_full=None,  # Not generated by mock provider
+            has_manipulative_content=has_manipulative,
+            spans=all_spans,
+            removed_phrases=[s.original_text for s in all_spans],  # Extract from spans
+        )
+
+    def _neutralize_detail_full(
+        self, body: str, title: str = None, feed_category: str | None = None
+    ) -> DetailFullResult:
+        """
+        Filter an article body using pattern matching (mock implementation).
+
+        Uses the same pattern matching logic as neutralize() but focused on body text.
+        Now also detects spans in title for headline manipulation.
+
+        Args:
+            body: Article body text
+            title: Original article title (for headline manipulation detection)
+            feed_category: Ignored by the mock (pattern matching is genre-agnostic)
+        """
+        if not body:
+            return DetailFullResult(detail_full="", spans=[])
+
+        # Find spans in title if provided
+        title_spans = self._find_spans(title, "title") if title else []
+
+        # Find spans in body
+        body_spans = self._find_spans(body, "body")
+
+        # Combine spans (title first, then body)
+        all_spans = title_spans + body_spans
+
+        # Apply neutralization to body only
+        filtered_body = self._neutralize_text(body, body_spans)
+
+        return DetailFullResult(
+            detail_full=filtered_body,
+            spans=all_spans,
+        )
+
+    def _detect_title_spans(self, title: str, feed_category: str | None = None) -> list[TransparencySpan]:
+        """Find manipulative spans in a headline using pattern matching."""
+        return self._find_spans(title, "title") if title else []
+
+    def _neutralize_detail_brief(self, body: str) -> str:
+        """
+        Synthesize an article body into a brief (mock implementation).
+
+        Creates a simple 3-paragraph summary by extracting key sentences.
+        This is a deterministic mock for testing purposes.
+        """
+        if not body:
+            return ""
+
+        # Split into sentences
+        sentences = re.split(r"(?<=[.!?])\s+", body.strip())
+        if not sentences:
+            return ""
+
+        # Filter out very short sentences and apply neutralization
+        body_spans = self._find_spans(body, "body")
+        filtered_body = self._neutralize_text(body, body_spans)
+        filtered_sentences = re.split(r"(?<=[.!?])\s+", filtered_body.strip())
+        filtered_sentences = [s for s in filtered_sentences if len(s) > 20]
+
+        if not filtered_sentences:
+            return filtered_body[:500] if filtered_body else ""
+
+        # Build 3-paragraph brief
+        paragraphs = []
+
+        # Paragraph 1: Grounding (first 2-3 sentences)
+        grounding = " ".join(filtered_sentences[: min(3, len(filtered_sentences))])
+        paragraphs.append(grounding)
+
+        # Paragraph 2: Context (next 2-3 sentences if available)
+        if len(filtered_sentences) > 3:
+            context = " ".join(filtered_sentences[3 : min(6, len(filtered_sentences))])
+            paragraphs.append(context)
+
+        # Paragraph 3: Remaining (if available)
+        if len(filtered_sentences) > 6:
+            remaining = " ".join(filtered_sentences[6 : min(9, len(filtered_sentences))])
+            paragraphs.append(remaining)
+
+        return "\n\n".join(paragraphs)
+
+    def _neutralize_feed_outputs(self, body: str, detail_brief: str) -> dict:
+        """
+        Generate compressed feed outputs (mock implementation).
+
+        Creates simple feed outputs by extracting from the original content.
+        This is a deterministic mock for testing purposes.
+        """
+        if not body and not detail_brief:
+            return {
+                "feed_title": "",
+                "feed_summary": "",
+                "detail_title": "",
+                "section": "world",
+            }
+
+        # Use detail_brief if available, otherwise use body
+        source = detail_brief or body or ""
+
+        # Split into sentences for processing
+        sentences = re.split(r"(?<=[.!?])\s+", source.strip())
+        sentences = [s.strip() for s in sentences if s.strip()]
+
+        # Apply neutralization to the source
+        body_spans = self._find_spans(source, "body")
+        filtered_source = self._neutralize_text(source, body_spans)
+        filtered_sentences = re.split(r"(?<=[.!?])\s+", filtered_source.strip())
+        filtered_sentences = [s.strip() for s in filtered_sentences if s.strip()]
+
+        # Generate feed_title: Extract key phrase from first sentence, max 12 words
+        feed_title = ""
+        if filtered_sentences:
+            first_sentence = filtered_sentences[0]
+            words = first_sentence.split()
+            # Take first 6-12 words, stopping at natural break
+            feed_title_words = words[: min(6, len(words))]
+            feed_title = " ".join(feed_title_words)
+            # Remove trailing punctuation except periods
+            feed_title = feed_title.rstrip(",:;")
+            if not feed_title.endswith("."):
+                feed_title = feed_title.rstrip(".")
+
+        # Generate feed_summary: First 1-2 sentences, max ~120 chars
+        feed_summary = ""
+        if filtered_sentences:
+            feed_summary = filtered_sentences[0]
+            if len(filtered_sentences) > 1 and len(feed_summary) < 60:
+                combined = f"{filtered_sentences[0]} {filtered_sentences[1]}"
+                if len(combined) <= 120:
+                    feed_summary = combined
+
+        # Generate detail_title: Slightly longer version of feed_title
+        detail_title = ""
+        if filtered_sentences:
+            first_sentence = filtered_sentences[0]
+            words = first_sentence.split()
+            # Take up to 15 words for detail_title
+            detail_title_words = words[: min(15, len(words))]
+            detail_title = " ".join(detail_title_words)
+            # Clean up punctuation
+            detail_title = detail_title.rstrip(",:;")
+
+        return {
+            "feed_title": feed_title,
+            "feed_summary": feed_summary,
+            "detail_title": detail_title,
+            "section": "world",  # Mock always returns world (LLM providers do real classification)
+        }
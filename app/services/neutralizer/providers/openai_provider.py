@@ -0,0 +1,441 @@
+# app/services/neutralizer/providers/openai_provider.py
+"""
+OpenAI neutralizer provider.
+
+Imported on first use by get_neutralizer_provider(). The openai
+SDK itself is only imported when a call is made.
+"""
+
+import logging
+import os
+from typing import Any
+
+from app.services.neutralizer import (
+    DetailFullResult,
+    NeutralizationResponseError,
+    NeutralizationResult,
+    NeutralizerProvider,
+    _detect_garbled_output,
+    _detect_spans_with_config,
+    _openai_chat,
+    _validate_feed_outputs,
+    build_brief_repair_prompt,
+    build_compression_feed_outputs_prompt,
+    build_feed_summary_repair_prompt,
+    build_fused_brief_feed_prompt,
+    build_repair_prompt,
+    build_synthesis_detail_brief_prompt,
+    build_synthesis_detail_full_prompt,
+    build_user_prompt,
+    finish_fused_brief_feed,
+    get_article_system_prompt,
+    get_headline_system_prompt,
+    get_repair_system_prompt,
+    get_system_prompt,
+    parse_fused_brief_feed_response,
+    parse_llm_response,
+    truncate_at_sentence,
+    validate_brief_neutralization,
+    validate_feed_summary,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class OpenAINeutralizerProvider(NeutralizerProvider):
+    """OpenAI-based neutralizer (GPT-4o-mini, GPT-4o, etc.)."""
+
+    def __init__(self, model: str = "gpt-4o-mini"):
+        self._model = model
+        self._api_key = os.getenv("OPENAI_API_KEY")
+
+    @property
+    def name(self) -> str:
+        return "openai"
+
+    @property
+    def model_name(self) -> str:
+        return self._model
+
+    def neutralize(
+        self,
+        title: str,
+        description: str | None,
+        body: str | None,
+        repair_instructions: str | None = None,
+    ) -> NeutralizationResult:
+        """Neutralize using OpenAI API.
+
+        Raises NeutralizationResponseError if no API key or neutralization fails.
+        """
+        if not self._api_key:
+            logger.error("No OPENAI_API_KEY set - cannot neutralize")
+            raise NeutralizationResponseError("No OPENAI_API_KEY configured")
+
+        try:
+            from openai import OpenAI
+
+            client = OpenAI(api_key=self._api_key)
+
+            if repair_instructions:
+                system_prompt = get_repair_system_prompt()
+                user_prompt = build_repair_prompt(title, description, body, repair_instructions)
+            else:
+                system_prompt = get_system_prompt()
+                user_prompt = build_user_prompt(title, description, body)
+
+            response = _openai_chat(
+                client,
+                "neutralize",
+                model=self._model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=0.3,
+                response_format={"type": "json_object"},
+            )
+
+            import json
+
+            data = json.loads(response.choices[0].message.content)
+            return parse_llm_response(data, title, description)
+
+        except NeutralizationResponseError:
+            raise  # Re-raise our own exceptions
+        except Exception as e:
+            logger.error(f"OpenAI neutralization failed: {e}")
+            raise NeutralizationResponseError(f"OpenAI neutralization failed: {str(e)}")
+
+    def _neutralize_detail_full(
+        self,
+        body: str,
+        title: str = None,
+        retry_count: int = 0,
+        feed_category: str | None = None,
+    ) -> DetailFullResult:
+        """
+        Neutralize an article body using OpenAI with SYNTHESIS approach.
+
+        Uses synthesis mode (plain text output) as the primary approach because:
+        - LLMs are better at generating fresh text than surgical editing
+        - No position tracking = better grammar preservation
+        - More consistent, readable output
+
+        Spans are detected via hybrid LLM + position matching:
+        1. LLM identifies manipulative phrases with context awareness
+        2. Position matcher finds exact character positions in original body/title
+        3. Returns failure status if LLM fails (no mock fallback)
+
+        Args:
+            body: Article body text
+            title: Original article title (for headline manipulation detection)
+            retry_count: Current retry attempt number
+            feed_category: Article genre for content-type-aware span detection
+        """
+        MAX_RETRIES = 2
+
+        if not body:
+            return DetailFullResult(detail_full="", spans=[])
+
+        if not self._api_key:
+            logger.error("No OPENAI_API_KEY set - cannot neutralize")
+            return DetailFullResult(
+                detail_full="", spans=[], status="failed_llm", failure_reason="No OPENAI_API_KEY configured"
+            )
+
+        # Get spans via config-aware detection (respects SPAN_DETECTION_MODE)
+        # Uses multi_pass for 99% recall if configured, otherwise single-pass
+        # Now includes title for headline manipulation detection
+        spans = _detect_spans_with_config(
+            body=body,
+            provider_api_key=self._api_key,
+            provider_type="openai",
+            provider_model=self._model,
+            title=title,
+            feed_category=feed_category,
+        )
+        logger.info(
+            f"Span detection completed with {len(spans)} spans (title spans: {sum(1 for s in spans if s.field == 'title')})"
+        )
+
+        try:
+            from openai import OpenAI
+
+            client = OpenAI(api_key=self._api_key)
+
+            # Use SYNTHESIS prompt (plain text output, not JSON)
+            system_prompt = get_article_system_prompt()
+            user_prompt = build_synthesis_detail_full_prompt(body)
+
+            # Allow model override for detail_full via DETAIL_FULL_MODEL
+            from app.config import get_settings
+
+            detail_full_model = get_settings().DETAIL_FULL_MODEL or self._model
+
+            # Some models (e.g. gpt-5-mini) only support temperature=1
+            create_kwargs: dict[str, Any] = {
+                "model": detail_full_model,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+            }
+            if not detail_full_model.startswith("gpt-5"):
+                create_kwargs["temperature"] = 0.3
+
+            response = _openai_chat(client, "detail_full", **create_kwargs)
+
+            detail_full = response.choices[0].message.content.strip()
+
+            # Validate output isn't garbled
+            if _detect_garbled_output(body, detail_full):
+                logger.error("OpenAI synthesis produced garbled output")
+                return DetailFullResult(
+                    detail_full="",
+                    spans=spans,
+                    status="failed_garbled",
+                    failure_reason="OpenAI synthesis produced garbled output",
+                )
+
+            return DetailFullResult(detail_full=detail_full, spans=spans)
+
+        except Exception as e:
+            # API error - retry, then return failure status
+            if retry_count < MAX_RETRIES:
+                logger.warning(
+                    f"OpenAI synthesis error (attempt {retry_count + 1}/{MAX_RETRIES + 1}): {e}, retrying..."
+                )
+                import time
+
+                time.sleep(1)
+                return self._neutralize_detail_full(body, title, retry_count + 1)
+            else:
+                logger.error(f"OpenAI synthesis failed after {MAX_RETRIES + 1} attempts: {e}")
+                return DetailFullResult(
+                    detail_full="",
+                    spans=spans,
+                    status="failed_llm",
+                    failure_reason=f"OpenAI synthesis failed after {MAX_RETRIES + 1} attempts: {str(e)}",
+                )
+
+    def _neutralize_detail_brief(self, body: str) -> str:
+        """
+        Synthesize an article body into a brief using OpenAI (Call 2: Synthesize).
+
+        Uses shared article_system_prompt + synthesis_detail_brief_prompt.
+        Returns plain text (3-5 paragraphs, no headers or bullets).
+
+        Includes retry logic: if the brief contains banned phrases, retry with
+        a repair prompt up to MAX_BRIEF_RETRIES times.
+
+        Raises NeutralizationResponseError if no API key or synthesis fails.
+        """
+        MAX_BRIEF_RETRIES = 2
+
+        if not body:
+            return ""
+
+        if not self._api_key:
+            logger.error("No OPENAI_API_KEY set - cannot synthesize brief")
+            raise NeutralizationResponseError("No OPENAI_API_KEY configured")
+
+        try:
+            from openai import OpenAI
+
+            client = OpenAI(api_key=self._api_key)
+
+            system_prompt = get_article_system_prompt()
+            user_prompt = build_synthesis_detail_brief_prompt(body)
+
+            response = _openai_chat(
+                client,
+                "detail_brief",
+                model=self._model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=0.3,
+                # Note: No JSON response format - we want plain text
+            )
+
+            brief = response.choices[0].message.content.strip()
+
+            # Validate and retry if violations found
+            for attempt in range(MAX_BRIEF_RETRIES):
+                violations = validate_brief_neutralization(brief)
+                if not violations:
+                    return brief
+
+                logger.warning(f"Brief validation failed (attempt {attempt + 1}/{MAX_BRIEF_RETRIES + 1}): {violations}")
+
+                # Generate repair prompt and retry
+                repair_prompt = build_brief_repair_prompt(brief, violations)
+                repair_response = _openai_chat(
+                    client,
+                    "detail_brief_repair",
+                    model=self._model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": repair_prompt},
+                    ],
+                    temperature=0.3,
+                )
+                brief = repair_response.choices[0].message.content.strip()
+
+            # Final validation after all retries
+            violations = validate_brief_neutralization(brief)
+            if violations:
+                logger.error(f"Brief validation failed after {MAX_BRIEF_RETRIES + 1} attempts: {violations}")
+            return brief
+
+        except Exception as e:
+            logger.error(f"OpenAI detail_brief synthesis failed: {e}")
+            raise NeutralizationResponseError(f"OpenAI detail_brief synthesis failed: {str(e)}")
+
+    def _neutralize_brief_and_feed_outputs(self, body: str) -> tuple[str, dict]:
+        """
+        Produce detail_brief and feed outputs in one OpenAI JSON call (Calls 2 + 3 fused).
+
+        Validation and repair match the separate calls (finish_fused_brief_feed).
+
+        Raises NeutralizationResponseError if no API key or the call fails.
+        """
+        if not self._api_key:
+            raise NeutralizationResponseError("No OPENAI_API_KEY configured")
+
+        try:
+            from openai import OpenAI
+
+            client = OpenAI(api_key=self._api_key)
+
+            response = _openai_chat(
+                client,
+                "brief_feed_fused",
+                model=self._model,
+                messages=[
+                    {"role": "system", "content": get_article_system_prompt()},
+                    {"role": "user", "content": build_fused_brief_feed_prompt(body)},
+                ],
+                temperature=0.3,
+                response_format={"type": "json_object"},
+            )
+            data = parse_fused_brief_feed_response(response.choices[0].message.content)
+
+            def repair(call_type: str, system_prompt: str, user_prompt: str) -> str:
+                repair_response = _openai_chat(
+                    client,
+                    call_type,
+                    model=self._model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=0.3,
+                )
+                return repair_response.choices[0].message.content
+
+            return finish_fused_brief_feed(data, repair)
+
+        except NeutralizationResponseError:
+            raise
+        except Exception as e:
+            logger.error(f"OpenAI fused brief/feed call failed: {e}")
+            raise NeutralizationResponseError(f"OpenAI fused brief/feed call failed: {str(e)}")
+
+    def _neutralize_feed_outputs(self, body: str, detail_brief: str) -> dict:
+        """
+        Generate compressed feed outputs using OpenAI (Call 3: Compress).
+
+        Uses shared article_system_prompt + compression_feed_outputs_prompt.
+        Returns dict with feed_title, feed_summary, detail_title.
+
+        Includes validation and retry for feed_summary banned phrases.
+        """
+        MAX_FEED_SUMMARY_RETRIES = 2
+
+        if not body and not detail_brief:
+            return {
+                "feed_title": "",
+                "feed_summary": "",
+                "detail_title": "",
+                "section": "world",
+            }
+
+        if not self._api_key:
+            logger.error("No OPENAI_API_KEY set - cannot generate feed outputs")
+            raise NeutralizationResponseError("No OPENAI_API_KEY configured")
+
+        try:
+            import json
+
+            from openai import OpenAI
+
+            client = OpenAI(api_key=self._api_key)
+
+            # Use lighter headline prompt for feed outputs (not aggressive article prompt)
+            system_prompt = get_headline_system_prompt()
+            user_prompt = build_compression_feed_outputs_prompt(body, detail_brief)
+
+            response = _openai_chat(
+                client,
+                "feed_outputs",
+                model=self._model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=0.3,
+                response_format={"type": "json_object"},
+            )
+
+            data = json.loads(response.choices[0].message.content)
+            result = {
+                "feed_title": data.get("feed_title", ""),
+                "feed_summary": data.get("feed_summary", ""),
+                "detail_title": data.get("detail_title", ""),
+                "section": data.get("section", "world"),
+            }
+
+            # Validate and retry feed_summary if it contains banned phrases
+            for attempt in range(MAX_FEED_SUMMARY_RETRIES):
+                violations = validate_feed_summary(result["feed_summary"])
+                if not violations:
+                    break
+
+                logger.warning(
+                    f"Feed summary validation failed (attempt {attempt + 1}/{MAX_FEED_SUMMARY_RETRIES + 1}): {violations}"
+                )
+
+                # Generate repair prompt and retry
+                repair_prompt = build_feed_summary_repair_prompt(result["feed_summary"], violations)
+                repair_response = _openai_chat(
+                    client,
+                    "feed_summary_repair",
+                    model=self._model,
+                    messages=[
+                        {"role": "system", "content": "You are a neutral news editor. Return only the rewritten text."},
+                        {"role": "user", "content": repair_prompt},
+                    ],
+                    temperature=0.3,
+                )
+                result["feed_summary"] = repair_response.choices[0].message.content.strip()
+
+            # Final validation
+            violations = validate_feed_summary(result["feed_summary"])
+            if violations:
+                logger.error(
+                    f"Feed summary validation failed after {MAX_FEED_SUMMARY_RETRIES + 1} attempts: {violations}"
+                )
+
+            # Apply sentence-boundary truncation as safety net
+            result["feed_summary"] = truncate_at_sentence(result["feed_summary"], 130)
+
+            # Validate feed outputs for garbled content
+            _validate_feed_outputs(result)
+            return result
+
+        except Exception as e:
+            logger.error(f"OpenAI feed outputs compression failed: {e}")
+            raise NeutralizationResponseError(f"OpenAI feed outputs compression failed: {str(e)}")
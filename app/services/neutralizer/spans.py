@@ -8,8 +8,10 @@ filtering spans inside quoted speech, and removing false positives.
 
 import logging
 import re
+from bisect import bisect_left, bisect_right
 
 from app.models import SpanAction, SpanReason
+from app.services.neutralizer.phrase_locator import BOUNDARY_PUNCTUATION, WHITESPACE_RE, BodyIndex
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,9 @@ QUOTE_CHARS_OPEN = set(QUOTE_PAIRS.keys())
 # All characters that can close a quote
 QUOTE_CHARS_CLOSE = set(QUOTE_PAIRS.values())
 
+# Any quote or apostrophe character (the only characters the quote scan acts on)
+_QUOTE_CHAR_RE = re.compile("[" + re.escape("".join(QUOTE_CHARS_OPEN | QUOTE_CHARS_CLOSE)) + "]")
+
 
 # Known false positive EXACT phrases that LLMs commonly flag incorrectly
 # Only include multi-word phrases - single words are too likely to have legitimate uses
@@ -437,25 +442,20 @@ def is_contraction_apostrophe(body: str, pos: int) -> bool:
     return False
 
 
-def filter_spans_in_quotes(body: str, spans: list) -> list:
+def _scan_quote_ranges(body: str) -> list[tuple[int, int]]:
     """
-    Reclassify spans inside quotation marks as selective_quoting.
-
-    Instead of removing spans in quotes (which killed recall), reclassifies them
-    with reason=SELECTIVE_QUOTING and action=SOFTENED. This preserves the span
-    for recall while giving users insight into editorial quote selection.
+    Find quoted passages, quote marks included, using a stack for nesting.
 
-    Handles multiple quote types: straight/curly double/single quotes.
-    Distinguishes between apostrophes used as quote marks vs contractions.
+    Apostrophes inside contractions (letters on both sides) are skipped so
+    "won't" does not close a single-quoted passage.
     """
-    if not body or not spans:
-        return spans
-
-    # Find all quote boundaries using a stack for nested quotes
     quote_ranges = []
     stack = []
 
-    for i, char in enumerate(body):
+    for match in _QUOTE_CHAR_RE.finditer(body):
+        i = match.start()
+        char = match.group()
+
         # Skip apostrophes that are part of contractions
         if char in ("'", "\u2019") and is_contraction_apostrophe(body, i):
             continue
@@ -480,7 +480,129 @@ def filter_spans_in_quotes(body: str, spans: list) -> list:
                     stack.pop()
                     quote_ranges.append((start, i + 1))
 
-    if not quote_ranges:
+    return quote_ranges
+
+
+class BodyAnalysis(BodyIndex):
+    """
+    Per-body context shared by position matching and the span filters.
+
+    Adds to the phrase-location index (lowercased text, whitespace-normalized
+    text, word token boundaries) an offset map from normalized back to body
+    positions and the body's quoted ranges with bisect lookup. A detection
+    pass builds one and hands it to find_phrase_positions,
+    filter_spans_in_quotes and _correct_span_positions instead of each of
+    them re-scanning the body. Every field is computed on first use.
+    """
+
+    def __init__(self, body: str):
+        super().__init__(body)
+        self._normalized_offsets: list[int] | None = None
+        self._quote_ranges: list[tuple[int, int]] | None = None
+        self._quote_starts: list[int] = []
+        self._quote_reach: list[int] = []
+
+    @classmethod
+    def of(cls, body: str, analysis: "BodyAnalysis | None" = None) -> "BodyAnalysis":
+        """Return analysis if it was built for body, otherwise analyse body."""
+        if analysis is not None and analysis.body == body:
+            return analysis
+        return cls(body)
+
+    @property
+    def ws_normalized(self) -> str:
+        """Whitespace-normalized lowercased body, same as normalize_whitespace(lower)."""
+        if self._normalized_offsets is None:
+            self._build_normalized()
+        return self._ws_normalized
+
+    @property
+    def normalized_offsets(self) -> list[int]:
+        """Body position of each character of ws_normalized."""
+        if self._normalized_offsets is None:
+            self._build_normalized()
+        return self._normalized_offsets
+
+    def _build_normalized(self) -> None:
+        lower = self.lower
+        pieces: list[str] = []
+        offsets: list[int] = []
+        pos = 0
+        for match in WHITESPACE_RE.finditer(lower):
+            pieces.append(lower[pos : match.start()])
+            offsets.extend(range(pos, match.start()))
+            pieces.append(" ")
+            offsets.append(match.start())
+            pos = match.end()
+        pieces.append(lower[pos:])
+        offsets.extend(range(pos, len(lower)))
+        collapsed = "".join(pieces)
+
+        # Strip exactly as normalize_whitespace() does, counting what comes off the front
+        stripped = collapsed.strip()
+        lead = len(collapsed) - len(collapsed.lstrip())
+        normalized = stripped.strip(BOUNDARY_PUNCTUATION)
+        lead += len(stripped) - len(stripped.lstrip(BOUNDARY_PUNCTUATION))
+
+        self._ws_normalized = normalized
+        self._normalized_offsets = offsets[lead : lead + len(normalized)]
+
+    def find_normalized(self, phrase_normalized: str, start: int = 0) -> tuple[int, int] | None:
+        """
+        Find a whitespace-normalized phrase at or after body position start.
+
+        Equivalent to searching the lowercased body for the phrase's words
+        joined by \\s+. Returns (start, end) in the body, or None.
+        """
+        if not phrase_normalized:
+            return None
+        offsets = self.normalized_offsets
+        at = self.ws_normalized.find(phrase_normalized, bisect_left(offsets, start))
+        if at == -1:
+            return None
+        return offsets[at], offsets[at + len(phrase_normalized) - 1] + 1
+
+    @property
+    def quote_ranges(self) -> list[tuple[int, int]]:
+        """Quoted passages as (start, end), quote marks included, sorted by start."""
+        if self._quote_ranges is None:
+            ranges = sorted(_scan_quote_ranges(self.body))
+            # reach[i] = furthest end among ranges[0..i], so one bisect answers containment
+            reach = []
+            furthest = -1
+            for _, end in ranges:
+                furthest = max(furthest, end)
+                reach.append(furthest)
+            self._quote_ranges = ranges
+            self._quote_starts = [start for start, _ in ranges]
+            self._quote_reach = reach
+        return self._quote_ranges
+
+    def in_quotes(self, start: int, end: int) -> bool:
+        """True if body[start:end] lies entirely inside one quoted passage."""
+        if not self.quote_ranges:
+            return False
+        i = bisect_right(self._quote_starts, start) - 1
+        return i >= 0 and self._quote_reach[i] >= end
+
+
+def filter_spans_in_quotes(body: str, spans: list, analysis: BodyAnalysis | None = None) -> list:
+    """
+    Reclassify spans inside quotation marks as selective_quoting.
+
+    Instead of removing spans in quotes (which killed recall), reclassifies them
+    with reason=SELECTIVE_QUOTING and action=SOFTENED. This preserves the span
+    for recall while giving users insight into editorial quote selection.
+
+    Handles multiple quote types: straight/curly double/single quotes.
+    Distinguishes between apostrophes used as quote marks vs contractions.
+    Pass the body's BodyAnalysis to reuse its quote ranges.
+    """
+    if not body or not spans:
+        return spans
+
+    analysis = BodyAnalysis.of(body, analysis)
+    if not analysis.quote_ranges:
         return spans
 
     # Reclassify spans inside quotes as selective_quoting
@@ -489,8 +611,7 @@ def filter_spans_in_quotes(body: str, spans: list) -> list:
     result = []
     reclassified_count = 0
     for span in spans:
-        inside_quote = any(start <= span.start_char and span.end_char <= end for start, end in quote_ranges)
-        if inside_quote:
+        if analysis.in_quotes(span.start_char, span.end_char):
             reclassified = TransparencySpan(
                 field=span.field,
                 start_char=span.start_char,
@@ -569,6 +690,56 @@ def filter_false_positives(spans: list, feed_category: str | None = None) -> lis
 # -----------------------------------------------------------------------------
 
 
+def _group_similar_spans(items: list[dict]) -> list[list[dict]]:
+    """
+    Group multi-pass span items by position overlap or identical text.
+
+    Each span joins the earliest-created group whose first span (its
+    representative) overlaps it or has the same lowercased text, otherwise
+    it starts a new group. A span only becomes a representative when it
+    overlaps none of the existing ones, so representatives never overlap
+    each other: sorted by (start, end) their ends are sorted too, and the
+    representatives overlapping a span form one contiguous run located with
+    two bisects. Assumes start_char <= end_char, as produced by
+    find_phrase_positions.
+    """
+    groups: list[list[dict]] = []
+    group_by_text: dict[str, int] = {}
+    # Representatives sorted by (start, end), with their group indexes
+    rep_keys: list[tuple[int, int]] = []
+    rep_starts: list[int] = []
+    rep_ends: list[int] = []
+    rep_groups: list[int] = []
+
+    for item in items:
+        span = item["span"]
+        text = span.original_text.lower()
+        matched = group_by_text.get(text)
+
+        # Representatives with end > start_char and start < end_char overlap this span
+        lo = bisect_right(rep_ends, span.start_char)
+        hi = bisect_left(rep_starts, span.end_char)
+        for i in range(lo, hi):
+            if matched is None or rep_groups[i] < matched:
+                matched = rep_groups[i]
+
+        if matched is not None:
+            groups[matched].append(item)
+            continue
+
+        group_idx = len(groups)
+        groups.append([item])
+        group_by_text[text] = group_idx
+        key = (span.start_char, span.end_char)
+        at = bisect_right(rep_keys, key)
+        rep_keys.insert(at, key)
+        rep_starts.insert(at, span.start_char)
+        rep_ends.insert(at, span.end_char)
+        rep_groups.insert(at, group_idx)
+
+    return groups
+
+
 def merge_multi_pass_spans(span_lists: list, body: str) -> list:
     """
     Merge spans from multiple detection passes into a unified list.
@@ -585,8 +756,6 @@ def merge_multi_pass_spans(span_lists: list, body: str) -> list:
     Returns:
         Merged and deduplicated list of TransparencySpan
     """
-    # Import here to avoid circular import
-
     if not span_lists:
         return []
 
@@ -596,43 +765,16 @@ def merge_multi_pass_spans(span_lists: list, body: str) -> list:
         if not spans:
             continue
         for span in spans:
-            all_spans.append(
-                {
-                    "span": span,
-                    "pass_idx": pass_idx,
-                    "key": f"{span.start_char}:{span.end_char}:{span.original_text.lower()}",
-                }
-            )
+            all_spans.append({"span": span, "pass_idx": pass_idx})
 
     if not all_spans:
         return []
 
-    # Group by similar spans (same position or same text)
-    span_groups = {}
-    for item in all_spans:
-        span = item["span"]
-
-        # Try to find existing group by position match
-        matched_group = None
-        for key, group in span_groups.items():
-            existing_span = group[0]["span"]
-            # Consider overlapping if positions overlap significantly
-            if _spans_overlap(span, existing_span):
-                matched_group = key
-                break
-            # Or if exact same text
-            if span.original_text.lower() == existing_span.original_text.lower():
-                matched_group = key
-                break
-
-        if matched_group:
-            span_groups[matched_group].append(item)
-        else:
-            span_groups[item["key"]] = [item]
+    span_groups = _group_similar_spans(all_spans)
 
     # Select best span from each group and track multi-model detection
     final_spans = []
-    for _key, group in span_groups.items():
+    for group in span_groups:
         # Get unique passes that detected this span
         passes = set(item["pass_idx"] for item in group)
         multi_model = len(passes) > 1
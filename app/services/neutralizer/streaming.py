@@ -0,0 +1,303 @@
+# app/services/neutralizer/streaming.py
+"""
+Streaming consumption of LLM responses with early abort.
+
+Without streaming, a refusal, a repetition loop or a reply that is not JSON
+is only found once the whole completion has arrived, after every output
+token has been paid for. With LLM_STREAMING on, the provider call helpers
+in app.services.neutralizer stream the reply through a StreamGuard, which
+runs cheap checks on the text received so far and raises StreamAborted as
+soon as one fails. The helper then closes the stream and retries right
+away.
+
+Checks:
+- JSON replies: the first significant character must open an object or
+  array (an optional ``` fence is allowed), brackets must match, and
+  nothing but a closing fence may follow the top-level value
+  (IncrementalJSONScanner).
+- Text replies: refusal openings (QualityGateService.LLM_REFUSAL_PATTERNS)
+  and broken-grammar patterns, as counted by _detect_garbled_output.
+- Both: a reply that ends in a short unit repeated back to back many times.
+
+A completed stream is returned in the same shape as the non-streaming SDK
+response, so callers read it exactly as before.
+"""
+
+import logging
+import re
+from types import SimpleNamespace
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Grammar breakage left by over-filtering; more than GARBLED_PATTERN_LIMIT matches means garbled
+BROKEN_GRAMMAR_PATTERNS = [
+    re.compile(r"\. [A-Z][a-z]* [,\.\!\?]"),  # "The ," or "She ."
+    re.compile(r"\. [A-Z][a-z]* (a|an|the) [,\.\!\?]"),  # "The a ," broken article
+    re.compile(r"'s [,\.\!\?]"),  # "'s ," missing word after possessive
+    re.compile(r"\. [,\.\!\?]"),  # Direct ". ," or ". ."
+]
+GARBLED_PATTERN_LIMIT = 5
+
+# A repetition loop: the reply ends in a 12-200 char unit repeated at least 6 times
+LOOP_MIN_UNIT = 12
+LOOP_MAX_UNIT = 200
+LOOP_REPEATS = 6
+
+# Refusals are decided by the opening, checked once this many characters have arrived
+_REFUSAL_PREFIX = 160
+
+DEFAULT_CHECK_EVERY = 256
+
+
+class StreamAborted(Exception):
+    """A streamed reply failed an online check; the partial text is attached."""
+
+    def __init__(self, reason: str, text: str = ""):
+        super().__init__(reason)
+        self.reason = reason
+        self.text = text
+
+
+def ends_in_repetition_loop(text: str) -> bool:
+    """
+    True if text ends in LOOP_REPEATS back-to-back copies of one unit (whitespace-insensitive).
+
+    A tail made of repeats has period len(unit), so each unit length costs
+    one string comparison rather than a backtracking search.
+    """
+    tail = " ".join(text[-LOOP_MAX_UNIT * LOOP_REPEATS * 2 :].split())
+    for unit in range(LOOP_MIN_UNIT, LOOP_MAX_UNIT + 1):
+        span = unit * (LOOP_REPEATS - 1)
+        if len(tail) < span + unit:
+            break
+        if tail[-span:] == tail[-span - unit : -unit]:
+            return True
+    return False
+
+
+def count_broken_grammar(text: str) -> int:
+    """Number of BROKEN_GRAMMAR_PATTERNS matches in text."""
+    return sum(len(pattern.findall(text)) for pattern in BROKEN_GRAMMAR_PATTERNS)
+
+
+_FENCE_LINE = re.compile(r"```[A-Za-z]*")
+
+
+class IncrementalJSONScanner:
+    """
+    Structural JSON check over a character stream.
+
+    Tracks strings, escapes and bracket nesting only; values are not
+    parsed. feed() returns an error message at the first character that
+    cannot belong to a single JSON object or array (optionally wrapped in a
+    ``` code fence), or None.
+    """
+
+    _CLOSERS = {"}": "{", "]": "["}
+
+    def __init__(self):
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._started = False
+        self._done = False
+        self._fence = ""  # Opening fence line received so far
+        self._fenced = False
+
+    @property
+    def complete(self) -> bool:
+        """True once the top-level value has closed."""
+        return self._done
+
+    def feed(self, chunk: str) -> str | None:
+        for char in chunk:
+            if self._done:
+                error = self._after(char)
+            elif self._started:
+                error = self._inside(char)
+            else:
+                error = self._before(char)
+            if error:
+                return error
+        return None
+
+    def _before(self, char: str) -> str | None:
+        if self._fence:
+            self._fence += char
+            if char == "\n":
+                if not _FENCE_LINE.fullmatch(self._fence.strip()):
+                    return f"malformed code fence {self._fence.strip()[:20]!r}"
+                self._fence = ""
+                self._fenced = True
+            elif not "```".startswith(self._fence[:3]):
+                return f"reply does not start with JSON (starts with {self._fence[:20]!r})"
+            return None
+        if char.isspace():
+            return None
+        if char == "`" and not self._fenced:
+            self._fence = char
+            return None
+        if char not in "{[":
+            return f"reply does not start with JSON (starts with {char!r})"
+        self._started = True
+        self._stack.append(char)
+        return None
+
+    def _inside(self, char: str) -> str | None:
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+        elif char == '"':
+            self._in_string = True
+        elif char in "{[":
+            self._stack.append(char)
+        elif char in self._CLOSERS:
+            if self._stack[-1] != self._CLOSERS[char]:
+                return f"unbalanced {char!r}"
+            self._stack.pop()
+            self._done = not self._stack
+        return None
+
+    def _after(self, char: str) -> str | None:
+        if char.isspace() or (char == "`" and self._fenced):
+            return None
+        return f"text after the JSON value (starts with {char!r})"
+
+
+class StreamGuard:
+    """
+    Online checks for one streamed reply.
+
+    Usage:
+        guard = StreamGuard(expect_json=True)
+        for delta in deltas:
+            guard.feed(delta)  # raises StreamAborted
+        guard.finish()
+        text = guard.text
+    """
+
+    def __init__(self, expect_json: bool, check_every: int = DEFAULT_CHECK_EVERY):
+        self.expect_json = expect_json
+        self.check_every = check_every
+        self._parts: list[str] = []
+        self._length = 0
+        self._checked_at = 0
+        self._scanner = IncrementalJSONScanner() if expect_json else None
+        self._refusal_checked = expect_json  # JSON replies fail the scanner instead
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def feed(self, delta: str | None) -> None:
+        if not delta:
+            return
+        self._parts.append(delta)
+        self._length += len(delta)
+        if self._scanner is not None:
+            error = self._scanner.feed(delta)
+            if error:
+                self._abort(error)
+        if not self._refusal_checked and self._length >= _REFUSAL_PREFIX:
+            self._check_refusal()
+        if self._length - self._checked_at >= self.check_every:
+            self._check()
+
+    def finish(self) -> None:
+        """Run the checks once more over the complete reply."""
+        if not self._refusal_checked:
+            self._check_refusal()
+        if self._length > self._checked_at:
+            self._check()
+
+    def _check_refusal(self) -> None:
+        from app.services.quality_gate import QualityGateService
+
+        self._refusal_checked = True
+        opening = self.text[:_REFUSAL_PREFIX]
+        if any(pattern.search(opening) for pattern in QualityGateService.LLM_REFUSAL_PATTERNS):
+            self._abort("refusal")
+
+    def _check(self) -> None:
+        self._checked_at = self._length
+        text = self.text
+        if ends_in_repetition_loop(text):
+            self._abort("repetition loop")
+        if not self.expect_json and count_broken_grammar(text) > GARBLED_PATTERN_LIMIT:
+            self._abort("broken grammar")
+
+    def _abort(self, reason: str) -> None:
+        raise StreamAborted(reason, self.text)
+
+
+# -----------------------------------------------------------------------------
+# Provider stream consumers
+# -----------------------------------------------------------------------------
+
+
+def stream_openai_chat(client: Any, guard: StreamGuard, **create_kwargs: Any) -> Any:
+    """
+    Stream an OpenAI chat completion through guard.
+
+    Returns an object with the fields callers read from a ChatCompletion:
+    choices[0].message.content, choices[0].finish_reason and usage.
+    """
+    stream = client.chat.completions.create(**create_kwargs, stream=True, stream_options={"include_usage": True})
+    usage = None
+    finish_reason = None
+    try:
+        for chunk in stream:
+            if getattr(chunk, "usage", None) is not None:
+                usage = chunk.usage
+            if chunk.choices:
+                choice = chunk.choices[0]
+                guard.feed(choice.delta.content)
+                finish_reason = choice.finish_reason or finish_reason
+        guard.finish()
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+    message = SimpleNamespace(content=guard.text, role="assistant")
+    return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason=finish_reason)], usage=usage)
+
+
+def stream_anthropic_message(client: Any, guard: StreamGuard, **create_kwargs: Any) -> Any:
+    """Stream an Anthropic message through guard; returns the SDK's final Message."""
+    with client.messages.stream(**create_kwargs) as stream:
+        for text in stream.text_stream:
+            guard.feed(text)
+        guard.finish()
+        return stream.get_final_message()
+
+
+def stream_gemini_generate(model_obj: Any, guard: StreamGuard, prompt: str) -> Any:
+    """Stream a Gemini generation through guard; returns the resolved streaming response."""
+    response = model_obj.generate_content(prompt, stream=True)
+    for chunk in response:
+        guard.feed(chunk.text)
+    guard.finish()
+    return response
+
+
+# -----------------------------------------------------------------------------
+# Settings
+# -----------------------------------------------------------------------------
+
+
+def streaming_settings() -> tuple[bool, int]:
+    """(LLM_STREAMING, LLM_STREAM_ABORT_RETRIES), or streaming off if settings are unavailable."""
+    try:
+        from app.config import get_settings
+
+        settings = get_settings()
+        return settings.LLM_STREAMING, settings.LLM_STREAM_ABORT_RETRIES
+    except Exception as e:
+        # Settings can be incomplete in scripts and unit tests; fall back to defaults
+        logger.debug(f"Streaming settings unavailable, streaming off: {e}")
+        return False, 0
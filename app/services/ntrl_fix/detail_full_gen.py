@@ -19,6 +19,7 @@ from dataclasses import dataclass
 
 import httpx
 
+from app.services.resilience import estimate_tokens, llm_permit
 from app.taxonomy import get_type
 
 from ..ntrl_scan.types import DetectionInstance, MergedScanResult
@@ -342,20 +343,22 @@ class DetailFullGenerator:
 
             prompt = DETAIL_FULL_PROMPT.format(body=body, spans_formatted=spans_formatted)
 
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.config.model,
-                    "max_tokens": self.config.max_tokens,
-                    "temperature": self.config.temperature,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "response_format": {"type": "json_object"},
-                },
-            )
+            async with llm_permit("openai", self.config.model, estimate_tokens(prompt)) as permit:
+                response = await client.post(
+                    "https://api.openai.com/v1/chat/completions",
+                    headers={
+                        "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
+                        "Content-Type": "application/json",
+                    },
+                    json={
+                        "model": self.config.model,
+                        "max_tokens": self.config.max_tokens,
+                        "temperature": self.config.temperature,
+                        "messages": [{"role": "user", "content": prompt}],
+                        "response_format": {"type": "json_object"},
+                    },
+                )
+                permit.record_status(response.status_code)
 
             if response.status_code != 200:
                 raise Exception(f"OpenAI API error: {response.status_code}")
@@ -395,20 +398,22 @@ class DetailFullGenerator:
 
             prompt = DETAIL_FULL_PROMPT.format(body=body, spans_formatted=spans_formatted)
 
-            response = await client.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": os.getenv("ANTHROPIC_API_KEY"),
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": self.config.model,
-                    "max_tokens": self.config.max_tokens,
-                    "temperature": self.config.temperature,
-                    "messages": [{"role": "user", "content": prompt}],
-                },
-            )
+            async with llm_permit("anthropic", self.config.model, estimate_tokens(prompt)) as permit:
+                response = await client.post(
+                    "https://api.anthropic.com/v1/messages",
+                    headers={
+                        "x-api-key": os.getenv("ANTHROPIC_API_KEY"),
+                        "anthropic-version": "2023-06-01",
+                        "content-type": "application/json",
+                    },
+                    json={
+                        "model": self.config.model,
+                        "max_tokens": self.config.max_tokens,
+                        "temperature": self.config.temperature,
+                        "messages": [{"role": "user", "content": prompt}],
+                    },
+                )
+                permit.record_status(response.status_code)
 
             if response.status_code != 200:
                 raise Exception(f"Anthropic API error: {response.status_code}")
@@ -448,20 +453,22 @@ class DetailFullGenerator:
 
             prompt = EDITORIAL_SYNTHESIS_PROMPT.format(body=body)
 
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.config.model,
-                    "max_tokens": self.config.max_tokens,
-                    "temperature": self.config.temperature,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "response_format": {"type": "json_object"},
-                },
-            )
+            async with llm_permit("openai", self.config.model, estimate_tokens(prompt)) as permit:
+                response = await client.post(
+                    "https://api.openai.com/v1/chat/completions",
+                    headers={
+                        "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
+                        "Content-Type": "application/json",
+                    },
+                    json={
+                        "model": self.config.model,
+                        "max_tokens": self.config.max_tokens,
+                        "temperature": self.config.temperature,
+                        "messages": [{"role": "user", "content": prompt}],
+                        "response_format": {"type": "json_object"},
+                    },
+                )
+                permit.record_status(response.status_code)
 
             if response.status_code != 200:
                 raise Exception(f"OpenAI API error: {response.status_code}")
@@ -500,20 +507,22 @@ class DetailFullGenerator:
 
             prompt = EDITORIAL_SYNTHESIS_PROMPT.format(body=body)
 
-            response = await client.post(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": os.getenv("ANTHROPIC_API_KEY"),
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json",
-                },
-                json={
-                    "model": self.config.model,
-                    "max_tokens": self.config.max_tokens,
-                    "temperature": self.config.temperature,
-                    "messages": [{"role": "user", "content": prompt}],
-                },
-            )
+            async with llm_permit("anthropic", self.config.model, estimate_tokens(prompt)) as permit:
+                response = await client.post(
+                    "https://api.anthropic.com/v1/messages",
+                    headers={
+                        "x-api-key": os.getenv("ANTHROPIC_API_KEY"),
+                        "anthropic-version": "2023-06-01",
+                        "content-type": "application/json",
+                    },
+                    json={
+                        "model": self.config.model,
+                        "max_tokens": self.config.max_tokens,
+                        "temperature": self.config.temperature,
+                        "messages": [{"role": "user", "content": prompt}],
+                    },
+                )
+                permit.record_status(response.status_code)
 
             if response.status_code != 200:
                 raise Exception(f"Anthropic API error: {response.status_code}")
@@ -16,6 +16,8 @@ from dataclasses import dataclass
 
 import httpx
 
+from app.services.resilience import estimate_tokens, llm_permit
+
 from ..ntrl_scan.types import MergedScanResult
 from .types import GeneratorConfig
 
@@ -215,20 +217,22 @@ class FeedOutputsGenerator:
             body=body_truncated, original_title=original_title or "(none provided)", title_issues=title_issues
         )
 
-        response = await client.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": self.config.model,
-                "max_tokens": 256,
-                "temperature": 0.2,  # More deterministic for titles
-                "messages": [{"role": "user", "content": prompt}],
-                "response_format": {"type": "json_object"},
-            },
-        )
+        async with llm_permit("openai", self.config.model, estimate_tokens(prompt)) as permit:
+            response = await client.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": self.config.model,
+                    "max_tokens": 256,
+                    "temperature": 0.2,  # More deterministic for titles
+                    "messages": [{"role": "user", "content": prompt}],
+                    "response_format": {"type": "json_object"},
+                },
+            )
+            permit.record_status(response.status_code)
 
         if response.status_code != 200:
             raise Exception(f"OpenAI API error: {response.status_code}")
@@ -248,20 +252,22 @@ class FeedOutputsGenerator:
             body=body_truncated, original_title=original_title or "(none provided)", title_issues=title_issues
         )
 
-        response = await client.post(
-            "https://api.anthropic.com/v1/messages",
-            headers={
-                "x-api-key": os.getenv("ANTHROPIC_API_KEY"),
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
-            json={
-                "model": self.config.model,
-                "max_tokens": 256,
-                "temperature": 0.2,
-                "messages": [{"role": "user", "content": prompt}],
-            },
-        )
+        async with llm_permit("anthropic", self.config.model, estimate_tokens(prompt)) as permit:
+            response = await client.post(
+                "https://api.anthropic.com/v1/messages",
+                headers={
+                    "x-api-key": os.getenv("ANTHROPIC_API_KEY"),
+                    "anthropic-version": "2023-06-01",
+                    "content-type": "application/json",
+                },
+                json={
+                    "model": self.config.model,
+                    "max_tokens": 256,
+                    "temperature": 0.2,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            )
+            permit.record_status(response.status_code)
 
         if response.status_code != 200:
             raise Exception(f"Anthropic API error: {response.status_code}")
@@ -108,6 +108,7 @@ class NTRLFixer:
         title: str = "",
         body_scan: MergedScanResult | None = None,
         title_scan: MergedScanResult | None = None,
+        strict_validation: bool | None = None,
     ) -> FixResult:
         """
         Fix/neutralize article content using detected manipulation spans.
@@ -120,11 +121,13 @@ class NTRLFixer:
             title: Original article title
             body_scan: Scan results for body
             title_scan: Scan results for title
+            strict_validation: Per-call override of config.strict_validation
 
         Returns:
             FixResult with all neutralized outputs
         """
         start_time = time.perf_counter()
+        strict = self.config.strict_validation if strict_validation is None else strict_validation
 
         if not body or not body.strip():
             return self._empty_result()
@@ -161,13 +164,11 @@ class NTRLFixer:
             feed_outputs = FeedOutputsResult(feed_title=title, feed_summary="")
 
         # Validate detail_full against original
-        validation = self.validator.validate(
-            original=body, rewritten=detail_full.text, strict=self.config.strict_validation
-        )
+        validation = self.validator.validate(original=body, rewritten=detail_full.text, strict=strict)
 
         # If validation failed and retries enabled, try again with more conservative settings
         if not validation.passed and self.config.retry_on_failure:
-            detail_full, validation = await self._retry_with_fallback(body, body_scan, validation)
+            detail_full, validation = await self._retry_with_fallback(body, body_scan, validation, strict)
 
         # Build change records from detail_full changes
         changes = self._build_change_records(detail_full.changes, body_scan)
@@ -187,7 +188,7 @@ class NTRLFixer:
         )
 
     async def _retry_with_fallback(
-        self, body: str, body_scan: MergedScanResult, original_validation: ValidationResult
+        self, body: str, body_scan: MergedScanResult, original_validation: ValidationResult, strict: bool = True
     ) -> tuple[DetailFullResult, ValidationResult]:
         """
         Retry generation with more conservative settings.
@@ -203,9 +204,7 @@ class NTRLFixer:
             # (In production, would use stricter prompt)
             result = self.detail_full_gen._mock_generate(body, body_scan.spans)
 
-            validation = self.validator.validate(
-                original=body, rewritten=result.text, strict=self.config.strict_validation
-            )
+            validation = self.validator.validate(original=body, rewritten=result.text, strict=strict)
 
             if validation.passed:
                 return result, validation
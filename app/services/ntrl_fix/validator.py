@@ -18,36 +18,25 @@ the original to ensure no factual changes were introduced. It implements
 10. Negation Integrity - Negations preserved
 
 Any failure in these checks indicates the rewrite may have changed meaning.
+
+Entity and date checks compare spaCy entities. The other eight compare
+TextFeatures, extracted from each text in a single pass (see
+validator_features.py) rather than rescanned by every check.
 """
 
-import re
 from functools import lru_cache
 
-import spacy
+from spacy.language import Language
 from spacy.tokens import Doc
 
+from app.services.spacy_runtime import SpacyRuntime, get_spacy_runtime
+
 from .types import (
     CheckResult,
     ValidationResult,
     ValidationStatus,
 )
-
-ALLOWED_SPACY_MODELS = {"en_core_web_sm", "en_core_web_md", "en_core_web_lg"}
-
-
-@lru_cache(maxsize=1)
-def _get_spacy_model(model_name: str = "en_core_web_sm"):
-    """Lazy-load and cache the spaCy model as a singleton."""
-    if model_name not in ALLOWED_SPACY_MODELS:
-        raise ValueError(f"Model '{model_name}' not in allowlist: {ALLOWED_SPACY_MODELS}")
-    try:
-        nlp = spacy.load(model_name)
-    except OSError:
-        import subprocess
-
-        subprocess.run(["python", "-m", "spacy", "download", model_name], check=True)
-        nlp = spacy.load(model_name)
-    return nlp
+from .validator_features import FeatureExtractor, TextFeatures
 
 
 class RedLineValidator:
@@ -156,9 +145,37 @@ class RedLineValidator:
         "so",
     }
 
+    # Risk and warning language that must survive rewriting
+    RISK_INDICATORS = [
+        "warning",
+        "danger",
+        "risk",
+        "threat",
+        "hazard",
+        "emergency",
+        "critical",
+        "severe",
+        "urgent",
+        "evacuate",
+        "avoid",
+        "caution",
+        "alert",
+    ]
+
     def __init__(self, model_name: str = "en_core_web_sm"):
-        """Initialize with lazy-loaded spaCy model."""
-        self.nlp = _get_spacy_model(model_name)
+        """Initialize with the shared spaCy runtime (model loaded on first use)."""
+        self.model_name = model_name
+        self.extractor = FeatureExtractor(
+            self.SOFT_MODALS | self.HARD_MODALS | self.SCOPE_WORDS | self.CAUSAL_WORDS | set(self.RISK_INDICATORS)
+        )
+
+    @property
+    def runtime(self) -> SpacyRuntime:
+        return get_spacy_runtime(self.model_name)
+
+    @property
+    def nlp(self) -> Language:
+        return self.runtime.nlp
 
     def validate(self, original: str, rewritten: str, strict: bool = True) -> ValidationResult:
         """
@@ -172,22 +189,26 @@ class RedLineValidator:
         Returns:
             ValidationResult with all check results
         """
-        # Parse both texts with spaCy
-        original_doc = self.nlp(original)
-        rewritten_doc = self.nlp(rewritten)
+        # Parse both texts with spaCy; the original is usually cached from the scan
+        original_doc = self.runtime.parse(original)
+        rewritten_doc = self.runtime.parse(rewritten)
+
+        # One feature pass per text for the string checks
+        original_features = self.extractor.extract(original)
+        rewritten_features = self.extractor.extract(rewritten)
 
         # Run all checks
         checks = {
             "entity_invariance": self._check_entities(original_doc, rewritten_doc),
-            "number_invariance": self._check_numbers(original, rewritten),
+            "number_invariance": self._check_numbers(original_features, rewritten_features),
             "date_invariance": self._check_dates(original_doc, rewritten_doc),
-            "attribution_invariance": self._check_attributions(original, rewritten),
-            "modality_invariance": self._check_modality(original, rewritten),
-            "causality_invariance": self._check_causality(original, rewritten),
-            "risk_invariance": self._check_risk(original, rewritten),
-            "quote_integrity": self._check_quotes(original, rewritten),
-            "scope_invariance": self._check_scope(original, rewritten),
-            "negation_integrity": self._check_negation(original, rewritten),
+            "attribution_invariance": self._check_attributions(original_features, rewritten_features),
+            "modality_invariance": self._check_modality(original_features, rewritten_features),
+            "causality_invariance": self._check_causality(original_features, rewritten_features),
+            "risk_invariance": self._check_risk(original_features, rewritten_features),
+            "quote_integrity": self._check_quotes(original_features, rewritten_features),
+            "scope_invariance": self._check_scope(original_features, rewritten_features),
+            "negation_integrity": self._check_negation(original_features, rewritten_features),
         }
 
         # Determine overall pass/fail
@@ -242,31 +263,13 @@ class RedLineValidator:
             check_name="entity_invariance", status=ValidationStatus.PASSED, message="All named entities preserved"
         )
 
-    def _check_numbers(self, original: str, rewritten: str) -> CheckResult:
+    def _check_numbers(self, original: TextFeatures, rewritten: TextFeatures) -> CheckResult:
         """
         Check that all numbers are preserved exactly.
 
         Numbers include: integers, decimals, percentages, currency, ordinals.
         """
-        # Pattern to match numbers in various formats
-        number_pattern = r"""
-            (?:
-                \$?\d{1,3}(?:,\d{3})*(?:\.\d+)?%?  |  # Currency/percentage
-                \d+(?:\.\d+)?%?                    |  # Simple numbers
-                \d+(?:st|nd|rd|th)                 |  # Ordinals
-                \b(?:one|two|three|four|five|six|seven|eight|nine|ten|
-                   eleven|twelve|hundred|thousand|million|billion)\b
-            )
-        """
-
-        original_numbers = set(re.findall(number_pattern, original, re.VERBOSE | re.IGNORECASE))
-        rewritten_numbers = set(re.findall(number_pattern, rewritten, re.VERBOSE | re.IGNORECASE))
-
-        # Normalize for comparison
-        original_normalized = {n.lower().replace(",", "") for n in original_numbers}
-        rewritten_normalized = {n.lower().replace(",", "") for n in rewritten_numbers}
-
-        missing = original_normalized - rewritten_normalized
+        missing = original.numbers - rewritten.numbers
 
         if missing:
             return CheckResult(
@@ -302,35 +305,13 @@ class RedLineValidator:
 
         return CheckResult(check_name="date_invariance", status=ValidationStatus.PASSED, message="All dates preserved")
 
-    def _check_attributions(self, original: str, rewritten: str) -> CheckResult:
+    def _check_attributions(self, original: TextFeatures, rewritten: TextFeatures) -> CheckResult:
         """
         Check that attributions (who said what) are preserved.
 
         Looks for patterns like "X said", "according to X".
         """
-        # Pattern to match attributions
-        attribution_pattern = r"""
-            (?:
-                (?:according\s+to|said|stated|announced|confirmed|
-                   reported|claimed|argued|explained|noted)\s+
-                (?:by\s+)?
-                [A-Z][a-z]+(?:\s+[A-Z][a-z]+)*
-            ) |
-            (?:
-                [A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+
-                (?:said|stated|announced|confirmed|reported|
-                   claimed|argued|explained|noted|told|added)
-            )
-        """
-
-        original_attrs = set(re.findall(attribution_pattern, original, re.VERBOSE))
-        rewritten_attrs = set(re.findall(attribution_pattern, rewritten, re.VERBOSE))
-
-        # Normalize
-        original_normalized = {a.lower().strip() for a in original_attrs if a.strip()}
-        rewritten_normalized = {a.lower().strip() for a in rewritten_attrs if a.strip()}
-
-        missing = original_normalized - rewritten_normalized
+        missing = original.attributions - rewritten.attributions
 
         if missing:
             return CheckResult(
@@ -344,23 +325,20 @@ class RedLineValidator:
             check_name="attribution_invariance", status=ValidationStatus.PASSED, message="Attributions preserved"
         )
 
-    def _check_modality(self, original: str, rewritten: str) -> CheckResult:
+    def _check_modality(self, original: TextFeatures, rewritten: TextFeatures) -> CheckResult:
         """
         Check that modality (certainty levels) hasn't been upgraded.
 
         Ensures "alleged" doesn't become "confirmed", etc.
         """
-        original_lower = original.lower()
-        rewritten_lower = rewritten.lower()
-
         violations = []
 
         for soft in self.SOFT_MODALS:
-            if soft in original_lower:
+            if original.contains(soft):
                 # Check if any hard modal appeared in rewritten
                 # that wasn't in original
                 for hard in self.HARD_MODALS:
-                    if hard in rewritten_lower and hard not in original_lower:
+                    if rewritten.contains(hard) and not original.contains(hard):
                         violations.append(f"{soft} -> {hard}")
 
         if violations:
@@ -375,17 +353,14 @@ class RedLineValidator:
             check_name="modality_invariance", status=ValidationStatus.PASSED, message="Modality levels preserved"
         )
 
-    def _check_causality(self, original: str, rewritten: str) -> CheckResult:
+    def _check_causality(self, original: TextFeatures, rewritten: TextFeatures) -> CheckResult:
         """
         Check that causal claims are preserved.
 
         Ensures cause-effect relationships aren't changed.
         """
-        original_lower = original.lower()
-        rewritten_lower = rewritten.lower()
-
         # Check for causal language in original
-        original_causal = [w for w in self.CAUSAL_WORDS if w in original_lower]
+        original_causal = [w for w in self.CAUSAL_WORDS if original.contains(w)]
 
         if not original_causal:
             return CheckResult(
@@ -395,7 +370,7 @@ class RedLineValidator:
             )
 
         # Check if causal language is preserved
-        missing_causal = [w for w in original_causal if w not in rewritten_lower]
+        missing_causal = [w for w in original_causal if not rewritten.contains(w)]
 
         if missing_causal:
             return CheckResult(
@@ -409,33 +384,14 @@ class RedLineValidator:
             check_name="causality_invariance", status=ValidationStatus.PASSED, message="Causal relationships preserved"
         )
 
-    def _check_risk(self, original: str, rewritten: str) -> CheckResult:
+    def _check_risk(self, original: TextFeatures, rewritten: TextFeatures) -> CheckResult:
         """
         Check that risk levels and warnings are preserved.
 
         Ensures safety-relevant information isn't removed.
         """
-        risk_indicators = [
-            "warning",
-            "danger",
-            "risk",
-            "threat",
-            "hazard",
-            "emergency",
-            "critical",
-            "severe",
-            "urgent",
-            "evacuate",
-            "avoid",
-            "caution",
-            "alert",
-        ]
-
-        original_lower = original.lower()
-        rewritten_lower = rewritten.lower()
-
-        original_risks = [r for r in risk_indicators if r in original_lower]
-        missing_risks = [r for r in original_risks if r not in rewritten_lower]
+        original_risks = [r for r in self.RISK_INDICATORS if original.contains(r)]
+        missing_risks = [r for r in original_risks if not rewritten.contains(r)]
 
         if missing_risks:
             return CheckResult(
@@ -449,25 +405,16 @@ class RedLineValidator:
             check_name="risk_invariance", status=ValidationStatus.PASSED, message="Risk levels preserved"
         )
 
-    def _check_quotes(self, original: str, rewritten: str) -> CheckResult:
+    def _check_quotes(self, original: TextFeatures, rewritten: TextFeatures) -> CheckResult:
         """
         Check that direct quotes are preserved verbatim.
 
         Quotes should never be modified during neutralization.
         """
-        # Extract quoted content
-        quote_pattern = r'"([^"]+)"|"([^"]+)"|\'([^\']+)\''
-
-        original_quotes = set()
-        for match in re.finditer(quote_pattern, original):
-            quote = match.group(1) or match.group(2) or match.group(3)
-            if quote and len(quote) > 10:  # Skip very short quotes
-                original_quotes.add(quote.strip())
-
         # Check each quote is preserved
         missing_quotes = []
-        for quote in original_quotes:
-            if quote not in rewritten:
+        for quote in original.quotes:
+            if quote not in rewritten.text:
                 missing_quotes.append(quote[:50] + "..." if len(quote) > 50 else quote)
 
         if missing_quotes:
@@ -482,20 +429,17 @@ class RedLineValidator:
             check_name="quote_integrity", status=ValidationStatus.PASSED, message="All quotes preserved verbatim"
         )
 
-    def _check_scope(self, original: str, rewritten: str) -> CheckResult:
+    def _check_scope(self, original: TextFeatures, rewritten: TextFeatures) -> CheckResult:
         """
         Check that scope quantifiers are preserved.
 
         Ensures "all" doesn't become "some", etc.
         """
-        original_lower = original.lower()
-        rewritten_lower = rewritten.lower()
-
         scope_changes = []
 
         for word in self.SCOPE_WORDS:
-            original_count = original_lower.count(word)
-            rewritten_count = rewritten_lower.count(word)
+            original_count = original.count(word)
+            rewritten_count = rewritten.count(word)
 
             if original_count > 0 and rewritten_count < original_count:
                 scope_changes.append(f"'{word}' reduced")
@@ -512,20 +456,17 @@ class RedLineValidator:
             check_name="scope_invariance", status=ValidationStatus.PASSED, message="Scope quantifiers preserved"
         )
 
-    def _check_negation(self, original: str, rewritten: str) -> CheckResult:
+    def _check_negation(self, original: TextFeatures, rewritten: TextFeatures) -> CheckResult:
         """
         Check that negations are preserved.
 
         Accidentally removing a "not" can completely reverse meaning.
         """
-        original_lower = original.lower()
-        rewritten_lower = rewritten.lower()
-
         removed_negations = []
 
         for neg in self.NEGATION_WORDS:
-            original_count = len(re.findall(r"\b" + neg + r"\b", original_lower))
-            rewritten_count = len(re.findall(r"\b" + neg + r"\b", rewritten_lower))
+            original_count = original.word_counts[neg]
+            rewritten_count = rewritten.word_counts[neg]
 
             if original_count > rewritten_count:
                 removed_negations.append(neg)
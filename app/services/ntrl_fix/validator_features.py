@@ -0,0 +1,167 @@
+# app/services/ntrl_fix/validator_features.py
+"""
+Text features for the Red-Line Validator, extracted in one pass per text.
+
+The validator's string checks (numbers, attributions, modality, causality,
+risk, quotes, scope, negation) used to scan the original and the rewrite
+separately, each with its own regex or with one `in` / count() per lexicon
+word: some 70 passes over each text per validation. FeatureExtractor
+tokenizes each text once and derives what those checks compare:
+
+- Whole-word counts (what \\bword\\b matches count).
+- Lexicon phrase counts (modal, causal, risk and scope words). These keep
+  the checks' substring semantics ("may" is counted in "mayor"): a
+  single-word phrase can only occur inside a word, so its count is the sum
+  of its occurrences in each distinct word, looked up in a per-word cache.
+  Multi-word phrases ("due to") are counted on the text.
+- Number words from the tokens; numerals (a pattern that only tries
+  positions starting with "$" or a digit), attributions and quotes from
+  precompiled patterns.
+
+Checks compare two TextFeatures and reach the same verdicts as the
+per-check scans did (scripts/bench_validator.py verifies and times this).
+"""
+
+import re
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+NUMBER_PATTERN = re.compile(
+    r"""
+    (?=[$\d])                            # Numerals only; number words come from the tokens
+    (?:
+        \$?\d{1,3}(?:,\d{3})*(?:\.\d+)?%?  |  # Currency/percentage
+        \d+(?:\.\d+)?%?                    |  # Simple numbers
+        \d+(?:st|nd|rd|th)                    # Ordinals
+    )
+    """,
+    re.VERBOSE | re.IGNORECASE,
+)
+
+NUMBER_WORDS = frozenset(
+    {
+        "one",
+        "two",
+        "three",
+        "four",
+        "five",
+        "six",
+        "seven",
+        "eight",
+        "nine",
+        "ten",
+        "eleven",
+        "twelve",
+        "hundred",
+        "thousand",
+        "million",
+        "billion",
+    }
+)
+
+ATTRIBUTION_PATTERN = re.compile(
+    r"""
+    (?:
+        (?:according\s+to|said|stated|announced|confirmed|
+           reported|claimed|argued|explained|noted)\s+
+        (?:by\s+)?
+        [A-Z][a-z]+(?:\s+[A-Z][a-z]+)*
+    ) |
+    (?:
+        [A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+
+        (?:said|stated|announced|confirmed|reported|
+           claimed|argued|explained|noted|told|added)
+    )
+    """,
+    re.VERBOSE,
+)
+
+QUOTE_PATTERN = re.compile(r'"([^"]+)"|"([^"]+)"|\'([^\']+)\'')
+
+# Quotes this short are not checked
+MIN_QUOTE_LENGTH = 10
+
+# Distinct words whose phrase occurrences are cached per extractor
+MAX_CACHED_WORDS = 100_000
+
+_WORD = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class TextFeatures:
+    """What the validator's string checks compare, for one text."""
+
+    text: str
+    phrase_counts: dict[str, int]  # Lexicon phrase -> substring occurrences (present phrases only)
+    word_counts: Counter[str]  # Lowercased whole word -> occurrences
+    numbers: frozenset[str]  # Lowercased, without thousands separators
+    attributions: frozenset[str]  # Lowercased
+    quotes: frozenset[str]  # Quoted passages longer than MIN_QUOTE_LENGTH
+
+    def count(self, phrase: str) -> int:
+        """Substring occurrences of a lexicon phrase."""
+        return self.phrase_counts.get(phrase, 0)
+
+    def contains(self, phrase: str) -> bool:
+        """Whether a lexicon phrase occurs (as a substring) in the lowercased text."""
+        return phrase in self.phrase_counts
+
+
+class FeatureExtractor:
+    """
+    Single-pass feature extraction over a fixed lexicon.
+
+    Usage:
+        extractor = FeatureExtractor(["alleged", "due to", "not"])
+        features = extractor.extract("The alleged fraud was not proven.")
+        features.count("alleged")  # 1
+        features.word_counts["not"]  # 1
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases = sorted({phrase.lower() for phrase in phrases})
+        self._word_phrases = [phrase for phrase in self.phrases if _WORD.fullmatch(phrase)]
+        self._text_phrases = [phrase for phrase in self.phrases if not _WORD.fullmatch(phrase)]
+        # word -> ((phrase, occurrences in word), ...)
+        self._in_word: dict[str, tuple[tuple[str, int], ...]] = {}
+
+    def _phrases_in(self, word: str) -> tuple[tuple[str, int], ...]:
+        found = self._in_word.get(word)
+        if found is None:
+            found = tuple((phrase, word.count(phrase)) for phrase in self._word_phrases if phrase in word)
+            if len(self._in_word) >= MAX_CACHED_WORDS:
+                self._in_word.clear()
+            self._in_word[word] = found
+        return found
+
+    def extract(self, text: str) -> TextFeatures:
+        lower = text.lower()
+        words = Counter(_WORD.findall(lower))
+
+        counts: dict[str, int] = {}
+        for word, occurrences in words.items():
+            for phrase, per_word in self._phrases_in(word):
+                counts[phrase] = counts.get(phrase, 0) + per_word * occurrences
+        for phrase in self._text_phrases:
+            found = lower.count(phrase)
+            if found:
+                counts[phrase] = found
+
+        numbers = {n.lower().replace(",", "") for n in NUMBER_PATTERN.findall(text)}
+        numbers.update(word for word in words if word in NUMBER_WORDS)
+
+        quotes = set()
+        for match in QUOTE_PATTERN.finditer(text):
+            quote = match.group(1) or match.group(2) or match.group(3)
+            if quote and len(quote) > MIN_QUOTE_LENGTH:
+                quotes.add(quote.strip())
+
+        return TextFeatures(
+            text=text,
+            phrase_counts=counts,
+            word_counts=words,
+            numbers=frozenset(numbers),
+            attributions=frozenset(a.lower().strip() for a in ATTRIBUTION_PATTERN.findall(text) if a.strip()),
+            quotes=frozenset(quotes),
+        )
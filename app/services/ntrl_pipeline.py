@@ -33,6 +33,7 @@ from .ntrl_fix import (
     NTRLFixer,
     ValidationResult,
 )
+from .ntrl_result_cache import DEFAULT_DISK_MAX_BYTES, DEFAULT_MAX_BYTES, ResultCache
 from .ntrl_scan import (
     ArticleSegment,
     MergedScanResult,
@@ -65,6 +66,9 @@ class PipelineConfig:
     # Caching
     enable_cache: bool = True
     cache_ttl_seconds: int = 3600  # 1 hour
+    cache_max_bytes: int = DEFAULT_MAX_BYTES  # In-memory bound (pickled size)
+    cache_dir: str | None = None  # Optional local disk tier
+    cache_disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES
 
     # Performance
     timeout_seconds: float = 30.0
@@ -177,8 +181,13 @@ class NTRLPipeline:
         self._scanner: NTRLScanner | None = None
         self._fixer: NTRLFixer | None = None
 
-        # Simple in-memory cache (would use Redis in production)
-        self._cache: dict[str, PipelineResult] = {}
+        # LRU/TTL result cache, bounded by bytes, optionally backed by disk
+        self._cache = ResultCache(
+            ttl_seconds=self.config.cache_ttl_seconds,
+            max_bytes=self.config.cache_max_bytes,
+            disk_dir=self.config.cache_dir,
+            disk_max_bytes=self.config.cache_disk_max_bytes,
+        )
 
     @property
     def scanner(self) -> NTRLScanner:
@@ -202,6 +211,8 @@ class NTRLPipeline:
         title: str = "",
         deck: str | None = None,
         force: bool = False,
+        enable_semantic: bool | None = None,
+        strict_validation: bool | None = None,
     ) -> PipelineResult:
         """
         Process an article through the full NTRL pipeline.
@@ -211,6 +222,8 @@ class NTRLPipeline:
             title: Article title
             deck: Optional deck/subheadline
             force: Force reprocessing even if cached
+            enable_semantic: Per-call override of the scanner's enable_semantic
+            strict_validation: Per-call override of the fixer's strict_validation
 
         Returns:
             PipelineResult with all outputs
@@ -219,11 +232,18 @@ class NTRLPipeline:
 
         # Generate content hash for caching
         content_hash = self._hash_content(body, title)
+        # Results differ per override, so the effective settings are part of the cache key
+        if enable_semantic is None:
+            enable_semantic = self.scanner.config.enable_semantic
+        if strict_validation is None:
+            strict_validation = self.fixer.config.strict_validation
+        cache_key = f"{content_hash}:{int(enable_semantic)}{int(strict_validation)}"
 
         # Check cache
         if self.config.enable_cache and not force:
-            cached = self._get_cached(content_hash)
+            cached = await self._get_cached(cache_key)
             if cached:
+                # A private copy: marking it does not touch the cached entry
                 cached.cache_hit = True
                 return cached
 
@@ -233,7 +253,7 @@ class NTRLPipeline:
 
         # Phase 1: Detection (ntrl-scan)
         scan_start = time.perf_counter()
-        body_scan, title_scan = await self._run_detection(body, title, deck)
+        body_scan, title_scan = await self._run_detection(body, title, deck, enable_semantic)
         scan_time_ms = (time.perf_counter() - scan_start) * 1000
 
         # Phase 2: Rewriting (ntrl-fix) - skip if scan_only mode
@@ -245,7 +265,7 @@ class NTRLPipeline:
             feed_title = title
             feed_summary = ""
         else:
-            fix_result = await self._run_fixing(body, title, body_scan, title_scan)
+            fix_result = await self._run_fixing(body, title, body_scan, title_scan, strict_validation)
             detail_full = fix_result.detail_full
             detail_brief = fix_result.detail_brief
             feed_title = fix_result.feed_title
@@ -279,21 +299,21 @@ class NTRLPipeline:
 
         # Cache result
         if self.config.enable_cache:
-            self._set_cached(content_hash, result)
+            await self._set_cached(cache_key, result)
 
         return result
 
     async def _run_detection(
-        self, body: str, title: str, deck: str | None
+        self, body: str, title: str, deck: str | None, enable_semantic: bool | None = None
     ) -> tuple[MergedScanResult, MergedScanResult | None]:
         """Run detection phase on all content."""
         # Run body and title scans in parallel
         tasks = [
-            self.scanner.scan(body, ArticleSegment.BODY),
+            self.scanner.scan(body, ArticleSegment.BODY, enable_semantic=enable_semantic),
         ]
 
         if title:
-            tasks.append(self.scanner.scan(title, ArticleSegment.TITLE))
+            tasks.append(self.scanner.scan(title, ArticleSegment.TITLE, enable_semantic=enable_semantic))
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -311,7 +331,12 @@ class NTRLPipeline:
         return body_scan, title_scan
 
     async def _run_fixing(
-        self, body: str, title: str, body_scan: MergedScanResult, title_scan: MergedScanResult | None
+        self,
+        body: str,
+        title: str,
+        body_scan: MergedScanResult,
+        title_scan: MergedScanResult | None,
+        strict_validation: bool | None = None,
     ) -> FixResult:
         """Run fixing phase on detected content."""
         return await self.fixer.fix(
@@ -319,6 +344,7 @@ class NTRLPipeline:
             title=title,
             body_scan=body_scan,
             title_scan=title_scan,
+            strict_validation=strict_validation,
         )
 
     def _build_transparency(
@@ -395,20 +421,17 @@ class NTRLPipeline:
         content = f"{title}|||{body}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
-    def _get_cached(self, content_hash: str) -> PipelineResult | None:
-        """Get cached result if available."""
-        return self._cache.get(content_hash)
+    async def _get_cached(self, cache_key: str) -> PipelineResult | None:
+        """Get a private copy of a cached result if available (disk reads run off the event loop)."""
+        return await self._cache.aget(cache_key)
 
-    def _set_cached(self, content_hash: str, result: PipelineResult):
-        """Cache a result."""
-        # Simple LRU-like behavior: limit cache size
-        if len(self._cache) > 1000:
-            # Remove oldest entries
-            keys = list(self._cache.keys())[:500]
-            for key in keys:
-                del self._cache[key]
+    async def _set_cached(self, cache_key: str, result: PipelineResult):
+        """Cache a snapshot of a result (disk writes run off the event loop)."""
+        await self._cache.aset(cache_key, result)
 
-        self._cache[content_hash] = result
+    def cache_stats(self) -> dict[str, int]:
+        """Result cache hit, miss and eviction counters."""
+        return self._cache.stats()
 
     def _empty_result(self, body: str, title: str, content_hash: str) -> PipelineResult:
         """Return empty result for empty input."""
@@ -440,6 +463,7 @@ class NTRLPipeline:
         self,
         body: str,
         title: str = "",
+        enable_semantic: bool | None = None,
     ) -> tuple[MergedScanResult, MergedScanResult | None]:
         """
         Run detection only (no rewriting).
@@ -449,11 +473,12 @@ class NTRLPipeline:
         Args:
             body: Article body
             title: Article title
+            enable_semantic: Per-call override of the scanner's enable_semantic
 
         Returns:
             Tuple of (body_scan, title_scan)
         """
-        return await self._run_detection(body, title, None)
+        return await self._run_detection(body, title, None, enable_semantic)
 
     async def close(self):
         """Clean up resources."""
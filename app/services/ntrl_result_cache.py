@@ -0,0 +1,291 @@
+# app/services/ntrl_result_cache.py
+"""
+Result cache for NTRLPipeline: LRU + TTL, bounded by bytes.
+
+Entries are stored pickled, which gives three properties at once:
+- Size: an entry's cost is the length of its pickle, so the memory bound
+  is in bytes rather than in entries of wildly different sizes.
+- Immutability: get() returns a fresh copy, so callers (e.g. setting
+  cache_hit on a result) can never change what later callers receive.
+- Persistence: the same bytes can be written to an optional local disk
+  tier, which survives restarts and holds more than memory does.
+
+Lookups check memory, then disk; a disk hit is promoted back to memory.
+Entries older than the TTL are dropped on access. Async callers use
+aget()/aset(), which do the disk tier's file I/O in a worker thread. The
+disk directory must be private to the application, since its files are
+unpickled.
+
+The disk tier's size is tracked in memory (scanned once at startup and
+again every DISK_RESCAN_SECONDS, to pick up files written by other
+processes), so a write trims only the entries it pushes over the bound.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import pickle
+import struct
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_DISK_MAX_BYTES = 512 * 1024 * 1024
+
+# How often the disk tier's size index is rebuilt from the directory
+DISK_RESCAN_SECONDS = 300.0
+
+# Disk entry layout: expiry timestamp (float64), then the pickle
+_HEADER = struct.Struct("<d")
+_SUFFIX = ".entry"
+
+
+class ResultCache:
+    """
+    Byte-bounded LRU cache with TTL and an optional disk tier.
+
+    Usage:
+        cache = ResultCache(ttl_seconds=3600, max_bytes=64 * 1024 * 1024, disk_dir="./storage/ntrl_cache")
+        cache.set(key, result)
+        result = cache.get(key)  # a copy, or None
+        cache.stats()
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk_dir: str | None = None,
+        disk_max_bytes: int = DEFAULT_DISK_MAX_BYTES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+
+        # key -> (expires_at, pickle)
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        # Disk file name -> size, least recently used first
+        self._disk_files: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_scanned_at = 0.0
+        self._disk_lock = threading.Lock()
+        if self.disk_dir:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._scan_disk()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.disk_evictions = 0
+
+    def get(self, key: str) -> Any | None:
+        """A copy of the live entry for key, or None."""
+        now = time.time()
+        blob = self._get_memory(key, now)
+        if blob is not None:
+            return pickle.loads(blob)
+        return self._get_disk(key, now)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a snapshot of value (later changes to value are not seen)."""
+        expires_at, blob = self._set_memory(key, value)
+        self._write_disk(key, expires_at, blob)
+
+    async def aget(self, key: str) -> Any | None:
+        """get() for async callers: a disk lookup runs in a worker thread."""
+        now = time.time()
+        blob = self._get_memory(key, now)
+        if blob is not None:
+            return pickle.loads(blob)
+        if self.disk_dir is None:
+            return self._get_disk(key, now)
+        return await asyncio.to_thread(self._get_disk, key, now)
+
+    async def aset(self, key: str, value: Any) -> None:
+        """set() for async callers: the disk write runs in a worker thread."""
+        expires_at, blob = self._set_memory(key, value)
+        if self.disk_dir is not None:
+            await asyncio.to_thread(self._write_disk, key, expires_at, blob)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the disk tier is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def stats(self) -> dict[str, int]:
+        """Hit, miss and eviction counters plus current memory usage."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "disk_evictions": self.disk_evictions,
+            "disk_bytes": self._disk_bytes,
+        }
+
+    # -------------------------------------------------------------------------
+    # Memory tier
+    # -------------------------------------------------------------------------
+
+    def _get_memory(self, key: str, now: float) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self._remove(key)
+            self.expirations += 1
+            return None
+
+    def _set_memory(self, key: str, value: Any) -> tuple[float, bytes]:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._insert(key, expires_at, blob)
+        return expires_at, blob
+
+    # Callers of _insert and _remove hold the lock
+
+    def _insert(self, key: str, expires_at: float, blob: bytes) -> None:
+        if key in self._entries:
+            self._remove(key)
+        if len(blob) > self.max_bytes:
+            # Would evict everything else and still not fit
+            return
+        self._entries[key] = (expires_at, blob)
+        self._bytes += len(blob)
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        _, blob = self._entries.pop(key)
+        self._bytes -= len(blob)
+
+    # -------------------------------------------------------------------------
+    # Disk tier
+    # -------------------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self.disk_dir / (hashlib.sha256(key.encode()).hexdigest()[:32] + _SUFFIX)
+
+    def _get_disk(self, key: str, now: float) -> Any | None:
+        entry = self._read_disk(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._insert(key, *entry)
+        return pickle.loads(entry[1])
+
+    def _read_disk(self, key: str, now: float) -> tuple[float, bytes] | None:
+        """The live disk entry for key; a missing, short or unreadable file is a miss."""
+        if self.disk_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            (expires_at,) = _HEADER.unpack_from(data)
+            if expires_at <= now:
+                self._delete_disk(path)
+                with self._lock:
+                    self.expirations += 1
+                return None
+            # Refresh recency for disk eviction (and for the next startup scan)
+            os.utime(path)
+        except FileNotFoundError:
+            # Never written, or trimmed since (possibly by another process)
+            self._forget_disk(path.name)
+            return None
+        except struct.error:
+            logger.warning(f"Result cache entry {path.name} is truncated; dropping it")
+            self._delete_disk(path)
+            return None
+        except OSError as e:
+            logger.warning(f"Result cache read failed for {path.name}: {e}")
+            return None
+        with self._disk_lock:
+            if path.name in self._disk_files:
+                self._disk_files.move_to_end(path.name)
+        return expires_at, data[_HEADER.size :]
+
+    def _write_disk(self, key: str, expires_at: float, blob: bytes) -> None:
+        if self.disk_dir is None:
+            return
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        data = _HEADER.pack(expires_at) + blob
+        try:
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Result cache write failed for {path.name}: {e}")
+            tmp.unlink(missing_ok=True)
+            return
+
+        if time.monotonic() - self._disk_scanned_at >= DISK_RESCAN_SECONDS:
+            self._scan_disk()
+        with self._disk_lock:
+            self._disk_bytes += len(data) - self._disk_files.pop(path.name, 0)
+            self._disk_files[path.name] = len(data)
+            evicted = []
+            while self._disk_bytes > self.disk_max_bytes and self._disk_files:
+                name, size = self._disk_files.popitem(last=False)
+                self._disk_bytes -= size
+                evicted.append(name)
+        for name in evicted:
+            (self.disk_dir / name).unlink(missing_ok=True)
+        if evicted:
+            with self._lock:
+                self.disk_evictions += len(evicted)
+
+    def _delete_disk(self, path: Path) -> None:
+        path.unlink(missing_ok=True)
+        self._forget_disk(path.name)
+
+    def _forget_disk(self, name: str) -> None:
+        with self._disk_lock:
+            self._disk_bytes -= self._disk_files.pop(name, 0)
+
+    def _scan_disk(self) -> None:
+        """Rebuild the disk size index from the directory, least recently used first."""
+        files = []
+        for path in self.disk_dir.glob("*" + _SUFFIX):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, path.name, stat.st_size))
+        files.sort()
+        with self._disk_lock:
+            self._disk_files = OrderedDict((name, size) for _, name, size in files)
+            self._disk_bytes = sum(self._disk_files.values())
+            self._disk_scanned_at = time.monotonic()
@@ -0,0 +1,146 @@
+# app/services/ntrl_runtime.py
+"""
+NTRL Runtime: app-lifespan pipeline and batcher instances for the API.
+
+The v2 endpoints used to build an NTRLPipeline or NTRLBatcher per request
+and close it at the end, so nothing outlived a request: the result cache,
+and the semantic detector's and generators' HTTP clients all started from
+scratch every time.
+
+NTRLRuntime keeps one pipeline per provider profile (real LLM providers,
+or mock providers for testing) for the life of the process. Per-request
+settings (semantic detection on/off, strict validation) are per-call
+parameters of the shared pipeline. Batchers wrap the shared pipelines and,
+like every batcher in the process, draw from the "ntrl_batcher" bucket of
+the process-wide rate limiter registry.
+
+With NTRL_CPU_EXECUTOR="process" the pipelines' scanners run the lexical
+and structural detectors in a DetectorPool; warm() starts its worker
+processes at application startup rather than on the first request.
+
+Usage:
+    runtime = get_ntrl_runtime()
+    await runtime.warm()  # application startup
+    result = await runtime.pipeline().process(body=..., title=..., enable_semantic=False)
+    batch = await runtime.batcher(mock=True).process_batch(articles)
+
+    await close_ntrl_runtime()  # application shutdown
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from .ntrl_batcher import BatchConfig, NTRLBatcher
+from .ntrl_fix import FixerConfig, GeneratorConfig
+from .ntrl_pipeline import NTRLPipeline, PipelineConfig, ProcessingMode
+from .ntrl_scan import ScannerConfig
+from .resilience import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+
+def _runtime_settings() -> Any | None:
+    try:
+        from app.config import get_settings
+
+        return get_settings()
+    except Exception as e:
+        # Settings can be incomplete in scripts and unit tests; fall back to defaults
+        logger.debug(f"NTRL runtime settings unavailable, using defaults: {e}")
+        return None
+
+
+class NTRLRuntime:
+    """
+    Shared NTRLPipeline and NTRLBatcher instances, created on first use.
+
+    Usage:
+        runtime = NTRLRuntime()
+        pipeline = runtime.pipeline(mock=True)
+        await runtime.close()
+    """
+
+    def __init__(
+        self,
+        batch_config: BatchConfig | None = None,
+        cpu_executor: str | None = None,
+        cpu_workers: int | None = None,
+    ):
+        settings = _runtime_settings()
+        self.batch_config = batch_config or BatchConfig()
+        # Lexical/structural detector executor and pool size (NTRL_CPU_EXECUTOR / NTRL_CPU_WORKERS)
+        self.cpu_executor = cpu_executor or (settings.NTRL_CPU_EXECUTOR if settings else "thread")
+        self.cpu_workers = cpu_workers or (settings.NTRL_CPU_WORKERS if settings else None)
+        self.rate_limiter = get_rate_limiter(
+            "ntrl_batcher",
+            self.batch_config.rate_limit_per_second,
+            self.batch_config.rate_limit_burst,
+        )
+        self._pipelines: dict[bool, NTRLPipeline] = {}
+        self._batchers: dict[bool, NTRLBatcher] = {}
+
+    def pipeline_config(self, mock: bool = False) -> PipelineConfig:
+        """Configuration of the shared pipeline for a provider profile."""
+        provider = "mock" if mock else "auto"
+        return PipelineConfig(
+            mode=ProcessingMode.REALTIME,
+            scanner_config=ScannerConfig(
+                semantic_provider=provider,
+                cpu_executor=self.cpu_executor,
+                cpu_workers=self.cpu_workers,
+            ),
+            fixer_config=FixerConfig(generator_config=GeneratorConfig(provider=provider)),
+            generate_transparency=True,
+        )
+
+    def pipeline(self, mock: bool = False) -> NTRLPipeline:
+        """Shared pipeline using mock or real (auto-selected) LLM providers."""
+        if mock not in self._pipelines:
+            self._pipelines[mock] = NTRLPipeline(config=self.pipeline_config(mock))
+        return self._pipelines[mock]
+
+    def batcher(self, mock: bool = False) -> NTRLBatcher:
+        """Shared batcher over pipeline(mock), rate limited together with every other batcher."""
+        if mock not in self._batchers:
+            self._batchers[mock] = NTRLBatcher(
+                batch_config=self.batch_config,
+                pipeline=self.pipeline(mock),
+                rate_limiter=self.rate_limiter,
+            )
+        return self._batchers[mock]
+
+    async def warm(self) -> None:
+        """Start the CPU detector worker processes (process executor only), off the event loop."""
+        pool = self.pipeline().scanner.cpu_pool
+        if pool is not None:
+            await asyncio.to_thread(pool.warm)
+
+    async def close(self) -> None:
+        """Close every shared pipeline (HTTP clients, caches)."""
+        pipelines = list(self._pipelines.values())
+        self._pipelines.clear()
+        self._batchers.clear()
+        results = await asyncio.gather(*(pipeline.close() for pipeline in pipelines), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Error closing NTRL pipeline: {result}")
+
+
+_runtime: NTRLRuntime | None = None
+
+
+def get_ntrl_runtime() -> NTRLRuntime:
+    """Get the process-wide runtime (usable as a FastAPI dependency)."""
+    global _runtime
+    if _runtime is None:
+        _runtime = NTRLRuntime()
+    return _runtime
+
+
+async def close_ntrl_runtime() -> None:
+    """Close and drop the process-wide runtime; the next get_ntrl_runtime() starts a new one."""
+    global _runtime
+    runtime, _runtime = _runtime, None
+    if runtime is not None:
+        await runtime.close()
@@ -29,6 +29,7 @@ Usage:
     )
 """
 
+from .cpu_pool import DetectorPool, get_detector_pool, shutdown_detector_pools
 from .lexical_detector import LexicalDetector, get_lexical_detector
 from .scanner import NTRLScanner, ScannerConfig, scan_text
 from .semantic_detector import (
@@ -70,4 +71,8 @@ __all__ = [
     "NTRLScanner",
     "ScannerConfig",
     "scan_text",
+    # CPU detector process pool
+    "DetectorPool",
+    "get_detector_pool",
+    "shutdown_detector_pools",
 ]
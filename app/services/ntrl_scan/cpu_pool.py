@@ -0,0 +1,187 @@
+# app/services/ntrl_scan/cpu_pool.py
+"""
+Process pool for the CPU-bound detectors (lexical, structural).
+
+By default NTRLScanner runs the lexical and structural detectors in the
+event loop's default thread pool. Both are pure-Python/Cython CPU work
+that holds the GIL, so on an API worker they serialize with each other
+and with request handling. With ScannerConfig(cpu_executor="process")
+they run in a DetectorPool instead:
+
+- Workers are warm: each one builds the lexical automaton and loads the
+  spaCy model once, in its initializer, not on its first article.
+- Results cross the process boundary as compact span tuples
+  (CompactSpan), not pickled DetectionInstance/ScanResult dataclasses;
+  the scanner process rebuilds the dataclasses.
+- The pool is sized to the machine's cores unless configured, and shared
+  by every scanner with the same settings in the process.
+
+Workers are started with "spawn", since forking a process that already
+runs an event loop and spaCy threads is unsafe.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from .lexical_detector import get_lexical_detector
+from .structural_detector import get_structural_detector
+from .types import (
+    ArticleSegment,
+    DetectionInstance,
+    DetectorSource,
+    ScanResult,
+    SpanAction,
+)
+
+logger = logging.getLogger(__name__)
+
+# (type_id, start, end, text, confidence, severity, action, pattern, rationale, exemptions)
+CompactSpan = tuple[str, int, int, str, float, int, str, str | None, str, tuple[str, ...]]
+
+CPU_DETECTORS = {
+    "lexical": (get_lexical_detector, DetectorSource.LEXICAL),
+    "structural": (get_structural_detector, DetectorSource.STRUCTURAL),
+}
+
+
+def pack_spans(spans: list[DetectionInstance]) -> list[CompactSpan]:
+    """Compact tuples for detector spans (segment and source are per result)."""
+    return [
+        (
+            span.type_id_primary,
+            span.span_start,
+            span.span_end,
+            span.text,
+            span.confidence,
+            span.severity,
+            span.recommended_action.value,
+            span.pattern_matched,
+            span.rationale,
+            tuple(span.exemptions_applied),
+        )
+        for span in spans
+    ]
+
+
+def unpack_spans(packed: list[CompactSpan], segment: ArticleSegment, source: DetectorSource) -> list[DetectionInstance]:
+    """Rebuild DetectionInstances from pack_spans output."""
+    return [
+        DetectionInstance(
+            type_id_primary=type_id,
+            segment=segment,
+            span_start=start,
+            span_end=end,
+            text=text,
+            confidence=confidence,
+            severity=severity,
+            detector_source=source,
+            recommended_action=SpanAction(action),
+            pattern_matched=pattern,
+            rationale=rationale,
+            exemptions_applied=list(exemptions),
+        )
+        for type_id, start, end, text, confidence, severity, action, pattern, rationale, exemptions in packed
+    ]
+
+
+# -----------------------------------------------------------------------------
+# Worker side
+# -----------------------------------------------------------------------------
+
+
+def _warm_worker(detectors: tuple[str, ...]) -> None:
+    """Pool initializer: build each detector (automaton, spaCy model) once per worker."""
+    for name in detectors:
+        CPU_DETECTORS[name][0]()
+
+
+def _detect_in_worker(detector: str, text: str, segment: str) -> tuple[list[CompactSpan], float]:
+    """Run one detector in a worker; returns (compact spans, scan duration ms)."""
+    result = CPU_DETECTORS[detector][0]().detect(text, ArticleSegment(segment))
+    return pack_spans(result.spans), result.scan_duration_ms
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+# -----------------------------------------------------------------------------
+# Pool
+# -----------------------------------------------------------------------------
+
+
+class DetectorPool:
+    """
+    Warm worker processes running CPU-bound detectors.
+
+    Usage:
+        pool = get_detector_pool(detectors=("lexical", "structural"))
+        result = await pool.detect("lexical", text, ArticleSegment.BODY)
+    """
+
+    def __init__(self, detectors: tuple[str, ...], workers: int | None = None):
+        unknown = set(detectors) - set(CPU_DETECTORS)
+        if unknown:
+            raise ValueError(f"Unknown CPU detectors: {sorted(unknown)}")
+        self.detectors = detectors
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_worker,
+            initargs=(detectors,),
+        )
+
+    async def detect(self, detector: str, text: str, segment: ArticleSegment) -> ScanResult:
+        """Run detector on text in a worker process."""
+        if detector not in self.detectors:
+            raise ValueError(f"Detector {detector!r} is not served by this pool ({self.detectors})")
+        loop = asyncio.get_running_loop()
+        packed, duration_ms = await loop.run_in_executor(
+            self._executor, _detect_in_worker, detector, text, segment.value
+        )
+        source = CPU_DETECTORS[detector][1]
+        return ScanResult(
+            spans=unpack_spans(packed, segment, source),
+            segment=segment,
+            text_length=len(text) if text and text.strip() else 0,
+            scan_duration_ms=duration_ms,
+            detector_source=source,
+        )
+
+    def warm(self) -> None:
+        """Start the workers and wait until they have run their initializer."""
+        for future in [self._executor.submit(_ready) for _ in range(self.workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_pools: dict[tuple[tuple[str, ...], int | None], DetectorPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_detector_pool(detectors: tuple[str, ...], workers: int | None = None) -> DetectorPool:
+    """Get the process-wide pool serving detectors with workers processes (cores if None)."""
+    key = (tuple(sorted(detectors)), workers)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = DetectorPool(key[0], workers)
+            _pools[key] = pool
+            logger.info(f"Started CPU detector pool ({', '.join(key[0])}) with {pool.workers} workers")
+        return pool
+
+
+def shutdown_detector_pools() -> None:
+    """Stop every detector pool (e.g. at application shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
@@ -8,13 +8,16 @@ manipulation patterns.
 
 Key features:
 - Quote-aware: Skips content inside quotation marks
-- Pattern caching: Compiles patterns once at startup
+- Pattern caching: Compiles patterns once at startup into a single
+  PatternEngine, which matches all of them in one pass over the text
 - Taxonomy-bound: All patterns map to canonical type IDs
 """
 
 import logging
+import math
 import re
 import time
+from bisect import bisect_right
 from functools import lru_cache
 
 from app.taxonomy import (
@@ -22,6 +25,7 @@ from app.taxonomy import (
     get_types_with_patterns,
 )
 
+from .pattern_engine import PatternEngine
 from .types import (
     ArticleSegment,
     DetectionInstance,
@@ -51,6 +55,12 @@ class LexicalDetector:
         self._type_metadata: dict[str, ManipulationType] = {}
         self._compile_patterns()
 
+        # (type_id, pattern) in taxonomy order, matched together by one engine
+        self._pattern_list = [
+            (type_id, original) for type_id, patterns in self._compiled_patterns.items() for _, original in patterns
+        ]
+        self._engine = PatternEngine([original for _, original in self._pattern_list])
+
     def _compile_patterns(self) -> None:
         """Compile all lexical patterns from taxonomy at startup."""
         types_with_patterns = get_types_with_patterns()
@@ -84,11 +94,9 @@ class LexicalDetector:
         return ranges
 
     def _is_inside_quote(self, pos: int, quote_ranges: list[tuple[int, int]]) -> bool:
-        """Check if a position is inside a quoted region."""
-        for start, end in quote_ranges:
-            if start <= pos < end:
-                return True
-        return False
+        """Check if a position is inside a quoted region (ranges are sorted and disjoint)."""
+        i = bisect_right(quote_ranges, (pos, math.inf)) - 1
+        return i >= 0 and pos < quote_ranges[i][1]
 
     def detect(
         self,
@@ -125,49 +133,46 @@ class LexicalDetector:
         seen_spans: set[tuple[int, int, str]] = set()  # Dedup overlapping matches
 
         # Run all patterns
-        for type_id, patterns in self._compiled_patterns.items():
+        for (type_id, original_pattern), matches in zip(self._pattern_list, self._engine.find_all(text)):
             manip_type = self._type_metadata[type_id]
 
-            for compiled_pattern, original_pattern in patterns:
-                for match in compiled_pattern.finditer(text):
-                    span_start = match.start()
-                    span_end = match.end()
-                    matched_text = match.group()
-
-                    # Skip if already detected this exact span for this type
-                    span_key = (span_start, span_end, type_id)
-                    if span_key in seen_spans:
-                        continue
-                    seen_spans.add(span_key)
-
-                    # Check if inside quote
-                    inside_quote = self._is_inside_quote(span_start, quote_ranges)
-                    exemptions = ["inside_quote"] if inside_quote else []
-
-                    # Determine action based on type and quote status
-                    if inside_quote:
-                        # Preserve quotes, but still record for transparency
-                        action = SpanAction.ANNOTATE
-                        confidence = manip_type.default_severity * 0.15  # Lower confidence
-                    else:
-                        action = manip_type.default_action
-                        confidence = 0.95  # High confidence for pattern matches
-
-                    detection = DetectionInstance(
-                        type_id_primary=type_id,
-                        segment=segment,
-                        span_start=span_start,
-                        span_end=span_end,
-                        text=matched_text,
-                        confidence=confidence,
-                        severity=manip_type.default_severity,
-                        detector_source=DetectorSource.LEXICAL,
-                        recommended_action=action,
-                        pattern_matched=original_pattern,
-                        exemptions_applied=exemptions,
-                        rationale=f"Matched pattern: {manip_type.label}",
-                    )
-                    detections.append(detection)
+            for span_start, span_end in matches:
+                matched_text = text[span_start:span_end]
+
+                # Skip if already detected this exact span for this type
+                span_key = (span_start, span_end, type_id)
+                if span_key in seen_spans:
+                    continue
+                seen_spans.add(span_key)
+
+                # Check if inside quote
+                inside_quote = self._is_inside_quote(span_start, quote_ranges)
+                exemptions = ["inside_quote"] if inside_quote else []
+
+                # Determine action based on type and quote status
+                if inside_quote:
+                    # Preserve quotes, but still record for transparency
+                    action = SpanAction.ANNOTATE
+                    confidence = manip_type.default_severity * 0.15  # Lower confidence
+                else:
+                    action = manip_type.default_action
+                    confidence = 0.95  # High confidence for pattern matches
+
+                detection = DetectionInstance(
+                    type_id_primary=type_id,
+                    segment=segment,
+                    span_start=span_start,
+                    span_end=span_end,
+                    text=matched_text,
+                    confidence=confidence,
+                    severity=manip_type.default_severity,
+                    detector_source=DetectorSource.LEXICAL,
+                    recommended_action=action,
+                    pattern_matched=original_pattern,
+                    exemptions_applied=exemptions,
+                    rationale=f"Matched pattern: {manip_type.label}",
+                )
+                detections.append(detection)
 
         # Sort by position in text
         detections.sort(key=lambda d: (d.span_start, d.span_end))
@@ -0,0 +1,340 @@
+# app/services/ntrl_scan/pattern_engine.py
+"""
+Pattern engine: every lexical pattern in one pass over the text.
+
+Running each taxonomy pattern's finditer separately scans an article once
+per pattern (300+ times). PatternEngine compiles the whole pattern list
+into one Aho-Corasick automaton, run once over the lowercased text:
+
+- Patterns that are finite sets of strings ("sparks? (fury|outrage|anger)",
+  "\\bslams?\\b") are expanded into those strings; an automaton hit that
+  passes the pattern's \\b checks is a match.
+- Other patterns contribute their literal prefix ("put" for
+  "put.{0,20}at risk"). The pattern is only tried, with pattern.match, at
+  positions where its prefix occurs.
+- The few patterns without a literal prefix keep their own finditer.
+
+Results are exactly what pattern.finditer(text) returns for each pattern:
+the same spans, in the same order, including finditer's leftmost,
+non-overlapping, first-alternative-wins semantics.
+"""
+
+import re
+from collections.abc import Iterable
+from re import _parser as sre_parse  # Pattern AST; the public sre_parse alias is deprecated
+
+# Patterns with more literal expansions than this are not expanded
+MAX_LITERAL_EXPANSIONS = 64
+
+_AT = sre_parse.AT
+_AT_BOUNDARY = sre_parse.AT_BOUNDARY
+
+
+def _ignorecase_unsafe_chars() -> re.Pattern:
+    """
+    Non-ASCII characters that IGNORECASE matches against ASCII letters.
+
+    str.lower() does not map these onto the ASCII letter sre compares them
+    with (e.g. KELVIN SIGN ~ "k", LATIN SMALL LETTER LONG S ~ "s"), so the
+    automaton cannot be used on text containing them.
+    """
+    bmp = "".join(chr(i) for i in range(0x80, 0x10000) if not 0xD800 <= i < 0xE000)
+    unsafe = set(re.findall(r"[a-z]", bmp, re.IGNORECASE))
+    unsafe.update(c for c in bmp if len(c.lower()) != 1)
+    return re.compile("[" + "".join(sorted(unsafe)) + "]")
+
+
+def _is_word(text: str, i: int) -> bool:
+    """Whether text[i] is a regex word character (False outside the text)."""
+    if i < 0 or i >= len(text):
+        return False
+    char = text[i]
+    return char.isalnum() or char == "_"
+
+
+def _at_boundary(text: str, i: int) -> bool:
+    """Regex \\b at position i."""
+    return _is_word(text, i - 1) != _is_word(text, i)
+
+
+# -----------------------------------------------------------------------------
+# Literal expansion
+# -----------------------------------------------------------------------------
+
+
+def _expand(items: Iterable) -> list[str] | None:
+    """Strings matched by a parsed sequence, in regex priority order, or None if not a finite literal set."""
+    expansions = [""]
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            if av > 0x7F:
+                return None
+            options = [chr(av)]
+        elif op is sre_parse.SUBPATTERN:
+            _group, add_flags, del_flags, sub = av
+            if add_flags or del_flags:
+                return None
+            options = _expand(sub)
+        elif op is sre_parse.BRANCH:
+            options = []
+            for alternative in av[1]:
+                expanded = _expand(alternative)
+                if expanded is None:
+                    return None
+                options.extend(expanded)
+        elif op is sre_parse.MAX_REPEAT and av[0] == 0 and av[1] == 1:
+            # Greedy "?": the longer form is tried first
+            options = _expand(av[2])
+            if options is not None:
+                options = options + [""]
+        elif op is sre_parse.IN and all(item_op is sre_parse.LITERAL and item_av <= 0x7F for item_op, item_av in av):
+            # Only one member of a class can match at a position, so order is irrelevant
+            options = [chr(item_av) for _, item_av in av]
+        else:
+            return None
+        if options is None:
+            return None
+        expansions = [prefix + option for prefix in expansions for option in options]
+        if len(expansions) > MAX_LITERAL_EXPANSIONS:
+            return None
+    return expansions
+
+
+def expand_literal_pattern(pattern: str) -> tuple[list[str], bool, bool] | None:
+    """
+    Expand a case-insensitive pattern into the literal strings it matches.
+
+    Supports literals, groups, alternation, "?" and literal character
+    classes, with an optional \\b at the start and end.
+
+    Returns:
+        (lowercased expansions in priority order, leading \\b, trailing \\b),
+        or None if the pattern is not a finite set of ASCII strings
+    """
+    try:
+        items = list(sre_parse.parse(pattern, re.IGNORECASE))
+    except re.error:
+        return None
+    lead = bool(items) and items[0] == (_AT, _AT_BOUNDARY)
+    if lead:
+        items = items[1:]
+    trail = bool(items) and items[-1] == (_AT, _AT_BOUNDARY)
+    if trail:
+        items = items[:-1]
+    expansions = _expand(items)
+    if not expansions or "" in expansions:
+        return None
+    return [expansion.lower() for expansion in expansions], lead, trail
+
+
+def literal_prefixes(pattern: str) -> list[str] | None:
+    """
+    Lowercased strings one of which every match of a case-insensitive pattern starts with.
+
+    Expands the pattern's leading literal items (a leading \\b is skipped,
+    and a repeat of at least one literal contributes one copy). Returns None
+    if the pattern has no non-empty literal prefix.
+    """
+    try:
+        items = list(sre_parse.parse(pattern, re.IGNORECASE))
+    except re.error:
+        return None
+    if items and items[0] == (_AT, _AT_BOUNDARY):
+        items = items[1:]
+    prefixes = [""]
+    for op, av in items:
+        options = _expand([(op, av)])
+        last = False
+        if options is None and op is sre_parse.MAX_REPEAT and av[0] >= 1:
+            options = _expand(av[2])
+            last = True
+        if options is None:
+            break
+        prefixes = [prefix + option for prefix in prefixes for option in options]
+        if len(prefixes) > MAX_LITERAL_EXPANSIONS:
+            return None
+        if last:
+            break
+    if "" in prefixes:
+        return None
+    return sorted({prefix.lower() for prefix in prefixes})
+
+
+# -----------------------------------------------------------------------------
+# Aho-Corasick automaton
+# -----------------------------------------------------------------------------
+
+
+class AhoCorasick:
+    """
+    Multi-string matcher: every occurrence of every word in one pass.
+
+    Usage:
+        automaton = AhoCorasick(["slam", "slams"])
+        automaton.find_all("senator slams")  # [(8, 0), (8, 1)]
+    """
+
+    def __init__(self, words: list[str]):
+        self.words = words
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        for word_id, word in enumerate(words):
+            state = 0
+            for char in word:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (word_id,)
+
+        # Breadth-first failure links (depth-1 states fail to the root);
+        # outputs inherit the failure state's
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> list[tuple[int, int]]:
+        """(start, word_id) for every occurrence, ordered by end position."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        words = self.words
+        hits = []
+        state = 0
+        for end, char in enumerate(text, 1):
+            nxt = goto[state].get(char)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(char)
+            state = nxt or 0
+            if out[state]:
+                for word_id in out[state]:
+                    hits.append((end - len(words[word_id]), word_id))
+        return hits
+
+
+# -----------------------------------------------------------------------------
+# Pattern engine
+# -----------------------------------------------------------------------------
+
+_unsafe_chars: re.Pattern | None = None
+
+
+class PatternEngine:
+    """
+    A fixed list of case-insensitive patterns, matched together.
+
+    Usage:
+        engine = PatternEngine([r"\\bslams?\\b", r"put.{0,20}at risk"])
+        spans = engine.find_all(text)  # spans[i] == [m.span() for m in finditer(patterns[i])]
+    """
+
+    def __init__(self, patterns: list[str]):
+        global _unsafe_chars
+        if _unsafe_chars is None:
+            _unsafe_chars = _ignorecase_unsafe_chars()
+
+        self.patterns = patterns
+        self._compiled = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        # Literal patterns: index -> (leading \b, trailing \b)
+        self._literal: dict[int, tuple[bool, bool]] = {}
+        # Patterns tried with match() where their prefix occurs
+        self._anchored: list[int] = []
+        # Patterns that keep their own finditer
+        self._standalone: list[int] = []
+
+        # word -> [(pattern index, priority)]; priority orders a literal pattern's alternatives
+        word_ids: dict[str, int] = {}
+        self._word_owners: list[list[tuple[int, int]]] = []
+
+        def add_words(index: int, words: list[str]) -> None:
+            for priority, word in enumerate(words):
+                if word not in word_ids:
+                    word_ids[word] = len(word_ids)
+                    self._word_owners.append([])
+                self._word_owners[word_ids[word]].append((index, priority))
+
+        for index, pattern in enumerate(patterns):
+            expanded = expand_literal_pattern(pattern)
+            if expanded is not None:
+                words, lead, trail = expanded
+                self._literal[index] = (lead, trail)
+                add_words(index, words)
+                continue
+            prefixes = literal_prefixes(pattern)
+            if prefixes is not None:
+                self._anchored.append(index)
+                add_words(index, prefixes)
+            else:
+                self._standalone.append(index)
+
+        self._automaton = AhoCorasick(list(word_ids))
+
+    @property
+    def literal_count(self) -> int:
+        """Number of patterns matched by the automaton alone."""
+        return len(self._literal)
+
+    def find_all(self, text: str) -> list[list[tuple[int, int]]]:
+        """(start, end) of each pattern's matches, as pattern.finditer(text) would yield them."""
+        spans: list[list[tuple[int, int]]] = [[] for _ in self.patterns]
+
+        if _unsafe_chars.search(text):
+            # Lowercasing would not line up with IGNORECASE; scan pattern by pattern
+            for index, compiled in enumerate(self._compiled):
+                spans[index] = [match.span() for match in compiled.finditer(text)]
+            return spans
+
+        for index in self._standalone:
+            spans[index] = [match.span() for match in self._compiled[index].finditer(text)]
+
+        # Best (lowest priority) word per (literal pattern, start); candidate starts per anchored pattern
+        best: dict[tuple[int, int], tuple[int, int]] = {}
+        candidates: dict[int, set[int]] = {}
+        owners = self._word_owners
+        words = self._automaton.words
+        for start, word_id in self._automaton.find_all(text.lower()):
+            end = start + len(words[word_id])
+            for index, priority in owners[word_id]:
+                boundaries = self._literal.get(index)
+                if boundaries is None:
+                    candidates.setdefault(index, set()).add(start)
+                    continue
+                lead, trail = boundaries
+                if (lead and not _at_boundary(text, start)) or (trail and not _at_boundary(text, end)):
+                    continue
+                current = best.get((index, start))
+                if current is None or priority < current[0]:
+                    best[(index, start)] = (priority, end)
+
+        # finditer semantics: leftmost match first, the next search resumes at its end
+        resume: dict[int, int] = {}
+        for (index, start), (_, end) in sorted(best.items(), key=lambda item: item[0][1]):
+            if start >= resume.get(index, 0):
+                spans[index].append((start, end))
+                resume[index] = end
+
+        for index, starts in candidates.items():
+            compiled = self._compiled[index]
+            next_start = 0
+            for start in sorted(starts):
+                if start < next_start:
+                    continue
+                match = compiled.match(text, start)
+                if match is not None:
+                    spans[index].append(match.span())
+                    next_start = match.end()
+
+        return spans
@@ -9,13 +9,19 @@ This is the main entry point for the ntrl-scan phase. It:
 4. Returns a unified ScanResult
 
 Target latency: ~400ms total (dominated by semantic detector)
+
+The CPU-bound lexical and structural detectors run in the event loop's
+default thread pool, or in a pool of warm worker processes with
+ScannerConfig(cpu_executor="process") (see cpu_pool).
 """
 
 import asyncio
+import heapq
 import logging
 import time
 from dataclasses import dataclass
 
+from .cpu_pool import DetectorPool, get_detector_pool
 from .lexical_detector import LexicalDetector, get_lexical_detector
 from .semantic_detector import SemanticDetector, create_semantic_detector
 from .structural_detector import StructuralDetector, get_structural_detector
@@ -45,6 +51,8 @@ class ScannerConfig:
 
     # Performance settings
     timeout_seconds: float = 10.0  # Max time for all detectors
+    cpu_executor: str = "thread"  # Lexical/structural in "thread" (default executor) or "process" (DetectorPool)
+    cpu_workers: int | None = None  # Process pool size; None = one per core
 
     # Deduplication settings
     overlap_threshold: float = 0.5  # Min overlap ratio to consider duplicate
@@ -67,11 +75,28 @@ class NTRLScanner:
             config: Scanner configuration. If None, uses defaults.
         """
         self.config = config or ScannerConfig()
+        if self.config.cpu_executor not in ("thread", "process"):
+            raise ValueError(f"cpu_executor must be 'thread' or 'process', not {self.config.cpu_executor!r}")
 
         # Initialize detectors lazily
         self._lexical: LexicalDetector | None = None
         self._structural: StructuralDetector | None = None
         self._semantic: SemanticDetector | None = None
+        self._cpu_pool: DetectorPool | None = None
+
+    @property
+    def cpu_pool(self) -> DetectorPool | None:
+        """Shared process pool for the CPU detectors, or None in thread mode."""
+        if self.config.cpu_executor != "process":
+            return None
+        if self._cpu_pool is None:
+            detectors = []
+            if self.config.enable_lexical:
+                detectors.append("lexical")
+            if self.config.enable_structural:
+                detectors.append("structural")
+            self._cpu_pool = get_detector_pool(tuple(detectors), self.config.cpu_workers)
+        return self._cpu_pool
 
     @property
     def lexical(self) -> LexicalDetector:
@@ -101,6 +126,7 @@ class NTRLScanner:
         self,
         text: str,
         segment: ArticleSegment = ArticleSegment.BODY,
+        enable_semantic: bool | None = None,
     ) -> MergedScanResult:
         """
         Scan text for manipulation using all enabled detectors.
@@ -110,6 +136,7 @@ class NTRLScanner:
         Args:
             text: The text to scan
             segment: Which article segment this is
+            enable_semantic: Per-call override of config.enable_semantic
 
         Returns:
             MergedScanResult with deduplicated detections
@@ -136,7 +163,7 @@ class NTRLScanner:
             tasks.append(self._run_structural(text, segment))
             task_names.append("structural")
 
-        if self.config.enable_semantic:
+        if self.config.enable_semantic if enable_semantic is None else enable_semantic:
             tasks.append(self._run_semantic(text, segment))
             task_names.append("semantic")
 
@@ -185,12 +212,16 @@ class NTRLScanner:
 
     async def _run_lexical(self, text: str, segment: ArticleSegment) -> ScanResult:
         """Run lexical detector (sync, but wrapped for parallel execution)."""
+        if self.cpu_pool is not None:
+            return await self.cpu_pool.detect("lexical", text, segment)
         # Lexical is sync, run in thread pool to not block
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: self.lexical.detect(text, segment))
 
     async def _run_structural(self, text: str, segment: ArticleSegment) -> ScanResult:
         """Run structural detector (sync, but wrapped for parallel execution)."""
+        if self.cpu_pool is not None:
+            return await self.cpu_pool.detect("structural", text, segment)
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, lambda: self.structural.detect(text, segment))
 
@@ -206,53 +237,80 @@ class NTRLScanner:
         - Keep the one with higher confidence
         - If same confidence, keep the one from more reliable detector
         - Preserve secondary type IDs from removed span
+
+        Spans are swept in position order. A merged span that ends before the
+        current span starts cannot overlap it or any later span, so only the
+        still-open merged spans are compared. They are kept in merge order,
+        so the first significant overlap wins just as in a full scan.
         """
         if not spans:
             return []
 
         # Sort by position
         sorted_spans = sorted(spans, key=lambda s: (s.span_start, s.span_end))
+        threshold = self.config.overlap_threshold
 
-        merged: list[DetectionInstance] = []
+        # Merge order -> span (dicts iterate in insertion order, i.e. merge order)
+        merged: dict[int, DetectionInstance] = {}
+        open_spans: dict[int, DetectionInstance] = {}
+        closing: list[tuple[int, int]] = []  # heap of (span_end, merge order)
+        next_order = 0
+
+        def add(span: DetectionInstance) -> None:
+            nonlocal next_order
+            merged[next_order] = span
+            open_spans[next_order] = span
+            heapq.heappush(closing, (span.span_end, next_order))
+            next_order += 1
+
+        def remove(order: int) -> None:
+            del merged[order]
+            open_spans.pop(order, None)
 
         for span in sorted_spans:
-            # Check if this span overlaps with any existing merged span
+            while closing and closing[0][0] <= span.span_start:
+                open_spans.pop(heapq.heappop(closing)[1], None)
+
+            # Check if this span overlaps with any existing merged span.
+            # Disjoint spans have ratio 0, so only a negative threshold needs closed ones.
             overlapping = None
+            overlapping_order = -1
             overlap_ratio = 0.0
 
-            for existing in merged:
+            for order, existing in (merged if threshold < 0 else open_spans).items():
                 ratio = self._compute_overlap(span, existing)
-                if ratio > self.config.overlap_threshold:
+                if ratio > threshold:
                     overlapping = existing
+                    overlapping_order = order
                     overlap_ratio = ratio
                     break
 
             if overlapping is None:
                 # No significant overlap, add span
-                merged.append(span)
+                add(span)
             else:
                 # Significant overlap - decide which to keep
                 if span.type_id_primary == overlapping.type_id_primary:
                     # Same type - keep higher confidence
                     if span.confidence > overlapping.confidence:
-                        merged.remove(overlapping)
-                        merged.append(span)
+                        remove(overlapping_order)
+                        add(span)
                 else:
                     # Different types - keep both if not exact same span
                     if overlap_ratio < 0.9:
-                        merged.append(span)
+                        add(span)
                     else:
                         # Very high overlap, keep higher severity
                         if span.severity > overlapping.severity:
                             # Add the existing type as secondary
                             span.type_ids_secondary.append(overlapping.type_id_primary)
-                            merged.remove(overlapping)
-                            merged.append(span)
+                            remove(overlapping_order)
+                            add(span)
                         else:
                             # Add new type as secondary to existing
                             overlapping.type_ids_secondary.append(span.type_id_primary)
 
-        return merged
+        return list(merged.values())
 
     def _compute_overlap(self, span1: DetectionInstance, span2: DetectionInstance) -> float:
         """
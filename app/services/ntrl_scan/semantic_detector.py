@@ -12,16 +12,27 @@ subtle manipulation patterns that require semantic understanding:
 - False balance (C.6.1)
 
 These patterns are too context-dependent for regex or simple NLP.
+
+LLM responses are cached by a hash of provider, model and prompt in a
+process-wide TTL cache, so re-scans of the same title or body (the API,
+batch retries, identical decks) do not call the provider again.
+Concurrent detections of the same text share one in-flight call.
+Failed calls are not cached.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import threading
 import time
 from dataclasses import dataclass
 
 import httpx
 
+from app.services.ntrl_result_cache import ResultCache
+from app.services.resilience import estimate_tokens, llm_permit
 from app.taxonomy import get_type
 
 from .types import (
@@ -78,6 +89,37 @@ If no manipulation found, return an empty array: []
 
 Return ONLY valid JSON, no other text."""
 
+# Cached LLM responses (raw JSON text that parses), shared by every detector in the process
+RESPONSE_CACHE_TTL_SECONDS = 3600
+RESPONSE_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+_response_cache: ResultCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResultCache:
+    """Get the process-wide semantic detector response cache."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResultCache(
+                ttl_seconds=RESPONSE_CACHE_TTL_SECONDS,
+                max_bytes=RESPONSE_CACHE_MAX_BYTES,
+            )
+        return _response_cache
+
+
+def _response_items(content: str) -> list | None:
+    """Detection items in an LLM response, or None if it is not valid JSON of the expected shape."""
+    try:
+        data = json.loads(content)
+    except json.JSONDecodeError:
+        return None
+    if isinstance(data, dict):
+        # OpenAI might wrap in object
+        data = data.get("detections", data.get("results"))
+    return data if isinstance(data, list) else None
+
 
 @dataclass
 class LLMConfig:
@@ -88,6 +130,7 @@ class LLMConfig:
     api_key: str | None = None
     timeout: float = 30.0
     max_tokens: int = 1024
+    cache_responses: bool = True
 
 
 class SemanticDetector:
@@ -123,6 +166,11 @@ class SemanticDetector:
             config = self._auto_configure()
         self.config = config
         self._client: httpx.AsyncClient | None = None
+        # Response cache key -> provider call shared by concurrent identical detections
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self.provider_calls = 0
+        self.cache_hits = 0
+        self.coalesced = 0
 
     def _auto_configure(self) -> LLMConfig:
         """Auto-configure from environment variables."""
@@ -184,10 +232,9 @@ class SemanticDetector:
         try:
             if self.config.provider == "mock":
                 detections = self._mock_detect(truncated_text, segment)
-            elif self.config.provider == "anthropic":
-                detections = await self._anthropic_detect(truncated_text, segment)
-            elif self.config.provider == "openai":
-                detections = await self._openai_detect(truncated_text, segment)
+            elif self.config.provider in ("anthropic", "openai"):
+                content = await self._complete(DETECTION_PROMPT.format(text=truncated_text))
+                detections = self._parse_llm_response(content, segment)
             else:
                 detections = []
         except Exception as e:
@@ -239,75 +286,113 @@ class SemanticDetector:
 
         return detections
 
-    async def _anthropic_detect(self, text: str, segment: ArticleSegment) -> list[DetectionInstance]:
-        """Detect using Anthropic Claude API."""
+    def _cache_key(self, prompt: str) -> str:
+        identity = f"{self.config.provider}\0{self.config.model}\0{self.config.max_tokens}\0{prompt}"
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    async def _complete(self, prompt: str) -> str:
+        """
+        LLM response text for prompt: cached, joined in flight, or fetched.
+
+        Every caller awaits the shared call through a shield, so one caller
+        being cancelled (e.g. a scan timeout) does not cancel it for others.
+        """
+        key = self._cache_key(prompt)
+        if self.config.cache_responses:
+            content = await get_response_cache().aget(key)
+            if content is not None:
+                self.cache_hits += 1
+                return content
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, prompt))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._call_finished(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _call_finished(self, key: str, task: asyncio.Task) -> None:
+        self._in_flight.pop(key, None)
+        if not task.cancelled():
+            # Mark a failure as retrieved even if every waiter was cancelled
+            task.exception()
+
+    async def _fetch(self, key: str, prompt: str) -> str:
+        self.provider_calls += 1
+        if self.config.provider == "anthropic":
+            content = await self._anthropic_complete(prompt)
+        else:
+            content = await self._openai_complete(prompt)
+        # A truncated or malformed response parses to no detections; retry it next time
+        if self.config.cache_responses and _response_items(content) is not None:
+            await get_response_cache().aset(key, content)
+        return content
+
+    async def _anthropic_complete(self, prompt: str) -> str:
+        """Call the Anthropic Claude API; returns the response text."""
         client = await self._get_client()
 
-        prompt = DETECTION_PROMPT.format(text=text)
-
-        response = await client.post(
-            "https://api.anthropic.com/v1/messages",
-            headers={
-                "x-api-key": self.config.api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
-            json={
-                "model": self.config.model,
-                "max_tokens": self.config.max_tokens,
-                "messages": [{"role": "user", "content": prompt}],
-            },
-        )
+        async with llm_permit("anthropic", self.config.model, estimate_tokens(prompt)) as permit:
+            response = await client.post(
+                "https://api.anthropic.com/v1/messages",
+                headers={
+                    "x-api-key": self.config.api_key,
+                    "anthropic-version": "2023-06-01",
+                    "content-type": "application/json",
+                },
+                json={
+                    "model": self.config.model,
+                    "max_tokens": self.config.max_tokens,
+                    "messages": [{"role": "user", "content": prompt}],
+                },
+            )
+            permit.record_status(response.status_code)
 
         if response.status_code != 200:
             raise Exception(f"Anthropic API error: {response.status_code}")
 
         result = response.json()
-        content = result.get("content", [{}])[0].get("text", "[]")
-
-        return self._parse_llm_response(content, segment)
+        return result.get("content", [{}])[0].get("text", "[]")
 
-    async def _openai_detect(self, text: str, segment: ArticleSegment) -> list[DetectionInstance]:
-        """Detect using OpenAI API."""
+    async def _openai_complete(self, prompt: str) -> str:
+        """Call the OpenAI API; returns the response text."""
         client = await self._get_client()
 
-        prompt = DETECTION_PROMPT.format(text=text)
-
-        response = await client.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {self.config.api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": self.config.model,
-                "max_tokens": self.config.max_tokens,
-                "messages": [{"role": "user", "content": prompt}],
-                "response_format": {"type": "json_object"},
-            },
-        )
+        async with llm_permit("openai", self.config.model, estimate_tokens(prompt)) as permit:
+            response = await client.post(
+                "https://api.openai.com/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.config.api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": self.config.model,
+                    "max_tokens": self.config.max_tokens,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "response_format": {"type": "json_object"},
+                },
+            )
+            permit.record_status(response.status_code)
 
         if response.status_code != 200:
             raise Exception(f"OpenAI API error: {response.status_code}")
 
         result = response.json()
-        content = result.get("choices", [{}])[0].get("message", {}).get("content", "[]")
-
-        return self._parse_llm_response(content, segment)
+        return result.get("choices", [{}])[0].get("message", {}).get("content", "[]")
 
     def _parse_llm_response(self, content: str, segment: ArticleSegment) -> list[DetectionInstance]:
         """Parse LLM JSON response into DetectionInstance objects."""
         detections = []
 
-        try:
-            # Handle both array and object responses
-            data = json.loads(content)
-            if isinstance(data, dict):
-                # OpenAI might wrap in object
-                data = data.get("detections", data.get("results", []))
-            if not isinstance(data, list):
-                return []
+        # Handle both array and object responses
+        data = _response_items(content)
+        if data is None:
+            logger.error("Failed to parse LLM response: not a JSON detection list")
+            return []
 
+        try:
             for item in data:
                 type_id = item.get("type_id", "")
 
@@ -9,15 +9,17 @@ require understanding sentence structure, not just keyword matching:
 - Agent deletion (D.3.2)
 - Vague quantifiers and temporal markers (D.5.x)
 
-Uses spaCy's en_core_web_sm model for fast, accurate parsing.
+Uses spaCy's en_core_web_sm model for fast, accurate parsing, through the
+process-wide SpacyRuntime shared with the NTRL-FIX validator.
 """
 
 import time
+from collections.abc import Sequence
 from functools import lru_cache
 
-import spacy
 from spacy.tokens import Doc, Span, Token
 
+from app.services.spacy_runtime import DEFAULT_PIPE_BATCH_SIZE, SpacyRuntime, get_spacy_runtime
 from app.taxonomy import get_type
 
 from .types import (
@@ -28,29 +30,6 @@ from .types import (
     SpanAction,
 )
 
-ALLOWED_SPACY_MODELS = {"en_core_web_sm", "en_core_web_md", "en_core_web_lg"}
-
-
-@lru_cache(maxsize=1)
-def _get_spacy_model(model_name: str = "en_core_web_sm"):
-    """Lazy-load and cache the spaCy model as a singleton.
-
-    The model is only loaded on first call (~2-3s), and cached for
-    all subsequent calls. Shared across StructuralDetector instances.
-    """
-    if model_name not in ALLOWED_SPACY_MODELS:
-        raise ValueError(f"Model '{model_name}' not in allowlist: {ALLOWED_SPACY_MODELS}")
-    try:
-        nlp = spacy.load(model_name)
-    except OSError:
-        import subprocess
-
-        subprocess.run(["python", "-m", "spacy", "download", model_name], check=True)
-        nlp = spacy.load(model_name)
-    # Disable NER for speed — we only need parser and tagger
-    nlp.select_pipes(disable=["ner"])
-    return nlp
-
 
 class StructuralDetector:
     """
@@ -113,9 +92,13 @@ class StructuralDetector:
     # Multi-word absolute phrases (D.5.4)
     ABSOLUTE_PHRASES = {"no one"}
 
-    def __init__(self, model_name: str = "en_core_web_sm"):
-        """Initialize with lazy-loaded spaCy model."""
-        self.nlp = _get_spacy_model(model_name)
+    # Pipes the structural checks do not use
+    DISABLED_PIPES = ("ner",)
+
+    def __init__(self, model_name: str = "en_core_web_sm", runtime: SpacyRuntime | None = None):
+        """Initialize with the shared spaCy runtime (model loaded on first use)."""
+        self.runtime = runtime or get_spacy_runtime(model_name)
+        self.nlp = self.runtime.nlp
 
     def detect(
         self,
@@ -144,8 +127,55 @@ class StructuralDetector:
             )
 
         # Parse with spaCy
-        doc = self.nlp(text)
+        # NER is not needed for structure; the validator adds it to the cached Doc if asked
+        doc = self.runtime.parse(text, disable=self.DISABLED_PIPES)
+
+        return self._detect_doc(doc, segment, start_time)
+
+    def detect_many(
+        self,
+        texts: Sequence[str],
+        segment: ArticleSegment = ArticleSegment.BODY,
+        batch_size: int = DEFAULT_PIPE_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> list[ScanResult]:
+        """
+        Detect structural manipulation patterns in several texts at once.
+
+        Texts are parsed together with nlp.pipe (see SpacyRuntime.parse_many),
+        which is much faster per document than one detect() call per text.
+        The Docs land in the shared cache, so a later detect() of the same
+        text does not parse again.
+
+        Args:
+            texts: The texts to analyze
+            segment: Which article segment the texts are from
+            batch_size: Texts per nlp.pipe batch
+            n_process: Parser processes (1 parses in this process)
+
+        Returns:
+            One ScanResult per text, in order
+        """
+        start_time = time.perf_counter()
+        non_empty = [text for text in texts if text and text.strip()]
+        docs = iter(
+            self.runtime.parse_many(non_empty, disable=self.DISABLED_PIPES, batch_size=batch_size, n_process=n_process)
+        )
+        # The batch parse is shared; each result reports its share of it
+        parse_ms = (time.perf_counter() - start_time) * 1000 / max(len(non_empty), 1)
+
+        results = []
+        for text in texts:
+            if not text or not text.strip():
+                results.append(self.detect(text, segment))
+                continue
+            check_start = time.perf_counter() - parse_ms / 1000
+            results.append(self._detect_doc(next(docs), segment, check_start))
+        return results
 
+    def _detect_doc(self, doc: Doc, segment: ArticleSegment, start_time: float) -> ScanResult:
+        """Run every structural check on a parsed Doc."""
+        text = doc.text
         detections: list[DetectionInstance] = []
 
         # Run all structural checks
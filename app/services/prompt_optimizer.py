@@ -18,6 +18,7 @@ from sqlalchemy.orm import Session
 
 from app import models
 from app.models import ChangeSource
+from app.services.resilience import estimate_tokens, llm_permit
 
 logger = logging.getLogger(__name__)
 
@@ -552,12 +553,15 @@ Generate an improved prompt that fixes these issues while preserving all working
             # o1 models don't support system prompts - combine into user message
             combined_prompt = f"{system_prompt}\n\n---\n\n{user_prompt}"
 
-            response = client.chat.completions.create(
-                model=self.teacher_model,
-                max_completion_tokens=4096,  # o1 uses max_completion_tokens, not max_tokens
-                messages=[{"role": "user", "content": combined_prompt}],
-                # Note: o1 doesn't support temperature, response_format, or other params
-            )
+            with llm_permit("openai", self.teacher_model, estimate_tokens(combined_prompt) + 4096) as permit:
+                response = client.chat.completions.create(
+                    model=self.teacher_model,
+                    max_completion_tokens=4096,  # o1 uses max_completion_tokens, not max_tokens
+                    messages=[{"role": "user", "content": combined_prompt}],
+                    # Note: o1 doesn't support temperature, response_format, or other params
+                )
+                if response.usage:
+                    permit.record_usage(response.usage.prompt_tokens + response.usage.completion_tokens)
 
             if response.usage:
                 self._total_input_tokens += response.usage.prompt_tokens
@@ -586,15 +590,18 @@ Generate an improved prompt that fixes these issues while preserving all working
 
             client = OpenAI(api_key=api_key, timeout=60.0)
 
-            response = client.chat.completions.create(
-                model=self.teacher_model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.3,
-                response_format={"type": "json_object"},
-            )
+            with llm_permit("openai", self.teacher_model, estimate_tokens(system_prompt, user_prompt)) as permit:
+                response = client.chat.completions.create(
+                    model=self.teacher_model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=0.3,
+                    response_format={"type": "json_object"},
+                )
+                if response.usage:
+                    permit.record_usage(response.usage.prompt_tokens + response.usage.completion_tokens)
 
             if response.usage:
                 self._total_input_tokens += response.usage.prompt_tokens
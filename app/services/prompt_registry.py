@@ -0,0 +1,324 @@
+# app/services/prompt_registry.py
+"""
+Process-wide registry of active prompts.
+
+All active rows of the prompts table are loaded with one query into an
+immutable PromptSnapshot. Every reload produces a snapshot with a higher
+version, and lookups read the current snapshot without touching the
+database.
+
+A snapshot is invalidated:
+- locally, by invalidate() (clear_prompt_cache() after a prompt is saved)
+- in every worker, by a PostgreSQL NOTIFY on PROMPTS_CHANNEL. A statement
+  trigger on the prompts table sends it on commit (migration 022) and a
+  listener thread per process receives it, so no worker keeps serving a
+  prompt once the change is committed.
+- without a listener (SQLite, PROMPT_REGISTRY_LISTEN off, or while the
+  listener reconnects), by a change-stamp query run at most every
+  PROMPT_REGISTRY_CHECK_SECONDS.
+"""
+
+import logging
+import select
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Channel notified by the prompts table trigger
+PROMPTS_CHANNEL = "prompts_changed"
+
+# Listener select() timeout; an idle connection is health-checked this often
+LISTEN_IDLE_SECONDS = 30.0
+
+# Per-context prompt overrides (name -> content), e.g. for POST /v1/prompts/test
+_prompt_overrides: ContextVar[dict[str, str] | None] = ContextVar("prompt_overrides", default=None)
+
+
+@dataclass(frozen=True)
+class PromptSnapshot:
+    """Active prompts as of one load, keyed by (name, model). model=None is model-agnostic."""
+
+    version: int
+    stamp: tuple
+    prompts: dict[tuple[str, str | None], str]
+    has_system_prompt: bool = False
+    active_model: str | None = None  # Model of the active system_prompt, which selects the provider
+    by_name: dict[str, str] = field(default_factory=dict)  # First active prompt per name, any model
+
+
+class PromptRegistry:
+    """
+    Versioned snapshot of the prompts table with push invalidation.
+
+    Usage:
+        registry = PromptRegistry(SessionLocal)
+        registry.start_listener(engine)  # PostgreSQL only
+        content = registry.get("system_prompt", registry.snapshot().active_model)
+    """
+
+    def __init__(self, session_factory: Callable[[], Any], check_interval: float = 5.0):
+        self._session_factory = session_factory
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._snapshot: PromptSnapshot | None = None
+        self._version = 0
+        self._stale = False
+        self._checked_at = 0.0
+        self._retry_after = 0.0
+        self._listening = False
+        self._listener: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def listening(self) -> bool:
+        """True while a NOTIFY listener is connected."""
+        return self._listening
+
+    def snapshot(self) -> PromptSnapshot:
+        """
+        Current snapshot, reloading first if it was invalidated.
+
+        Raises if the first load fails. After that a failed reload is logged
+        and the previous snapshot keeps being served until the next retry.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            now = time.monotonic()
+            if not self._stale and (self._listening or now - self._checked_at < self.check_interval):
+                return snapshot
+            if now < self._retry_after:
+                return snapshot
+        return self._refresh()
+
+    def get(self, name: str, model: str | None) -> str | None:
+        """Active prompt content for (name, model), or None."""
+        overrides = _prompt_overrides.get()
+        if overrides and name in overrides:
+            return overrides[name]
+        return self.snapshot().prompts.get((name, model))
+
+    def get_any(self, name: str) -> str | None:
+        """Active prompt content for name regardless of model, or None."""
+        overrides = _prompt_overrides.get()
+        if overrides and name in overrides:
+            return overrides[name]
+        return self.snapshot().by_name.get(name)
+
+    def invalidate(self) -> None:
+        """Reload on the next lookup."""
+        self._stale = True
+        self._retry_after = 0.0
+
+    def _refresh(self) -> PromptSnapshot:
+        with self._lock:
+            snapshot = self._snapshot
+            now = time.monotonic()
+            if snapshot is not None and not self._stale:
+                # Another thread finished a refresh while this one waited
+                if self._listening or now - self._checked_at < self.check_interval:
+                    return snapshot
+
+            stale = self._stale
+            # Cleared before loading so an invalidation during the load is not lost
+            self._stale = False
+            try:
+                snapshot = self._load(None if stale else snapshot)
+            except Exception as e:
+                self._stale = self._stale or stale
+                if snapshot is None:
+                    raise
+                self._retry_after = now + self.check_interval
+                logger.warning(f"Prompt reload failed, serving prompts v{snapshot.version}: {e}")
+                return snapshot
+
+            self._snapshot = snapshot
+            self._checked_at = now
+            self._retry_after = 0.0
+            return snapshot
+
+    def _load(self, current: PromptSnapshot | None) -> PromptSnapshot:
+        """Load a new snapshot, or return current if the change stamp has not moved."""
+        from sqlalchemy import func
+
+        from app import models
+
+        db = self._session_factory()
+        try:
+            # Stamp first: a change landing between the two reads only causes one extra reload
+            count, version_sum, updated_at = db.query(
+                func.count(models.Prompt.id),
+                func.coalesce(func.sum(models.Prompt.version), 0),
+                func.max(models.Prompt.updated_at),
+            ).one()
+            stamp = (count, int(version_sum), updated_at)
+            if current is not None and stamp == current.stamp:
+                return current
+
+            rows = (
+                db.query(models.Prompt.name, models.Prompt.model, models.Prompt.content)
+                .filter(models.Prompt.is_active == True)  # noqa: E712
+                .all()
+            )
+        finally:
+            db.close()
+
+        prompts: dict[tuple[str, str | None], str] = {}
+        by_name: dict[str, str] = {}
+        has_system_prompt = False
+        active_model = None
+        for name, model, content in rows:
+            prompts[(name, model)] = content
+            by_name.setdefault(name, content)
+            if name == "system_prompt" and not has_system_prompt:
+                has_system_prompt = True
+                active_model = model
+
+        self._version += 1
+        logger.info(f"Loaded {len(prompts)} active prompts (v{self._version})")
+        return PromptSnapshot(
+            version=self._version,
+            stamp=stamp,
+            prompts=prompts,
+            has_system_prompt=has_system_prompt,
+            active_model=active_model,
+            by_name=by_name,
+        )
+
+    # -------------------------------------------------------------------------
+    # NOTIFY listener
+    # -------------------------------------------------------------------------
+
+    def start_listener(self, engine: Any) -> bool:
+        """Start the NOTIFY listener thread. Returns False if the database is not PostgreSQL."""
+        if engine.dialect.name != "postgresql":
+            return False
+        with self._lock:
+            if self._listener is None:
+                self._stop.clear()
+                self._listener = threading.Thread(
+                    target=self._listen, args=(engine,), name="prompt-registry-listener", daemon=True
+                )
+                self._listener.start()
+        return True
+
+    def stop_listener(self) -> None:
+        """Stop the listener thread (tests and shutdown)."""
+        self._stop.set()
+        listener = self._listener
+        if listener is not None:
+            listener.join(timeout=LISTEN_IDLE_SECONDS + 1)
+        self._listener = None
+
+    def _listen(self, engine: Any) -> None:
+        backoff = 1.0
+        while not self._stop.is_set():
+            conn = None
+            try:
+                # A dedicated connection outside the pool, held for the life of the listener
+                conn = engine.raw_connection()
+                conn.detach()
+                dbapi_conn = conn.driver_connection
+                dbapi_conn.autocommit = True
+                with dbapi_conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {PROMPTS_CHANNEL}")
+                self._listening = True
+                # Changes committed while no listener was connected were not notified
+                self.invalidate()
+                backoff = 1.0
+                logger.info(f"Prompt registry listening on '{PROMPTS_CHANNEL}'")
+                self._wait_for_notifies(dbapi_conn)
+            except Exception as e:
+                logger.warning(f"Prompt registry listener disconnected, retrying in {backoff:.0f}s: {e}")
+            finally:
+                self._listening = False
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+    def _wait_for_notifies(self, dbapi_conn: Any) -> None:
+        while not self._stop.is_set():
+            readable, _, _ = select.select([dbapi_conn], [], [], LISTEN_IDLE_SECONDS)
+            if not readable:
+                # Detect a silently dropped connection
+                with dbapi_conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                continue
+            dbapi_conn.poll()
+            if dbapi_conn.notifies:
+                dbapi_conn.notifies.clear()
+                self.invalidate()
+
+
+@contextmanager
+def override_prompts(overrides: dict[str, str]) -> Iterator[None]:
+    """Serve the given prompt contents by name, for the current context only."""
+    token = _prompt_overrides.set({**(_prompt_overrides.get() or {}), **overrides})
+    try:
+        yield
+    finally:
+        _prompt_overrides.reset(token)
+
+
+# -----------------------------------------------------------------------------
+# Process-wide registry
+# -----------------------------------------------------------------------------
+
+_registry: PromptRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def _registry_settings() -> Any | None:
+    try:
+        from app.config import get_settings
+
+        return get_settings()
+    except Exception as e:
+        # Settings can be incomplete in scripts and unit tests; fall back to defaults
+        logger.debug(f"Prompt registry settings unavailable, using defaults: {e}")
+        return None
+
+
+def get_prompt_registry() -> PromptRegistry:
+    """Get the process-wide prompt registry, starting its NOTIFY listener on first use."""
+    global _registry
+    if _registry is not None:
+        return _registry
+
+    with _registry_lock:
+        if _registry is None:
+            from app.database import SessionLocal, engine
+
+            settings = _registry_settings()
+            registry = PromptRegistry(
+                SessionLocal,
+                check_interval=settings.PROMPT_REGISTRY_CHECK_SECONDS if settings is not None else 5.0,
+            )
+            if settings is None or settings.PROMPT_REGISTRY_LISTEN:
+                registry.start_listener(engine)
+            _registry = registry
+        return _registry
+
+
+def invalidate_prompt_registry() -> None:
+    """Drop this process's prompt snapshot (no-op if nothing was loaded yet)."""
+    if _registry is not None:
+        _registry.invalidate()
+
+
+def reset_prompt_registry() -> None:
+    """Discard the process-wide registry (for tests)."""
+    global _registry
+    with _registry_lock:
+        if _registry is not None:
+            _registry.stop_listener()
+        _registry = None
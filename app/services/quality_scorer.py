@@ -14,6 +14,8 @@ import os
 from dataclasses import dataclass
 from typing import Literal
 
+from app.services.resilience import estimate_tokens, llm_permit
+
 logger = logging.getLogger(__name__)
 
 
@@ -256,14 +258,15 @@ def _score_with_openai(prompt: str) -> QualityScore:
 
         client = OpenAI(api_key=api_key)
 
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.3,
-            response_format={"type": "json_object"},
-        )
+        with llm_permit("openai", "gpt-4o-mini", estimate_tokens(prompt)):
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.3,
+                response_format={"type": "json_object"},
+            )
 
         data = json.loads(response.choices[0].message.content)
         return QualityScore(
@@ -288,13 +291,14 @@ def _score_with_anthropic(prompt: str) -> QualityScore:
 
         client = anthropic.Anthropic(api_key=api_key)
 
-        response = client.messages.create(
-            model="claude-haiku-4-5",
-            max_tokens=1024,
-            messages=[
-                {"role": "user", "content": prompt},
-            ],
-        )
+        with llm_permit("anthropic", "claude-haiku-4-5", estimate_tokens(prompt) + 1024):
+            response = client.messages.create(
+                model="claude-haiku-4-5",
+                max_tokens=1024,
+                messages=[
+                    {"role": "user", "content": prompt},
+                ],
+            )
 
         # Extract JSON from response
         text = response.content[0].text
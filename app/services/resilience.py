@@ -1,13 +1,18 @@
 """
 Resilience patterns for pipeline execution.
 
-Provides retry logic, circuit breaker, and rate limiting for LLM and external
-service calls to handle transient failures gracefully.
+Provides retry logic, circuit breaker, rate limiting and adaptive (AIMD)
+concurrency control for LLM and external service calls to handle transient
+failures gracefully.
 """
 
 import asyncio
 import logging
+import math
+import threading
 import time
+import zlib
+from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -248,11 +253,72 @@ def with_sync_retry(
 # -----------------------------------------------------------------------------
 
 
+class RateBucketCoordinator(ABC):
+    """Shares a token bucket across processes."""
+
+    @abstractmethod
+    def try_take(self, key: str, tokens: float, tokens_per_second: float, max_tokens: int) -> float:
+        """Take tokens from the shared bucket for key. Returns 0 on success, else seconds to wait."""
+        pass
+
+
+class PostgresRateBucketCoordinator(RateBucketCoordinator):
+    """
+    Cross-process token buckets stored in the rate_limit_buckets table.
+
+    Refill and take happen in one UPDATE that locks the key's row, so
+    concurrent processes never spend the same tokens. The database clock
+    is used throughout, so process clocks do not need to agree.
+    """
+
+    _CREATE = """
+        INSERT INTO rate_limit_buckets (key, tokens, updated_at)
+        VALUES (:key, :max_tokens, clock_timestamp())
+        ON CONFLICT (key) DO NOTHING
+    """
+    _TAKE = """
+        UPDATE rate_limit_buckets AS b
+        SET tokens = r.available - CASE WHEN r.available >= :tokens THEN :tokens ELSE 0 END,
+            updated_at = clock_timestamp()
+        FROM (
+            SELECT LEAST(
+                CAST(:max_tokens AS double precision),
+                tokens + CAST(EXTRACT(EPOCH FROM clock_timestamp() - updated_at) AS double precision)
+                * CAST(:rate AS double precision)
+            ) AS available
+            FROM rate_limit_buckets
+            WHERE key = :key
+            FOR UPDATE
+        ) AS r
+        WHERE b.key = :key
+        RETURNING r.available
+    """
+
+    def __init__(self, engine: Any):
+        self._engine = engine
+
+    def try_take(self, key: str, tokens: float, tokens_per_second: float, max_tokens: int) -> float:
+        from sqlalchemy import text
+
+        params = {"key": key, "tokens": tokens, "rate": tokens_per_second, "max_tokens": max_tokens}
+        with self._engine.begin() as conn:
+            conn.execute(text(self._CREATE), params)
+            available = float(conn.execute(text(self._TAKE), params).scalar())
+        if available >= tokens:
+            return 0.0
+        return (tokens - available) / tokens_per_second
+
+
 @dataclass
 class RateLimiter:
     """
     Token bucket rate limiter for controlling request rates.
 
+    Safe to share between threads and event loops, which lets one limiter
+    from get_rate_limiter() cover every caller in the process. With a
+    coordinator, the bucket itself lives in the database and is shared by
+    every process using the same name.
+
     Usage:
         limiter = RateLimiter(tokens_per_second=10, max_tokens=50)
 
@@ -262,39 +328,86 @@ class RateLimiter:
 
     tokens_per_second: float
     max_tokens: int
+    name: str = "default"
+    coordinator: RateBucketCoordinator | None = None
+    # After a coordinator failure, use the local bucket for this long before trying the database again
+    coordinator_backoff_seconds: float = 30.0
 
     _tokens: float = field(init=False)
     _last_update: float = field(init=False)
-    _lock: asyncio.Lock | None = field(default=None, init=False)
-
-    def _get_lock(self) -> asyncio.Lock:
-        if self._lock is None:
-            self._lock = asyncio.Lock()
-        return self._lock
+    _coordinator_retry_at: float = field(default=0.0, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
 
     def __post_init__(self):
         self._tokens = float(self.max_tokens)
-        self._last_update = time.time()
+        self._last_update = time.monotonic()
+
+    def try_acquire(self, tokens: int = 1) -> float:
+        """Non-blocking acquire. Returns 0 if the tokens were taken, else seconds to wait."""
+        tokens = min(tokens, self.max_tokens)  # Oversized requests wait for a full bucket
+        if self._use_coordinator():
+            wait = self._try_shared(tokens)
+            if wait is not None:
+                return wait
+        return self._try_local(tokens)
 
     async def acquire(self, tokens: int = 1) -> None:
         """Acquire tokens, waiting if necessary."""
+        tokens = min(tokens, self.max_tokens)
         while True:
-            async with self._get_lock():
-                now = time.time()
-                elapsed = now - self._last_update
-                self._tokens = min(self.max_tokens, self._tokens + elapsed * self.tokens_per_second)
-                self._last_update = now
-
-                if self._tokens >= tokens:
-                    self._tokens -= tokens
-                    return
+            wait = None
+            if self._use_coordinator():
+                # The database round trip must not block the event loop
+                wait = await asyncio.to_thread(self._try_shared, tokens)
+            if wait is None:
+                wait = self._try_local(tokens)
+            if not wait:
+                return
+            # Sleep outside the lock so other requests aren't blocked
+            await asyncio.sleep(wait)
 
-                # Calculate wait time outside the lock
-                needed = tokens - self._tokens
-                wait_time = needed / self.tokens_per_second
+    def _use_coordinator(self) -> bool:
+        return self.coordinator is not None and time.monotonic() >= self._coordinator_retry_at
 
-            # Sleep outside the lock so other requests aren't blocked
-            await asyncio.sleep(wait_time)
+    def _try_shared(self, tokens: float) -> float | None:
+        """Take from the shared bucket; None if the coordinator is unavailable."""
+        try:
+            return self.coordinator.try_take(self.name, tokens, self.tokens_per_second, self.max_tokens)
+        except Exception as e:
+            self._coordinator_retry_at = time.monotonic() + self.coordinator_backoff_seconds
+            logger.warning(
+                f"Rate limit coordination for '{self.name}' unavailable, continuing locally "
+                f"for {self.coordinator_backoff_seconds:.0f}s: {e}"
+            )
+            return None
+
+    def _try_local(self, tokens: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_update
+            self._tokens = min(self.max_tokens, self._tokens + elapsed * self.tokens_per_second)
+            self._last_update = now
+
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.tokens_per_second
+
+    def acquire_sync(self, tokens: int = 1) -> None:
+        """Blocking variant of acquire() for synchronous callers."""
+        while wait := self.try_acquire(tokens):
+            time.sleep(wait)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current state for metrics endpoints and logs (local bucket only)."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "tokens_per_second": self.tokens_per_second,
+                "max_tokens": self.max_tokens,
+                "tokens_available": round(self._tokens, 2),
+                "shared": self.coordinator is not None,
+            }
 
     async def __aenter__(self):
         await self.acquire()
@@ -304,6 +417,60 @@ class RateLimiter:
         pass
 
 
+_rate_limiters: dict[str, RateLimiter] = {}
+# "provider:model" -> requests per minute (None if unbudgeted), resolved from settings once
+_llm_rate_budgets: dict[str, int | None] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, tokens_per_second: float, max_tokens: int) -> RateLimiter:
+    """
+    Get the process-wide token bucket called name.
+
+    The first call for a name creates the bucket with its rate and burst;
+    later calls share it (with a warning if they ask for different
+    settings). With RATE_LIMIT_DB_COORDINATION on, the bucket is shared
+    by every process through the database.
+    """
+    limiter = _rate_limiters.get(name)
+    if limiter is None:
+        with _rate_limiters_lock:
+            limiter = _rate_limiters.get(name)
+            if limiter is None:
+                coordinator = None
+                settings = _llm_limiter_settings()
+                if settings is not None and settings.RATE_LIMIT_DB_COORDINATION:
+                    from app.database import engine
+
+                    coordinator = PostgresRateBucketCoordinator(engine)
+                limiter = RateLimiter(
+                    tokens_per_second=tokens_per_second,
+                    max_tokens=max_tokens,
+                    name=name,
+                    coordinator=coordinator,
+                )
+                _rate_limiters[name] = limiter
+                return limiter
+    if (limiter.tokens_per_second, limiter.max_tokens) != (tokens_per_second, max_tokens):
+        logger.warning(
+            f"Rate limiter '{name}' already runs at {limiter.tokens_per_second}/s "
+            f"(burst {limiter.max_tokens}); ignoring {tokens_per_second}/s (burst {max_tokens})"
+        )
+    return limiter
+
+
+def rate_limiter_snapshots() -> list[dict[str, Any]]:
+    """State of every rate limiter created in this process."""
+    return [limiter.snapshot() for limiter in list(_rate_limiters.values())]
+
+
+def reset_rate_limiters() -> None:
+    """Drop all rate limiters (tests, or after changing settings)."""
+    with _rate_limiters_lock:
+        _rate_limiters.clear()
+        _llm_rate_budgets.clear()
+
+
 # -----------------------------------------------------------------------------
 # LLM-Specific Errors
 # -----------------------------------------------------------------------------
@@ -369,3 +536,576 @@ async def with_timeout(coro, timeout_seconds: float, error_message: str = "Opera
         return await asyncio.wait_for(coro, timeout=timeout_seconds)
     except TimeoutError:
         raise LLMTimeoutError(f"{error_message} (timeout: {timeout_seconds}s)")
+
+
+# -----------------------------------------------------------------------------
+# Adaptive Concurrency (AIMD)
+# -----------------------------------------------------------------------------
+
+OUTCOME_OK = "ok"
+OUTCOME_ERROR = "error"
+OUTCOME_RATE_LIMITED = "rate_limited"
+OUTCOME_TIMEOUT = "timeout"
+
+
+def classify_llm_exception(exc: BaseException) -> str:
+    """
+    Classify an exception raised by an LLM call into a permit outcome.
+
+    Works across SDKs without importing them: OpenAI/Anthropic raise
+    RateLimitError / APITimeoutError subclasses carrying a status_code,
+    httpx raises TimeoutException subclasses.
+    """
+    name = type(exc).__name__
+    if isinstance(exc, LLMRateLimitError) or getattr(exc, "status_code", None) == 429 or "RateLimit" in name:
+        return OUTCOME_RATE_LIMITED
+    if isinstance(exc, TimeoutError | LLMTimeoutError) or "Timeout" in name:
+        return OUTCOME_TIMEOUT
+    return OUTCOME_ERROR
+
+
+def classify_status_code(status_code: int) -> str:
+    """Classify an HTTP status code from a raw API call into a permit outcome."""
+    if status_code == 429:
+        return OUTCOME_RATE_LIMITED
+    if status_code in (408, 504):
+        return OUTCOME_TIMEOUT
+    if status_code >= 400:
+        return OUTCOME_ERROR
+    return OUTCOME_OK
+
+
+def estimate_tokens(*texts: str | None) -> int:
+    """Rough token estimate for TPM budgeting (~4 characters per token)."""
+    return sum(len(t) for t in texts if t) // 4
+
+
+class ConcurrencyCoordinator(ABC):
+    """Shares a limiter's concurrency slots across processes."""
+
+    @abstractmethod
+    def try_acquire_slot(self, key: str, limit: int) -> Any | None:
+        """Claim one of `limit` shared slots for key. Returns a handle, or None if all are taken."""
+        pass
+
+    @abstractmethod
+    def release_slot(self, handle: Any) -> None:
+        """Release a slot claimed by try_acquire_slot."""
+        pass
+
+
+class PostgresAdvisoryCoordinator(ConcurrencyCoordinator):
+    """
+    Cross-process concurrency slots backed by PostgreSQL advisory locks.
+
+    Slot i of key k is the session-level advisory lock (crc32(k), i), held on
+    its own connection for the duration of the LLM call. Locks are released
+    automatically if the process dies, so slots never leak.
+
+    Give it an unpooled engine (see coordinator_engine()) so held slots don't
+    drain the app's session pool. Each key is capped at max_slots shared
+    slots, which bounds the connections one provider/model can hold.
+    """
+
+    def __init__(self, engine: Any, max_slots: int = 8):
+        self._engine = engine
+        self.max_slots = max_slots
+
+    def try_acquire_slot(self, key: str, limit: int) -> Any | None:
+        from sqlalchemy import text
+
+        lock_key = zlib.crc32(key.encode()) & 0x7FFFFFFF
+        conn = self._engine.connect()
+        try:
+            for slot in range(min(limit, self.max_slots)):
+                if conn.execute(text("SELECT pg_try_advisory_lock(:k, :s)"), {"k": lock_key, "s": slot}).scalar():
+                    return conn, lock_key, slot
+        except Exception:
+            conn.close()
+            raise
+        conn.close()
+        return None
+
+    def release_slot(self, handle: Any) -> None:
+        from sqlalchemy import text
+
+        conn, lock_key, slot = handle
+        try:
+            conn.execute(text("SELECT pg_advisory_unlock(:k, :s)"), {"k": lock_key, "s": slot})
+        finally:
+            conn.close()
+
+
+_coordinator_engine: Any | None = None
+_coordinator_engine_lock = threading.Lock()
+
+
+def coordinator_engine() -> Any:
+    """
+    Process-wide unpooled engine for advisory-lock slots.
+
+    Every held slot keeps a connection open for a whole LLM call, so the
+    coordinator opens its own connections (NullPool) instead of borrowing
+    from app.database's pool_size=10 session pool.
+    """
+    global _coordinator_engine
+    with _coordinator_engine_lock:
+        if _coordinator_engine is None:
+            from sqlalchemy import create_engine
+            from sqlalchemy.pool import NullPool
+
+            from app.database import DATABASE_URL
+
+            _coordinator_engine = create_engine(DATABASE_URL, future=True, poolclass=NullPool)
+        return _coordinator_engine
+
+
+@dataclass
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit plus tokens-per-minute budget for one provider/model.
+
+    Callers hold a permit for the duration of each LLM call. The limit grows
+    by one after every window of healthy calls (error rate and p95 latency
+    within bounds) and is cut multiplicatively on 429s and timeouts, or when
+    a window's p95 drifts past latency_tolerance x the best p95 seen. Congestion
+    signals from calls that started before the last cut are ignored, so one
+    burst of 429s only halves the limit once.
+
+    Usage:
+        limiter = AdaptiveConcurrencyLimiter(name="openai:gpt-4o-mini", tokens_per_minute=200_000)
+
+        with limiter.permit(estimated_tokens=1500) as permit:
+            response = client.chat.completions.create(...)
+            permit.record_usage(response.usage.total_tokens)
+    """
+
+    name: str
+    initial_limit: int = 4
+    min_limit: int = 1
+    max_limit: int = 16
+    tokens_per_minute: int | None = None
+    window_size: int = 20
+    latency_tolerance: float = 2.0
+    error_rate_threshold: float = 0.1
+    decrease_factor: float = 0.5
+    acquire_timeout_seconds: float = 300.0
+    coordinator: ConcurrencyCoordinator | None = None
+    # After a coordinator failure, run on local slots for this long before trying the database again
+    coordinator_backoff_seconds: float = 30.0
+
+    _limit: float = field(init=False)
+    _in_flight: int = field(default=0, init=False)
+    _latencies: list[float] = field(default_factory=list, init=False)
+    _window_errors: int = field(default=0, init=False)
+    _baseline_p95: float | None = field(default=None, init=False)
+    _last_decrease_at: float = field(default=0.0, init=False)
+    _tokens: float = field(default=0.0, init=False)
+    _tokens_updated: float = field(init=False)
+    _coordinator_retry_at: float = field(default=0.0, init=False)
+    _cond: threading.Condition = field(default_factory=threading.Condition, init=False)
+
+    def __post_init__(self):
+        self._limit = float(max(self.min_limit, min(self.initial_limit, self.max_limit)))
+        self._tokens = float(self.tokens_per_minute or 0)
+        self._tokens_updated = time.monotonic()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Permits currently held in this process."""
+        return self._in_flight
+
+    def _refill(self, now: float) -> None:
+        if self.tokens_per_minute:
+            elapsed = now - self._tokens_updated
+            self._tokens = min(float(self.tokens_per_minute), self._tokens + elapsed * self.tokens_per_minute / 60.0)
+        self._tokens_updated = now
+
+    def _reserve(self, tokens: int) -> float:
+        """Reserve a local slot and tokens under the lock. Returns 0 on success, else seconds to wait."""
+        now = time.monotonic()
+        self._refill(now)
+        if self._in_flight >= self.limit:
+            return 0.05  # Woken by release(); the timeout only bounds a missed notify
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)  # Oversized calls wait for a full bucket
+            if self._tokens < tokens:
+                return (tokens - self._tokens) * 60.0 / self.tokens_per_minute
+            self._tokens -= tokens
+        self._in_flight += 1
+        return 0.0
+
+    def _unreserve(self, tokens: int) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            if self.tokens_per_minute:
+                self._tokens += min(tokens, self.tokens_per_minute)
+            self._cond.notify()
+
+    def _claim_shared_slot(self, tokens: int) -> tuple[bool, Any | None]:
+        """Claim a cross-process slot after a local reservation; fail open on DB errors."""
+        if self.coordinator is None or time.monotonic() < self._coordinator_retry_at:
+            return True, None
+        try:
+            handle = self.coordinator.try_acquire_slot(self.name, self.limit)
+        except Exception as e:
+            self._coordinator_retry_at = time.monotonic() + self.coordinator_backoff_seconds
+            logger.warning(
+                f"Concurrency coordination for '{self.name}' unavailable, continuing locally "
+                f"for {self.coordinator_backoff_seconds:.0f}s: {e}"
+            )
+            return True, None
+        if handle is None:
+            self._unreserve(tokens)
+            return False, None
+        return True, handle
+
+    async def _claim_shared_slot_async(self, tokens: int) -> tuple[bool, Any | None]:
+        """_claim_shared_slot() with the database round trip in a worker thread."""
+        if self.coordinator is None:
+            return True, None
+        claim = asyncio.ensure_future(asyncio.to_thread(self._claim_shared_slot, tokens))
+        try:
+            return await asyncio.shield(claim)
+        except asyncio.CancelledError:
+            # The thread still finishes the claim; hand back whatever it took
+            claim.add_done_callback(lambda f: self._abandon_claim(f, tokens))
+            raise
+
+    def _abandon_claim(self, claim: "asyncio.Future", tokens: int) -> None:
+        if claim.cancelled() or claim.exception() is not None:
+            return
+        acquired, handle = claim.result()
+        if acquired:
+            self._release_shared_slot(handle)
+            self._unreserve(tokens)
+
+    def _release_shared_slot(self, handle: Any | None) -> None:
+        if handle is None or self.coordinator is None:
+            return
+        try:
+            self.coordinator.release_slot(handle)
+        except Exception as e:
+            logger.warning(f"Failed to release shared concurrency slot for '{self.name}': {e}")
+
+    def try_acquire(self, tokens: int = 0) -> tuple[bool, float, Any | None]:
+        """
+        Non-blocking acquire.
+
+        Returns:
+            (acquired, seconds to wait before retrying, coordinator handle)
+        """
+        with self._cond:
+            wait = self._reserve(tokens)
+        if wait:
+            return False, wait, None
+        acquired, handle = self._claim_shared_slot(tokens)
+        return acquired, 0.0 if acquired else 0.25, handle
+
+    def acquire(self, tokens: int = 0) -> Any | None:
+        """
+        Block until a permit is available. Returns the coordinator handle (if any).
+
+        Raises:
+            LLMRateLimitError: If no permit frees up within acquire_timeout_seconds
+        """
+        deadline = time.monotonic() + self.acquire_timeout_seconds
+        while True:
+            with self._cond:
+                wait = self._reserve(tokens)
+                if wait:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise LLMRateLimitError(f"Timed out waiting for an LLM permit for '{self.name}'")
+                    self._cond.wait(min(wait, remaining))
+                    continue
+            acquired, handle = self._claim_shared_slot(tokens)
+            if acquired:
+                return handle
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise LLMRateLimitError(f"Timed out waiting for an LLM permit for '{self.name}'")
+            time.sleep(min(0.25, remaining))
+
+    async def acquire_async(self, tokens: int = 0) -> Any | None:
+        """Async variant of acquire() that keeps sleeps and database calls off the event loop."""
+        deadline = time.monotonic() + self.acquire_timeout_seconds
+        while True:
+            with self._cond:
+                wait = self._reserve(tokens)
+            if not wait:
+                acquired, handle = await self._claim_shared_slot_async(tokens)
+                if acquired:
+                    return handle
+                wait = 0.25
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise LLMRateLimitError(f"Timed out waiting for an LLM permit for '{self.name}'")
+            await asyncio.sleep(min(wait, remaining))
+
+    def release(
+        self,
+        started_at: float,
+        outcome: str,
+        estimated_tokens: int = 0,
+        actual_tokens: int | None = None,
+        handle: Any | None = None,
+    ) -> None:
+        """Return a permit and feed the call's latency and outcome into the AIMD loop."""
+        try:
+            self._release_shared_slot(handle)
+        finally:
+            self._release_local(started_at, outcome, estimated_tokens, actual_tokens)
+
+    async def release_async(
+        self,
+        started_at: float,
+        outcome: str,
+        estimated_tokens: int = 0,
+        actual_tokens: int | None = None,
+        handle: Any | None = None,
+    ) -> None:
+        """Async variant of release() that unlocks the shared slot in a worker thread."""
+        try:
+            if handle is not None:
+                await asyncio.to_thread(self._release_shared_slot, handle)
+        finally:
+            self._release_local(started_at, outcome, estimated_tokens, actual_tokens)
+
+    def _release_local(self, started_at: float, outcome: str, estimated_tokens: int, actual_tokens: int | None) -> None:
+        now = time.monotonic()
+        with self._cond:
+            self._in_flight -= 1
+            if self.tokens_per_minute and actual_tokens is not None:
+                # Reconcile the estimate with what the provider actually counted
+                self._tokens += min(estimated_tokens, self.tokens_per_minute) - actual_tokens
+
+            if outcome in (OUTCOME_RATE_LIMITED, OUTCOME_TIMEOUT):
+                if started_at >= self._last_decrease_at:
+                    self._decrease(now, reason=outcome)
+            else:
+                self._record_sample(now, now - started_at, outcome == OUTCOME_ERROR)
+            self._cond.notify_all()
+
+    def _record_sample(self, now: float, latency: float, is_error: bool) -> None:
+        self._latencies.append(latency)
+        self._window_errors += int(is_error)
+        if len(self._latencies) < self.window_size:
+            return
+
+        ordered = sorted(self._latencies)
+        p95 = ordered[min(len(ordered) - 1, math.ceil(0.95 * len(ordered)) - 1)]
+        error_rate = self._window_errors / len(self._latencies)
+        self._latencies = []
+        self._window_errors = 0
+
+        if error_rate > self.error_rate_threshold:
+            self._decrease(now, reason=f"error_rate={error_rate:.0%}")
+        elif self._baseline_p95 is not None and p95 > self.latency_tolerance * self._baseline_p95:
+            self._decrease(now, reason=f"p95={p95:.1f}s baseline={self._baseline_p95:.1f}s")
+        elif self._limit < self.max_limit:
+            self._limit = min(float(self.max_limit), self._limit + 1)
+            logger.info(f"Concurrency for '{self.name}' raised to {self.limit} (p95={p95:.1f}s)")
+
+        # Best p95 seen, allowed to creep up 10% per window so a lasting slowdown
+        # doesn't pin concurrency at the floor forever
+        self._baseline_p95 = p95 if self._baseline_p95 is None else min(p95, self._baseline_p95 * 1.1)
+
+    def _decrease(self, now: float, reason: str) -> None:
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self._last_decrease_at = now
+        self._latencies = []
+        self._window_errors = 0
+        logger.warning(f"Concurrency for '{self.name}' cut to {self.limit} ({reason})")
+
+    def permit(self, estimated_tokens: int = 0) -> "LLMPermit":
+        """Context manager (sync or async) holding one permit for an LLM call."""
+        return LLMPermit(self, estimated_tokens)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current state for metrics endpoints and logs."""
+        with self._cond:
+            return {
+                "name": self.name,
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "tokens_available": int(self._tokens) if self.tokens_per_minute else None,
+                "tokens_per_minute": self.tokens_per_minute,
+                "baseline_p95_seconds": self._baseline_p95,
+            }
+
+
+class LLMPermit:
+    """
+    One held permit on an AdaptiveConcurrencyLimiter.
+
+    With a rate_limiter, entering the block first takes one request from
+    that bucket (requests per minute), then waits for a concurrency slot.
+
+    Exceptions raised inside the block are classified automatically (429s and
+    timeouts cut the limit). Raw HTTP callers that don't raise on error status
+    report it with record_status(), and callers that give up on a reply
+    without raising report record_outcome(OUTCOME_ERROR). A permit without
+    a limiter is a no-op.
+    """
+
+    def __init__(
+        self,
+        limiter: AdaptiveConcurrencyLimiter | None,
+        estimated_tokens: int = 0,
+        rate_limiter: RateLimiter | None = None,
+    ):
+        self._limiter = limiter
+        self._rate_limiter = rate_limiter
+        self._estimated_tokens = estimated_tokens
+        self._actual_tokens: int | None = None
+        self._status_outcome = OUTCOME_OK
+        self._started_at = 0.0
+        self._handle: Any | None = None
+
+    def record_usage(self, tokens: int) -> None:
+        """Report the tokens the provider actually counted for this call."""
+        self._actual_tokens = tokens
+
+    def record_status(self, status_code: int) -> None:
+        """Report the HTTP status of a raw API call."""
+        if isinstance(status_code, int):
+            self._status_outcome = classify_status_code(status_code)
+
+    def record_outcome(self, outcome: str) -> None:
+        """Report the outcome of a call that returned without raising (e.g. an abandoned stream)."""
+        self._status_outcome = outcome
+
+    def _release_kwargs(self, exc: BaseException | None) -> dict[str, Any]:
+        return {
+            "started_at": self._started_at,
+            "outcome": classify_llm_exception(exc) if exc is not None else self._status_outcome,
+            "estimated_tokens": self._estimated_tokens,
+            "actual_tokens": self._actual_tokens,
+            "handle": self._handle,
+        }
+
+    def __enter__(self) -> "LLMPermit":
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire_sync()
+        if self._limiter is not None:
+            self._handle = self._limiter.acquire(self._estimated_tokens)
+        self._started_at = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._limiter is not None:
+            self._limiter.release(**self._release_kwargs(exc_val))
+
+    async def __aenter__(self) -> "LLMPermit":
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        if self._limiter is not None:
+            self._handle = await self._limiter.acquire_async(self._estimated_tokens)
+        self._started_at = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._limiter is not None:
+            await self._limiter.release_async(**self._release_kwargs(exc_val))
+
+
+_llm_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+_llm_limiters_lock = threading.Lock()
+
+
+def _llm_limiter_settings() -> Any | None:
+    try:
+        from app.config import get_settings
+
+        return get_settings()
+    except Exception as e:
+        # Settings can be incomplete in scripts and unit tests; fall back to defaults
+        logger.debug(f"LLM limiter settings unavailable, using defaults: {e}")
+        return None
+
+
+def get_llm_limiter(provider: str, model: str) -> AdaptiveConcurrencyLimiter | None:
+    """
+    Get the process-wide limiter for a provider/model (None if adaptive concurrency is off).
+
+    TPM budgets come from LLM_TPM_BUDGETS, keyed "provider:model" or just "provider".
+    """
+    key = f"{provider}:{model}"
+    limiter = _llm_limiters.get(key)
+    if limiter is not None:
+        return limiter
+
+    settings = _llm_limiter_settings()
+    if settings is not None and not settings.LLM_ADAPTIVE_CONCURRENCY:
+        return None
+
+    with _llm_limiters_lock:
+        if key not in _llm_limiters:
+            kwargs: dict[str, Any] = {}
+            if settings is not None:
+                budgets = settings.LLM_TPM_BUDGETS
+                kwargs = {
+                    "initial_limit": settings.LLM_CONCURRENCY_INITIAL,
+                    "min_limit": settings.LLM_CONCURRENCY_MIN,
+                    "max_limit": settings.LLM_CONCURRENCY_MAX,
+                    "tokens_per_minute": budgets.get(key) or budgets.get(provider),
+                }
+                if settings.LLM_CONCURRENCY_DB_COORDINATION:
+                    kwargs["coordinator"] = PostgresAdvisoryCoordinator(coordinator_engine())
+            _llm_limiters[key] = AdaptiveConcurrencyLimiter(name=key, **kwargs)
+        return _llm_limiters[key]
+
+
+def get_llm_rate_limiter(provider: str, model: str) -> RateLimiter | None:
+    """
+    Get the process-wide requests-per-minute bucket for a provider/model (None if unbudgeted).
+
+    Budgets come from LLM_RPM_BUDGETS, keyed "provider:model" or just
+    "provider". The bucket allows bursts of about one second's requests.
+    """
+    key = f"{provider}:{model}"
+    if key in _llm_rate_budgets:
+        rpm = _llm_rate_budgets[key]
+    else:
+        settings = _llm_limiter_settings()
+        budgets = settings.LLM_RPM_BUDGETS if settings is not None else {}
+        rpm = budgets.get(key) or budgets.get(provider)
+        _llm_rate_budgets[key] = rpm
+    if not rpm:
+        return None
+    return get_rate_limiter(f"llm:{key}", rpm / 60.0, max(1, math.ceil(rpm / 60.0)))
+
+
+def llm_permit(provider: str, model: str, estimated_tokens: int = 0) -> LLMPermit:
+    """
+    Permit for one LLM call against the shared provider/model limiters.
+
+    Takes one request from the provider/model's requests-per-minute bucket
+    (if budgeted), then holds an adaptive concurrency slot for the call.
+
+    Usage:
+        with llm_permit("openai", model, estimate_tokens(prompt)) as permit:
+            response = client.chat.completions.create(...)
+
+        async with llm_permit("anthropic", model) as permit:
+            response = await client.post(...)
+            permit.record_status(response.status_code)
+    """
+    return LLMPermit(get_llm_limiter(provider, model), estimated_tokens, get_llm_rate_limiter(provider, model))
+
+
+def llm_limiter_snapshots() -> list[dict[str, Any]]:
+    """State of every limiter created in this process."""
+    return [limiter.snapshot() for limiter in list(_llm_limiters.values())]
+
+
+def reset_llm_limiters() -> None:
+    """Drop all limiters (tests, or after changing settings)."""
+    with _llm_limiters_lock:
+        _llm_limiters.clear()
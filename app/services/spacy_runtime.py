@@ -0,0 +1,187 @@
+# app/services/spacy_runtime.py
+"""
+Process-wide spaCy runtime shared by NTRL-SCAN and NTRL-FIX.
+
+StructuralDetector (parser only) and RedLineValidator (parser + NER) used
+to load their own copy of the same model and parse the same article body
+once each. SpacyRuntime loads the model once with every pipe and lets each
+caller disable the pipes it does not need per call.
+
+Parsed Docs are kept in a bounded LRU cache keyed by a hash of the text.
+A Doc parsed with a pipe disabled is completed in place by running only
+the missing pipes when a later caller needs them (e.g. NER for the
+validator after the structural scan), so a full NTRLPipeline.process
+tokenizes, tags and parses each distinct text exactly once.
+
+Cached Docs are shared between callers and must be treated as read-only.
+"""
+
+import hashlib
+import logging
+import subprocess
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from functools import cache
+
+import spacy
+from spacy.language import Language
+from spacy.tokens import Doc
+
+logger = logging.getLogger(__name__)
+
+ALLOWED_SPACY_MODELS = {"en_core_web_sm", "en_core_web_md", "en_core_web_lg"}
+
+# Parsed Docs kept per runtime
+DEFAULT_DOC_CACHE_SIZE = 256
+
+# nlp.pipe defaults for parse_many
+DEFAULT_PIPE_BATCH_SIZE = 16
+
+
+def load_spacy_model(model_name: str = "en_core_web_sm") -> Language:
+    """Load an allowlisted spaCy model, downloading it on first use (~2-3s)."""
+    if model_name not in ALLOWED_SPACY_MODELS:
+        raise ValueError(f"Model '{model_name}' not in allowlist: {ALLOWED_SPACY_MODELS}")
+    try:
+        return spacy.load(model_name)
+    except OSError:
+        subprocess.run(["python", "-m", "spacy", "download", model_name], check=True)
+        return spacy.load(model_name)
+
+
+def _text_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class SpacyRuntime:
+    """
+    One loaded spaCy pipeline plus an LRU cache of parsed Docs.
+
+    Usage:
+        runtime = get_spacy_runtime()
+        doc = runtime.parse(text, disable=("ner",))  # parser only
+        doc = runtime.parse(text)  # same Doc, NER added
+        docs = runtime.parse_many(texts, disable=("ner",), batch_size=32)
+    """
+
+    def __init__(self, nlp: Language, cache_size: int = DEFAULT_DOC_CACHE_SIZE):
+        self.nlp = nlp
+        self.cache_size = cache_size
+        # text hash -> (Doc, names of the pipes that have run on it)
+        self._docs: OrderedDict[str, tuple[Doc, set[str]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, text: str, disable: Iterable[str] = ()) -> Doc:
+        """
+        Doc for text with at least every pipe not in disable applied.
+
+        A cached Doc may carry more annotations than requested.
+        """
+        disabled = set(disable)
+        wanted = self._wanted(disabled)
+        key = _text_key(text)
+
+        doc = self._lookup(key, wanted)
+        if doc is not None:
+            return doc
+
+        doc = self.nlp(text, disable=list(disabled))
+        self._store(key, doc, wanted)
+        return doc
+
+    def parse_many(
+        self,
+        texts: Sequence[str],
+        disable: Iterable[str] = (),
+        batch_size: int = DEFAULT_PIPE_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> list[Doc]:
+        """
+        Docs for texts, in order, parsing the uncached ones with nlp.pipe.
+
+        nlp.pipe batches the tokenizer and every pipe over batch_size texts
+        at a time, which is several times faster per document than calling
+        nlp(text) in a loop; n_process > 1 parses in worker processes. The
+        Docs are cached like parse() results, so a later parse() of the
+        same text is a cache hit.
+        """
+        disabled = set(disable)
+        wanted = self._wanted(disabled)
+        keys = [_text_key(text) for text in texts]
+
+        docs: list[Doc | None] = [self._lookup(key, wanted) for key in keys]
+        # Duplicate texts in one call are parsed once
+        pending: dict[str, int] = {}
+        for i, doc in enumerate(docs):
+            if doc is None and keys[i] not in pending:
+                pending[keys[i]] = i
+
+        if pending:
+            parsed = self.nlp.pipe(
+                (texts[i] for i in pending.values()),
+                disable=list(disabled),
+                batch_size=batch_size,
+                n_process=n_process,
+            )
+            for key, doc in zip(pending, parsed):
+                self._store(key, doc, wanted)
+                docs[pending[key]] = doc
+
+        for i, doc in enumerate(docs):
+            if doc is None:
+                docs[i] = docs[pending[keys[i]]]
+        return docs
+
+    def _wanted(self, disabled: set[str]) -> list[str]:
+        return [name for name in self.nlp.pipe_names if name not in disabled]
+
+    def _lookup(self, key: str, wanted: list[str]) -> Doc | None:
+        """Cached Doc for key completed with the wanted pipes, or None."""
+        with self._lock:
+            cached = self._docs.get(key)
+            if cached is None:
+                return None
+            self._docs.move_to_end(key)
+            doc, applied = cached
+            missing = [name for name in wanted if name not in applied]
+            # Completing a shared Doc is serialized with other parses of it
+            try:
+                for name in missing:
+                    doc = self.nlp.get_pipe(name)(doc)
+                    applied.add(name)
+            except Exception as e:
+                # E.g. a pipe that listens to an upstream tok2vec cannot run on its own
+                logger.debug(f"Could not complete cached Doc with {missing}, reparsing: {e}")
+                del self._docs[key]
+                return None
+            self.hits += 1
+            return doc
+
+    def _store(self, key: str, doc: Doc, wanted: list[str]) -> None:
+        with self._lock:
+            self.misses += 1
+            # Another thread may have parsed the same text meanwhile; either Doc is valid
+            self._docs[key] = (doc, set(wanted))
+            self._docs.move_to_end(key)
+            while len(self._docs) > self.cache_size:
+                self._docs.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached Doc."""
+        with self._lock:
+            self._docs.clear()
+
+    @property
+    def cached_docs(self) -> int:
+        return len(self._docs)
+
+
+@cache
+def get_spacy_runtime(model_name: str = "en_core_web_sm") -> SpacyRuntime:
+    """Get the process-wide runtime for model_name, loading the model on first call."""
+    runtime = SpacyRuntime(load_spacy_model(model_name))
+    logger.info(f"Loaded spaCy model {model_name} (pipes: {', '.join(runtime.nlp.pipe_names)})")
+    return runtime
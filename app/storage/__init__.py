@@ -4,6 +4,8 @@ Storage provider abstraction for raw article content.
 
 Raw article bodies are stored in object storage (S3), not Postgres.
 This module provides a clean interface for upload/download operations.
+S3StorageProvider is imported on first access so that boto3 is only loaded
+by processes that use S3.
 """
 
 from app.storage.base import (
@@ -19,7 +21,6 @@ from app.storage.factory import (
     set_storage_provider,
 )
 from app.storage.local_provider import LocalStorageProvider
-from app.storage.s3_provider import S3StorageProvider
 
 __all__ = [
     "StorageProvider",
@@ -33,3 +34,11 @@ __all__ = [
     "set_storage_provider",
     "reset_storage_provider",
 ]
+
+
+def __getattr__(name: str):
+    if name == "S3StorageProvider":
+        from app.storage.s3_provider import S3StorageProvider
+
+        return S3StorageProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
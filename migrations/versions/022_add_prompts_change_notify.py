@@ -0,0 +1,44 @@
+"""Notify listeners when the prompts table changes
+
+Revision ID: 022_prompts_notify
+Revises: 021_add_api_cats
+Create Date: 2026-10-18
+
+Adds a statement-level trigger that sends NOTIFY prompts_changed whenever
+rows in prompts are inserted, updated, deleted or truncated. Every worker's
+prompt registry (app/services/prompt_registry.py) LISTENs on this channel
+and reloads its prompt snapshot after the change commits, whichever
+process or tool made it.
+"""
+
+from alembic import op
+
+revision: str = "022_prompts_notify"
+down_revision: str = "021_add_api_cats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_prompts_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('prompts_changed', '');
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER prompts_changed_notify
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON prompts
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_prompts_changed()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS prompts_changed_notify ON prompts")
+    op.execute("DROP FUNCTION IF EXISTS notify_prompts_changed()")
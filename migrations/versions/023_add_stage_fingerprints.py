@@ -0,0 +1,31 @@
+"""Add stage_fingerprints column to stories_neutralized table
+
+Revision ID: 023_stage_fingerprints
+Revises: 022_prompts_notify
+Create Date: 2026-10-18
+
+Records, per neutralized version, a fingerprint of the prompts, models and
+body each generation stage (detail_full, detail_brief, feed_outputs) ran
+with. A forced re-neutralization reuses the outputs of stages whose
+fingerprint has not changed instead of calling the LLM again.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision: str = "023_stage_fingerprints"
+down_revision: str = "022_prompts_notify"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "stories_neutralized",
+        sa.Column("stage_fingerprints", JSONB, nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("stories_neutralized", "stage_fingerprints")
@@ -0,0 +1,33 @@
+"""Add rate_limit_buckets table
+
+Revision ID: 024_rate_limit_buckets
+Revises: 023_stage_fingerprints
+Create Date: 2026-10-19
+
+Holds the token buckets shared across processes when
+RATE_LIMIT_DB_COORDINATION is on: one row per limiter name (e.g.
+"llm:openai:gpt-4o-mini", "ntrl_batcher") with its remaining tokens and
+the time they were last refilled (see PostgresRateBucketCoordinator in
+app/services/resilience.py).
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "024_rate_limit_buckets"
+down_revision: str = "023_stage_fingerprints"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("key", sa.String(255), primary_key=True),
+        sa.Column("tokens", sa.Float(precision=53), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rate_limit_buckets")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Import-Time Benchmark
+
+Measures cold-start cost of the neutralizer in fresh interpreters:
+1. app.services.neutralizer alone (prompts, span utilities, service)
+2. plus the mock provider (tests, offline tools)
+3. plus one LLM provider and its SDK (what a worker calling that provider pays)
+4. every provider and every SDK (what importing the package used to cost)
+
+Each scenario runs in a new subprocess so nothing is cached in sys.modules.
+Reports median wall time, modules loaded and peak RSS.
+
+Usage:
+    python scripts/bench_import_time.py
+    python scripts/bench_import_time.py --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).parent.parent
+
+PROVIDER_SDKS = {
+    "openai": "openai",
+    "gemini": "google.generativeai",
+    "anthropic": "anthropic",
+}
+
+# Runs inside the subprocess; {setup} is replaced with the scenario's imports
+PROBE = """
+import importlib, json, resource, sys, time
+started = time.perf_counter()
+{setup}
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": elapsed,
+    "modules": len(sys.modules),
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}}))
+"""
+
+
+def provider_setup(provider_name: str) -> str:
+    """Imports for loading one provider and the SDK it calls."""
+    lines = [
+        "import app.services.neutralizer",
+        "from app.services.neutralizer.providers import load_provider_class",
+        f"load_provider_class({provider_name!r})",
+    ]
+    if provider_name in PROVIDER_SDKS:
+        lines.append(f"importlib.import_module({PROVIDER_SDKS[provider_name]!r})")
+    return "\n".join(lines)
+
+
+def scenarios() -> dict[str, str]:
+    all_providers = [
+        "import app.services.neutralizer",
+        "from app.services.neutralizer.providers import PROVIDERS, load_provider_class",
+        "for name in PROVIDERS: load_provider_class(name)",
+    ]
+    for sdk in PROVIDER_SDKS.values():
+        all_providers.append(f"try: importlib.import_module({sdk!r})\nexcept ImportError: pass")
+    return {
+        "neutralizer": "import app.services.neutralizer",
+        "+ mock provider": provider_setup("mock"),
+        "+ openai provider": provider_setup("openai"),
+        "+ gemini provider": provider_setup("gemini"),
+        "+ anthropic provider": provider_setup("anthropic"),
+        "all providers + SDKs": "\n".join(all_providers),
+    }
+
+
+def run_probe(setup: str) -> dict | None:
+    """Run one scenario in a fresh interpreter; None if an import is missing."""
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_DIR)}
+    env.setdefault("DATABASE_URL", "sqlite:///:memory:")
+    proc = subprocess.run(
+        [sys.executable, "-c", PROBE.format(setup=setup)],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_DIR,
+        env=env,
+    )
+    if proc.returncode != 0:
+        return None
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark neutralizer import time in fresh interpreters")
+    parser.add_argument("--runs", "-n", type=int, default=5, help="Subprocess runs per scenario (median is reported)")
+    args = parser.parse_args()
+
+    # Warm the bytecode cache so the first scenario does not pay compilation
+    run_probe("import app.services.neutralizer")
+
+    print(f"{'scenario':<24} {'median ms':>10} {'modules':>8} {'peak RSS MB':>12}")
+    for label, setup in scenarios().items():
+        results = [run_probe(setup) for _ in range(args.runs)]
+        if any(r is None for r in results):
+            print(f"{label:<24} {'skipped (import failed)':>32}")
+            continue
+        ms = statistics.median(r["seconds"] for r in results) * 1000
+        modules = results[-1]["modules"]
+        rss = statistics.median(r["rss_mb"] for r in results)
+        print(f"{label:<24} {ms:10.1f} {modules:8d} {rss:12.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
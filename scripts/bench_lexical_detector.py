@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Lexical Detector Microbenchmark
+
+Times LexicalDetector on the test corpus (title + body per article):
+1. Per-pattern scans: re.finditer for every taxonomy pattern, as the
+   detector did before the single-automaton engine (reference below)
+2. PatternEngine.find_all: one pass over the text for all patterns
+3. LexicalDetector.detect end to end (quote skipping, span building)
+
+Engine and reference matches are compared and any mismatch fails the run,
+as does an article whose title + body detection exceeds the budget
+(default 20 ms, the figure documented in lexical_detector.py).
+
+Usage:
+    python scripts/bench_lexical_detector.py
+    python scripts/bench_lexical_detector.py --repeat 5 --budget-ms 20
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.ntrl_scan.lexical_detector import LexicalDetector  # noqa: E402
+from app.services.ntrl_scan.types import ArticleSegment  # noqa: E402
+
+# Paths
+TEST_CORPUS_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "test_corpus"
+
+
+def load_articles() -> list[tuple[str, str]]:
+    """Return (title, body) per corpus article."""
+    articles = []
+    for path in sorted(TEST_CORPUS_DIR.glob("*.json")):
+        article = json.loads(path.read_text())
+        articles.append((article["original_title"], article["original_body"]))
+    return articles
+
+
+def finditer_reference(patterns: list[str], text: str) -> list[list[tuple[int, int]]]:
+    """Spans of every pattern, one re.finditer scan per pattern."""
+    return [[m.span() for m in re.finditer(pattern, text, re.IGNORECASE)] for pattern in patterns]
+
+
+def time_best(fn, repeat: int) -> float:
+    """Best wall time of `repeat` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark lexical detection on the test corpus")
+    parser.add_argument("--repeat", "-r", type=int, default=3, help="Runs per measurement (best is reported)")
+    parser.add_argument("--budget-ms", type=float, default=20.0, help="Max title + body detection time per article")
+    args = parser.parse_args()
+
+    articles = load_articles()
+    if not articles:
+        print("No test corpus articles found")
+        return 1
+    detector = LexicalDetector()
+    patterns = [pattern for _, pattern in detector._pattern_list]
+    texts = [text for article in articles for text in article]
+    print(f"{len(articles)} articles, {sum(len(t) for t in texts)} chars, {len(patterns)} patterns\n")
+
+    mismatches = sum(detector._engine.find_all(text) != finditer_reference(patterns, text) for text in texts)
+
+    def run_reference():
+        for text in texts:
+            finditer_reference(patterns, text)
+
+    def run_engine():
+        for text in texts:
+            detector._engine.find_all(text)
+
+    def detect_article(title: str, body: str) -> None:
+        detector.detect(title, ArticleSegment.TITLE)
+        detector.detect(body, ArticleSegment.BODY)
+
+    def run_detect():
+        for article in articles:
+            detect_article(*article)
+
+    reference_ms = time_best(run_reference, args.repeat)
+    engine_ms = time_best(run_engine, args.repeat)
+    detect_ms = time_best(run_detect, args.repeat)
+
+    slowest = max(time_best(lambda article=article: detect_article(*article), args.repeat) for article in articles)
+
+    print(f"Per-pattern finditer  {reference_ms:9.1f} ms")
+    print(f"PatternEngine         {engine_ms:9.1f} ms   ({reference_ms / max(engine_ms, 1e-9):.1f}x)")
+    print(f"LexicalDetector       {detect_ms:9.1f} ms   (all articles, title + body)")
+    print(f"\nSlowest article: {slowest:.2f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"Mismatches vs reference: {mismatches}/{len(texts)} texts")
+    return 1 if mismatches or slowest > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Phrase Locator Microbenchmark
+
+Times span position matching on the gold standard corpus:
+1. Tier 4 fuzzy matching: unindexed reference (re-tokenize + SequenceMatcher
+   on every window, per phrase) vs BodyIndex (tokenize once, bound-pruned)
+2. find_phrase_positions end to end on the same phrases
+
+Phrases per article are the gold span texts as-is (tier 1), upper-cased
+(tier 2), with letters dropped/inflected (tier 4) and shuffled body words
+(mostly misses, the worst case for tier 4). Indexed and reference results
+are compared and any mismatch fails the run.
+
+Usage:
+    python scripts/bench_phrase_locator.py
+    python scripts/bench_phrase_locator.py --repeat 5 --variants 4
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.neutralizer import find_phrase_positions  # noqa: E402
+from app.services.neutralizer.phrase_locator import BodyIndex, fuzzy_find_reference  # noqa: E402
+
+# Paths
+FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures"
+TEST_CORPUS_DIR = FIXTURES_DIR / "test_corpus"
+GOLD_STANDARD_DIR = FIXTURES_DIR / "gold_standard"
+
+
+def perturb(phrase: str, rng: random.Random) -> str:
+    """Drop letters and inflect words the way LLM paraphrases drift."""
+    words = []
+    for word in phrase.split():
+        roll = rng.random()
+        if roll < 0.25 and len(word) > 3:
+            cut = rng.randrange(len(word))
+            word = word[:cut] + word[cut + 1 :]
+        elif roll < 0.4:
+            word += "s"
+        words.append(word)
+    return " ".join(words)
+
+
+def load_cases(variants: int, seed: int) -> list[tuple[str, list[str]]]:
+    """Return (body, phrases) per gold standard article."""
+    rng = random.Random(seed)
+    cases = []
+    for spans_path in sorted(GOLD_STANDARD_DIR.glob("article_*_spans.json")):
+        gold = json.loads(spans_path.read_text())
+        corpus_path = TEST_CORPUS_DIR / f"article_{gold['article_id']}.json"
+        if not corpus_path.exists():
+            continue
+        body = json.loads(corpus_path.read_text())["original_body"]
+        words = body.split()
+        phrases = []
+        for span in gold["expected_spans"]:
+            phrases.append(span["text"])
+            phrases.append(span["text"].upper())
+            phrases.extend(perturb(span["text"], rng) for _ in range(variants))
+        for _ in range(variants * 2):
+            phrases.append(" ".join(rng.choice(words) for _ in range(rng.randint(3, 7))))
+        cases.append((body, phrases))
+    return cases
+
+
+def time_best(fn, repeat: int) -> float:
+    """Best wall time of `repeat` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark span phrase location on the gold standard corpus")
+    parser.add_argument("--repeat", "-r", type=int, default=3, help="Runs per measurement (best is reported)")
+    parser.add_argument("--variants", "-v", type=int, default=2, help="Perturbed copies per gold phrase")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for phrase perturbation")
+    args = parser.parse_args()
+
+    cases = load_cases(args.variants, args.seed)
+    if not cases:
+        print("No gold standard articles found")
+        return 1
+    total_phrases = sum(len(phrases) for _, phrases in cases)
+    total_words = sum(len(body.split()) for body, _ in cases)
+    print(f"{len(cases)} articles, {total_words} body words, {total_phrases} phrases\n")
+
+    reference = [[fuzzy_find_reference(p, body) for p in phrases] for body, phrases in cases]
+    indexed = [[BodyIndex(body).fuzzy_find(p) for p in phrases] for body, phrases in cases]
+    mismatches = sum(r != i for ref_row, idx_row in zip(reference, indexed) for r, i in zip(ref_row, idx_row))
+    matched = sum(r is not None for row in reference for r in row)
+
+    def run_reference():
+        for body, phrases in cases:
+            for phrase in phrases:
+                fuzzy_find_reference(phrase, body)
+
+    def run_indexed():
+        for body, phrases in cases:
+            index = BodyIndex(body)
+            for phrase in phrases:
+                index.fuzzy_find(phrase)
+
+    def run_find_phrase_positions():
+        for body, phrases in cases:
+            find_phrase_positions(body, [{"phrase": p, "reason": "emotional_trigger"} for p in phrases])
+
+    reference_ms = time_best(run_reference, args.repeat)
+    indexed_ms = time_best(run_indexed, args.repeat)
+    end_to_end_ms = time_best(run_find_phrase_positions, args.repeat)
+
+    print(f"Tier 4 reference      {reference_ms:9.1f} ms")
+    print(f"Tier 4 BodyIndex      {indexed_ms:9.1f} ms   ({reference_ms / max(indexed_ms, 1e-9):.1f}x)")
+    print(f"find_phrase_positions {end_to_end_ms:9.1f} ms   (all tiers)")
+    print(f"\nFuzzy matches: {matched}/{total_phrases}, mismatches vs reference: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
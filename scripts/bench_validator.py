@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Red-Line Validator Microbenchmark
+
+Times the validator's eight string checks (numbers, attributions, modality,
+causality, risk, quotes, scope, negation) on the test corpus:
+1. Per-check scans: each check scanning both texts itself, as the
+   validator did before single-pass extraction (reference below)
+2. Feature extraction: FeatureExtractor.extract on both texts, once
+3. Each check comparing the extracted TextFeatures
+
+Rewrites per article are the body itself, the body with sentences dropped
+and the body with negations, hedges and quantifiers edited, so every check
+sees passes and failures. Reference and feature verdicts are compared and
+any mismatch fails the run. Entity and date checks need the spaCy model
+and are not timed here.
+
+Usage:
+    python scripts/bench_validator.py
+    python scripts/bench_validator.py --repeat 5
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.ntrl_fix import RedLineValidator  # noqa: E402
+from app.services.ntrl_fix.validator_features import ATTRIBUTION_PATTERN, QUOTE_PATTERN  # noqa: E402
+
+# Paths
+TEST_CORPUS_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "test_corpus"
+
+CHECKS = ["numbers", "attributions", "modality", "causality", "risk", "quotes", "scope", "negation"]
+
+EDITS = [("not ", ""), ("may ", "will "), ("allegedly ", "definitely "), ("all ", "some "), ("because", "and")]
+
+
+def load_pairs() -> list[tuple[str, str]]:
+    """Return (original, rewritten) pairs per corpus article."""
+    pairs = []
+    for path in sorted(TEST_CORPUS_DIR.glob("article_*.json")):
+        body = json.loads(path.read_text())["original_body"]
+        sentences = re.split(r"(?<=[.!?])\s+", body)
+        edited = body
+        for old, new in EDITS:
+            edited = edited.replace(old, new)
+        # Spell out a numeral so the number check sees number words change
+        edited = re.sub(r"\b1\b", "one", edited, count=1)
+        pairs.append((body, body))
+        pairs.append((body, " ".join(sentences[::2])))
+        pairs.append((body, edited))
+    return pairs
+
+
+# -----------------------------------------------------------------------------
+# Reference: every check scanning both texts (verdicts only)
+# -----------------------------------------------------------------------------
+
+# The number check's pattern before number words moved to the tokens
+REFERENCE_NUMBER_PATTERN = r"""
+    (?:
+        \$?\d{1,3}(?:,\d{3})*(?:\.\d+)?%?  |  # Currency/percentage
+        \d+(?:\.\d+)?%?                    |  # Simple numbers
+        \d+(?:st|nd|rd|th)                 |  # Ordinals
+        \b(?:one|two|three|four|five|six|seven|eight|nine|ten|
+           eleven|twelve|hundred|thousand|million|billion)\b
+    )
+"""
+
+
+def reference_check(name: str, original: str, rewritten: str) -> bool:
+    """Whether the check finds a problem, scanning the texts directly."""
+    v = RedLineValidator
+    lower, rewritten_lower = original.lower(), rewritten.lower()
+    if name == "numbers":
+        found = [
+            {n.lower().replace(",", "") for n in re.findall(REFERENCE_NUMBER_PATTERN, t, re.VERBOSE | re.IGNORECASE)}
+            for t in (original, rewritten)
+        ]
+        return bool(found[0] - found[1])
+    if name == "attributions":
+        found = [
+            {a.lower().strip() for a in ATTRIBUTION_PATTERN.findall(t) if a.strip()} for t in (original, rewritten)
+        ]
+        return bool(found[0] - found[1])
+    if name == "modality":
+        return any(
+            soft in lower and hard in rewritten_lower and hard not in lower
+            for soft in v.SOFT_MODALS
+            for hard in v.HARD_MODALS
+        )
+    if name == "causality":
+        return any(w in lower and w not in rewritten_lower for w in v.CAUSAL_WORDS)
+    if name == "risk":
+        return any(r in lower and r not in rewritten_lower for r in v.RISK_INDICATORS)
+    if name == "quotes":
+        for match in QUOTE_PATTERN.finditer(original):
+            quote = match.group(1) or match.group(2) or match.group(3)
+            if quote and len(quote) > 10 and quote.strip() not in rewritten:
+                return True
+        return False
+    if name == "scope":
+        return any(0 < lower.count(w) > rewritten_lower.count(w) for w in v.SCOPE_WORDS)
+    if name == "negation":
+        return any(
+            len(re.findall(r"\b" + w + r"\b", lower)) > len(re.findall(r"\b" + w + r"\b", rewritten_lower))
+            for w in v.NEGATION_WORDS
+        )
+    raise ValueError(name)
+
+
+def time_best(fn, repeat: int) -> float:
+    """Best wall time of `repeat` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Red-Line Validator string checks on the test corpus")
+    parser.add_argument("--repeat", "-r", type=int, default=5, help="Runs per measurement (best is reported)")
+    args = parser.parse_args()
+
+    pairs = load_pairs()
+    if not pairs:
+        print("No test corpus articles found")
+        return 1
+    validator = RedLineValidator()
+    extractor = validator.extractor
+    print(f"{len(pairs)} original/rewrite pairs, {sum(len(o) + len(r) for o, r in pairs)} characters\n")
+
+    features = [(extractor.extract(o), extractor.extract(r)) for o, r in pairs]
+    mismatches = 0
+    for (original, rewritten), (of, rf) in zip(pairs, features):
+        for name in CHECKS:
+            failed = getattr(validator, f"_check_{name}")(of, rf).status.value != "passed"
+            mismatches += failed != reference_check(name, original, rewritten)
+
+    def run_extraction():
+        for original, rewritten in pairs:
+            extractor.extract(original)
+            extractor.extract(rewritten)
+
+    extraction_ms = time_best(run_extraction, args.repeat)
+    reference_total = 0.0
+    features_total = extraction_ms
+
+    print(f"{'check':<14}{'per-check scan':>16}{'on features':>14}")
+    for name in CHECKS:
+        check = getattr(validator, f"_check_{name}")
+
+        def run_reference(name=name):
+            for original, rewritten in pairs:
+                reference_check(name, original, rewritten)
+
+        def run_features(check=check):
+            for of, rf in features:
+                check(of, rf)
+
+        reference_ms = time_best(run_reference, args.repeat)
+        check_ms = time_best(run_features, args.repeat)
+        reference_total += reference_ms
+        features_total += check_ms
+        print(f"{name:<14}{reference_ms:13.2f} ms{check_ms:11.2f} ms")
+
+    print(f"{'extraction':<14}{'':>16}{extraction_ms:11.2f} ms")
+    print(
+        f"{'total':<14}{reference_total:13.2f} ms{features_total:11.2f} ms"
+        f"   ({reference_total / max(features_total, 1e-9):.1f}x)"
+    )
+    print(f"\nVerdict mismatches vs per-check scans: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
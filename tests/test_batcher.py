@@ -3,6 +3,9 @@
 Integration tests for the NTRL Batcher.
 """
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from app.services.ntrl_batcher import (
@@ -12,7 +15,7 @@ from app.services.ntrl_batcher import (
     process_articles,
 )
 from app.services.ntrl_fix import FixerConfig, GeneratorConfig
-from app.services.ntrl_pipeline import PipelineConfig
+from app.services.ntrl_pipeline import PipelineConfig, PipelineResult, ProcessingMode
 from app.services.ntrl_scan import ScannerConfig
 
 
@@ -196,3 +199,98 @@ class TestCleanup:
         await mock_batcher.close()
         # Should be able to call close multiple times
         await mock_batcher.close()
+
+
+class TestStructuralMicroBatching:
+    """Tests for background-mode structural prefetch."""
+
+    class RecordingRuntime:
+        def __init__(self):
+            self.calls = []
+
+        def parse_many(self, texts, disable, batch_size, n_process):
+            self.calls.append((list(texts), set(disable), batch_size, n_process))
+            return []
+
+    class RecordingStructural:
+        DISABLED_PIPES = ("ner",)
+
+        def __init__(self, runtime):
+            self.runtime = runtime
+
+        def detect_many(self, texts, segment, batch_size, n_process):
+            raise AssertionError("prefetch should parse without running the structural checks")
+
+    def _batcher(self, mode, micro_batch=4):
+        batcher = NTRLBatcher(
+            pipeline_config=PipelineConfig(mode=mode, scanner_config=ScannerConfig(enable_semantic=False)),
+            batch_config=BatchConfig(
+                max_concurrent=3, chunk_size=2, structural_micro_batch=micro_batch, nlp_batch_size=8, retry_delay=0
+            ),
+        )
+        runtime = self.RecordingRuntime()
+        batcher.pipeline.scanner._structural = self.RecordingStructural(runtime)
+        batcher.process_one = AsyncMock(return_value=MagicMock(spec=PipelineResult))
+        return batcher, runtime
+
+    @pytest.mark.asyncio
+    async def test_background_parses_micro_batches(self):
+        """Background batches should be parsed ahead in micro-batches."""
+        batcher, runtime = self._batcher(ProcessingMode.BACKGROUND)
+        articles = [make_article(f"bg-{i}") for i in range(6)]
+
+        result = await batcher.process_batch(articles)
+
+        assert result.successful == 6
+        assert [texts for texts, *_ in runtime.calls] == [
+            [text for a in articles[:4] for text in (a.body, a.title)],
+            [text for a in articles[4:] for text in (a.body, a.title)],
+        ]
+        assert all(call[1:] == ({"ner"}, 8, 1) for call in runtime.calls)
+
+    @pytest.mark.asyncio
+    async def test_realtime_does_not_prefetch(self):
+        """Realtime batches should parse per article as before."""
+        batcher, runtime = self._batcher(ProcessingMode.REALTIME)
+
+        await batcher.process_batch([make_article(f"rt-{i}") for i in range(6)])
+
+        assert runtime.calls == []
+
+
+class TestStreamingBatch:
+    """Tests for per-article streaming."""
+
+    def _batcher(self, delays, batch_timeout=5.0):
+        batcher = NTRLBatcher(batch_config=BatchConfig(max_concurrent=2, max_retries=0, batch_timeout=batch_timeout))
+
+        async def process_one(article, force=False, enable_semantic=None):
+            delay = delays[article.article_id]
+            if delay is None:
+                raise ValueError("generator failed")
+            await asyncio.sleep(delay)
+            return MagicMock(spec=PipelineResult)
+
+        batcher.process_one = process_one
+        return batcher
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self):
+        """Each article should arrive as soon as it completes."""
+        batcher = self._batcher({"slow": 0.2, "fast": 0.01, "broken": None})
+        articles = [make_article(article_id) for article_id in ("slow", "fast", "broken")]
+
+        outcomes = [outcome async for outcome in batcher.process_stream(articles)]
+
+        assert [o.article_id for o in outcomes] == ["fast", "broken", "slow"]  # "broken" waits for a free slot
+        assert outcomes[1].result is None and "generator failed" in outcomes[1].error
+        assert outcomes[0].result is not None and outcomes[0].error is None
+
+    @pytest.mark.asyncio
+    async def test_unfinished_articles_time_out(self):
+        """Articles still running at batch_timeout should be reported as timed out."""
+        batcher = self._batcher({"done": 0.01, "stuck": 10}, batch_timeout=0.2)
+
+        outcomes = [o async for o in batcher.process_stream([make_article("done"), make_article("stuck")])]
+
+        assert [(o.article_id, o.error) for o in outcomes] == [("done", None), ("stuck", "Timeout")]
@@ -3,17 +3,24 @@
 Unit tests for the NTRL-SCAN Lexical Detector.
 """
 
+import json
+import re
+from pathlib import Path
+
 import pytest
 
 from app.services.ntrl_scan.lexical_detector import (
     LexicalDetector,
     get_lexical_detector,
 )
+from app.services.ntrl_scan.pattern_engine import AhoCorasick, expand_literal_pattern, literal_prefixes
 from app.services.ntrl_scan.types import (
     ArticleSegment,
     SpanAction,
 )
 
+CORPUS_DIR = Path(__file__).parent / "fixtures" / "test_corpus"
+
 
 @pytest.fixture
 def detector():
@@ -243,3 +250,70 @@ class TestPerformance:
 
         assert result.text_length > 50000
         assert result.scan_duration_ms < 500  # Still reasonable
+
+
+def _corpus() -> list[dict]:
+    return [json.loads(path.read_text()) for path in sorted(CORPUS_DIR.glob("*.json"))]
+
+
+class TestPatternEngine:
+    """The single-pass engine must return exactly what per-pattern finditer does."""
+
+    @staticmethod
+    def _finditer_spans(detector, text):
+        return [[m.span() for m in re.finditer(pattern, text, re.IGNORECASE)] for _, pattern in detector._pattern_list]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "BREAKING!!! Senator SLAMS critics?!? You won't believe what happened next.",
+            "Real Americans and real americans; the real story. Experts say experts warn.",
+            "Slams slammed slam. He rips ripped rip. Is your home safe from this?",
+            "again and again and still and yet. No way. No how. No chance.",
+            'She said "it was a stunning betrayal" and \u201cshocking\u201d news broke.',
+            "Prices saw a 40% surge and a 12 % jump; put your family at risk.",
+            "Why did the plan fail? When will officials admit the truth?",
+            # Characters IGNORECASE folds onto ASCII letters take the per-pattern path
+            "\u212aNOCKOUT blow: the \u017fcience is settled, \u0130ndisputably.",
+        ],
+    )
+    def test_matches_finditer(self, detector, text):
+        assert detector._engine.find_all(text) == self._finditer_spans(detector, text)
+
+    def test_matches_finditer_on_corpus(self, detector):
+        for article in _corpus():
+            for text in (article["original_title"], article["original_body"]):
+                assert detector._engine.find_all(text) == self._finditer_spans(detector, text)
+
+    def test_most_patterns_are_literal(self, detector):
+        assert detector._engine.literal_count > detector.pattern_count // 2
+
+    def test_literal_expansion(self):
+        assert expand_literal_pattern(r"\bslams?\b") == (["slams", "slam"], True, True)
+        assert expand_literal_pattern("(the )?internet can'?t") == (
+            ["the internet can't", "the internet cant", "internet can't", "internet cant"],
+            False,
+            False,
+        )
+        assert expand_literal_pattern("put.{0,20}at risk") is None
+        assert literal_prefixes("put.{0,20}at risk") == ["put"]
+        assert literal_prefixes(r"(?-i:\b[A-Z]{4,}\b)") is None
+
+    def test_aho_corasick_reports_overlaps(self):
+        automaton = AhoCorasick(["he", "she", "hers"])
+
+        hits = automaton.find_all("ushers")
+
+        assert sorted(hits) == [(1, 1), (2, 0), (2, 2)]
+
+
+class TestQuoteLookup:
+    """Quote membership uses bisect over the sorted quote ranges."""
+
+    def test_inside_quote(self, detector):
+        ranges = [(0, 5), (10, 20), (30, 31)]
+
+        inside = [pos for pos in range(35) if detector._is_inside_quote(pos, ranges)]
+
+        assert inside == [0, 1, 2, 3, 4, *range(10, 20), 30]
+        assert not detector._is_inside_quote(3, [])
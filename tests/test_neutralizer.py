@@ -3,13 +3,67 @@
 Unit tests for neutralization service.
 """
 
+import json
+import os
+import subprocess
+import sys
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import models
+from app.logging_config import record_llm_usage
 from app.models import SpanAction, SpanReason
+from app.services.auditor import AuditVerdict
 from app.services.neutralizer import (
+    DEFAULT_SYNTHESIS_DETAIL_BRIEF_PROMPT,
     DetailFullResult,
     MockNeutralizerProvider,
+    NeutralizationResponseError,
     NeutralizationResult,
+    NeutralizerConfigError,
+    NeutralizerService,
+    PreviousStageOutputs,
     TransparencySpan,
+    apply_spans_to_text,
+    build_anthropic_cached_request,
+    build_fused_brief_feed_prompt,
+    compute_stage_fingerprints,
+    detail_full_chunk_bounds,
+    finish_fused_brief_feed,
+    get_neutralizer_provider,
+    group_syndicated_stories,
+    neutralize_detail_full_chunked,
+    parse_fused_brief_feed_response,
+    reconstruct_detail_full,
+    split_cacheable_prefix,
 )
+from app.services.neutralizer.batch import (
+    AnthropicBatchExecutor,
+    BatchRequest,
+    LocalBatchExecutor,
+    OpenAIBatchExecutor,
+    get_batch_executor,
+    make_custom_id,
+    parse_custom_id,
+    run_batch_neutralization,
+)
+from app.services.neutralizer.chunking import ArticleChunker
+
+
+def make_story_data(body: str, title: str = "Senate passes budget", **fields) -> dict:
+    """A story dict shaped like NeutralizerService._prepare_story_data output."""
+    return {
+        "story_id": uuid.uuid4(),
+        "title": title,
+        "description": None,
+        "body": body,
+        "feed_category": "us",
+        "content_hash": None,
+        **fields,
+    }
 
 
 class TestMockNeutralizerProvider:
@@ -249,3 +303,1062 @@ class TestDetailFullNeutralization:
             assert s1.start_char == s2.start_char
             assert s1.end_char == s2.end_char
             assert s1.original_text == s2.original_text
+
+
+class TestChunkedDetailFull:
+    """Tests for chunked Call 1 on long bodies (DETAIL_FULL_CHUNKING)."""
+
+    PARAGRAPH = (
+        "BREAKING: The senator slams critics over the budget in a furious speech. "
+        "Officials said the plan would change hospital funding across the state. "
+        "The vote is expected next week after committee hearings conclude. "
+    )
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.provider = MockNeutralizerProvider()
+        self.body = "\n\n".join(f"Section {i}. {self.PARAGRAPH * 3}" for i in range(12))
+        self.chunker = ArticleChunker(chunk_size=1500, overlap_size=0)
+
+    def test_bounds_cover_body_at_paragraph_breaks(self):
+        bounds = detail_full_chunk_bounds(self.body, self.chunker)
+
+        assert len(bounds) > 2
+        assert bounds[0][0] == 0 and bounds[-1][1] == len(self.body)
+        assert all(prev[1] == cur[0] for prev, cur in zip(bounds, bounds[1:]))
+        assert all(self.body[start - 2 : start] == "\n\n" for start, _ in bounds[1:])
+
+    def test_matches_unchunked_spans_and_text(self):
+        """Re-based chunk spans equal whole-body spans and the stitched text matches."""
+        whole = self.provider._neutralize_detail_full(self.body, title="Senator slams critics")
+
+        chunked = neutralize_detail_full_chunked(self.provider, self.body, self.chunker, title="Senator slams critics")
+
+        assert chunked.status == "success"
+        key = [(s.field, s.start_char, s.end_char, s.original_text) for s in whole.spans]
+        assert [(s.field, s.start_char, s.end_char, s.original_text) for s in chunked.spans] == key
+        for span in chunked.spans:
+            if span.field == "body":
+                assert self.body[span.start_char : span.end_char] == span.original_text
+        # The mock flattens whitespace within a chunk; chunk boundaries keep their paragraph break
+        assert chunked.detail_full.split() == whole.detail_full.split()
+        assert chunked.detail_full.count("\n\n") == len(detail_full_chunk_bounds(self.body, self.chunker)) - 1
+
+    def test_title_spans_from_first_chunk_only(self):
+        chunked = neutralize_detail_full_chunked(self.provider, self.body, self.chunker, title="Shocking news")
+
+        assert sum(1 for s in chunked.spans if s.field == "title") == 1
+
+    def test_failed_chunk_fails_call(self):
+        original = self.provider._neutralize_detail_full
+
+        def flaky(body, title=None, feed_category=None):
+            if body.startswith("Section 0."):
+                return original(body, title=title)
+            return DetailFullResult(detail_full="", spans=[], status="failed_llm", failure_reason="timeout")
+
+        with patch.object(self.provider, "_neutralize_detail_full", side_effect=flaky):
+            result = neutralize_detail_full_chunked(self.provider, self.body, self.chunker)
+
+        assert result.status == "failed_llm"
+        assert "timeout" in result.failure_reason
+        assert result.detail_full == ""
+
+    def test_entry_point_respects_setting(self):
+        settings = SimpleNamespace(
+            DETAIL_FULL_MODE="synthesis",
+            DETAIL_FULL_CHUNKING=True,
+            DETAIL_FULL_CHUNK_SIZE=1500,
+            DETAIL_FULL_CHUNK_CONCURRENCY=3,
+        )
+        with (
+            patch("app.services.neutralizer.get_settings", return_value=settings),
+            patch.object(self.provider, "_neutralize_detail_full", wraps=self.provider._neutralize_detail_full) as call,
+        ):
+            self.provider.neutralize_detail_full(self.body)
+            chunk_calls = call.call_count
+            settings.DETAIL_FULL_CHUNKING = False
+            self.provider.neutralize_detail_full(self.body)
+
+        assert chunk_calls == len(detail_full_chunk_bounds(self.body, self.chunker))
+        assert call.call_count == chunk_calls + 1
+
+
+class TestDetailFullReconstruction:
+    """Tests for rebuilding detail_full locally from spans (DETAIL_FULL_MODE="spans")."""
+
+    BODY = (
+        "BREAKING: The senator slams critics in a shocking speech on the budget. "
+        "Shockingly, the vote failed by two votes after a long debate.\n\n"
+        "Officials were scrambling to respond, e.g. the treasury issued a statement."
+    )
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.provider = MockNeutralizerProvider()
+
+    def _span(self, phrase: str, replacement: str | None = None, field: str = "body") -> TransparencySpan:
+        start = self.BODY.index(phrase) if field == "body" else 0
+        return TransparencySpan(
+            field=field,
+            start_char=start,
+            end_char=start + len(phrase),
+            original_text=phrase,
+            action=SpanAction.REPLACED if replacement else SpanAction.REMOVED,
+            reason=SpanReason.EMOTIONAL_TRIGGER,
+            replacement_text=replacement,
+        )
+
+    def _spans(self) -> list[TransparencySpan]:
+        return [
+            self._span("BREAKING"),
+            self._span("slams", "criticizes"),
+            self._span("shocking"),
+            self._span("Shockingly"),
+            self._span("scrambling", "working"),
+        ]
+
+    def test_apply_spans_tidies_seams(self):
+        result = apply_spans_to_text(self.BODY, self._spans())
+
+        assert result == (
+            "The senator criticizes critics in a speech on the budget. "
+            "The vote failed by two votes after a long debate.\n\n"
+            "Officials were working to respond, e.g. the treasury issued a statement."
+        )
+
+    def test_apply_spans_skips_overlaps_and_keeps_case(self):
+        spans = [self._span("shocking speech", "speech"), self._span("shocking"), self._span("Shockingly", "notably")]
+
+        result = apply_spans_to_text(self.BODY, spans)
+
+        assert "in a speech on the budget." in result
+        assert "Notably, the vote failed" in result
+
+    def test_reconstructs_from_detected_spans(self):
+        spans = [*self._spans(), self._span("Shocking", field="title")]
+        with patch("app.services.neutralizer._detect_spans_with_config", return_value=spans) as detect:
+            result = reconstruct_detail_full(self.provider, self.BODY, title="Shocking vote")
+
+        assert result.status == "success"
+        assert result.detail_full == apply_spans_to_text(self.BODY, self._spans())
+        assert result.spans == spans
+        assert detect.call_args.kwargs["title"] == "Shocking vote"
+
+    def test_clean_body_returned_unchanged(self):
+        with patch("app.services.neutralizer._detect_spans_with_config", return_value=[]):
+            result = reconstruct_detail_full(self.provider, self.BODY)
+
+        assert result.detail_full == self.BODY
+
+    @pytest.mark.parametrize(
+        "guard",
+        ["app.services.neutralizer._detect_garbled_output", "app.services.neutralizer._spans_took_effect"],
+    )
+    def test_failed_guard_falls_back_to_synthesis(self, guard):
+        failed = guard.endswith("_detect_garbled_output")
+        settings = SimpleNamespace(DETAIL_FULL_MODE="spans", DETAIL_FULL_CHUNKING=False)
+        with (
+            patch("app.services.neutralizer.get_settings", return_value=settings),
+            patch("app.services.neutralizer._detect_spans_with_config", return_value=self._spans()),
+            patch(guard, return_value=failed),
+            patch.object(self.provider, "_neutralize_detail_full", wraps=self.provider._neutralize_detail_full) as full,
+        ):
+            self.provider.neutralize_detail_full(self.BODY)
+
+        assert full.call_count == 1
+
+    def test_few_spans_on_long_body_skip_synthesis(self):
+        """A handful of small edits to a long article is a normal spans-mode result."""
+        filler = "Lawmakers met again on Tuesday to review the committee's budget figures in detail. " * 50
+        body = self.BODY + "\n\n" + filler
+        spans = self._spans()[:4]
+        settings = SimpleNamespace(DETAIL_FULL_MODE="spans", DETAIL_FULL_CHUNKING=False)
+        with (
+            patch("app.services.neutralizer.get_settings", return_value=settings),
+            patch("app.services.neutralizer._detect_spans_with_config", return_value=spans),
+            patch.object(self.provider, "_neutralize_detail_full") as full,
+        ):
+            result = self.provider.neutralize_detail_full(body)
+
+        full.assert_not_called()
+        assert result.detail_full == apply_spans_to_text(body, spans)
+
+    def test_skipped_spans_fall_back_to_synthesis(self):
+        """A span skipped as overlapping leaves far fewer characters edited than the spans cover."""
+        spans = [self._span("The senator slams critics in a shocking speech"), self._span("critics")]
+        with patch("app.services.neutralizer._detect_spans_with_config", return_value=spans):
+            assert reconstruct_detail_full(self.provider, self.BODY) is None
+
+    def test_detection_error_falls_back_to_synthesis(self):
+        settings = SimpleNamespace(DETAIL_FULL_MODE="spans", DETAIL_FULL_CHUNKING=False)
+        with (
+            patch("app.services.neutralizer.get_settings", return_value=settings),
+            patch("app.services.neutralizer._detect_spans_with_config", side_effect=RuntimeError("timeout")),
+            patch.object(self.provider, "_neutralize_detail_full", wraps=self.provider._neutralize_detail_full) as full,
+        ):
+            result = self.provider.neutralize_detail_full(self.BODY)
+
+        assert full.call_count == 1
+        assert result.status == "success"
+
+    def test_entry_point_skips_generation(self):
+        settings = SimpleNamespace(DETAIL_FULL_MODE="spans", DETAIL_FULL_CHUNKING=False)
+        with (
+            patch("app.services.neutralizer.get_settings", return_value=settings),
+            patch("app.services.neutralizer._detect_spans_with_config", return_value=self._spans()),
+            patch.object(self.provider, "_neutralize_detail_full") as full,
+        ):
+            result = self.provider.neutralize_detail_full(self.BODY)
+
+        full.assert_not_called()
+        assert result.detail_full.startswith("The senator criticizes critics")
+
+
+class TestFusedBriefFeed:
+    """Tests for the fused brief + feed outputs call (FUSED_BRIEF_FEED_CALL)."""
+
+    BODY = "The senate passed the budget on Tuesday after a long debate over hospital funding. " * 3
+
+    REPLY = {
+        "detail_brief": "The senate passed the budget on Tuesday.\n\nThe debate centred on hospital funding.",
+        "feed_title": "Senate Passes Budget After Long Debate",
+        "feed_summary": "The vote came on Tuesday. Hospital funding was the main issue.",
+        "detail_title": "Senate passes budget after debate over hospital funding",
+        "section": "us",
+    }
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.provider = MockNeutralizerProvider()
+        self.patchers = [
+            patch("app.services.neutralizer.get_prompt", side_effect=lambda name, default: default),
+            patch("app.services.neutralizer.get_model_agnostic_prompt", side_effect=lambda name, default: default),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def teardown_method(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_prompt_contains_both_tasks_and_article_once(self):
+        prompt = build_fused_brief_feed_prompt(self.BODY)
+
+        assert prompt.count(self.BODY) == 1
+        assert DEFAULT_SYNTHESIS_DETAIL_BRIEF_PROMPT.split("\n")[0] in prompt
+        assert "feed_title" in prompt and '"detail_brief"' in prompt
+
+    def test_parse_reply(self):
+        fenced = "```json\n" + json.dumps(self.REPLY) + "\n```"
+
+        assert parse_fused_brief_feed_response(fenced) == self.REPLY
+        with pytest.raises(NeutralizationResponseError):
+            parse_fused_brief_feed_response("Here is the brief:")
+        with pytest.raises(NeutralizationResponseError):
+            parse_fused_brief_feed_response(json.dumps({**self.REPLY, "detail_brief": ""}))
+
+    def test_clean_reply_needs_no_repair(self):
+        repair = MagicMock()
+
+        brief, feed = finish_fused_brief_feed(dict(self.REPLY), repair)
+
+        repair.assert_not_called()
+        assert brief == self.REPLY["detail_brief"]
+        assert feed == {key: self.REPLY[key] for key in ("feed_title", "feed_summary", "detail_title", "section")}
+
+    def test_violations_are_repaired(self):
+        reply = {
+            **self.REPLY,
+            "detail_brief": "The couple enjoyed a romantic getaway.",
+            "feed_summary": "The power couple sailed on Sunday. They returned on Monday.",
+        }
+        repaired = {
+            "detail_brief_repair": "The couple took a trip.",
+            "feed_summary_repair": "The couple sailed on Sunday. They returned on Monday.",
+        }
+        repair = MagicMock(side_effect=lambda call_type, system, prompt: repaired[call_type])
+
+        brief, feed = finish_fused_brief_feed(reply, repair)
+
+        assert brief == "The couple took a trip."
+        assert feed["feed_summary"] == repaired["feed_summary_repair"]
+        assert [c.args[0] for c in repair.call_args_list] == ["detail_brief_repair", "feed_summary_repair"]
+
+    def test_repairs_are_bounded(self):
+        reply = {**self.REPLY, "detail_brief": "A romantic trip."}
+        repair = MagicMock(return_value="Still romantic.")
+
+        brief, _ = finish_fused_brief_feed(reply, repair)
+
+        assert repair.call_count == 2
+        assert brief == "Still romantic."
+
+    def test_entry_point_uses_fused_call(self):
+        fused = (self.REPLY["detail_brief"], {"feed_title": "t"})
+        settings = SimpleNamespace(FUSED_BRIEF_FEED_CALL=True)
+        with (
+            patch("app.services.neutralizer.get_settings", return_value=settings),
+            patch.object(self.provider, "_neutralize_brief_and_feed_outputs", return_value=fused),
+            patch.object(self.provider, "_neutralize_detail_brief") as brief_call,
+        ):
+            assert self.provider.neutralize_brief_and_feed(self.BODY) == fused
+
+        brief_call.assert_not_called()
+
+    @pytest.mark.parametrize("error", [NotImplementedError(), NeutralizationResponseError("bad json")])
+    def test_entry_point_falls_back_to_separate_calls(self, error):
+        settings = SimpleNamespace(FUSED_BRIEF_FEED_CALL=True)
+        with (
+            patch("app.services.neutralizer.get_settings", return_value=settings),
+            patch.object(self.provider, "_neutralize_brief_and_feed_outputs", side_effect=error),
+        ):
+            brief, feed = self.provider.neutralize_brief_and_feed(self.BODY)
+
+        assert brief == self.provider._neutralize_detail_brief(self.BODY)
+        assert feed == self.provider._neutralize_feed_outputs(self.BODY, brief)
+
+    def test_entry_point_off_by_default(self):
+        settings = SimpleNamespace(FUSED_BRIEF_FEED_CALL=False)
+        with (
+            patch("app.services.neutralizer.get_settings", return_value=settings),
+            patch.object(self.provider, "_neutralize_brief_and_feed_outputs") as fused,
+        ):
+            self.provider.neutralize_brief_and_feed(self.BODY)
+
+        fused.assert_not_called()
+
+
+class TestSyndicationFanOut:
+    """Tests for neutralize-once, fan-out-many handling of syndicated stories."""
+
+    BODY = "BREAKING: The senator slams critics over the budget. " * 4
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.provider = MockNeutralizerProvider()
+        self.service = NeutralizerService(provider=self.provider)
+
+    def _completed(self, story: dict) -> dict:
+        """Build a completed representative result from the mock's three calls."""
+        detail_full = self.provider._neutralize_detail_full(story["body"], title=story["title"])
+        detail_brief = self.provider._neutralize_detail_brief(story["body"])
+        feed_outputs = self.provider._neutralize_feed_outputs(story["body"], detail_brief)
+        result = NeutralizationResult(
+            feed_title=feed_outputs["feed_title"],
+            feed_summary=feed_outputs["feed_summary"],
+            detail_title=feed_outputs["detail_title"],
+            detail_brief=detail_brief,
+            detail_full=detail_full.detail_full,
+            has_manipulative_content=bool(detail_full.spans),
+            spans=detail_full.spans,
+        )
+        return {
+            "story_id": story["story_id"],
+            "status": "completed",
+            "result": result,
+            "transparency_spans": detail_full.spans,
+        }
+
+    def test_groups_identical_bodies(self):
+        """Stories with the same body share one representative."""
+        a = make_story_data(self.BODY, "Senator slams critics")
+        b = make_story_data(self.BODY, "Senator criticizes opponents")
+        c = make_story_data("A different article body about local weather. " * 4, "Unrelated story")
+
+        groups = group_syndicated_stories([a, b, c])
+
+        assert groups == [(a, [b]), (c, [])]
+
+    def test_groups_by_stored_hash(self):
+        """The stored raw_content_hash is preferred over hashing the body."""
+        a = make_story_data(self.BODY, "First", content_hash="abc")
+        b = make_story_data("Different text that is not hashed. " * 4, "Second", content_hash="abc")
+
+        groups = group_syndicated_stories([a, b])
+
+        assert groups == [(a, [b])]
+
+    def test_fan_out_reuses_body_outputs(self):
+        """Siblings get the representative's body outputs and their own title spans."""
+        rep = make_story_data(self.BODY, "Shocking vote on the budget")
+        sibling = make_story_data(self.BODY, "Lawmakers approve the budget")
+        rep_result = self._completed(rep)
+
+        fanned = self.service._fan_out_syndicated(rep_result, rep["title"], sibling)
+
+        assert fanned["status"] == "completed"
+        assert fanned["story_id"] == sibling["story_id"]
+        neutralization = fanned["result"]
+        assert neutralization.detail_full == rep_result["result"].detail_full
+        assert neutralization.detail_brief == rep_result["result"].detail_brief
+        assert neutralization.feed_title == rep_result["result"].feed_title
+        title_spans = [s for s in neutralization.spans if s.field == "title"]
+        body_spans = [s for s in neutralization.spans if s.field == "body"]
+        expected_title = self.provider._detect_title_spans(sibling["title"])
+        assert [s.original_text for s in title_spans] == [s.original_text for s in expected_title]
+        rep_body_spans = [s for s in rep_result["result"].spans if s.field == "body"]
+        assert [(s.start_char, s.end_char) for s in body_spans] == [(s.start_char, s.end_char) for s in rep_body_spans]
+
+    def test_fan_out_same_title_copies_title_spans(self):
+        """A sibling with the same headline reuses the headline spans without detection."""
+        rep = make_story_data(self.BODY, "Shocking vote on the budget")
+        sibling = make_story_data(self.BODY, "Shocking vote on the budget")
+        rep_result = self._completed(rep)
+        self.provider._detect_title_spans = MagicMock(side_effect=AssertionError("should not be called"))
+
+        fanned = self.service._fan_out_syndicated(rep_result, rep["title"], sibling)
+
+        assert len(fanned["transparency_spans"]) == len(rep_result["transparency_spans"])
+
+    def test_fan_out_propagates_failure(self):
+        """A failed representative marks its siblings failed with the same error."""
+        sibling = make_story_data(self.BODY, "Anything")
+        rep_result = {"story_id": uuid.uuid4(), "status": "failed", "error": "boom"}
+
+        fanned = self.service._fan_out_syndicated(rep_result, "Title", sibling)
+
+        assert fanned == {"story_id": sibling["story_id"], "status": "failed", "error": "boom"}
+
+
+class TestStreamingPersistence:
+    """Tests for per-story commits in neutralize_pending."""
+
+    BODY = "The senate passed the budget on Tuesday after a long debate. " * 3
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.service = NeutralizerService(provider=MockNeutralizerProvider())
+        self.db = MagicMock()
+        settings = SimpleNamespace(NEUTRALIZE_SYNDICATION_DEDUPE=True)
+        self.patcher = patch("app.services.neutralizer.get_settings", return_value=settings)
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+
+    def _run(self, story_data: list[dict]) -> dict:
+        def neutralize(story_id, title, description, body, feed_category, previous=None):
+            result = NeutralizationResult(
+                feed_title=title,
+                feed_summary="Summary.",
+                detail_title=title,
+                detail_brief="Brief.",
+                detail_full=body,
+                has_manipulative_content=False,
+                spans=[],
+            )
+            return {"story_id": story_id, "status": "completed", "result": result, "transparency_spans": []}
+
+        with (
+            patch.object(self.service, "_select_stories_for_neutralization", return_value=[MagicMock()]),
+            patch.object(self.service, "_prepare_story_data", return_value=(story_data, 0)),
+            patch.object(self.service, "_neutralize_content", side_effect=neutralize),
+        ):
+            return self.service.neutralize_pending(self.db, max_workers=2)
+
+    def test_commits_each_story(self):
+        """Every story is written in its own transaction."""
+        story_data = [make_story_data(f"Body {i}. " * 30, story_obj=MagicMock()) for i in range(3)]
+
+        result = self._run(story_data)
+
+        assert result["total_processed"] == 3
+        assert self.db.commit.call_count == 3
+        assert result["status"] == "completed"
+
+    def test_commit_failure_only_loses_one_story(self):
+        """A failed commit is rolled back and the remaining stories still persist."""
+        story_data = [make_story_data(f"Body {i}. " * 30, story_obj=MagicMock()) for i in range(3)]
+        self.db.commit.side_effect = [None, Exception("deadlock"), None]
+
+        result = self._run(story_data)
+
+        assert result["total_processed"] == 2
+        assert result["total_failed"] == 1
+        assert result["status"] == "partial"
+        self.db.rollback.assert_called_once()
+        failed = [r for r in result["story_results"] if r["status"] == "failed"]
+        assert failed[0]["error"] == "Persist failed: deadlock"
+
+    def test_frees_bodies_after_persisting(self):
+        """Bodies and ORM references are dropped once a story is committed."""
+        story_data = [make_story_data(f"Body {i}. " * 30, story_obj=MagicMock()) for i in range(2)]
+
+        self._run(story_data)
+
+        assert all(sd["body"] is None and sd["story_obj"] is None for sd in story_data)
+
+    def test_syndicated_siblings_persisted_after_representative(self):
+        """Siblings are fanned out from the completed representative and committed separately."""
+        representative, sibling = (make_story_data(self.BODY, story_obj=MagicMock()) for _ in range(2))
+
+        with patch.object(self.service, "_log_pipeline") as log_pipeline:
+            result = self._run([representative, sibling])
+
+        assert result["total_processed"] == 2
+        assert result["total_syndicated"] == 1
+        assert self.db.commit.call_count == 2
+        logged = {c.kwargs["story_raw_id"]: c.kwargs["metadata"] for c in log_pipeline.call_args_list}
+        assert logged[representative["story_id"]]["syndicated_from"] is None
+        assert logged[sibling["story_id"]]["syndicated_from"] == str(representative["story_id"])
+
+
+class TestIncrementalReneutralization:
+    """Forced re-runs reuse stages whose prompt fingerprint is unchanged."""
+
+    BODY = "The senate passed the budget on Tuesday after a long debate, officials said. " * 4
+
+    def setup_method(self):
+        self.provider = MockNeutralizerProvider()
+        self.service = NeutralizerService(provider=self.provider)
+        self.prompts: dict[str, str] = {}
+        settings = SimpleNamespace(
+            DETAIL_FULL_MODEL="gpt-4o-mini",
+            DETAIL_FULL_MODE="synthesis",
+            DETAIL_FULL_CHUNKING=False,
+            DETAIL_FULL_CHUNK_SIZE=6000,
+            SPAN_DETECTION_MODE="single",
+            SPAN_DETECTION_MODEL="gpt-4o-mini",
+            HIGH_RECALL_MODEL="claude-haiku-4-5",
+            ADVERSARIAL_MODEL="gpt-4o-mini",
+            FUSED_BRIEF_FEED_CALL=False,
+        )
+        prompt = lambda name, default: self.prompts.get(name, default)  # noqa: E731
+        self.patchers = [
+            patch("app.services.neutralizer.get_settings", return_value=settings),
+            patch("app.services.neutralizer.get_prompt", side_effect=prompt),
+            patch("app.services.neutralizer.get_model_agnostic_prompt", side_effect=prompt),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def teardown_method(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def _fingerprints(self) -> dict[str, str]:
+        return compute_stage_fingerprints(self.provider, self.BODY)
+
+    def _previous(self) -> PreviousStageOutputs:
+        span = TransparencySpan(
+            field="body",
+            start_char=0,
+            end_char=3,
+            original_text="The",
+            action=SpanAction.REMOVED,
+            reason=SpanReason.EMOTIONAL_TRIGGER,
+        )
+        return PreviousStageOutputs(
+            fingerprints=self._fingerprints(),
+            detail_full=DetailFullResult(detail_full="Previous full.", spans=[span]),
+            detail_brief="Previous brief.",
+            feed_outputs={
+                "feed_title": "Senate passes budget",
+                "feed_summary": "The senate passed the budget on Tuesday.",
+                "detail_title": "Senate passes budget after debate",
+            },
+        )
+
+    def _run(self, previous: PreviousStageOutputs) -> dict:
+        with patch("app.services.auditor.Auditor.audit", return_value=SimpleNamespace(verdict=AuditVerdict.PASS)):
+            return self.service._neutralize_content(
+                uuid.uuid4(), "Senate passes budget", None, self.BODY, "us", previous=previous
+            )
+
+    def test_prompt_change_only_moves_dependent_stages(self):
+        before = self._fingerprints()
+
+        self.prompts["compression_feed_outputs_prompt"] = "New compression prompt"
+        feed_changed = self._fingerprints()
+        self.prompts["synthesis_detail_brief_prompt"] = "New brief prompt"
+        brief_changed = self._fingerprints()
+
+        assert feed_changed["detail_full"] == before["detail_full"]
+        assert feed_changed["detail_brief"] == before["detail_brief"]
+        assert feed_changed["feed_outputs"] != before["feed_outputs"]
+        # The feed outputs are written from the brief, so they move with it
+        assert brief_changed["detail_brief"] != feed_changed["detail_brief"]
+        assert brief_changed["feed_outputs"] != feed_changed["feed_outputs"]
+        assert brief_changed["detail_full"] == before["detail_full"]
+
+    def test_model_and_body_change_every_stage(self):
+        before = self._fingerprints()
+        other_body = compute_stage_fingerprints(self.provider, self.BODY + " More.")
+        with patch.object(MockNeutralizerProvider, "model_name", "other-model"):
+            other_model = self._fingerprints()
+
+        assert all(other_body[stage] != before[stage] for stage in before)
+        assert all(other_model[stage] != before[stage] for stage in before)
+
+    def test_unchanged_fingerprints_skip_every_call(self):
+        previous = self._previous()
+        self.provider.neutralize_detail_full = MagicMock(side_effect=AssertionError("Call 1 rerun"))
+        self.provider.neutralize_brief_and_feed = MagicMock(side_effect=AssertionError("Calls 2/3 rerun"))
+
+        outcome = self._run(previous)
+
+        assert outcome["status"] == "completed"
+        assert outcome["reused_stages"] == ["detail_brief", "detail_full", "feed_outputs"]
+        assert outcome["stage_fingerprints"] == previous.fingerprints
+        result = outcome["result"]
+        assert (result.detail_full, result.detail_brief, result.feed_title) == (
+            "Previous full.",
+            "Previous brief.",
+            "Senate passes budget",
+        )
+        assert outcome["transparency_spans"] == previous.detail_full.spans
+
+    def test_changed_feed_prompt_reruns_only_call_3(self):
+        previous = self._previous()
+        self.prompts["compression_feed_outputs_prompt"] = "New compression prompt"
+        self.provider.neutralize_detail_full = MagicMock(side_effect=AssertionError("Call 1 rerun"))
+        self.provider._neutralize_detail_brief = MagicMock(side_effect=AssertionError("Call 2 rerun"))
+        feed = {"feed_title": "New title", "feed_summary": "New summary.", "detail_title": "New detail title"}
+        self.provider._neutralize_feed_outputs = MagicMock(return_value=feed)
+
+        outcome = self._run(previous)
+
+        assert outcome["reused_stages"] == ["detail_brief", "detail_full"]
+        self.provider._neutralize_feed_outputs.assert_called_once()
+        assert self.provider._neutralize_feed_outputs.call_args.args[1] == "Previous brief."
+        assert outcome["result"].feed_title == "New title"
+        assert outcome["stage_fingerprints"]["feed_outputs"] != previous.fingerprints["feed_outputs"]
+
+    def test_changed_article_prompt_reruns_everything(self):
+        previous = self._previous()
+        self.prompts["article_system_prompt"] = "New canon"
+
+        outcome = self._run(previous)
+
+        assert outcome["reused_stages"] == []
+        assert outcome["result"].detail_brief != "Previous brief."
+
+    def test_from_row(self):
+        row = models.StoryNeutralized(
+            detail_full="Full.",
+            detail_brief="Brief.",
+            feed_title="Title",
+            feed_summary="Summary.",
+            detail_title="Detail title",
+            neutralization_status="success",
+            stage_fingerprints={"detail_full": "abc"},
+        )
+        row.spans = [
+            models.TransparencySpan(
+                field="body",
+                start_char=0,
+                end_char=5,
+                original_text="Shock",
+                action="removed",
+                reason="emotional_trigger",
+            )
+        ]
+
+        previous = PreviousStageOutputs.from_row(row)
+
+        assert previous.detail_full.spans[0].action == SpanAction.REMOVED
+        assert previous.feed_outputs["detail_title"] == "Detail title"
+        assert previous.reusable_stages({"detail_full": "abc", "detail_brief": "def"}) == {"detail_full"}
+        # Rows written before fingerprints existed are always regenerated
+        row.stage_fingerprints = None
+        assert PreviousStageOutputs.from_row(row) is None
+
+
+class TestPromptCacheLayout:
+    """Tests for the cache-friendly request layout and cached-token accounting."""
+
+    def _prompt(self, body: str) -> str:
+        wrapped = f"<article_content>\n{body}\n</article_content>"
+        return DEFAULT_SYNTHESIS_DETAIL_BRIEF_PROMPT.format(body=wrapped)
+
+    def test_prefix_is_identical_across_articles(self):
+        """The static template prefix does not depend on the article."""
+        prefix_a, suffix_a = split_cacheable_prefix(self._prompt("First article body."))
+        prefix_b, suffix_b = split_cacheable_prefix(self._prompt("A completely different body."))
+
+        assert prefix_a == prefix_b
+        assert prefix_a
+        assert suffix_a.startswith("<article_content>")
+        assert "First article body." in suffix_a
+        assert "First article body." not in prefix_a
+
+    def test_prompt_without_tag_is_not_split(self):
+        """Repair prompts have no article tag and go out as a single block."""
+        assert split_cacheable_prefix("Rewrite this summary.") == ("", "Rewrite this summary.")
+
+    def test_anthropic_request_marks_cache_breakpoints(self):
+        """System prompt and template prefix carry cache_control; the article does not."""
+        request = build_anthropic_cached_request("SYSTEM RULES", self._prompt("Body text."))
+
+        assert request["system"] == [{"type": "text", "text": "SYSTEM RULES", "cache_control": {"type": "ephemeral"}}]
+        blocks = request["messages"][0]["content"]
+        assert len(blocks) == 2
+        assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in blocks[1]
+        assert blocks[0]["text"] + blocks[1]["text"] == self._prompt("Body text.")
+
+    def test_record_usage_openai(self):
+        """OpenAI cached tokens come from prompt_tokens_details."""
+        response = SimpleNamespace(
+            usage=SimpleNamespace(
+                prompt_tokens=3000,
+                completion_tokens=200,
+                prompt_tokens_details=SimpleNamespace(cached_tokens=2048),
+            )
+        )
+        metrics = {"tokens_in": 0, "tokens_out": 0, "tokens_cached": 0, "tokens_cache_write": 0}
+
+        record_llm_usage(metrics, response)
+
+        assert metrics == {"tokens_in": 3000, "tokens_out": 200, "tokens_cached": 2048, "tokens_cache_write": 0}
+
+    def test_record_usage_anthropic(self):
+        """Anthropic cache reads and writes are added back into tokens_in."""
+        response = SimpleNamespace(
+            usage=SimpleNamespace(
+                input_tokens=500,
+                output_tokens=300,
+                cache_read_input_tokens=2500,
+                cache_creation_input_tokens=0,
+            )
+        )
+        metrics = {"tokens_in": 0, "tokens_out": 0, "tokens_cached": 0, "tokens_cache_write": 0}
+
+        record_llm_usage(metrics, response)
+
+        assert metrics == {"tokens_in": 3000, "tokens_out": 300, "tokens_cached": 2500, "tokens_cache_write": 0}
+
+    def test_record_usage_gemini(self):
+        """Gemini cached tokens come from usage_metadata."""
+        response = SimpleNamespace(
+            usage_metadata=SimpleNamespace(
+                prompt_token_count=1200,
+                candidates_token_count=90,
+                cached_content_token_count=1024,
+            )
+        )
+        metrics = {"tokens_in": 0, "tokens_out": 0, "tokens_cached": 0, "tokens_cache_write": 0}
+
+        record_llm_usage(metrics, response)
+
+        assert metrics["tokens_in"] == 1200
+        assert metrics["tokens_cached"] == 1024
+
+
+class TestBatchNeutralization:
+    """Tests for offline batch neutralization through a local stand-in executor."""
+
+    TITLE = "Shocking vote on the budget"
+    BODY = (
+        "The senate passed the budget on Tuesday after a long debate. "
+        "Critics called the plan a devastating blow to rural hospitals. "
+        "Supporters said the bill keeps spending flat for the next two years. "
+        "The measure now goes to the house for a final vote next week."
+    )
+    BRIEF = "The senate passed the budget on Tuesday. The measure now goes to the house."
+    DESCRIPTION = "The senate passed the budget after a long debate over hospital funding."
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.provider = MockNeutralizerProvider()
+        self.service = NeutralizerService(provider=self.provider)
+        self.brief_replies = [self.BRIEF]
+        self.prompts: dict[str, str] = {}
+        settings = SimpleNamespace(
+            SPAN_DETECTION_MODEL="gpt-5-mini",
+            DETAIL_FULL_MODEL="",
+            DETAIL_FULL_MODE="synthesis",
+            DETAIL_FULL_CHUNKING=False,
+            DETAIL_FULL_CHUNK_SIZE=6000,
+            SPAN_DETECTION_MODE="single",
+            HIGH_RECALL_MODEL="claude-haiku-4-5",
+            ADVERSARIAL_MODEL="gpt-4o-mini",
+            FUSED_BRIEF_FEED_CALL=False,
+            NEUTRALIZE_SYNDICATION_DEDUPE=True,
+            NEUTRALIZE_BATCH_DIR="/tmp/ntrl-batches",
+            NEUTRALIZE_BATCH_POLL_SECONDS=0,
+            NEUTRALIZE_BATCH_TIMEOUT_SECONDS=1,
+        )
+        prompt = lambda name, default: self.prompts.get(name, default)  # noqa: E731
+        self.patchers = [
+            patch("app.services.neutralizer.get_settings", return_value=settings),
+            patch("app.services.neutralizer.batch.get_settings", return_value=settings),
+            patch("app.services.neutralizer.get_prompt", side_effect=prompt),
+            patch("app.services.neutralizer.get_model_agnostic_prompt", side_effect=prompt),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def teardown_method(self):
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def _story(self, title: str | None = None) -> dict:
+        return make_story_data(self.BODY, title or self.TITLE, description=self.DESCRIPTION)
+
+    def _handler(self, request: BatchRequest) -> str:
+        """Answer each stage like a well-behaved provider would."""
+        if request.call_type == "span_detection":
+            return json.dumps(
+                {
+                    "phrases": [
+                        {"phrase": "Shocking", "reason": "emotional_trigger", "action": "removed"},
+                        {"phrase": "devastating blow", "reason": "emotional_trigger", "action": "replaced"},
+                    ]
+                }
+            )
+        if request.call_type == "detail_full":
+            return self.BODY.replace("a devastating blow", "harmful")
+        if request.call_type == "detail_brief":
+            return self.brief_replies.pop(0)
+        if request.call_type == "detail_brief_repair":
+            return self.BRIEF
+        if request.call_type == "feed_outputs":
+            return json.dumps(
+                {
+                    "feed_title": "Senate passes budget",
+                    "feed_summary": "The senate passed the budget on Tuesday.",
+                    "detail_title": "Senate passes budget after long debate",
+                    "section": "us",
+                }
+            )
+        raise AssertionError(f"unexpected call_type {request.call_type}")
+
+    def test_custom_id_round_trip(self):
+        """custom_ids encode stage and story and fit provider constraints."""
+        story_id = uuid.uuid4()
+        custom_id = make_custom_id("detail_brief_repair", story_id)
+
+        assert parse_custom_id(custom_id) == ("detail_brief_repair", str(story_id))
+        assert len(custom_id) <= 64
+
+    def test_openai_request_line(self):
+        """OpenAI batch lines wrap a chat completion body."""
+        request = BatchRequest(
+            custom_id="feed_outputs-1",
+            call_type="feed_outputs",
+            model="gpt-5-mini",
+            system="sys",
+            user_prompt="user",
+            json_output=True,
+        )
+
+        line = OpenAIBatchExecutor.request_line(request)
+
+        assert line["method"] == "POST"
+        assert line["url"] == "/v1/chat/completions"
+        assert line["body"]["response_format"] == {"type": "json_object"}
+        assert line["body"]["prompt_cache_key"] == "ntrl-feed_outputs"
+        # gpt-5 models only support the default temperature
+        assert "temperature" not in line["body"]
+
+    def test_openai_result_line_parsing(self):
+        """Output and error file lines become responses or errors."""
+        ok = OpenAIBatchExecutor.parse_result_line(
+            {
+                "custom_id": "a",
+                "response": {"status_code": 200, "body": {"choices": [{"message": {"content": " hi "}}]}},
+                "error": None,
+            }
+        )
+        failed = OpenAIBatchExecutor.parse_result_line(
+            {"custom_id": "b", "response": None, "error": {"code": "x", "message": "boom"}}
+        )
+
+        assert (ok.text, ok.error) == ("hi", None)
+        assert failed.error == "boom"
+
+    def test_anthropic_request_line_uses_cache_layout(self):
+        """Anthropic batch params use the same cached layout as sync calls."""
+        request = BatchRequest(
+            custom_id="detail_brief-1",
+            call_type="detail_brief",
+            model="claude-haiku-4-5",
+            system="sys",
+            user_prompt="Instructions\n<article_content>\nbody\n</article_content>",
+            max_tokens=2048,
+        )
+
+        line = AnthropicBatchExecutor.request_line(request)
+
+        expected = build_anthropic_cached_request(request.system, request.user_prompt)
+        assert line["params"]["system"] == expected["system"]
+        assert line["params"]["messages"] == expected["messages"]
+        assert line["params"]["max_tokens"] == 2048
+
+    def test_run_submits_one_job_per_model(self):
+        """Requests are split by model; handler errors come back as errors."""
+
+        def handler(request):
+            if request.custom_id == "bad":
+                raise RuntimeError("nope")
+            return "ok"
+
+        executor = LocalBatchExecutor(handler)
+        requests = [
+            BatchRequest("a", "detail_full", "m1", "s", "u"),
+            BatchRequest("b", "detail_brief", "m2", "s", "u"),
+            BatchRequest("bad", "detail_brief", "m2", "s", "u"),
+        ]
+
+        responses = executor.run(requests, poll_interval=0, timeout=1)
+
+        assert [[r.model for r in job] for job in executor.submitted] == [["m1"], ["m2", "m2"]]
+        assert responses["a"].text == "ok"
+        assert responses["bad"].error == "nope"
+
+    def test_batch_produces_all_outputs(self):
+        """A story runs through all rounds and comes back completed."""
+        story = self._story()
+        executor = LocalBatchExecutor(self._handler)
+
+        results = run_batch_neutralization(self.provider, executor, [story], poll_interval=0, timeout=1)
+
+        result = results[story["story_id"]]
+        assert result["status"] == "completed"
+        neutralization = result["result"]
+        assert neutralization.feed_title == "Senate passes budget"
+        assert neutralization.detail_brief == self.BRIEF
+        assert "harmful" in neutralization.detail_full
+        spans = {(s.field, s.original_text) for s in neutralization.spans}
+        assert spans == {("title", "Shocking"), ("body", "devastating blow")}
+        title_span = next(s for s in neutralization.spans if s.field == "title")
+        assert story["title"][title_span.start_char : title_span.end_char] == "Shocking"
+        # No repair rounds were needed
+        assert [job[0].call_type for job in executor.submitted] == ["span_detection", "feed_outputs"]
+
+    def test_brief_with_banned_phrase_is_repaired(self):
+        """Briefs that fail validation get a repair round before feed outputs."""
+        self.brief_replies = ["The couple enjoyed a romantic getaway before the vote."]
+        story = self._story()
+        executor = LocalBatchExecutor(self._handler)
+
+        results = run_batch_neutralization(self.provider, executor, [story], poll_interval=0, timeout=1)
+
+        assert results[story["story_id"]]["result"].detail_brief == self.BRIEF
+        assert ["detail_brief_repair"] in [[r.call_type for r in job] for job in executor.submitted]
+
+    def test_failed_detail_full_fails_story(self):
+        """A failed synthesis request fails the story without feed outputs."""
+        story = self._story()
+
+        def handler(request):
+            if request.call_type == "detail_full":
+                raise RuntimeError("overloaded")
+            return self._handler(request)
+
+        results = run_batch_neutralization(
+            self.provider, LocalBatchExecutor(handler), [story], poll_interval=0, timeout=1
+        )
+
+        assert results[story["story_id"]]["status"] == "failed"
+        assert "overloaded" in results[story["story_id"]]["error"]
+
+    def test_neutralize_batch_persists_like_pending(self):
+        """Batch results go through the same persistence as neutralize_pending."""
+        rep = self._story()
+        sibling = self._story(title="Senate passes budget")
+        story_data = [rep, sibling]
+        self.service._select_stories_for_neutralization = lambda *args: [object(), object()]
+        self.service._prepare_story_data = lambda stories: (story_data, 0)
+        db = MagicMock()
+
+        result = self.service.neutralize_batch(db, executor=LocalBatchExecutor(self._handler))
+
+        assert result["status"] == "completed"
+        assert result["total_processed"] == 2
+        assert result["total_syndicated"] == 1
+        added = [c.args[0] for c in db.add.call_args_list]
+        neutralized = [a for a in added if isinstance(a, models.StoryNeutralized)]
+        assert {n.story_raw_id for n in neutralized} == {rep["story_id"], sibling["story_id"]}
+        assert db.commit.call_count == 2
+
+    def test_neutralize_batch_commit_failure_only_loses_one_story(self):
+        """Each batch story is committed separately, as in neutralize_pending."""
+        story_data = [self._story(), self._story()]
+        story_data[0]["content_hash"], story_data[1]["content_hash"] = "a", "b"  # Not syndicated
+        self.brief_replies = [self.BRIEF, self.BRIEF]
+        self.service._select_stories_for_neutralization = lambda *args: [object(), object()]
+        self.service._prepare_story_data = lambda stories: (story_data, 0)
+        db = MagicMock()
+        db.commit.side_effect = [Exception("deadlock"), None]
+
+        result = self.service.neutralize_batch(db, executor=LocalBatchExecutor(self._handler))
+
+        assert result["total_processed"] == 1
+        assert result["total_failed"] == 1
+        assert result["status"] == "partial"
+        db.rollback.assert_called_once()
+
+    def test_forced_rerun_resubmits_only_changed_stages(self):
+        """A second forced batch run after a compression prompt edit only resubmits feed outputs."""
+        story = self._story()
+        story["content_hash"] = "a"
+        self.service._select_stories_for_neutralization = lambda *args: [object()]
+        self.service._prepare_story_data = lambda stories: ([dict(story)], 0)
+        db = MagicMock()
+        self.service.neutralize_batch(db, force=True, executor=LocalBatchExecutor(self._handler))
+        row = next(c.args[0] for c in db.add.call_args_list if isinstance(c.args[0], models.StoryNeutralized))
+        row.neutralization_status = "success"  # Column default, applied on insert
+        row.spans = []
+        assert set(row.stage_fingerprints) == {"detail_full", "detail_brief", "feed_outputs"}
+
+        self.prompts["compression_feed_outputs_prompt"] = "New compression prompt"
+        executor = LocalBatchExecutor(self._handler)
+        db = MagicMock()
+        with patch.object(self.service, "_load_existing_neutralizations", return_value={story["story_id"]: row}):
+            result = self.service.neutralize_batch(db, force=True, executor=executor)
+
+        assert [[r.call_type for r in job] for job in executor.submitted] == [["feed_outputs"]]
+        assert result["total_processed"] == 1
+        rerun = next(c.args[0] for c in db.add.call_args_list if isinstance(c.args[0], models.StoryNeutralized))
+        assert rerun.version == row.version + 1
+        assert rerun.detail_brief == row.detail_brief
+        assert rerun.stage_fingerprints["detail_full"] == row.stage_fingerprints["detail_full"]
+        assert rerun.stage_fingerprints["feed_outputs"] != row.stage_fingerprints["feed_outputs"]
+
+    def test_executor_required_for_unsupported_provider(self):
+        """Providers without a batch API are rejected up front."""
+        with pytest.raises(NeutralizerConfigError):
+            get_batch_executor(self.provider)
+
+
+class TestLazyProviders:
+    """Provider implementations are imported on first use."""
+
+    def test_provider_classes_resolve_from_package(self):
+        from app.services.neutralizer import AnthropicNeutralizerProvider
+
+        assert AnthropicNeutralizerProvider.__module__ == "app.services.neutralizer.providers.anthropic_provider"
+        assert MockNeutralizerProvider.__module__ == "app.services.neutralizer.providers.mock_provider"
+
+    def test_unknown_attribute_raises(self):
+        import app.services.neutralizer as neutralizer
+
+        with pytest.raises(AttributeError):
+            neutralizer.NoSuchProvider  # noqa: B018
+
+    def test_get_neutralizer_provider_uses_active_model(self):
+        with patch("app.services.neutralizer.get_active_model", return_value="mock"):
+            assert isinstance(get_neutralizer_provider(), MockNeutralizerProvider)
+
+    def test_only_selected_provider_is_imported(self):
+        """A fresh interpreter loads no provider until one is selected, then only that one."""
+        probe = (
+            "import sys\n"
+            "from unittest.mock import patch\n"
+            "import app.services.neutralizer as n\n"
+            "loaded = lambda: sorted(m.rsplit('.', 1)[1] for m in sys.modules if m.startswith(n.__name__ + '.providers.'))\n"
+            "before = loaded()\n"
+            "with patch.object(n, 'get_active_model', return_value='claude-3-5-haiku'):\n"
+            "    provider = n.get_neutralizer_provider()\n"
+            "print(before, loaded(), type(provider).__name__, 'openai' in sys.modules, 'app.services.ingestion' in sys.modules)\n"
+        )
+        env = {"PATH": "", "DATABASE_URL": "sqlite:///:memory:", "ANTHROPIC_API_KEY": "test"}
+        project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        proc = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, text=True, env=env, cwd=project_dir, check=True
+        )
+
+        assert proc.stdout.split() == ["[]", "['anthropic_provider']", "AnthropicNeutralizerProvider", "False", "False"]
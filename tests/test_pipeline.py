@@ -300,3 +300,55 @@ class TestCleanup:
         await mock_pipeline.close()
         # Should be able to call close multiple times
         await mock_pipeline.close()
+
+
+class TestPerCallOverrides:
+    """Tests for per-call settings on a shared pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_overrides_are_part_of_cache_key(self):
+        """A cached result should only be reused for the same effective settings."""
+        pipeline = NTRLPipeline(
+            config=PipelineConfig(
+                mode=ProcessingMode.SCAN_ONLY,
+                scanner_config=ScannerConfig(enable_structural=False, semantic_provider="mock"),
+            )
+        )
+        body = "BREAKING: Senator SLAMS critics in shocking outburst."
+
+        lexical_only = await pipeline.process(body=body, enable_semantic=False)
+        assert not lexical_only.cache_hit
+        assert {s.detector_source.value for s in lexical_only.body_scan.spans} == {"lexical"}
+
+        assert not (await pipeline.process(body=body, enable_semantic=True)).cache_hit
+        assert (await pipeline.process(body=body)).cache_hit  # Config default is enable_semantic=True
+        assert (await pipeline.process(body=body, enable_semantic=False)).cache_hit
+
+        await pipeline.close()
+
+
+class TestResultCacheIsolation:
+    """Tests for cached results being independent copies."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_does_not_mutate_earlier_results(self):
+        """Marking a hit should not change results handed out before."""
+        pipeline = NTRLPipeline(
+            config=PipelineConfig(
+                mode=ProcessingMode.SCAN_ONLY,
+                scanner_config=ScannerConfig(enable_structural=False, enable_semantic=False),
+            )
+        )
+        body = "BREAKING: Senator SLAMS critics in shocking outburst."
+
+        first = await pipeline.process(body=body)
+        second = await pipeline.process(body=body)
+        second.body_scan.spans.clear()
+        third = await pipeline.process(body=body)
+
+        assert first.cache_hit is False
+        assert second.cache_hit is True and third.cache_hit is True
+        assert len(third.body_scan.spans) == len(first.body_scan.spans) > 0
+        assert pipeline.cache_stats()["hits"] == 2
+
+        await pipeline.close()
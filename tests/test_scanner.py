@@ -3,15 +3,23 @@
 Unit tests for the NTRL Scanner orchestrator.
 """
 
+import asyncio
+import json
+
 import pytest
 
 from app.services.ntrl_scan import (
     ArticleSegment,
     DetectorSource,
+    LLMConfig,
     NTRLScanner,
     ScannerConfig,
+    SemanticDetector,
+    get_lexical_detector,
     scan_text,
+    shutdown_detector_pools,
 )
+from app.services.ntrl_scan.cpu_pool import pack_spans, unpack_spans
 
 
 @pytest.fixture
@@ -242,6 +250,118 @@ class TestSemanticDetector:
         assert len(semantic_spans) == 0
 
 
+class TestSemanticResponseCache:
+    """Tests for semantic detector response caching and request coalescing."""
+
+    TEXT = "They did this to silence critics."
+    RESPONSE = json.dumps(
+        [{"type_id": "C.2.3", "span_start": 0, "span_end": 16, "text": "They did this to", "confidence": 0.8}]
+    )
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self, monkeypatch):
+        monkeypatch.setattr("app.services.ntrl_scan.semantic_detector._response_cache", None)
+
+    def detector(self, monkeypatch, cache_responses=True, fail_first=False, first_response=None):
+        detector = SemanticDetector(
+            LLMConfig(provider="anthropic", model="test-model", api_key="test", cache_responses=cache_responses)
+        )
+        calls = []
+
+        async def complete(prompt):
+            calls.append(prompt)
+            await asyncio.sleep(0.05)
+            if fail_first and len(calls) == 1:
+                raise Exception("Anthropic API error: 529")
+            if first_response is not None and len(calls) == 1:
+                return first_response
+            return self.RESPONSE
+
+        monkeypatch.setattr(detector, "_anthropic_complete", complete)
+        return detector, calls
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_is_served_from_cache(self, monkeypatch):
+        """A re-scan of the same text (in any segment) does not call the provider again."""
+        detector, calls = self.detector(monkeypatch)
+
+        body = await detector.detect(self.TEXT, ArticleSegment.BODY)
+        title = await detector.detect(self.TEXT, ArticleSegment.TITLE)
+
+        assert len(calls) == 1
+        assert detector.cache_hits == 1
+        assert [span.type_id_primary for span in body.spans] == ["C.2.3"]
+        assert title.spans[0].segment == ArticleSegment.TITLE
+
+    @pytest.mark.asyncio
+    async def test_cache_is_shared_across_detectors(self, monkeypatch):
+        first, calls = self.detector(monkeypatch)
+        second, second_calls = self.detector(monkeypatch)
+
+        await first.detect(self.TEXT)
+        await second.detect(self.TEXT)
+
+        assert len(calls) == 1
+        assert second_calls == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_detections_share_one_call(self, monkeypatch):
+        detector, calls = self.detector(monkeypatch)
+
+        results = await asyncio.gather(*(detector.detect(self.TEXT) for _ in range(3)))
+
+        assert len(calls) == 1
+        assert detector.coalesced == 2
+        assert all(len(result.spans) == 1 for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self, monkeypatch):
+        detector, calls = self.detector(monkeypatch)
+
+        leader = asyncio.create_task(detector.detect(self.TEXT))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(detector.detect(self.TEXT))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        result = await follower
+        assert len(calls) == 1
+        assert len(result.spans) == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, monkeypatch):
+        detector, calls = self.detector(monkeypatch, fail_first=True)
+
+        failed = await detector.detect(self.TEXT)
+        retried = await detector.detect(self.TEXT)
+
+        assert failed.spans == []
+        assert len(retried.spans) == 1
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("first_response", [RESPONSE[:40], "Sorry, I cannot help with that.", '{"error": 1}'])
+    async def test_unparseable_responses_are_not_cached(self, monkeypatch, first_response):
+        """A truncated or malformed response is retried rather than served as "no spans" for an hour."""
+        detector, calls = self.detector(monkeypatch, first_response=first_response)
+
+        failed = await detector.detect(self.TEXT)
+        retried = await detector.detect(self.TEXT)
+
+        assert failed.spans == []
+        assert len(retried.spans) == 1
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_can_be_disabled(self, monkeypatch):
+        detector, calls = self.detector(monkeypatch, cache_responses=False)
+
+        await detector.detect(self.TEXT)
+        await detector.detect(self.TEXT)
+
+        assert len(calls) == 2
+
+
 class TestConvenienceFunction:
     """Tests for scan_text convenience function."""
 
@@ -293,3 +413,52 @@ class TestCleanup:
         await scanner_mock_semantic.close()
         # Should be able to call close multiple times
         await scanner_mock_semantic.close()
+
+
+class TestProcessPoolExecution:
+    """Tests for running the CPU detectors in worker processes."""
+
+    TEXT = 'BREAKING: Senator SLAMS the "devastating" plan. He said it was "a disaster".'
+
+    def test_compact_spans_round_trip(self):
+        """Packed spans should rebuild into equal detections."""
+        spans = get_lexical_detector().detect(self.TEXT, ArticleSegment.TITLE).spans
+
+        rebuilt = unpack_spans(pack_spans(spans), ArticleSegment.TITLE, DetectorSource.LEXICAL)
+
+        fields = (
+            "type_id_primary",
+            "span_start",
+            "span_end",
+            "text",
+            "confidence",
+            "severity",
+            "recommended_action",
+            "pattern_matched",
+            "rationale",
+            "exemptions_applied",
+            "severity_weighted",
+        )
+        assert [[getattr(s, f) for f in fields] for s in rebuilt] == [[getattr(s, f) for f in fields] for s in spans]
+
+    def test_invalid_executor_rejected(self):
+        """Unknown executor names should fail fast."""
+        with pytest.raises(ValueError):
+            NTRLScanner(ScannerConfig(cpu_executor="gpu"))
+
+    @pytest.mark.asyncio
+    async def test_process_mode_matches_thread_mode(self, scanner_lexical_only):
+        """Process-pool scans should return the thread-mode spans."""
+        config = ScannerConfig(enable_structural=False, enable_semantic=False, cpu_executor="process", cpu_workers=1)
+        scanner = NTRLScanner(config)
+        try:
+            pooled = await scanner.scan(self.TEXT, ArticleSegment.BODY)
+            threaded = await scanner_lexical_only.scan(self.TEXT, ArticleSegment.BODY)
+        finally:
+            shutdown_detector_pools()
+
+        assert scanner.cpu_pool.detectors == ("lexical",)
+        assert pooled.spans
+        assert [(s.type_id_primary, s.span_start, s.span_end, s.detector_source) for s in pooled.spans] == [
+            (s.type_id_primary, s.span_start, s.span_end, s.detector_source) for s in threaded.spans
+        ]
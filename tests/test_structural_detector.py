@@ -4,6 +4,7 @@ Unit tests for the NTRL-SCAN Structural Detector.
 """
 
 import pytest
+import spacy
 
 from app.services.ntrl_scan.structural_detector import (
     StructuralDetector,
@@ -13,6 +14,7 @@ from app.services.ntrl_scan.types import (
     ArticleSegment,
     DetectorSource,
 )
+from app.services.spacy_runtime import SpacyRuntime
 
 
 @pytest.fixture
@@ -227,3 +229,42 @@ class TestPerformance:
 
         assert result.text_length > 5000
         assert result.scan_duration_ms < 2000  # Allow more time for long text
+
+
+class TestDetectMany:
+    """Tests for batched detection (blank pipeline, no trained model needed)."""
+
+    @pytest.fixture
+    def blank_detector(self):
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        return StructuralDetector(runtime=SpacyRuntime(nlp))
+
+    def test_matches_detect(self, blank_detector):
+        """detect_many should return what detect returns for each text."""
+        texts = [
+            "Everyone knows the plan will never work. No one disagreed.",
+            "",
+            "The budget passed on Tuesday.",
+            "Nobody voted against it, and all members attended.",
+        ]
+
+        batched = blank_detector.detect_many(texts, ArticleSegment.TITLE, batch_size=2)
+        single = [blank_detector.detect(text, ArticleSegment.TITLE) for text in texts]
+
+        assert len(batched) == len(texts)
+        for got, want in zip(batched, single):
+            assert got.segment == ArticleSegment.TITLE
+            assert got.text_length == want.text_length
+            assert [(s.type_id_primary, s.span_start, s.span_end) for s in got.spans] == [
+                (s.type_id_primary, s.span_start, s.span_end) for s in want.spans
+            ]
+
+    def test_docs_reused_by_detect(self, blank_detector):
+        """Texts parsed by detect_many should not be parsed again by detect."""
+        blank_detector.detect_many(["First text.", "Second text."])
+        misses = blank_detector.runtime.misses
+
+        blank_detector.detect("Second text.")
+
+        assert blank_detector.runtime.misses == misses
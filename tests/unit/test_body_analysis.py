@@ -0,0 +1,139 @@
+# tests/unit/test_body_analysis.py
+"""
+Unit tests for the shared per-body analysis used by span post-processing.
+
+Covers:
+- Normalized text and offset map agree with normalize_whitespace()
+- find_normalized() agrees with the flexible-whitespace regex it replaced
+- Quote ranges and bisect containment agree with a linear scan
+- One analysis shared across position matching and the quote filter
+"""
+
+import json
+import random
+import re
+from pathlib import Path
+
+from app.models import SpanAction, SpanReason
+from app.services.neutralizer import TransparencySpan, filter_spans_in_quotes, find_phrase_positions
+from app.services.neutralizer.phrase_locator import normalize_whitespace
+from app.services.neutralizer.spans import BodyAnalysis, _scan_quote_ranges
+
+CORPUS_DIR = Path(__file__).parent.parent / "fixtures" / "test_corpus"
+
+BODIES = [
+    '  "Shocking"   claims,\n\nthe  senator said. ',
+    "He said 'this won't stand' and left.\tThe vote failed!",
+    "“A ‘devastating’ blow,” she said. It’s over.",
+    '...  "" ',
+    "",
+]
+
+
+def _corpus_bodies() -> list[str]:
+    return [json.loads(p.read_text())["original_body"] for p in sorted(CORPUS_DIR.glob("article_*.json"))]
+
+
+def _span(start: int, end: int, body: str) -> TransparencySpan:
+    return TransparencySpan(
+        field="body",
+        start_char=start,
+        end_char=end,
+        original_text=body[start:end],
+        action=SpanAction.REMOVED,
+        reason=SpanReason.EMOTIONAL_TRIGGER,
+    )
+
+
+class TestNormalizedOffsets:
+    """Whitespace-normalized text and its map back to body positions."""
+
+    def test_matches_normalize_whitespace(self):
+        for body in BODIES + _corpus_bodies():
+            analysis = BodyAnalysis(body)
+            assert analysis.ws_normalized == normalize_whitespace(body.lower())
+            assert len(analysis.normalized_offsets) == len(analysis.ws_normalized)
+
+    def test_offsets_point_at_same_characters(self):
+        for body in BODIES + _corpus_bodies():
+            analysis = BodyAnalysis(body)
+            for i, ch in enumerate(analysis.ws_normalized):
+                original = analysis.lower[analysis.normalized_offsets[i]]
+                assert original == ch or (ch == " " and original.isspace())
+
+    def test_find_normalized_matches_regex(self):
+        """Offset-map lookup agrees with searching for the words joined by \\s+."""
+        rng = random.Random(11)
+        for body in _corpus_bodies():
+            analysis = BodyAnalysis(body)
+            words = analysis.ws_normalized.split()
+            for _ in range(20):
+                size = rng.randint(2, 5)
+                at = rng.randrange(max(1, len(words) - size))
+                phrase = normalize_whitespace(" ".join(words[at : at + size]))
+                start = rng.randrange(len(body))
+                match = re.compile(r"\s+".join(re.escape(w) for w in phrase.split())).search(analysis.lower, start)
+                expected = (match.start(), match.end()) if match else None
+                assert analysis.find_normalized(phrase, start) == expected
+
+    def test_find_normalized_spans_line_breaks(self):
+        body = "It was a\n\n   devastating   blow."
+        start, end = BodyAnalysis(body).find_normalized("devastating blow")
+
+        assert body[start:end] == "devastating   blow"
+
+
+class TestQuoteRanges:
+    """Quoted passages and bisect containment."""
+
+    def test_in_quotes_matches_linear_scan(self):
+        rng = random.Random(5)
+        for body in BODIES[:3] + _corpus_bodies():
+            analysis = BodyAnalysis(body)
+            ranges = _scan_quote_ranges(body)
+            for _ in range(200):
+                start = rng.randrange(len(body) + 1)
+                end = rng.randrange(start, len(body) + 1)
+                expected = any(s <= start and end <= e for s, e in ranges)
+                assert analysis.in_quotes(start, end) is expected
+
+    def test_nested_quotes(self):
+        body = "“A ‘devastating’ blow,” she said."
+        analysis = BodyAnalysis(body)
+        word = body.index("devastating")
+
+        assert analysis.in_quotes(word, word + len("devastating"))
+        assert analysis.in_quotes(body.index("blow"), body.index("blow") + 4)
+        assert not analysis.in_quotes(body.index("she"), body.index("she") + 3)
+
+    def test_curly_contraction_does_not_close_quote(self):
+        """A right single quote between letters is an apostrophe, not a closing quote."""
+        body = "‘It won’t pass,’ he said."
+        analysis = BodyAnalysis(body)
+
+        assert analysis.quote_ranges == [(0, body.index(",") + 2)]
+
+    def test_no_quotes(self):
+        assert BodyAnalysis("No quotes here.").in_quotes(0, 2) is False
+
+
+class TestSharedAnalysis:
+    """Passing one analysis through a detection pass."""
+
+    def test_position_match_and_quote_filter_share_analysis(self):
+        body = 'Officials called it "a devastating blow" to the region. A devastating blow indeed.'
+        analysis = BodyAnalysis(body)
+
+        spans = find_phrase_positions(body, [{"phrase": "devastating blow"}], analysis)
+        filtered = filter_spans_in_quotes(body, spans, analysis)
+
+        assert [s.reason for s in filtered] == [SpanReason.SELECTIVE_QUOTING, SpanReason.EMOTIONAL_TRIGGER]
+
+    def test_analysis_for_other_body_is_ignored(self):
+        body = 'He said "shocking" things.'
+        stale = BodyAnalysis("Nothing quoted.")
+        start = body.index("shocking")
+
+        result = filter_spans_in_quotes(body, [_span(start, start + 8, body)], stale)
+
+        assert result[0].reason == SpanReason.SELECTIVE_QUOTING
@@ -0,0 +1,270 @@
+# tests/unit/test_llm_streaming.py
+"""
+Unit tests for streamed LLM replies with early abort.
+
+Covers:
+- IncrementalJSONScanner structural checks (prelude, fences, nesting, trailing text)
+- StreamGuard refusal, repetition-loop and broken-grammar checks
+- Stream consumers rebuilding the non-streaming response shape
+- Abort-and-retry in the provider call helpers
+"""
+
+import json
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.neutralizer import _anthropic_message, _detect_garbled_output, _openai_chat
+from app.services.neutralizer.streaming import (
+    IncrementalJSONScanner,
+    StreamAborted,
+    StreamGuard,
+    stream_openai_chat,
+)
+from app.services.resilience import OUTCOME_ERROR
+
+
+def _feed_all(guard: StreamGuard, text: str, size: int = 7) -> None:
+    for i in range(0, len(text), size):
+        guard.feed(text[i : i + size])
+    guard.finish()
+
+
+def _openai_chunks(text: str, size: int = 5, usage=None):
+    for i in range(0, len(text), size):
+        delta = SimpleNamespace(content=text[i : i + size])
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=None)], usage=None)
+    yield SimpleNamespace(choices=[], usage=usage)
+
+
+class _OpenAIStream:
+    """Iterable stream that records how many chunks were read and whether it was closed."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.read = 0
+        self.closed = False
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            self.read += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class TestIncrementalJSONScanner:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"phrases": [{"phrase": "a } tricky \\" ]", "n": 1}]}',
+            '  \n```json\n{"a": [1, 2, {"b": null}]}\n```\n',
+            "[1, 2, 3]",
+        ],
+    )
+    def test_accepts_valid_json(self, text):
+        scanner = IncrementalJSONScanner()
+
+        assert all(scanner.feed(char) is None for char in text)
+        assert scanner.complete
+
+    @pytest.mark.parametrize(
+        "text, message",
+        [
+            ("Sure! Here is the JSON: {", "does not start with JSON"),
+            ("`oops", "does not start with JSON"),
+            ("```json with words\n{", "malformed code fence"),
+            ('{"a": [1, 2}', "unbalanced"),
+            ('{"a": 1} and some commentary', "text after the JSON value"),
+        ],
+    )
+    def test_rejects_at_first_bad_character(self, text, message):
+        error = IncrementalJSONScanner().feed(text)
+
+        assert error is not None and message in error
+
+
+class TestStreamGuard:
+    def test_clean_text_passes(self):
+        guard = StreamGuard(expect_json=False, check_every=32)
+        text = " ".join(
+            f"Section {i}: the senate passed the budget on Tuesday and officials said {i * 7} hospitals would benefit."
+            for i in range(20)
+        )
+
+        _feed_all(guard, text)
+
+        assert guard.text == text
+
+    def test_non_json_prelude_aborts_immediately(self):
+        guard = StreamGuard(expect_json=True)
+
+        with pytest.raises(StreamAborted) as exc:
+            guard.feed("I'm sorry, but I can't help with that.")
+
+        assert "does not start with JSON" in exc.value.reason
+
+    def test_refusal_aborts_on_opening(self):
+        guard = StreamGuard(expect_json=False)
+        refusal = "I'm sorry, but I can't neutralize this article because it appears to be incomplete. " * 3
+
+        with pytest.raises(StreamAborted) as exc:
+            for i in range(0, len(refusal), 10):
+                guard.feed(refusal[i : i + 10])
+
+        assert exc.value.reason == "refusal"
+        assert len(exc.value.text) < 200
+
+    def test_short_refusal_caught_at_finish(self):
+        guard = StreamGuard(expect_json=False)
+        guard.feed("I cannot process this content.")
+
+        with pytest.raises(StreamAborted):
+            guard.finish()
+
+    def test_repetition_loop_aborts_before_end(self):
+        guard = StreamGuard(expect_json=False, check_every=64)
+        text = "The officials said the plan. " * 200
+
+        with pytest.raises(StreamAborted) as exc:
+            _feed_all(guard, text)
+
+        assert exc.value.reason == "repetition loop"
+        assert len(exc.value.text) < len(text) // 4
+
+    def test_repetition_inside_json_aborts(self):
+        guard = StreamGuard(expect_json=True, check_every=64)
+        text = '{"feed_title": "' + "and the vote and the vote " * 100
+
+        with pytest.raises(StreamAborted) as exc:
+            _feed_all(guard, text)
+
+        assert exc.value.reason == "repetition loop"
+
+    def test_broken_grammar_matches_garbled_check(self):
+        garbled = "The senator spoke. The , vote failed. She . Officials 's , said. The , plan. The . end. " * 2
+        guard = StreamGuard(expect_json=False, check_every=16)
+
+        with pytest.raises(StreamAborted) as exc:
+            _feed_all(guard, garbled)
+
+        assert exc.value.reason == "broken grammar"
+        assert _detect_garbled_output(garbled, garbled)
+
+
+class TestStreamConsumers:
+    def test_openai_stream_rebuilds_response(self):
+        usage = SimpleNamespace(prompt_tokens=100, completion_tokens=20, prompt_tokens_details=None)
+        text = json.dumps({"feed_title": "Senate passes budget", "feed_summary": "The vote was close."})
+        stream = _OpenAIStream(_openai_chunks(text, usage=usage))
+        client = MagicMock()
+        client.chat.completions.create.return_value = stream
+
+        response = stream_openai_chat(client, StreamGuard(expect_json=True), model="gpt-4o-mini", messages=[])
+
+        assert response.choices[0].message.content == text
+        assert response.usage is usage
+        assert client.chat.completions.create.call_args.kwargs["stream"] is True
+        assert stream.closed
+
+    def test_openai_stream_stops_reading_on_abort(self):
+        text = "Here is your JSON: " + json.dumps({"a": "b" * 500})
+        stream = _OpenAIStream(_openai_chunks(text))
+        client = MagicMock()
+        client.chat.completions.create.return_value = stream
+
+        with pytest.raises(StreamAborted):
+            stream_openai_chat(client, StreamGuard(expect_json=True), model="gpt-4o-mini", messages=[])
+
+        assert stream.read == 1
+        assert stream.closed
+
+
+class TestGuardedCalls:
+    GOOD = json.dumps({"feed_title": "Senate passes budget after debate"})
+
+    def _client(self, replies):
+        client = MagicMock()
+        client.chat.completions.create.side_effect = [_OpenAIStream(_openai_chunks(reply)) for reply in replies]
+        return client
+
+    def _call(self, client, retries=1):
+        with patch("app.services.neutralizer.streaming_settings", return_value=(True, retries)):
+            return _openai_chat(
+                client,
+                "feed_outputs",
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "x"}],
+                response_format={"type": "json_object"},
+            )
+
+    def test_aborted_reply_is_retried(self):
+        client = self._client(["As an AI, I cannot do that.", self.GOOD])
+
+        response = self._call(client)
+
+        assert response.choices[0].message.content == self.GOOD
+        assert client.chat.completions.create.call_count == 2
+
+    def test_gives_up_after_retries(self):
+        client = self._client(["No.", "Still no."])
+
+        with pytest.raises(StreamAborted):
+            self._call(client, retries=1)
+
+        assert client.chat.completions.create.call_count == 2
+
+    def test_aborted_attempt_is_charged_and_counted_as_error(self, caplog):
+        client = self._client(["As an AI, I cannot do that.", self.GOOD])
+        permits = []
+
+        def permit(provider, model, estimated_tokens):
+            permits.append(MagicMock())
+            permits[-1].__enter__.return_value = permits[-1]
+            return permits[-1]
+
+        with (
+            patch("app.services.neutralizer.llm_permit", side_effect=permit),
+            caplog.at_level(logging.INFO, logger="pipeline.llm"),
+        ):
+            self._call(client)
+
+        aborted_permit = permits[0]
+        aborted_permit.record_outcome.assert_called_once_with(OUTCOME_ERROR)
+        assert aborted_permit.record_usage.call_args.args[0] > 0
+        permits[1].record_outcome.assert_not_called()
+        events = [(r.event, r.aborted, r.tokens_out) for r in caplog.records if hasattr(r, "aborted")]
+        assert events[0][0] == "llm_call_aborted" and events[0][1] and events[0][2] > 0
+        assert events[1] == ("llm_call_complete", None, 0)
+
+    def test_streaming_off_uses_plain_call(self):
+        client = MagicMock()
+        client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=self.GOOD))], usage=None
+        )
+
+        with patch("app.services.neutralizer.streaming_settings", return_value=(False, 1)):
+            response = _openai_chat(client, "feed_outputs", model="gpt-4o-mini", messages=[])
+
+        assert response.choices[0].message.content == self.GOOD
+        assert "stream" not in client.chat.completions.create.call_args.kwargs
+
+    def test_anthropic_text_stream(self):
+        final = SimpleNamespace(content=[SimpleNamespace(text="A calm brief.")], usage=None)
+        stream = MagicMock()
+        stream.__enter__.return_value = stream
+        stream.text_stream = iter(["A calm ", "brief."])
+        stream.get_final_message.return_value = final
+        client = MagicMock()
+        client.messages.stream.return_value = stream
+
+        with patch("app.services.neutralizer.streaming_settings", return_value=(True, 0)):
+            response = _anthropic_message(
+                client, "detail_brief", model="claude-sonnet-4-20250514", max_tokens=100, system="s", user_prompt="u"
+            )
+
+        assert response is final
+        assert client.messages.stream.call_args.kwargs["model"] == "claude-sonnet-4-20250514"
@@ -0,0 +1,84 @@
+# tests/unit/test_ntrl_runtime.py
+"""
+Unit tests for the app-lifespan NTRL pipeline runtime.
+
+Covers:
+- One shared pipeline per provider profile
+- Batchers sharing their pipeline and one rate limiter
+- close() releasing shared pipelines, not batcher.close()
+- The CPU detector executor setting and warm() starting its workers
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.ntrl_runtime import NTRLRuntime, close_ntrl_runtime, get_ntrl_runtime
+
+
+class TestNTRLRuntime:
+    def test_pipeline_shared_per_profile(self):
+        runtime = NTRLRuntime()
+
+        assert runtime.pipeline() is runtime.pipeline()
+        assert runtime.pipeline(mock=True) is not runtime.pipeline()
+        assert runtime.pipeline(mock=True).config.fixer_config.generator_config.provider == "mock"
+        assert runtime.pipeline().scanner.config.semantic_provider == "auto"
+
+    def test_batchers_share_pipeline_and_limiter(self):
+        runtime = NTRLRuntime()
+
+        real, mock = runtime.batcher(), runtime.batcher(mock=True)
+
+        assert runtime.batcher() is real
+        assert real.pipeline is runtime.pipeline()
+        assert mock.pipeline is runtime.pipeline(mock=True)
+        assert real.rate_limiter is mock.rate_limiter is runtime.rate_limiter
+
+    @pytest.mark.asyncio
+    async def test_batcher_close_leaves_shared_pipeline_open(self):
+        runtime = NTRLRuntime()
+        pipeline = runtime.pipeline()
+        pipeline.close = AsyncMock()
+
+        await runtime.batcher().close()
+        pipeline.close.assert_not_called()
+
+        await runtime.close()
+        pipeline.close.assert_awaited_once()
+        assert runtime.pipeline() is not pipeline
+
+    def test_cpu_executor_reaches_scanners(self):
+        runtime = NTRLRuntime(cpu_executor="process", cpu_workers=2)
+
+        for mock in (False, True):
+            config = runtime.pipeline(mock=mock).scanner.config
+            assert (config.cpu_executor, config.cpu_workers) == ("process", 2)
+
+    @pytest.mark.asyncio
+    async def test_warm_starts_process_pool_workers(self):
+        runtime = NTRLRuntime(cpu_executor="process", cpu_workers=1)
+        pool = MagicMock()
+        runtime.pipeline().scanner._cpu_pool = pool
+
+        await runtime.warm()
+
+        pool.warm.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_warm_without_process_executor_is_noop(self):
+        runtime = NTRLRuntime(cpu_executor="thread")
+
+        await runtime.warm()
+
+        assert runtime.pipeline().scanner.cpu_pool is None
+
+    @pytest.mark.asyncio
+    async def test_process_wide_runtime(self):
+        first = get_ntrl_runtime()
+        assert get_ntrl_runtime() is first
+
+        await close_ntrl_runtime()
+
+        assert get_ntrl_runtime() is not first
+        await close_ntrl_runtime()
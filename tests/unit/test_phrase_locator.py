@@ -0,0 +1,149 @@
+# tests/unit/test_phrase_locator.py
+"""
+Unit tests for the indexed phrase locator.
+
+Covers:
+- Bit-parallel LCS against a plain dynamic-programming LCS
+- Fuzzy tier equivalence with the unindexed SequenceMatcher reference on
+  perturbed gold-standard phrases
+- Start offsets, short phrases and bodies shorter than the phrase
+"""
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from app.services.neutralizer.phrase_locator import (
+    BodyIndex,
+    _lcs_length,
+    fuzzy_find_reference,
+    normalize_whitespace,
+)
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+def _dp_lcs(a: str, b: str) -> int:
+    row = [0] * (len(b) + 1)
+    for ca in a:
+        prev = 0
+        for j, cb in enumerate(b):
+            prev, row[j + 1] = row[j + 1], prev + 1 if ca == cb else max(row[j + 1], row[j])
+    return row[-1]
+
+
+def _masks(text: str) -> dict[str, int]:
+    masks: dict[str, int] = {}
+    for i, ch in enumerate(text):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    return masks
+
+
+def _perturb(phrase: str, rng: random.Random) -> str:
+    """Drop letters, inflect and re-case words the way LLM paraphrases drift."""
+    words = []
+    for word in phrase.split():
+        roll = rng.random()
+        if roll < 0.2 and len(word) > 3:
+            cut = rng.randrange(len(word))
+            word = word[:cut] + word[cut + 1 :]
+        elif roll < 0.3:
+            word += "s"
+        elif roll < 0.35:
+            word = word.upper()
+        words.append(word)
+    return " ".join(words)
+
+
+def _gold_cases() -> list[tuple[str, str]]:
+    """(body, phrase) pairs from gold spans plus perturbed and shuffled variants."""
+    rng = random.Random(7)
+    cases = []
+    for spans_path in sorted((FIXTURES_DIR / "gold_standard").glob("article_*_spans.json")):
+        article_id = json.loads(spans_path.read_text())["article_id"]
+        corpus_path = FIXTURES_DIR / "test_corpus" / f"article_{article_id}.json"
+        if not corpus_path.exists():
+            continue
+        body = json.loads(corpus_path.read_text())["original_body"]
+        words = body.split()
+        for span in json.loads(spans_path.read_text())["expected_spans"]:
+            cases.append((body, _perturb(span["text"], rng)))
+        for _ in range(10):
+            size = rng.randint(2, 7)
+            at = rng.randrange(max(1, len(words) - size))
+            cases.append((body, _perturb(" ".join(words[at : at + size]), rng)))
+            cases.append((body, " ".join(rng.choice(words) for _ in range(size))))
+    return cases
+
+
+class TestLCSLength:
+    """Bit-parallel LCS matches the textbook DP."""
+
+    def test_random_strings(self):
+        rng = random.Random(3)
+        for _ in range(500):
+            a = "".join(rng.choice("ab cd") for _ in range(rng.randint(1, 25)))
+            b = "".join(rng.choice("ab cd") for _ in range(rng.randint(0, 25)))
+            assert _lcs_length(_masks(a), len(a), b) == _dp_lcs(a, b)
+
+    def test_identical(self):
+        text = "devastating blow to hospitals"
+        assert _lcs_length(_masks(text), len(text), text) == len(text)
+
+
+class TestBodyIndexFuzzyFind:
+    """Indexed fuzzy matching gives the same answer as scoring every window."""
+
+    def test_matches_reference_on_gold_fixtures(self):
+        cases = _gold_cases()
+        assert cases, "gold standard fixtures missing"
+        indexes: dict[str, BodyIndex] = {}
+        found = 0
+        for body, phrase in cases:
+            index = indexes.setdefault(body, BodyIndex(body))
+            expected = fuzzy_find_reference(phrase, body)
+            assert index.fuzzy_find(phrase) == expected, phrase
+            found += expected is not None
+        # The perturbations must actually exercise the fuzzy path
+        assert found > len(cases) // 4
+
+    def test_inflected_phrase(self):
+        body = "Officials said the deal was a devastating blow to rural hospitals."
+        index = BodyIndex(body)
+
+        start, end = index.fuzzy_find("devastating blows to rural hospital")
+
+        assert body[start:end] == "devastating blow to rural hospitals"
+
+    @pytest.mark.parametrize("phrase", ["short phrase", "singlewordphrasethatislong", ""])
+    def test_short_or_single_word_phrase(self, phrase):
+        assert BodyIndex("a short phrase and singlewordphrasethatislong").fuzzy_find(phrase) is None
+
+    def test_body_shorter_than_phrase(self):
+        assert BodyIndex("two words").fuzzy_find("two words and then some more") is None
+
+    def test_start_offset(self):
+        body = "The sweeping overhaul passed. Later the sweeping overhauls stalled."
+        start = body.index("Later")
+        expected = fuzzy_find_reference("sweeping overhaul stalled", body, start)
+
+        assert BodyIndex(body, start).fuzzy_find("sweeping overhaul stalled") == expected
+        assert expected[0] > start
+
+    def test_first_best_window_wins(self):
+        body = "record breaking heat today and record breaking heat tomorrow"
+        index = BodyIndex(body)
+
+        assert index.fuzzy_find("record breaking heats") == (0, len("record breaking heat"))
+
+
+class TestNormalizeWhitespace:
+    """Tier 3 normalization."""
+
+    def test_collapses_and_strips(self):
+        assert normalize_whitespace('  "A  wild\n\tclaim."  ') == "A wild claim"
+
+    def test_index_exposes_normalized_lowercase(self):
+        assert BodyIndex("Hello   World.").ws_normalized == "hello world"
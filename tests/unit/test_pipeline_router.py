@@ -0,0 +1,89 @@
+# tests/unit/test_pipeline_router.py
+"""
+Unit tests for the v2 pipeline router's streamed batch mode.
+
+The shared runtime is replaced with one whose batcher returns canned
+results, so no models or LLM providers are needed.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.ntrl_batcher import NTRLBatcher
+from app.services.ntrl_pipeline import PipelineResult
+from app.services.ntrl_runtime import get_ntrl_runtime
+from app.services.ntrl_scan import ArticleSegment, MergedScanResult
+
+
+def _result(article_id: str) -> PipelineResult:
+    return PipelineResult(
+        original_body=f"Body {article_id}",
+        original_title="",
+        detail_full=f"Neutral body {article_id}",
+        detail_brief="",
+        feed_title=f"Title {article_id}",
+        feed_summary="",
+        body_scan=MergedScanResult(spans=[], segment=ArticleSegment.BODY, text_length=6),
+        title_scan=None,
+        fix_result=None,
+        transparency=None,
+        total_processing_time_ms=5.0,
+        scan_time_ms=1.0,
+        fix_time_ms=4.0,
+    )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", "test-key")
+
+    async def process_one(article, force=False, enable_semantic=None):
+        if article.article_id == "bad":
+            raise ValueError("boom")
+        return _result(article.article_id)
+
+    batcher = NTRLBatcher()
+    batcher.process_one = process_one
+    runtime = MagicMock()
+    runtime.batcher.return_value = batcher
+
+    app.dependency_overrides[get_ntrl_runtime] = lambda: runtime
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_ntrl_runtime, None)
+
+
+class TestStreamedBatch:
+    def test_ndjson_lines_then_summary(self, client):
+        articles = [{"article_id": i, "body": f"Body {i}"} for i in ("a", "bad", "c")]
+
+        response = client.post(
+            "/v2/batch",
+            json={"articles": articles, "stream": True, "mock_mode": True},
+            headers={"X-API-Key": "test-key"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        results = {line["article_id"]: line for line in lines[:-1]}
+        assert all(line["type"] == "result" for line in lines[:-1])
+        assert results["a"]["success"] and results["a"]["detail_full"] == "Neutral body a"
+        assert not results["bad"]["success"] and "boom" in results["bad"]["error"]
+        assert lines[-1]["type"] == "summary"
+        assert (lines[-1]["total_articles"], lines[-1]["successful"], lines[-1]["failed"]) == (3, 2, 1)
+
+    def test_non_streaming_response_unchanged(self, client):
+        response = client.post(
+            "/v2/batch",
+            json={"articles": [{"article_id": "a", "body": "Body a"}]},
+            headers={"X-API-Key": "test-key"},
+        )
+
+        data = response.json()
+        assert data["successful"] == 1
+        assert data["results"][0]["feed_title"] == "Title a"
+        assert "type" not in data["results"][0]
@@ -0,0 +1,226 @@
+# tests/unit/test_prompt_registry.py
+"""
+Unit tests for the versioned prompt registry.
+
+Covers:
+- One query loads every active prompt; lookups never touch the DB
+- Change-stamp checks, explicit invalidation and version numbering
+- Serving the previous snapshot when a reload fails
+- Per-context overrides
+- get_prompt / get_active_model / get_model_agnostic_prompt on top of the registry
+"""
+
+import time
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+from app.services.neutralizer import (
+    NeutralizerConfigError,
+    get_active_model,
+    get_model_agnostic_prompt,
+    get_prompt,
+)
+from app.services.prompt_registry import PromptRegistry, override_prompts
+
+
+@pytest.fixture
+def db_engine():
+    engine = create_engine("sqlite:///:memory:")
+    models.Prompt.__table__.create(engine)
+    return engine
+
+
+@pytest.fixture
+def session_factory(db_engine):
+    return sessionmaker(bind=db_engine)
+
+
+@pytest.fixture
+def statements(db_engine):
+    """SQL statements executed against the test engine."""
+    executed: list[str] = []
+    event.listen(db_engine, "before_cursor_execute", lambda conn, cursor, sql, *args: executed.append(sql))
+    return executed
+
+
+def _add_prompt(session_factory, name, content, model=None, is_active=True, version=1):
+    db = session_factory()
+    db.add(
+        models.Prompt(
+            id=uuid.uuid4(),
+            name=name,
+            model=model,
+            content=content,
+            version=version,
+            is_active=is_active,
+            updated_at=datetime.now(UTC),
+        )
+    )
+    db.commit()
+    db.close()
+
+
+def _update_prompt(session_factory, name, content):
+    db = session_factory()
+    prompt = db.query(models.Prompt).filter(models.Prompt.name == name).one()
+    prompt.content = content
+    prompt.version += 1
+    prompt.updated_at = datetime.now(UTC)
+    db.commit()
+    db.close()
+
+
+@pytest.fixture
+def seeded(session_factory):
+    _add_prompt(session_factory, "system_prompt", "system v1", model="gpt-4o-mini")
+    _add_prompt(session_factory, "span_detection_prompt", "spans v1", model="gpt-4o-mini")
+    _add_prompt(session_factory, "high_recall_prompt", "recall v1")
+    _add_prompt(session_factory, "span_detection_prompt", "old spans", model="gemini-2.0-flash", is_active=False)
+    return session_factory
+
+
+class TestPromptRegistry:
+    """Snapshot loading and invalidation."""
+
+    def test_loads_active_prompts(self, seeded):
+        snapshot = PromptRegistry(seeded).snapshot()
+
+        assert snapshot.prompts == {
+            ("system_prompt", "gpt-4o-mini"): "system v1",
+            ("span_detection_prompt", "gpt-4o-mini"): "spans v1",
+            ("high_recall_prompt", None): "recall v1",
+        }
+        assert snapshot.active_model == "gpt-4o-mini"
+        assert snapshot.version == 1
+
+    def test_lookups_do_not_query(self, seeded, statements):
+        registry = PromptRegistry(seeded, check_interval=60)
+        registry.snapshot()
+        loaded = len(statements)
+
+        for _ in range(100):
+            assert registry.get("span_detection_prompt", "gpt-4o-mini") == "spans v1"
+            assert registry.get("missing", None) is None
+            assert registry.get_any("high_recall_prompt") == "recall v1"
+
+        # Stamp plus one query for all active prompts, nothing after
+        assert loaded == 2
+        assert len(statements) == loaded
+
+    def test_unchanged_stamp_keeps_snapshot(self, seeded, statements):
+        registry = PromptRegistry(seeded, check_interval=0)
+        first = registry.snapshot()
+        loaded = len(statements)
+
+        assert registry.snapshot() is first
+        # Only the stamp was re-read
+        assert len(statements) == loaded + 1
+
+    def test_change_detected_by_stamp(self, seeded):
+        registry = PromptRegistry(seeded, check_interval=0)
+        registry.snapshot()
+
+        _update_prompt(seeded, "high_recall_prompt", "recall v2")
+
+        assert registry.get("high_recall_prompt", None) == "recall v2"
+        assert registry.snapshot().version == 2
+
+    def test_change_not_seen_within_interval(self, seeded):
+        registry = PromptRegistry(seeded, check_interval=60)
+        registry.snapshot()
+
+        _update_prompt(seeded, "high_recall_prompt", "recall v2")
+
+        assert registry.get("high_recall_prompt", None) == "recall v1"
+
+    def test_invalidate_forces_reload(self, seeded):
+        registry = PromptRegistry(seeded, check_interval=60)
+        registry.snapshot()
+        _update_prompt(seeded, "high_recall_prompt", "recall v2")
+
+        registry.invalidate()
+
+        assert registry.get("high_recall_prompt", None) == "recall v2"
+
+    def test_listener_skips_stamp_checks(self, seeded, statements):
+        registry = PromptRegistry(seeded, check_interval=0)
+        registry.snapshot()
+        loaded = len(statements)
+        registry._listening = True
+
+        registry.snapshot()
+
+        assert len(statements) == loaded
+
+    def test_failed_reload_serves_previous_snapshot(self, seeded):
+        registry = PromptRegistry(seeded, check_interval=60)
+        first = registry.snapshot()
+        registry.invalidate()
+
+        with patch.object(registry, "_load", side_effect=RuntimeError("db down")) as load:
+            assert registry.snapshot() is first
+            # Backs off instead of retrying on every lookup
+            assert registry.snapshot() is first
+            assert load.call_count == 1
+
+        registry._retry_after = time.monotonic()
+        assert registry.snapshot().version == 2
+
+    def test_first_load_failure_raises(self):
+        def broken_session():
+            raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            PromptRegistry(broken_session).snapshot()
+
+    def test_listener_needs_postgres(self, db_engine, session_factory):
+        assert PromptRegistry(session_factory).start_listener(db_engine) is False
+
+    def test_override_prompts(self, seeded):
+        registry = PromptRegistry(seeded)
+
+        with override_prompts({"span_detection_prompt": "trial"}):
+            assert registry.get("span_detection_prompt", "gpt-4o-mini") == "trial"
+            assert registry.get_any("span_detection_prompt") == "trial"
+        assert registry.get("span_detection_prompt", "gpt-4o-mini") == "spans v1"
+
+
+class TestNeutralizerPromptLookups:
+    """Neutralizer prompt accessors read the registry snapshot."""
+
+    def _patch_registry(self, registry):
+        return patch("app.services.neutralizer.get_prompt_registry", return_value=registry)
+
+    def test_get_prompt_uses_active_model(self, seeded):
+        with self._patch_registry(PromptRegistry(seeded)):
+            assert get_active_model() == "gpt-4o-mini"
+            assert get_prompt("span_detection_prompt", "default") == "spans v1"
+            assert get_prompt("user_prompt_template", "default") == "default"
+            assert get_model_agnostic_prompt("high_recall_prompt", "default") == "recall v1"
+
+    def test_no_active_system_prompt(self, session_factory):
+        _add_prompt(session_factory, "high_recall_prompt", "recall v1")
+
+        with self._patch_registry(PromptRegistry(session_factory)), pytest.raises(NeutralizerConfigError):
+            get_active_model()
+
+    def test_system_prompt_without_model(self, session_factory):
+        _add_prompt(session_factory, "system_prompt", "system v1")
+
+        with self._patch_registry(PromptRegistry(session_factory)), pytest.raises(NeutralizerConfigError):
+            get_active_model()
+
+    def test_db_failure(self):
+        def broken_session():
+            raise RuntimeError("db down")
+
+        with self._patch_registry(PromptRegistry(broken_session)):
+            with pytest.raises(NeutralizerConfigError):
+                get_active_model()
+            assert get_model_agnostic_prompt("high_recall_prompt", "default") == "default"
@@ -1,21 +1,38 @@
 """
 Unit tests for resilience patterns.
 
-Tests circuit breaker, retry decorators, and rate limiter.
+Tests circuit breaker, retry decorators, rate limiter and adaptive concurrency.
 """
 
 import asyncio
+import threading
 import time
+from types import SimpleNamespace
 
 import pytest
 
 from app.services.resilience import (
+    OUTCOME_ERROR,
+    OUTCOME_OK,
+    OUTCOME_RATE_LIMITED,
+    OUTCOME_TIMEOUT,
+    AdaptiveConcurrencyLimiter,
     CircuitBreaker,
     CircuitOpenError,
     CircuitState,
+    ConcurrencyCoordinator,
     LLMRateLimitError,
     LLMTimeoutError,
+    PostgresAdvisoryCoordinator,
+    RateBucketCoordinator,
     RateLimiter,
+    classify_llm_exception,
+    get_llm_limiter,
+    get_llm_rate_limiter,
+    get_rate_limiter,
+    llm_permit,
+    reset_llm_limiters,
+    reset_rate_limiters,
     with_retry,
     with_sync_retry,
     with_timeout,
@@ -268,6 +285,146 @@ class TestRateLimiter:
         # Should have fewer tokens after acquisition
         assert limiter._tokens < 10
 
+    def test_try_acquire_reports_wait(self):
+        """An empty bucket reports how long until enough tokens refill."""
+        limiter = RateLimiter(tokens_per_second=10, max_tokens=2)
+
+        assert limiter.try_acquire(2) == 0
+        wait = limiter.try_acquire(1)
+
+        assert 0 < wait <= 0.1
+
+    def test_shared_across_threads_and_event_loops(self):
+        """One limiter can be used from several threads, each with its own event loop."""
+        limiter = RateLimiter(tokens_per_second=1, max_tokens=4)
+
+        threads = [threading.Thread(target=lambda: asyncio.run(limiter.acquire())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert limiter._tokens < 1
+
+    def test_coordinator_holds_the_bucket(self):
+        """With a coordinator, tokens come from the shared bucket, not the local one."""
+
+        class FakeCoordinator(RateBucketCoordinator):
+            def __init__(self):
+                self.calls = []
+
+            def try_take(self, key, tokens, tokens_per_second, max_tokens):
+                self.calls.append((key, tokens))
+                return 0.5
+
+        coordinator = FakeCoordinator()
+        limiter = RateLimiter(tokens_per_second=10, max_tokens=10, name="shared", coordinator=coordinator)
+
+        assert limiter.try_acquire() == 0.5
+        assert coordinator.calls == [("shared", 1)]
+        assert limiter._tokens == 10
+
+    def test_coordinator_failure_falls_back_to_local_bucket(self):
+        """A database outage does not stop rate-limited callers."""
+
+        class BrokenCoordinator(RateBucketCoordinator):
+            def try_take(self, key, tokens, tokens_per_second, max_tokens):
+                raise ConnectionError("database down")
+
+        limiter = RateLimiter(tokens_per_second=10, max_tokens=10, coordinator=BrokenCoordinator())
+
+        assert limiter.try_acquire() == 0
+        assert limiter._tokens == 9
+
+    def test_coordinator_failure_backs_off_from_database(self):
+        """After a failure, acquires skip the database until the backoff expires."""
+
+        class BrokenCoordinator(RateBucketCoordinator):
+            calls = 0
+
+            def try_take(self, key, tokens, tokens_per_second, max_tokens):
+                BrokenCoordinator.calls += 1
+                raise ConnectionError("database down")
+
+        limiter = RateLimiter(tokens_per_second=10, max_tokens=10, coordinator=BrokenCoordinator())
+
+        for _ in range(3):
+            limiter.try_acquire()
+        assert BrokenCoordinator.calls == 1
+
+        limiter._coordinator_retry_at = time.monotonic()
+        limiter.try_acquire()
+        assert BrokenCoordinator.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_async_acquire_calls_coordinator_off_event_loop(self):
+        """The coordinator's blocking database call runs in a worker thread."""
+
+        class RecordingCoordinator(RateBucketCoordinator):
+            def __init__(self):
+                self.threads = []
+
+            def try_take(self, key, tokens, tokens_per_second, max_tokens):
+                self.threads.append(threading.get_ident())
+                return 0.0 if len(self.threads) > 1 else 0.01
+
+        coordinator = RecordingCoordinator()
+        limiter = RateLimiter(tokens_per_second=10, max_tokens=10, coordinator=coordinator)
+
+        await limiter.acquire()
+
+        assert len(coordinator.threads) == 2
+        assert threading.get_ident() not in coordinator.threads
+
+
+class TestRateLimiterRegistry:
+    """Tests for the process-wide rate limiter registry."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_registry(self):
+        reset_rate_limiters()
+        yield
+        reset_rate_limiters()
+
+    def test_registry_shares_limiter_per_name(self):
+        """Every caller asking for a name gets the same bucket; the first caller sets its rate."""
+        a = get_rate_limiter("ntrl_batcher", 20.0, 10)
+
+        assert get_rate_limiter("ntrl_batcher", 5.0, 5) is a
+        assert a.tokens_per_second == 20.0
+        assert get_rate_limiter("other", 20.0, 10) is not a
+
+    def test_llm_rate_limiter_from_rpm_budgets(self, monkeypatch):
+        """Requests-per-minute budgets are looked up per provider/model, then per provider."""
+        settings = SimpleNamespace(
+            LLM_RPM_BUDGETS={"openai": 600, "anthropic:claude-haiku-4-5": 120},
+            RATE_LIMIT_DB_COORDINATION=False,
+        )
+        monkeypatch.setattr("app.services.resilience._llm_limiter_settings", lambda: settings)
+
+        openai = get_llm_rate_limiter("openai", "gpt-4o-mini")
+        haiku = get_llm_rate_limiter("anthropic", "claude-haiku-4-5")
+
+        assert openai.tokens_per_second == 10.0
+        assert openai.max_tokens == 10
+        assert get_llm_rate_limiter("openai", "gpt-4o-mini") is openai
+        assert haiku.tokens_per_second == 2.0
+        assert get_llm_rate_limiter("anthropic", "claude-sonnet-4-5") is None
+
+    def test_llm_permit_takes_a_request(self, monkeypatch):
+        """Every LLM permit draws one request from the provider/model bucket."""
+        settings = SimpleNamespace(
+            LLM_ADAPTIVE_CONCURRENCY=False,
+            LLM_RPM_BUDGETS={"openai": 600},
+            RATE_LIMIT_DB_COORDINATION=False,
+        )
+        monkeypatch.setattr("app.services.resilience._llm_limiter_settings", lambda: settings)
+
+        with llm_permit("openai", "gpt-4o-mini"):
+            pass
+
+        assert get_llm_rate_limiter("openai", "gpt-4o-mini")._tokens < 10
+
 
 class TestWithTimeout:
     """Tests for timeout helper."""
@@ -320,3 +477,256 @@ class TestLLMExceptions:
         """Test LLMTimeoutError exception."""
         error = LLMTimeoutError("Request timed out")
         assert str(error) == "Request timed out"
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Tests for the AIMD LLM concurrency limiter."""
+
+    def _complete(self, limiter, count, latency=1.0, outcome=OUTCOME_OK):
+        """Run `count` calls of the given latency through the limiter."""
+        for _ in range(count):
+            limiter.acquire()
+            limiter.release(time.monotonic() - latency, outcome)
+
+    def test_additive_increase_on_healthy_window(self):
+        """A full window of healthy calls raises the limit by one."""
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=2, window_size=5)
+
+        self._complete(limiter, 5)
+        assert limiter.limit == 3
+        self._complete(limiter, 5)
+        assert limiter.limit == 4
+
+    def test_limit_capped_at_max(self):
+        """The limit never grows past max_limit."""
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=2, max_limit=3, window_size=2)
+
+        self._complete(limiter, 10)
+
+        assert limiter.limit == 3
+
+    def test_rate_limit_cuts_once_per_burst(self):
+        """A burst of 429s from calls already in flight only halves the limit once."""
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=8)
+        started = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+
+        for _ in range(4):
+            limiter.release(started, OUTCOME_RATE_LIMITED)
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_timeout_cuts_limit(self):
+        """Timeouts are treated as congestion; calls started after a cut can cut again."""
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=8)
+
+        self._complete(limiter, 1, outcome=OUTCOME_TIMEOUT)
+        self._complete(limiter, 1, latency=-0.01, outcome=OUTCOME_TIMEOUT)
+
+        assert limiter.limit == 2
+
+    def test_limit_floor(self):
+        """The limit never drops below min_limit."""
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=2, min_limit=1)
+
+        self._complete(limiter, 5, outcome=OUTCOME_RATE_LIMITED)
+
+        assert limiter.limit == 1
+
+    def test_error_rate_cuts_limit(self):
+        """A window with too many errors cuts the limit."""
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=8, window_size=5)
+
+        self._complete(limiter, 3)
+        self._complete(limiter, 2, outcome=OUTCOME_ERROR)
+
+        assert limiter.limit == 4
+
+    def test_latency_drift_cuts_limit(self):
+        """p95 drifting past the tolerance over the best window cuts the limit."""
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=4, window_size=5, latency_tolerance=2.0)
+
+        self._complete(limiter, 5, latency=1.0)
+        assert limiter.limit == 5
+        self._complete(limiter, 5, latency=5.0)
+
+        assert limiter.limit == 2
+
+    def test_try_acquire_respects_limit(self):
+        """Permits beyond the limit are refused until one is released."""
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=1)
+
+        assert limiter.try_acquire()[0] is True
+        assert limiter.try_acquire()[0] is False
+        limiter.release(time.monotonic(), OUTCOME_OK)
+        assert limiter.try_acquire()[0] is True
+
+    def test_tpm_budget(self):
+        """Calls wait once the tokens-per-minute budget is spent; actual usage is reconciled."""
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=10, tokens_per_minute=6000)
+
+        assert limiter.try_acquire(5000)[0] is True
+        acquired, wait, _ = limiter.try_acquire(5000)
+        assert acquired is False
+        assert wait > 30  # ~40s to refill 4000 tokens at 100/s
+
+        # The first call only used 1000 tokens: the other 4000 are refunded
+        limiter.release(time.monotonic(), OUTCOME_OK, estimated_tokens=5000, actual_tokens=1000)
+        assert limiter.try_acquire(5000)[0] is True
+
+    def test_classify_llm_exception(self):
+        """SDK exceptions are classified by status code and class name."""
+
+        class RateLimitError(Exception):
+            pass
+
+        class APITimeoutError(Exception):
+            pass
+
+        class APIStatusError(Exception):
+            status_code = 429
+
+        assert classify_llm_exception(RateLimitError()) == OUTCOME_RATE_LIMITED
+        assert classify_llm_exception(APIStatusError()) == OUTCOME_RATE_LIMITED
+        assert classify_llm_exception(LLMRateLimitError()) == OUTCOME_RATE_LIMITED
+        assert classify_llm_exception(APITimeoutError()) == OUTCOME_TIMEOUT
+        assert classify_llm_exception(TimeoutError()) == OUTCOME_TIMEOUT
+        assert classify_llm_exception(ValueError()) == OUTCOME_ERROR
+
+    def test_permit_releases_on_exception(self):
+        """A permit is returned and the limit cut when the call raises a 429."""
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=4)
+
+        with pytest.raises(LLMRateLimitError):
+            with limiter.permit():
+                assert limiter.in_flight == 1
+                raise LLMRateLimitError("429")
+
+        assert limiter.in_flight == 0
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_async_permit_records_status(self):
+        """Raw HTTP callers report 429s via record_status."""
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=4)
+
+        async with limiter.permit() as permit:
+            permit.record_status(429)
+
+        assert limiter.in_flight == 0
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_async_acquire_waits_for_release(self):
+        """Async callers wait on the event loop for a permit."""
+        limiter = AdaptiveConcurrencyLimiter(name="test", initial_limit=1)
+        limiter.acquire()
+
+        async def release_later():
+            await asyncio.sleep(0.1)
+            limiter.release(time.monotonic(), OUTCOME_OK)
+
+        task = asyncio.create_task(release_later())
+        await limiter.acquire_async()
+        await task
+
+        assert limiter.in_flight == 1
+
+    def test_full_shared_slots_time_out(self):
+        """A blocking acquire gives up when cross-process slots never free up."""
+
+        class FullCoordinator(ConcurrencyCoordinator):
+            def try_acquire_slot(self, key, limit):
+                return None
+
+            def release_slot(self, handle):
+                pass
+
+        limiter = AdaptiveConcurrencyLimiter(name="test", acquire_timeout_seconds=0.3, coordinator=FullCoordinator())
+
+        with pytest.raises(LLMRateLimitError):
+            limiter.acquire()
+        assert limiter.in_flight == 0
+
+    def test_coordinator_failure_backs_off_from_database(self):
+        """After a failure, permits skip the database until the backoff expires."""
+
+        class BrokenCoordinator(ConcurrencyCoordinator):
+            calls = 0
+
+            def try_acquire_slot(self, key, limit):
+                BrokenCoordinator.calls += 1
+                raise ConnectionError("database down")
+
+            def release_slot(self, handle):
+                pass
+
+        limiter = AdaptiveConcurrencyLimiter(name="test", coordinator=BrokenCoordinator())
+
+        for _ in range(3):
+            with limiter.permit():
+                pass
+        assert BrokenCoordinator.calls == 1
+
+        limiter._coordinator_retry_at = time.monotonic()
+        with limiter.permit():
+            pass
+        assert BrokenCoordinator.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_async_permit_calls_coordinator_off_event_loop(self):
+        """Slot claims and releases run in a worker thread, not on the event loop."""
+
+        class RecordingCoordinator(ConcurrencyCoordinator):
+            def __init__(self):
+                self.threads = []
+
+            def try_acquire_slot(self, key, limit):
+                self.threads.append(threading.get_ident())
+                return "slot"
+
+            def release_slot(self, handle):
+                self.threads.append(threading.get_ident())
+
+        coordinator = RecordingCoordinator()
+        limiter = AdaptiveConcurrencyLimiter(name="test", coordinator=coordinator)
+
+        async with limiter.permit():
+            assert limiter.in_flight == 1
+
+        assert limiter.in_flight == 0
+        assert len(coordinator.threads) == 2
+        assert threading.get_ident() not in coordinator.threads
+
+    def test_advisory_coordinator_caps_shared_slots(self):
+        """Each key holds at most max_slots advisory locks, whatever the limit."""
+        tried = []
+
+        class FakeConnection:
+            def execute(self, statement, params):
+                tried.append(params["s"])
+                return SimpleNamespace(scalar=lambda: False)
+
+            def close(self):
+                pass
+
+        coordinator = PostgresAdvisoryCoordinator(SimpleNamespace(connect=FakeConnection), max_slots=3)
+
+        assert coordinator.try_acquire_slot("openai:gpt-4o-mini", limit=16) is None
+        assert tried == [0, 1, 2]
+
+    def test_registry_shares_limiter_per_model(self):
+        """One limiter per provider/model, shared by all call sites."""
+        reset_llm_limiters()
+        try:
+            a = get_llm_limiter("openai", "gpt-4o-mini")
+            assert get_llm_limiter("openai", "gpt-4o-mini") is a
+            assert get_llm_limiter("openai", "gpt-5-mini") is not a
+
+            with llm_permit("openai", "gpt-4o-mini"):
+                assert a.in_flight == 1
+            assert a.in_flight == 0
+        finally:
+            reset_llm_limiters()
@@ -0,0 +1,175 @@
+# tests/unit/test_result_cache.py
+"""
+Unit tests for the NTRLPipeline result cache.
+
+Covers:
+- Immutable entries (get returns a copy, set stores a snapshot)
+- LRU eviction by pickled byte size
+- TTL expiry
+- Disk tier persistence, promotion, trimming and damaged entries
+- Async access with disk I/O off the event loop
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from app.services.ntrl_result_cache import ResultCache
+
+
+def _payload(size: int) -> dict:
+    return {"body": "x" * size}
+
+
+class TestMemoryTier:
+    def test_entries_are_immutable(self):
+        cache = ResultCache(ttl_seconds=60)
+        value = {"feed_title": "Senate passes budget", "flags": []}
+
+        cache.set("k", value)
+        value["flags"].append("mutated after set")
+        first = cache.get("k")
+        first["feed_title"] = "mutated after get"
+
+        assert cache.get("k") == {"feed_title": "Senate passes budget", "flags": []}
+
+    def test_lru_eviction_by_bytes(self):
+        cache = ResultCache(ttl_seconds=60, max_bytes=2500)
+        cache.set("a", _payload(1000))
+        cache.set("b", _payload(1000))
+        cache.get("a")  # "b" is now least recently used
+
+        cache.set("c", _payload(1000))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert cache.size_bytes <= 2500
+        assert cache.stats()["evictions"] == 1
+
+    def test_oversized_entry_not_cached(self):
+        cache = ResultCache(ttl_seconds=60, max_bytes=100)
+        cache.set("small", "ok")
+
+        cache.set("big", _payload(1000))
+
+        assert cache.get("big") is None
+        assert cache.get("small") == "ok"
+
+    def test_ttl_expiry(self):
+        cache = ResultCache(ttl_seconds=10)
+        with patch("app.services.ntrl_result_cache.time.time", return_value=1000.0):
+            cache.set("k", "v")
+        with patch("app.services.ntrl_result_cache.time.time", return_value=1009.0):
+            assert cache.get("k") == "v"
+        with patch("app.services.ntrl_result_cache.time.time", return_value=1011.0):
+            assert cache.get("k") is None
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["expirations"], stats["misses"], stats["entries"]) == (1, 1, 1, 0)
+
+
+class TestDiskTier:
+    def test_survives_restart_and_promotes(self, tmp_path):
+        ResultCache(ttl_seconds=60, disk_dir=str(tmp_path)).set("k", _payload(10))
+
+        cache = ResultCache(ttl_seconds=60, disk_dir=str(tmp_path))
+
+        assert cache.get("k") == _payload(10)
+        assert cache.get("k") == _payload(10)
+        assert (cache.disk_hits, cache.hits) == (1, 1)
+
+    def test_memory_eviction_falls_back_to_disk(self, tmp_path):
+        cache = ResultCache(ttl_seconds=60, max_bytes=1500, disk_dir=str(tmp_path))
+        cache.set("a", _payload(1000))
+        cache.set("b", _payload(1000))
+
+        assert cache.get("a") == _payload(1000)
+        assert cache.disk_hits == 1
+
+    def test_expired_disk_entry_removed(self, tmp_path):
+        with patch("app.services.ntrl_result_cache.time.time", return_value=1000.0):
+            ResultCache(ttl_seconds=10, disk_dir=str(tmp_path)).set("k", "v")
+
+        with patch("app.services.ntrl_result_cache.time.time", return_value=2000.0):
+            assert ResultCache(ttl_seconds=10, disk_dir=str(tmp_path)).get("k") is None
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_disk_trimmed_to_bound(self, tmp_path):
+        cache = ResultCache(ttl_seconds=60, disk_dir=str(tmp_path), disk_max_bytes=2500)
+
+        for key in "abcd":
+            cache.set(key, _payload(1000))
+
+        assert sum(path.stat().st_size for path in tmp_path.iterdir()) <= 2500
+        assert cache.disk_evictions >= 2
+
+    def test_disk_size_tracked_without_rescanning(self, tmp_path):
+        ResultCache(ttl_seconds=60, disk_dir=str(tmp_path)).set("old", _payload(1000))
+        cache = ResultCache(ttl_seconds=60, disk_dir=str(tmp_path), disk_max_bytes=2500)
+        assert cache.stats()["disk_bytes"] > 1000  # scanned at startup
+
+        with patch.object(cache, "_scan_disk", side_effect=AssertionError("rescanned")):
+            cache.set("a", _payload(1000))
+            cache.set("b", _payload(1000))
+
+        assert sorted(path.stat().st_size for path in tmp_path.iterdir()) == [cache.stats()["disk_bytes"] // 2] * 2
+        assert cache.get("old") is None and cache.disk_evictions == 1
+
+    def test_truncated_entry_is_a_miss(self, tmp_path):
+        cache = ResultCache(ttl_seconds=60, disk_dir=str(tmp_path))
+        cache.set("k", "v")
+        cache.clear()
+        (path,) = tmp_path.iterdir()
+        path.write_bytes(b"\x00\x01")
+
+        assert cache.get("k") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_entry_trimmed_during_read_is_a_miss(self, tmp_path):
+        cache = ResultCache(ttl_seconds=60, disk_dir=str(tmp_path))
+        cache.set("k", "v")
+        cache.clear()
+
+        with patch("app.services.ntrl_result_cache.os.utime", side_effect=FileNotFoundError):
+            assert cache.get("k") is None
+        assert cache.misses == 1
+
+
+class TestAsyncAccess:
+    @pytest.mark.asyncio
+    async def test_disk_io_runs_in_worker_thread(self, tmp_path):
+        cache = ResultCache(ttl_seconds=60, disk_dir=str(tmp_path))
+        loop_thread = threading.get_ident()
+        io_threads = []
+        read_disk, write_disk = cache._read_disk, cache._write_disk
+
+        def record(fn):
+            def wrapper(*args):
+                io_threads.append(threading.get_ident())
+                return fn(*args)
+
+            return wrapper
+
+        with (
+            patch.object(cache, "_read_disk", record(read_disk)),
+            patch.object(cache, "_write_disk", record(write_disk)),
+        ):
+            await cache.aset("k", _payload(10))
+            cache.clear()
+            assert await cache.aget("k") == _payload(10)
+            assert await cache.aget("k") == _payload(10)  # memory hit, no disk I/O
+
+        assert len(io_threads) == 2 and loop_thread not in io_threads
+        assert (cache.disk_hits, cache.hits) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_memory_only_cache(self):
+        cache = ResultCache(ttl_seconds=60)
+
+        assert await cache.aget("k") is None
+        await cache.aset("k", "v")
+
+        assert await cache.aget("k") == "v"
+        assert (cache.misses, cache.hits) == (1, 1)
@@ -0,0 +1,109 @@
+# tests/unit/test_spacy_runtime.py
+"""
+Unit tests for the shared spaCy runtime and its parsed-Doc cache.
+
+Uses a blank English pipeline with counting components, so no trained
+model is needed.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import spacy
+from spacy.language import Language
+
+from app.services.spacy_runtime import SpacyRuntime, load_spacy_model
+
+CALLS: dict[str, int] = {"parser_stub": 0, "ner_stub": 0}
+
+
+@Language.component("parser_stub")
+def _parser_stub(doc):
+    CALLS["parser_stub"] += 1
+    return doc
+
+
+@Language.component("ner_stub")
+def _ner_stub(doc):
+    CALLS["ner_stub"] += 1
+    return doc
+
+
+@pytest.fixture
+def runtime():
+    for name in CALLS:
+        CALLS[name] = 0
+    nlp = spacy.blank("en")
+    nlp.add_pipe("parser_stub")
+    nlp.add_pipe("ner_stub")
+    return SpacyRuntime(nlp, cache_size=2)
+
+
+class TestSpacyRuntime:
+    def test_same_text_parsed_once(self, runtime):
+        first = runtime.parse("The senate passed the budget.")
+        second = runtime.parse("The senate passed the budget.")
+
+        assert first is second
+        assert CALLS == {"parser_stub": 1, "ner_stub": 1}
+        assert (runtime.hits, runtime.misses) == (1, 1)
+
+    def test_disabled_pipe_added_on_demand(self, runtime):
+        text = "Officials said the plan was approved."
+
+        structural = runtime.parse(text, disable=("ner_stub",))
+        assert CALLS == {"parser_stub": 1, "ner_stub": 0}
+
+        full = runtime.parse(text)
+
+        assert full is structural
+        assert CALLS == {"parser_stub": 1, "ner_stub": 1}
+
+    def test_cached_doc_serves_smaller_request(self, runtime):
+        runtime.parse("A full parse.")
+
+        runtime.parse("A full parse.", disable=("ner_stub",))
+
+        assert CALLS == {"parser_stub": 1, "ner_stub": 1}
+
+    def test_lru_eviction(self, runtime):
+        runtime.parse("one")
+        runtime.parse("two")
+        runtime.parse("one")  # refreshes "one"
+        runtime.parse("three")  # evicts "two"
+
+        runtime.parse("one")
+        runtime.parse("two")
+
+        assert runtime.cached_docs == 2
+        assert runtime.misses == 4
+
+    def test_model_allowlist(self):
+        with pytest.raises(ValueError):
+            load_spacy_model("../../evil_model")
+
+
+class TestParseMany:
+    def test_batch_parsed_with_pipe_and_cached(self, runtime):
+        runtime.cache_size = 8
+        runtime.parse("cached")
+        texts = ["one", "two", "cached", "one"]
+
+        with patch.object(runtime.nlp, "pipe", wraps=runtime.nlp.pipe) as pipe:
+            docs = runtime.parse_many(texts, disable=("ner_stub",), batch_size=2)
+
+        assert [doc.text for doc in docs] == texts
+        assert docs[0] is docs[3]
+        pipe.assert_called_once()
+        assert pipe.call_args.kwargs["batch_size"] == 2
+        assert CALLS == {"parser_stub": 3, "ner_stub": 1}
+        assert runtime.parse("two", disable=("ner_stub",)) is docs[1]
+
+    def test_all_cached_skips_pipe(self, runtime):
+        runtime.parse("one")
+
+        with patch.object(runtime.nlp, "pipe") as pipe:
+            docs = runtime.parse_many(["one"])
+
+        assert docs[0].text == "one"
+        pipe.assert_not_called()
@@ -0,0 +1,208 @@
+# tests/unit/test_span_merging.py
+"""
+Property tests for the sort-and-sweep span mergers.
+
+merge_multi_pass_spans and NTRLScanner._merge_spans used to compare every
+span against every group / merged span. The sweep versions must give
+exactly the same output, including tie-breaking, so each is checked against
+a verbatim copy of the old quadratic implementation on randomly generated
+span sets (seeded, so failures reproduce).
+
+Covers:
+- Grouping by overlap or identical text, best-span selection, final sweep
+- Empty and nested spans, duplicate positions, text collisions
+- Scanner same-type/different-type resolution and secondary type IDs
+- Non-default and negative overlap thresholds
+"""
+
+import copy
+import random
+
+import pytest
+
+from app.models import SpanAction, SpanReason
+from app.services.neutralizer import TransparencySpan
+from app.services.neutralizer.spans import _spans_overlap, merge_multi_pass_spans
+from app.services.ntrl_scan.scanner import NTRLScanner, ScannerConfig
+from app.services.ntrl_scan.types import ArticleSegment, DetectionInstance, DetectorSource
+
+WORDS = ["shocking", "slams", "crisis", "devastating blow", "BREAKING", "Shocking", "huge"]
+
+
+def _reference_merge_multi_pass_spans(span_lists: list) -> list:
+    """merge_multi_pass_spans before the sweep (logging removed)."""
+    if not span_lists:
+        return []
+    all_spans = []
+    for pass_idx, spans in enumerate(span_lists):
+        if not spans:
+            continue
+        for span in spans:
+            all_spans.append(
+                {
+                    "span": span,
+                    "pass_idx": pass_idx,
+                    "key": f"{span.start_char}:{span.end_char}:{span.original_text.lower()}",
+                }
+            )
+    if not all_spans:
+        return []
+    span_groups = {}
+    for item in all_spans:
+        span = item["span"]
+        matched_group = None
+        for key, group in span_groups.items():
+            existing_span = group[0]["span"]
+            if _spans_overlap(span, existing_span):
+                matched_group = key
+                break
+            if span.original_text.lower() == existing_span.original_text.lower():
+                matched_group = key
+                break
+        if matched_group:
+            span_groups[matched_group].append(item)
+        else:
+            span_groups[item["key"]] = [item]
+    final_spans = []
+    for _key, group in span_groups.items():
+        best = group[0]["span"]
+        for item in group[1:]:
+            span = item["span"]
+            if (
+                span.action.value > best.action.value
+                or span.action == best.action
+                and len(span.original_text) > len(best.original_text)
+            ):
+                best = span
+        final_spans.append(best)
+    final_spans.sort(key=lambda s: s.start_char)
+    non_overlapping = []
+    last_end = -1
+    for span in final_spans:
+        if span.start_char >= last_end:
+            non_overlapping.append(span)
+            last_end = span.end_char
+        else:
+            if non_overlapping and len(span.original_text) > len(non_overlapping[-1].original_text):
+                non_overlapping[-1] = span
+                last_end = span.end_char
+    return non_overlapping
+
+
+def _reference_scanner_merge(scanner: NTRLScanner, spans: list[DetectionInstance]) -> list[DetectionInstance]:
+    """NTRLScanner._merge_spans before the sweep."""
+    if not spans:
+        return []
+    sorted_spans = sorted(spans, key=lambda s: (s.span_start, s.span_end))
+    merged: list[DetectionInstance] = []
+    for span in sorted_spans:
+        overlapping = None
+        overlap_ratio = 0.0
+        for existing in merged:
+            ratio = scanner._compute_overlap(span, existing)
+            if ratio > scanner.config.overlap_threshold:
+                overlapping = existing
+                overlap_ratio = ratio
+                break
+        if overlapping is None:
+            merged.append(span)
+        else:
+            if span.type_id_primary == overlapping.type_id_primary:
+                if span.confidence > overlapping.confidence:
+                    merged.remove(overlapping)
+                    merged.append(span)
+            else:
+                if overlap_ratio < 0.9:
+                    merged.append(span)
+                else:
+                    if span.severity > overlapping.severity:
+                        span.type_ids_secondary.append(overlapping.type_id_primary)
+                        merged.remove(overlapping)
+                        merged.append(span)
+                    else:
+                        overlapping.type_ids_secondary.append(span.type_id_primary)
+    return merged
+
+
+def _random_transparency_span(rng: random.Random, length: int) -> TransparencySpan:
+    start = rng.randrange(length)
+    text = rng.choice(WORDS)
+    end = min(length, start + rng.choice([0, len(text), len(text), rng.randint(1, 30)]))
+    return TransparencySpan(
+        field="body",
+        start_char=start,
+        end_char=end,
+        original_text=text,
+        action=rng.choice(list(SpanAction)),
+        reason=SpanReason.EMOTIONAL_TRIGGER,
+    )
+
+
+def _random_detection(rng: random.Random, length: int) -> DetectionInstance:
+    start = rng.randrange(length)
+    end = min(length, start + rng.choice([0, rng.randint(1, 6), rng.randint(1, 25)]))
+    return DetectionInstance(
+        type_id_primary=rng.choice(["A.1.1", "A.1.2", "B.2.1"]),
+        segment=ArticleSegment.BODY,
+        span_start=start,
+        span_end=end,
+        text="x" * (end - start),
+        confidence=rng.choice([0.5, 0.7, 0.9]),
+        severity=rng.randint(1, 5),
+        detector_source=rng.choice(list(DetectorSource)),
+    )
+
+
+class TestMergeMultiPassSpans:
+    """merge_multi_pass_spans matches the quadratic implementation."""
+
+    @pytest.mark.parametrize("seed", range(40))
+    def test_matches_reference(self, seed):
+        rng = random.Random(seed)
+        length = rng.choice([40, 120, 400])
+        span_lists = [
+            [_random_transparency_span(rng, length) for _ in range(rng.randint(0, 60))]
+            for _ in range(rng.randint(1, 4))
+        ]
+
+        assert merge_multi_pass_spans(span_lists, "") == _reference_merge_multi_pass_spans(span_lists)
+
+    def test_empty_inputs(self):
+        assert merge_multi_pass_spans([], "") == []
+        assert merge_multi_pass_spans([[], None], "") == []
+
+    def test_same_text_groups_across_positions(self):
+        """Identical text joins the first group even when positions differ."""
+        first = TransparencySpan("body", 0, 8, "shocking", SpanAction.SOFTENED, SpanReason.EMOTIONAL_TRIGGER)
+        later = TransparencySpan("body", 50, 58, "Shocking", SpanAction.REMOVED, SpanReason.EMOTIONAL_TRIGGER)
+
+        assert merge_multi_pass_spans([[first], [later]], "") == [first]
+
+
+class TestScannerMergeSpans:
+    """NTRLScanner._merge_spans matches the quadratic implementation."""
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.0, 0.3, 0.8, -0.1])
+    @pytest.mark.parametrize("seed", range(15))
+    def test_matches_reference(self, seed, threshold):
+        rng = random.Random(seed)
+        scanner = NTRLScanner(ScannerConfig(overlap_threshold=threshold))
+        length = rng.choice([30, 100, 300])
+        spans = [_random_detection(rng, length) for _ in range(rng.randint(0, 80))]
+        reference_input = copy.deepcopy(spans)
+
+        result = scanner._merge_spans(spans)
+        expected = _reference_scanner_merge(scanner, reference_input)
+
+        assert [(s.detection_id, s.type_ids_secondary) for s in result] == [
+            (s.detection_id, s.type_ids_secondary) for s in expected
+        ]
+
+    def test_replaced_span_moves_to_end(self):
+        """A higher-confidence replacement is ordered after spans merged before it."""
+        scanner = NTRLScanner()
+        low = DetectionInstance("A.1.1", ArticleSegment.BODY, 0, 10, "x" * 10, 0.5, 3, DetectorSource.LEXICAL)
+        other = DetectionInstance("B.2.1", ArticleSegment.BODY, 6, 16, "x" * 10, 0.9, 3, DetectorSource.LEXICAL)
+        high = DetectionInstance("A.1.1", ArticleSegment.BODY, 7, 12, "x" * 5, 0.9, 3, DetectorSource.LEXICAL)
+
+        assert scanner._merge_spans([low, other, high]) == [other, high]
@@ -0,0 +1,116 @@
+"""
+Unit tests for single-pass validator feature extraction.
+
+Features must count exactly what the validator's per-check scans counted:
+substring occurrences (str.count) for lexicon phrases and \\bword\\b
+matches for whole words.
+"""
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from app.services.ntrl_fix import RedLineValidator, ValidationStatus
+from app.services.ntrl_fix.validator_features import FeatureExtractor
+
+CORPUS_DIR = Path(__file__).parent.parent / "fixtures" / "test_corpus"
+
+LEXICON = (
+    RedLineValidator.SOFT_MODALS
+    | RedLineValidator.HARD_MODALS
+    | RedLineValidator.SCOPE_WORDS
+    | RedLineValidator.CAUSAL_WORDS
+    | set(RedLineValidator.RISK_INDICATORS)
+)
+
+
+def corpus_texts() -> list[str]:
+    texts = []
+    for path in sorted(CORPUS_DIR.glob("article_*.json")):
+        article = json.loads(path.read_text())
+        texts.extend([article["original_title"], article["original_body"]])
+    return texts
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    return FeatureExtractor(LEXICON)
+
+
+@pytest.fixture(scope="module")
+def validator():
+    # The string checks never touch spaCy, so no model is loaded
+    return RedLineValidator()
+
+
+class TestFeatureExtractor:
+    """Feature counts match per-phrase scans."""
+
+    def test_phrase_counts_match_str_count(self, extractor):
+        for text in corpus_texts() + ["The mayor may say so, also", "nono no-no", "alll all"]:
+            features = extractor.extract(text)
+            lower = text.lower()
+            for phrase in LEXICON:
+                assert features.count(phrase) == lower.count(phrase), (phrase, text[:40])
+                assert features.contains(phrase) == (phrase in lower)
+
+    def test_self_overlapping_phrase_counts_non_overlapping(self):
+        features = FeatureExtractor(["aa"]).extract("aaaaa")
+
+        assert features.count("aa") == "aaaaa".count("aa") == 2
+
+    def test_word_counts_match_boundary_regex(self, extractor):
+        for text in corpus_texts() + ["No-one said no, not ever; notably none_ nothing."]:
+            features = extractor.extract(text)
+            lower = text.lower()
+            for word in RedLineValidator.NEGATION_WORDS:
+                assert features.word_counts[word] == len(re.findall(r"\b" + word + r"\b", lower)), word
+
+    def test_numbers_attributions_and_quotes(self, extractor):
+        features = extractor.extract('Police Chief Smith said 1,200 people, or 15%, left. "We will rebuild the town."')
+
+        assert {"1200", "15%"} <= features.numbers
+        assert "police chief smith said" in features.attributions
+        assert features.quotes == {"We will rebuild the town."}
+
+    def test_number_words_are_whole_words(self, extractor):
+        features = extractor.extract("ONE of them, someone, one1 and two-thirds")
+
+        assert features.numbers == {"one", "two", "1"}
+
+
+class TestChecksOnFeatures:
+    """Checks compare extracted features and keep their verdicts."""
+
+    def check(self, validator, name, original, rewritten):
+        method = getattr(validator, f"_check_{name}")
+        return method(validator.extractor.extract(original), validator.extractor.extract(rewritten))
+
+    def test_modality_upgrade_fails(self, validator):
+        result = self.check(validator, "modality", "The suspect allegedly fled.", "The suspect definitely fled.")
+
+        assert result.status == ValidationStatus.FAILED
+
+    def test_removed_negation_fails(self, validator):
+        result = self.check(validator, "negation", "He did not resign.", "He did resign.")
+
+        assert result.status == ValidationStatus.FAILED
+        assert result.details["removed"] == ["not"]
+
+    def test_reduced_scope_warns(self, validator):
+        result = self.check(validator, "scope", "All residents left.", "Residents left.")
+
+        assert result.status == ValidationStatus.WARNING
+
+    def test_removed_risk_fails(self, validator):
+        result = self.check(validator, "risk", "Officials issued a warning.", "Officials spoke.")
+
+        assert result.status == ValidationStatus.FAILED
+        assert result.details["removed"] == ["warning"]
+
+    def test_identical_text_passes_every_string_check(self, validator):
+        for text in corpus_texts():
+            for name in ("numbers", "attributions", "modality", "causality", "risk", "quotes", "scope", "negation"):
+                assert self.check(validator, name, text, text).status == ValidationStatus.PASSED, name